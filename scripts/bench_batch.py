@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=import-outside-toplevel
+"""Benchmark a batch run against sequential runs of the same flow.
+
+Runs the tests' flow without human input (a user proxy and an assistant
+without models, so no API keys are needed) once per input: first with N
+``runner.run(message=...)`` calls, then with two
+``runner.run_batch(inputs, concurrency=K)`` calls (the first one of a sync
+flow also starts the workers' fork server). With no model latency, this
+measures the per-run overhead (export, requirements check, temp dir,
+import and post-run) that a batch pays once.
+
+Usage: python scripts/bench_batch.py [--inputs N] [--concurrency K] [--async]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def _flow(is_async: bool) -> Any:
+    """Get the tests' flow without human input."""
+    sys.path.insert(0, str(ROOT_DIR))
+    from tests.conftest import get_runnable_flow
+    from waldiez.models import Waldiez
+
+    flow = get_runnable_flow()
+    for user in flow.data.agents.userProxyAgents:
+        user.data.human_input_mode = "NEVER"
+    flow.data.is_async = is_async
+    return Waldiez(flow=flow)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inputs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--async", dest="is_async", action="store_true")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    from waldiez import WaldiezRunner
+
+    waldiez = _flow(args.is_async)
+    messages = [f"input {index}" for index in range(args.inputs)]
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = WaldiezRunner(waldiez, output_path=Path(tmp) / "flow.py")
+        started = time.perf_counter()
+        for message in messages:
+            runner.run(message=message, skip_deps=False, skip_mmd=True)
+        sequential = time.perf_counter() - started
+
+        timings = [("sequential", sequential)]
+        failed = 0
+        for name in ("batch", "batch again"):
+            runner = WaldiezRunner(waldiez, output_path=Path(tmp) / "flow.py")
+            started = time.perf_counter()
+            records = runner.run_batch(
+                messages,
+                concurrency=args.concurrency,
+                results_file=Path(tmp) / "results.jsonl",
+                skip_deps=False,
+            )
+            timings.append((name, time.perf_counter() - started))
+            failed += sum(1 for record in records if record["error"])
+    for name, elapsed in timings:
+        print(
+            f"{name:>11}: {elapsed:.2f}s "
+            f"({args.inputs / elapsed:.1f} inputs/s)"
+        )
+    if failed:
+        print(f"{failed} batch inputs failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=import-outside-toplevel,consider-using-with
+"""Benchmark the time to the first event of a subprocess flow run.
+
+Compares a fresh ``python -m waldiez run ...`` with a command handed to
+a warm worker of a ``WarmWorkerPool``. The flow (a user proxy and an
+assistant without models) asks for the user's input first, so no model
+API keys are needed: the first structured (json) line on stdout is the
+event, log lines are skipped.
+
+Usage: python scripts/bench_first_event.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    from waldiez.running.subprocess_runner import (
+        BaseSubprocessRunner,
+        WarmWorkerPool,
+    )
+except ImportError:
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+    from waldiez.running.subprocess_runner import (
+        BaseSubprocessRunner,
+        WarmWorkerPool,
+    )
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+
+def _flow_file(directory: Path) -> Path:
+    """Dump the tests' runnable flow."""
+    sys.path.insert(0, str(ROOT_DIR))
+    from tests.conftest import get_runnable_flow
+    from waldiez.models import Waldiez
+
+    flow_path = directory / "flow.waldiez"
+    waldiez = Waldiez(flow=get_runnable_flow())
+    flow_path.write_text(waldiez.model_dump_json(), encoding="utf-8")
+    return flow_path
+
+
+def _first_event(process: subprocess.Popen[str], started: float) -> float:
+    """Wait for the first structured event on stdout, stop the process."""
+    assert process.stdout is not None
+    for line in process.stdout:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            # log lines
+            continue
+        if isinstance(event, dict) and event.get("type"):
+            break
+    else:
+        raise RuntimeError("The flow exited without any event")
+    elapsed = time.perf_counter() - started
+    process.kill()
+    process.wait()
+    for stream in (process.stdin, process.stdout, process.stderr):
+        if stream:
+            stream.close()
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        flow_path = _flow_file(Path(tmp))
+        cmd = BaseSubprocessRunner(worker_pool=None).build_command(
+            flow_path, output_path=Path(tmp) / "flow.py"
+        )
+        cmd.append("--skip-deps")
+        cold: list[float] = []
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            cold.append(_first_event(process, started))
+
+        pool = WarmWorkerPool(size=1)
+        pooled: list[float] = []
+        for _ in range(args.runs):
+            pool.start()
+            # let the worker warm up (as it would between runs)
+            time.sleep(5)
+            worker = pool.take()
+            assert worker is not None
+            started = time.perf_counter()
+            pool.run(worker, cmd)
+            pooled.append(_first_event(worker, started))
+        pool.close()
+    for name, values in (("cold", cold), ("pooled", pooled)):
+        print(
+            f"{name:>7}: median {statistics.median(values):.3f}s "
+            f"(min {min(values):.3f}s, max {max(values):.3f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -53,7 +53,7 @@ def test_export_captain_agent(tmp_path: Path) -> None:
         '    default_auto_reply="",\n'
         "    code_execution_config=False,\n"
         "    is_termination_msg=None,\n"
-        "    agent_config_save_path=os.getcwd(),\n"
+        "    agent_config_save_path=__WORK_DIR__,\n"
         "    nested_config={\n"
         '        "autobuild_init_config": {\n'
         f"            {config_arg},\n"
@@ -131,7 +131,7 @@ def test_export_captain_agent(tmp_path: Path) -> None:
         '    default_auto_reply="",\n'
         "    code_execution_config=False,\n"
         "    is_termination_msg=None,\n"
-        "    agent_config_save_path=os.getcwd(),\n"
+        "    agent_config_save_path=__WORK_DIR__,\n"
         f'    agent_lib="{agent1.name}_agent_lib.json",\n'
         # '    tool_lib="default",\n'
         "    nested_config={\n"
@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc
+# pylint: disable=too-few-public-methods,no-self-use
+"""Test the chat graph runner of waldiez.exporting.chats.utils.sequential."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from autogen import ChatResult  # type: ignore
+
+from waldiez.exporting.chats import ChatsExporter
+from waldiez.exporting.chats.utils.sequential import (
+    CHAT_GRAPH_IMPORTS,
+    CHAT_GRAPH_RUNNER,
+)
+from waldiez.models import (
+    WaldiezAgent,
+    WaldiezAgentConnection,
+    WaldiezChat,
+    WaldiezChatData,
+    WaldiezChatMessage,
+    WaldiezChatNested,
+    WaldiezChatSummary,
+    WaldiezDefaultCondition,
+    WaldiezTransitionAvailability,
+)
+
+
+def _agent(index: int) -> WaldiezAgent:
+    """Get an assistant."""
+    return WaldiezAgent(
+        id=f"wa-{index}",
+        name=f"agent{index}",
+        agent_type="assistant",
+        description="agent description",
+        data={},  # type: ignore
+    )
+
+
+def _chat(index: int, source: str, target: str) -> WaldiezChat:
+    """Get a chat between two agents."""
+    chat = WaldiezChat(
+        id=f"wc-{index}",
+        source=source,
+        target=target,
+        type="chat",
+        data=WaldiezChatData(
+            source_type="assistant",
+            target_type="assistant",
+            name=f"chat{index}",
+            description="A chat between two agents.",
+            message=WaldiezChatMessage(type="string", content="Hi"),
+            nested_chat=WaldiezChatNested(),
+            summary=WaldiezChatSummary(),
+            condition=WaldiezDefaultCondition.create(),
+            available=WaldiezTransitionAvailability(),
+        ),
+    )
+    chat.set_chat_id(index)
+    return chat
+
+
+@pytest.mark.parametrize("is_async", [True, False])
+def test_export_chat_graph(is_async: bool) -> None:
+    """Test exporting chats with prerequisites."""
+    agents = [_agent(index) for index in range(4)]
+    chats = [_chat(index, "wa-0", f"wa-{index + 1}") for index in range(3)]
+    chats[2].set_prerequisites([0, 1])
+    main_chats: list[WaldiezAgentConnection] = [
+        {"chat": chat, "source": agents[0], "target": agents[index + 1]}
+        for index, chat in enumerate(chats)
+    ]
+    exporter = ChatsExporter(
+        all_agents=agents,
+        agent_names={agent.id: agent.name for agent in agents},
+        all_chats=chats,
+        chat_names={chat.id: chat.name for chat in chats},
+        main_chats=main_chats,
+        root_group_manager=None,
+        cache_seed=None,
+        for_notebook=False,
+        is_async=is_async,
+    )
+    exporter.export()
+    initiation = exporter.extras.chat_initiation
+    prerequisites = exporter.extras.chat_prerequisites
+    imports = [item.statement for item in exporter.extras.extra_imports]
+    if is_async:
+        assert "await a_run_chat_graph(agent0, __INITIAL_MSG__)" in initiation
+        assert CHAT_GRAPH_RUNNER in prerequisites
+        assert prerequisites.index("a_run_chat_graph") < prerequisites.index(
+            "__INITIAL_MSG__ = ["
+        )
+        assert all(statement in imports for statement in CHAT_GRAPH_IMPORTS)
+    else:
+        assert "agent0.sequential_run(__INITIAL_MSG__)" in initiation
+        assert "a_run_chat_graph" not in prerequisites
+        assert not any(item in imports for item in CHAT_GRAPH_IMPORTS)
+
+
+class _Agent:
+    """An agent whose chats take some time."""
+
+    active = 0
+    max_active = 0
+
+    def __init__(
+        self, name: str, fail: bool = False, delay: float = 0.05
+    ) -> None:
+        self.name = name
+        self.client = None
+        self.fail = fail
+        self.delay = delay
+        self.carryovers: list[list[str]] = []
+        self.started_at: list[float] = []
+
+    async def a_initiate_chat(self, **chat_info: Any) -> ChatResult:
+        recipient = chat_info["recipient"]
+        recipient.carryovers.append(chat_info["carryover"])
+        recipient.started_at.append(asyncio.get_running_loop().time())
+        _Agent.active += 1
+        _Agent.max_active = max(_Agent.max_active, _Agent.active)
+        await asyncio.sleep(recipient.delay)
+        _Agent.active -= 1
+        if recipient.fail:
+            raise RuntimeError(f"{recipient.name} failed")
+        return ChatResult(
+            chat_history=[{"name": recipient.name, "content": "done"}],
+            summary=f"summary of {recipient.name}",
+            cost={},
+        )
+
+
+def _runner() -> Any:
+    """Get the generated runner."""
+    namespace: dict[str, Any] = {}
+    code = "\n".join(
+        [
+            "import asyncio",
+            "import os",
+            "from typing import Any",
+            "from autogen import ChatResult, ConversableAgent",
+            "from autogen.io.run_response import AsyncRunResponseProtocol",
+            *CHAT_GRAPH_IMPORTS,
+            CHAT_GRAPH_RUNNER,
+        ]
+    )
+    exec(code, namespace)  # nosec B102 # pylint: disable=exec-used
+    return namespace["a_run_chat_graph"]
+
+
+def _queue(agents: list[_Agent], **prerequisites: list[int]) -> list[Any]:
+    """Get a chat queue (from the first agent to the others)."""
+    return [
+        {
+            "chat_id": index,
+            "recipient": agent,
+            "message": "Hi",
+            "silent": True,
+            "prerequisites": prerequisites.get(agent.name, []),
+        }
+        for index, agent in enumerate(agents[1:])
+    ]
+
+
+async def test_a_run_chat_graph(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test running independent chats concurrently."""
+    monkeypatch.setenv("WALDIEZ_MAX_PARALLEL_CHATS", "2")
+    _Agent.active = _Agent.max_active = 0
+    agents = [_Agent(name) for name in ("user", "a", "b", "c", "d")]
+    a_run_chat_graph = _runner()
+    # d after a and b, c is independent
+    responses = await a_run_chat_graph(agents[0], _queue(agents, d=[0, 1]))
+    summaries = []
+    for response in responses:
+        async for _ in response.events:
+            pass
+        summaries.append(await response.summary)
+    assert summaries == [
+        "summary of a",
+        "summary of b",
+        "summary of c",
+        "summary of d",
+    ]
+    assert _Agent.max_active == 2
+    assert agents[4].carryovers == [["summary of a", "summary of b"]]
+    assert agents[3].carryovers == [[]]
+
+
+async def test_a_run_chat_graph_critical_path() -> None:
+    """Test a chat not waiting for chats it does not depend on."""
+    agents = [
+        _Agent("user"),
+        _Agent("a", delay=0.5),
+        _Agent("b"),
+        _Agent("x"),
+        _Agent("y"),
+    ]
+    a_run_chat_graph = _runner()
+    # x after the slow a, y after the fast b (but after x in the order)
+    responses = await a_run_chat_graph(agents[0], _queue(agents, x=[0], y=[1]))
+    for response in responses:
+        async for _ in response.events:
+            pass
+    # y starts when b is done, not when x starts (after a)
+    assert agents[4].started_at[0] < agents[3].started_at[0]
+    assert agents[4].started_at[0] - agents[1].started_at[0] < 0.4
+
+
+async def test_a_run_chat_graph_errors() -> None:
+    """Test a failed prerequisite and a cycle."""
+    agents = [_Agent("user"), _Agent("a", fail=True), _Agent("b")]
+    a_run_chat_graph = _runner()
+    responses = await a_run_chat_graph(agents[0], _queue(agents, b=[0]))
+    for response in responses:
+        with pytest.raises(RuntimeError):
+            async for _ in response.events:
+                pass
+    assert not agents[2].carryovers
+    with pytest.raises(ValueError, match="cycle"):
+        await a_run_chat_graph(agents[0], _queue(agents, a=[1], b=[0]))
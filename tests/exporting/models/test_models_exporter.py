@@ -159,3 +159,63 @@ def test_models_exporter(tmp_path: Path) -> None:
     models_exporter.get_imports()
     agent_llm = models_exporter.get_agent_llm_config_arg(agent)
     assert agent_llm == "    llm_config=False,\n"
+
+
+def test_models_exporter_rate_limit() -> None:
+    """Test exporting a model with a rate limit."""
+    agents = [
+        WaldiezAgent(
+            id=f"wa-{index}",
+            name=f"agent{index}",
+            agent_type="assistant",
+            description="agent description",
+            data={"model_ids": model_ids},  # type: ignore
+        )
+        for index, model_ids in enumerate([["wm-2", "wm-1"], ["wm-2"]])
+    ]
+    model1 = WaldiezModel(
+        id="wm-1",
+        name="model1",
+        description="model description",
+        data={  # type: ignore
+            "apiType": "openai",
+            "rateLimit": {"requestsPerMinute": 60, "maxInFlight": 2},
+        },
+    )
+    model2 = WaldiezModel(
+        id="wm-2",
+        name="model2",
+        description="model description",
+        data={"apiType": "openai"},  # type: ignore
+    )
+    models_exporter = ModelsExporter(
+        flow_name="flow",
+        agents=agents,
+        agent_names={agent.id: agent.name for agent in agents},
+        models=[model1, model2],
+        model_names={"wm-1": "model1", "wm-2": "model2"},
+        for_notebook=False,
+        output_dir=None,
+        cache_seed=None,
+    )
+    generated_string = models_exporter.generate_main_content()
+    assert generated_string is not None
+    assert "from waldiez.running.llm_rate_limiter import" in generated_string
+    assert (
+        'model1_rate_limit: dict[str, Any] = {\n    "key": "openai::model1",'
+        in generated_string
+    )
+    assert '"requests_per_minute": 60,' in generated_string
+    assert "model2_rate_limit" not in generated_string
+    assert (
+        models_exporter.get_agent_rate_limit_call(agents[0])
+        == "limit_llm_calls(agent0, model1_rate_limit)"
+    )
+    assert not models_exporter.get_agent_rate_limit_call(agents[1])
+    result = models_exporter.export()
+    calls = [
+        content.content
+        for content in result.positioned_content
+        if content.content.startswith("limit_llm_calls(")
+    ]
+    assert calls == ["limit_llm_calls(agent0, model1_rate_limit)"]
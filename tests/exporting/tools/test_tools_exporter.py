@@ -2,8 +2,10 @@
 # Copyright (c) 2024 - 2026 Waldiez and contributors.
 """Test for waldiez.exporting.tools.ToolsExporter."""
 
+import os
 import shutil
 from pathlib import Path
+from typing import Any
 
 from waldiez.exporting.tools import ToolsExporter
 from waldiez.exporting.tools.factory import create_tools_exporter
@@ -329,3 +331,17 @@ wiki_tool = WikipediaQueryRun(api_wrapper=api_wrapper)
         ")\n"
     )
     assert after_agent == expected_after_agent_string
+    # the secrets go to the flow's environment (if given), not os.environ
+    secrets_file = (
+        tmp_path / "test_export_interop_tool" / f"{flow_name}_tool1_secrets.py"
+    )
+    flow_env = {"SECRET_KEY_2": "FROM_ENV"}
+    namespace: dict[str, Any] = {"__ENV__": flow_env}
+    exec(  # nosec B102 # pylint: disable=exec-used
+        secrets_file.read_text("utf-8"), namespace
+    )
+    assert flow_env == {
+        "SECRET_KEY_1": "SECRET_VALUE_1",  # nosemgrep # nosec
+        "SECRET_KEY_2": "FROM_ENV",
+    }
+    assert "SECRET_KEY_1" not in os.environ
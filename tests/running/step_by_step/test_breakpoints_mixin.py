@@ -277,24 +277,49 @@ def test_should_break_on_event_matching_breakpoint(
     assert mixin.should_break_on_event(event, True)
 
 
-def test_should_break_on_event_caching(mixin: DummyBreakpointsMixin) -> None:
-    """Test should_break_on_event caching mechanism."""
+def test_should_break_on_event_compiled(mixin: DummyBreakpointsMixin) -> None:
+    """Test should_break_on_event compiles the breakpoints once."""
+    mixin._config.auto_continue = True
     mixin.add_breakpoint("event:message")
 
     event = MagicMock()
     event.type = "message"
     event.sender = "user"
-    event.model_dump.return_value = {"type": "message", "sender": "user"}
 
-    # First call - cache miss
-    result1 = mixin.should_break_on_event(event, True)
+    assert mixin.should_break_on_event(event, True)
+    assert mixin.should_break_on_event(event, True)
+    event.type = "tool_call"
+    assert not mixin.should_break_on_event(event, True)
+    event.model_dump.assert_not_called()
+    assert mixin._breakpoint_stats["compilations"] == 1
+    assert mixin._breakpoint_stats["checks"] == 3
+
+    mixin.add_breakpoint("agent:user")
+    assert mixin.should_break_on_event(event, True)
+    assert mixin._breakpoint_stats["compilations"] == 2
+
+
+def test_compiled_breakpoints_agent_ids(mixin: DummyBreakpointsMixin) -> None:
+    """Test matching breakpoints and events with agent ids or names."""
+    mixin._config.auto_continue = True
+    mixin.set_agent_id_to_name({"wa-1": "user", "wa-2": "assistant"})
+    mixin.add_breakpoint("wa-2:tool_call")
+    mixin.add_breakpoint("agent:user")
+
+    event = MagicMock()
+    event.type = "tool_call"
+    event.sender = None
+    event.recipient = None
+    event.content = {"sender": "assistant", "recipient": "wa-1"}
+    assert mixin.should_break_on_event(event, True)
 
-    # Second call with same event - cache hit
-    result2 = mixin.should_break_on_event(event, True)
-    cache_hits_after_second = mixin._breakpoint_stats["cache_hits"]
+    event.content = {"sender": "other", "recipient": "wa-1"}
+    assert not mixin.should_break_on_event(event, True)
+    assert mixin.should_break_on_event(event, False)
 
-    assert result1 == result2
-    assert cache_hits_after_second > 0
+    event.type = "text"
+    event.content = {"sender": "wa-2", "recipient": "other"}
+    assert not mixin.should_break_on_event(event, False)
 
 
 def test_should_break_on_event_exception_handling(
@@ -325,8 +350,9 @@ def test_get_breakpoint_stats(mixin: DummyBreakpointsMixin) -> None:
     assert stats["total_breakpoints"] == 2
     assert stats["has_breakpoints"] is True
     assert len(stats["breakpoints"]) == 2
-    assert "cache_stats" in stats
-    assert "performance" in stats
+    assert stats["match_stats"]["checks"] == 1
+    assert stats["compiled"]["event_types"] == ["message"]
+    assert stats["compiled"]["agents"] == ["user"]
 
 
 def test_export_breakpoints(mixin: DummyBreakpointsMixin) -> None:
@@ -412,33 +438,24 @@ def test_agent_event_breakpoint_matching(mixin: DummyBreakpointsMixin) -> None:
     # Test matching event
     event1 = MagicMock()
     event1.type = "message"
-    event1.model_dump.return_value = {
-        "type": "message",
-        "sender": "user",
-        "recipient": "assistant",
-    }
+    event1.sender = "user"
+    event1.recipient = "assistant"
 
     assert mixin.should_break_on_event(event1, True)
 
     # Test non-matching event type
     event2 = MagicMock()
     event2.type = "tool_call"
-    event2.model_dump.return_value = {
-        "type": "tool_call",
-        "sender": "user",
-        "recipient": "assistant",
-    }
+    event2.sender = "user"
+    event2.recipient = "assistant"
 
     assert not mixin.should_break_on_event(event2, True)
 
     # Test non-matching agent
     event3 = MagicMock()
     event3.type = "message"
-    event3.model_dump.return_value = {
-        "type": "message",
-        "sender": "assistant",
-        "recipient": "other",
-    }
+    event3.sender = "assistant"
+    event3.recipient = "other"
 
     assert not mixin.should_break_on_event(event3, True)
     mixin._config.auto_continue = auto_continue
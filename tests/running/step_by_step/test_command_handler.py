@@ -116,6 +116,29 @@ def test_handle_command_stats(
     runner.show_stats.assert_called_once()
 
 
+def test_handle_command_sync_agents(
+    handler: CommandHandler, runner: MagicMock
+) -> None:
+    """Test handling the agents' sync command."""
+    result = handler.handle_command("sy")
+    assert result == WaldiezDebugStepAction.SYNC_AGENTS
+    runner.show_agents_state.assert_called_once()
+
+
+def test_handle_command_history(
+    handler: CommandHandler, runner: MagicMock
+) -> None:
+    """Test handling the event history command."""
+    assert handler.handle_command("hi") == WaldiezDebugStepAction.HISTORY
+    runner.show_event_history.assert_called_once_with()
+    handler.handle_command("hi 20 10")
+    runner.show_event_history.assert_called_with(20, 10)
+    runner.show_event_history.reset_mock()
+    handler.handle_command("hi twenty")
+    runner.show_event_history.assert_not_called()
+    assert isinstance(runner.emit.call_args[0][0], WaldiezDebugError)
+
+
 def test_handle_command_add_breakpoint_with_args(
     handler: CommandHandler, runner: MagicMock
 ) -> None:
@@ -269,6 +292,8 @@ def test_command_map_completeness(handler: CommandHandler) -> None:
         "i",
         "h",
         "st",
+        "sy",
+        "hi",
         "ab",
         "rb",
         "lb",
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc,protected-access
+# pyright: reportPrivateUsage=false
+
+"""Test waldiez.running.step_by_step.event_history.*."""
+
+import json
+from pathlib import Path
+
+from waldiez.running.step_by_step.event_history import (
+    EVENT_HISTORY_FILE,
+    EventHistory,
+)
+
+
+def _event(count: int) -> dict[str, object]:
+    """Get an event."""
+    return {"type": "text", "count": count, "content": f"message {count}"}
+
+
+def test_event_history_in_memory() -> None:
+    """Test keeping only the newest events without a file."""
+    history = EventHistory(maxlen=3)
+    for count in range(1, 6):
+        history.append(_event(count))
+    assert [event["count"] for event in history] == [3, 4, 5]
+    assert history.total == 3
+    page = history.page(start=1, limit=2)
+    assert [event["count"] for event in page["events"]] == [3, 4]
+    assert page["next"] == 5
+
+
+def test_event_history_spilled(tmp_path: Path) -> None:
+    """Test moving the older events to a file and reading them back."""
+    history = EventHistory(maxlen=3)
+    history.spill_to(tmp_path / EVENT_HISTORY_FILE)
+    for count in range(1, 11):
+        history.append(_event(count))
+    assert len(history) == 3
+    assert history.spilled == 7
+    assert history.total == 10
+
+    page = history.page(start=1, limit=4)
+    assert [event["count"] for event in page["events"]] == [1, 2, 3, 4]
+    assert page["next"] == 5
+    page = history.page(start=page["next"], limit=4)
+    assert [event["count"] for event in page["events"]] == [5, 6, 7, 8]
+    page = history.page(start=page["next"], limit=4)
+    assert [event["count"] for event in page["events"]] == [9, 10]
+    assert page["next"] is None
+
+    history.close()
+    lines = (tmp_path / EVENT_HISTORY_FILE).read_text("utf-8").splitlines()
+    assert [json.loads(line)["count"] for line in lines] == list(range(1, 11))
+    assert history.spilled == 0
+    assert [event["count"] for event in history] == [8, 9, 10]
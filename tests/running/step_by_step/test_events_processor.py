@@ -9,6 +9,7 @@
 """Test waldiez.running.step_by_step.events_processor.*."""
 
 from collections import deque
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -34,6 +35,7 @@ def runner_fixture() -> MagicMock:
     runner.add_to_history = MagicMock()
     runner.pop_event = MagicMock()
     runner.should_break_on_event = MagicMock(return_value=True)
+    runner.delta_agents_state = False
     runner._config = WaldiezDebugConfig()
     return runner
 
@@ -332,3 +334,69 @@ def test_swap_participant_names_on_input_request(
     event_info = result["event_info"]
     assert event_info["sender"] == "recipient"
     assert event_info["recipient"] == "sender"
+
+
+class _Agent:
+    """An agent with some messages."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.description = f"{name} description"
+        self.system_message = "Be helpful"
+        self.chat_messages: dict[Any, list[dict[str, Any]]] = {}
+
+    def get_actual_usage(self) -> dict[str, Any] | None:
+        return None
+
+    def get_total_usage(self) -> dict[str, Any] | None:
+        return None
+
+
+def test_delta_agents_state(
+    processor: EventProcessor, runner: MagicMock, mock_event: MagicMock
+) -> None:
+    """Test sending a snapshot, then only the agents' changes."""
+    runner.delta_agents_state = True
+    user, assistant = _Agent("user"), _Agent("assistant")
+    user.chat_messages[assistant] = [{"content": "Hi", "role": "user"}]
+
+    first = processor.process_event(mock_event, [user, assistant])
+    agents = first["event_info"]["agents"]
+    assert agents["seq"] == 1
+    assert agents["snapshot"] is True
+    assert agents["sender"]["name"] == "user"
+    assert agents["sender"]["chat_messages"] == {
+        "assistant": [{"content": "Hi", "role": "user"}]
+    }
+    assert len(agents["all"]) == 2
+
+    user.chat_messages[assistant].append({"content": "Bye", "role": "user"})
+    assistant.description = "changed"
+    second = processor.process_event(mock_event, [user, assistant])
+    agents = second["event_info"]["agents"]
+    assert agents["seq"] == 2
+    assert agents["snapshot"] is False
+    assert agents["sender"] == "user"
+    assert agents["all"] == [
+        {
+            "name": "user",
+            "new_messages": {"assistant": [{"content": "Bye", "role": "user"}]},
+        },
+        {"name": "assistant", "changed": {"description": "changed"}},
+    ]
+
+    user.chat_messages[assistant] = []
+    third = processor.process_event(mock_event, [user, assistant])
+    assert third["event_info"]["agents"]["all"] == [
+        {"name": "user", "chat_messages": {"assistant": []}}
+    ]
+    fourth = processor.process_event(mock_event, [user, assistant])
+    assert fourth["event_info"]["agents"]["all"] == []
+
+    snapshot = processor.request_agents_snapshot()
+    assert snapshot is not None
+    assert snapshot["seq"] == 5
+    assert [dump["name"] for dump in snapshot["all"]] == ["user", "assistant"]
+    fifth = processor.process_event(mock_event, [user, assistant])
+    assert fifth["event_info"]["agents"]["seq"] == 6
+    assert fifth["event_info"]["agents"]["all"] == []
@@ -9,6 +9,7 @@
 
 """Test waldiez.running.step_by_step_runner.*."""
 
+import json
 import threading
 from collections import deque
 from pathlib import Path
@@ -25,10 +26,15 @@ from autogen.events.agent_events import (  # type: ignore
 
 from waldiez.models.flow.info import WaldiezFlowInfo
 from waldiez.running.exceptions import StopRunningException
+from waldiez.running.step_by_step.event_history import (
+    EVENT_HISTORY_FILE,
+    EventHistory,
+)
 from waldiez.running.step_by_step.step_by_step_models import (
     HELP_MESSAGE,
     WaldiezBreakpoint,
     WaldiezBreakpointType,
+    WaldiezDebugEventHistory,
     WaldiezDebugStats,
     WaldiezDebugStepAction,
 )
@@ -312,7 +318,9 @@ def test_get_execution_stats_returns_correct_data(
     runner._step_mode = True
     runner._config.auto_continue = False
     runner.set_breakpoints(["event1", "event2"])
-    runner._event_history = deque([{"type": "event1"}, {"type": "event2"}])
+    runner._event_history.clear()
+    for event_info in [{"type": "event1"}, {"type": "event2"}]:
+        runner._event_history.append(event_info)
 
     stats = runner.execution_stats
 
@@ -640,7 +648,9 @@ def test_show_stats_emits_correct_stats(
     runner._step_mode = True
     runner._config.auto_continue = False
     runner.set_breakpoints(["eventA", "eventB"])
-    runner._event_history = deque([{"type": "eventA"}, {"type": "eventB"}])
+    runner._event_history.clear()
+    for event_info in [{"type": "eventA"}, {"type": "eventB"}]:
+        runner._event_history.append(event_info)
 
     with patch.object(runner, "emit") as mock_emit:
         runner.show_stats()
@@ -676,7 +686,8 @@ def test_show_stats_with_empty_breakpoints(
     runner._step_mode = False
     runner._config.auto_continue = True
     runner._breakpoints = set()
-    runner._event_history = deque([{}])
+    runner._event_history.clear()
+    runner._event_history.append({"count": 1})
 
     with patch.object(runner, "emit") as mock_emit:
         runner.show_stats()
@@ -697,6 +708,73 @@ def test_on_event_returns_false_if_stop_requested(
     assert result is False
 
 
+def test_show_event_history_pages(
+    runner: WaldiezStepByStepRunner, tmp_path: Path
+) -> None:
+    """Test showing pages of a history larger than the one in memory."""
+    runner._event_history = EventHistory(maxlen=2)
+    runner._spill_event_history(tmp_path)
+    for count in range(1, 6):
+        runner.add_to_history({"type": "text", "count": count})
+    assert len(runner.event_history) == 2
+
+    with patch.object(runner, "emit") as mock_emit:
+        runner.show_event_history(1, 3)
+    message = mock_emit.call_args[0][0]
+    assert isinstance(message, WaldiezDebugEventHistory)
+    assert [event["count"] for event in message.events] == [1, 2, 3]
+    assert message.next == 4
+    assert message.total == 5
+    runner._event_history.close()
+
+
+def test_on_event_fast_auto_continue(
+    runner: WaldiezStepByStepRunner, text_event: TextEvent
+) -> None:
+    """Test skipping the debug processing of events without breakpoints."""
+    runner._config.fast_auto_continue = True
+    runner._config.auto_continue = True
+    runner.add_breakpoint("event:tool_call")
+    with (
+        patch.object(runner, "emit") as mock_emit,
+        patch(f"{EVENTS_MIXIN}.process_event") as mock_process,
+    ):
+        assert runner._on_event(text_event, []) is True
+        assert runner._on_event(text_event, []) is True
+        mock_emit.assert_not_called()
+        mock_process.assert_called_with(
+            text_event, [], output_dir=runner._output_dir
+        )
+    assert runner.event_count == 2
+    assert len(runner._skipped_events) == 2
+    assert not runner._event_history
+
+    history = runner.event_history
+    assert [event["count"] for event in history] == [1, 2]
+    assert history[0]["type"] == "text"
+    assert history[0]["sender"] == "test_sender"
+    assert history[0]["recipient"] == "test_recipient"
+    assert not runner._skipped_events
+
+
+def test_fast_auto_continue_spilled(
+    runner: WaldiezStepByStepRunner, text_event: TextEvent, tmp_path: Path
+) -> None:
+    """Test the skipped events that do not fit in memory being spilled."""
+    runner._config.fast_auto_continue = True
+    runner._config.auto_continue = True
+    runner._event_history = EventHistory(maxlen=3)
+    runner._skipped_events = deque(maxlen=3)
+    runner._spill_event_history(tmp_path)
+    with patch(f"{EVENTS_MIXIN}.process_event"):
+        for _ in range(10):
+            assert runner._on_event(text_event, []) is True
+    assert len(runner._skipped_events) <= 3
+    runner._close_event_history()
+    lines = (tmp_path / EVENT_HISTORY_FILE).read_text("utf-8").splitlines()
+    assert [json.loads(line)["count"] for line in lines] == list(range(1, 11))
+
+
 @pytest.mark.asyncio
 async def test_async_on_event_returns_false_if_stop_requested(
     runner: WaldiezStepByStepRunner, text_event: TextEvent
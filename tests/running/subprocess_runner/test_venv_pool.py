@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc, missing-return-doc,missing-yield-doc
+# pylint: disable=protected-access,no-self-use
+# pyright: reportPrivateUsage=false
+"""Tests for the per-requirements virtualenv pool."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from waldiez.models import Waldiez
+from waldiez.running.subprocess_runner import (
+    VenvPool,
+    WaldiezSubprocessRunner,
+)
+from waldiez.running.subprocess_runner.venv_pool import (
+    LEASES_DIR,
+    READY_FILE,
+    WALDIEZ_VENV_POOL,
+)
+from waldiez.utils.requirements import WALDIEZ_REQUIREMENTS_CACHE
+
+MISSING = "surely-not-installed-package==1.0"
+# surely not a running process
+DEAD_PID = 2**31 - 2
+
+
+@pytest.fixture(autouse=True)
+def _requirements_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep the recorded requirement sets in the test's directory."""
+    monkeypatch.setenv(
+        WALDIEZ_REQUIREMENTS_CACHE, str(tmp_path / "requirements.json")
+    )
+
+
+def _noop_pip(_: VenvPool, python: Path, __: list[str]) -> list[str]:
+    """Skip installing anything (no network in tests)."""
+    return [str(python), "-c", "pass"]
+
+
+class TestVenvPool:
+    """Tests for VenvPool."""
+
+    def test_satisfied_requirements_use_current_python(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that no environment is needed if nothing is missing."""
+        pool = VenvPool(tmp_path / "venvs")
+        assert pool.acquire(["packaging"]) == sys.executable
+        pool.release(sys.executable)
+        assert not pool.root.exists()
+        # a known satisfied set is not resolved again
+        with patch(
+            "waldiez.utils.requirements.missing_requirements"
+        ) as missing:
+            assert pool.acquire(["packaging"]) == sys.executable
+            missing.assert_not_called()
+
+    def test_create_and_reuse(self, tmp_path: Path) -> None:
+        """Test creating an environment once and reusing it."""
+        pool = VenvPool(tmp_path / "venvs", wheel_cache=tmp_path / "wheels")
+        printer = MagicMock()
+        with patch.object(VenvPool, "_pip_command", _noop_pip):
+            python = pool.acquire([MISSING, "packaging"], printer=printer)
+        assert python is not None
+        env_dir = pool.env_dir(["packaging", MISSING])
+        assert Path(python).parent.parent == env_dir
+        assert (env_dir / READY_FILE).is_file()
+        lease = env_dir / LEASES_DIR / str(os.getpid())
+        assert lease.is_file()
+        # the environment sees the current one's packages
+        subprocess.run(
+            [python, "-c", "import waldiez.utils.requirements"], check=True
+        )
+        with patch.object(VenvPool, "_create") as create:
+            assert pool.acquire([MISSING, "packaging"]) == python
+            create.assert_not_called()
+        pool.release(python)
+        assert lease.is_file()
+        pool.release(python)
+        assert not pool._in_use
+        assert not lease.exists()
+
+    def test_pip_command(self, tmp_path: Path) -> None:
+        """Test the install command with a wheel cache."""
+        pool = VenvPool(tmp_path / "venvs", wheel_cache=tmp_path / "cache")
+        (tmp_path / "cache" / "wheels").mkdir(parents=True)
+        cmd = pool._pip_command(Path("python"), [MISSING])
+        assert cmd[:4] == ["python", "-m", "pip", "install"]
+        assert cmd[-1] == MISSING
+        assert str(tmp_path / "cache") in cmd
+        assert str(tmp_path / "cache" / "wheels") in cmd
+
+    def test_failed_install_falls_back(self, tmp_path: Path) -> None:
+        """Test getting no interpreter if the install fails."""
+        pool = VenvPool(tmp_path / "venvs")
+
+        def _failing_pip(_: VenvPool, python: Path, __: Any) -> list[str]:
+            return [str(python), "-c", "raise SystemExit(3)"]
+
+        with patch.object(VenvPool, "_pip_command", _failing_pip):
+            assert pool.acquire([MISSING], printer=MagicMock()) is None
+        assert not pool.environments()
+        assert not pool._in_use
+        assert not list(pool.root.iterdir())
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test removing the least recently used environments."""
+        pool = VenvPool(tmp_path / "venvs", max_envs=2)
+        envs: list[Path] = []
+        for number in range(3):
+            env_dir = pool.root / f"env{number}"
+            env_dir.mkdir(parents=True)
+            (env_dir / READY_FILE).write_text("{}")
+            os.utime(env_dir / READY_FILE, (number, number))
+            envs.append(env_dir)
+        # in use by this process
+        pool._in_use["env0"] = 1
+        assert pool.evict() == [envs[1]]
+        assert pool.environments() == [envs[0], envs[2]]
+        pool._in_use.clear()
+        pool.clear()
+        assert not pool.environments()
+
+    def test_eviction_respects_leases(self, tmp_path: Path) -> None:
+        """Test keeping the environments other processes hold a lease of."""
+        pool = VenvPool(tmp_path / "venvs", max_envs=2)
+        envs: list[Path] = []
+        for number, pid in enumerate((os.getppid(), DEAD_PID, None)):
+            env_dir = pool.root / f"env{number}"
+            (env_dir / LEASES_DIR).mkdir(parents=True)
+            (env_dir / READY_FILE).write_text("{}")
+            os.utime(env_dir / READY_FILE, (number, number))
+            if pid is not None:
+                (env_dir / LEASES_DIR / str(pid)).touch()
+            envs.append(env_dir)
+        # env0 is leased by a running process, env1's lease is stale
+        assert pool.evict() == [envs[1]]
+        assert pool.environments() == [envs[0], envs[2]]
+        assert not list(pool.root.glob(".*"))
+
+    def test_lease_fails_if_removed(self, tmp_path: Path) -> None:
+        """Test that an environment removed meanwhile cannot be leased."""
+        pool = VenvPool(tmp_path / "venvs")
+        env_dir = pool.root / "env"
+        env_dir.mkdir(parents=True)
+        (env_dir / READY_FILE).write_text("{}")
+        assert pool._take_lease(env_dir)
+        pool.release(str(env_dir / "bin" / "python"))
+        assert pool._remove(env_dir)
+        assert not pool._take_lease(env_dir)
+        assert not env_dir.exists()
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test enabling the pool with an environment variable."""
+        monkeypatch.delenv(WALDIEZ_VENV_POOL, raising=False)
+        assert VenvPool.from_env() is None
+        monkeypatch.setenv(WALDIEZ_VENV_POOL, "/tmp/waldiez-venvs")
+        pool = VenvPool.from_env()
+        assert pool is not None
+        assert pool.root == Path("/tmp/waldiez-venvs")
+
+
+class TestRunnerWithVenvPool:
+    """Tests for running a flow with a pooled environment."""
+
+    def test_run_with_pooled_python(self, tmp_path: Path) -> None:
+        """Test that the subprocess uses the pool's interpreter."""
+        waldiez = MagicMock(spec=Waldiez)
+        waldiez.name = "test_flow"
+        waldiez.is_async = False
+        waldiez.requirements = [MISSING]
+        flow_file = tmp_path / "flow.waldiez"
+        flow_file.write_text('{"name": "test_flow"}')
+        pool = MagicMock(spec=VenvPool)
+        pool.acquire.return_value = "/envs/abc/bin/python"
+        runner = WaldiezSubprocessRunner(
+            waldiez=waldiez, waldiez_file=flow_file, venv_pool=pool
+        )
+        with patch(
+            "waldiez.running.subprocess_runner.runner.SyncSubprocessRunner"
+        ) as sync_runner:
+            runner.run()
+        requirements = pool.acquire.call_args.args[0]
+        assert MISSING in requirements
+        kwargs = sync_runner.call_args.kwargs
+        assert kwargs["python_executable"] == "/envs/abc/bin/python"
+        assert kwargs["skip_deps"] is True
+        pool.release.assert_called_once_with("/envs/abc/bin/python")
+
+    def test_run_if_the_pool_fails(self, tmp_path: Path) -> None:
+        """Test installing the requirements if no environment is ready."""
+        waldiez = MagicMock(spec=Waldiez)
+        waldiez.name = "test_flow"
+        waldiez.is_async = False
+        waldiez.requirements = [MISSING]
+        flow_file = tmp_path / "flow.waldiez"
+        flow_file.write_text('{"name": "test_flow"}')
+        pool = VenvPool(tmp_path / "venvs")
+        runner = WaldiezSubprocessRunner(
+            waldiez=waldiez, waldiez_file=flow_file, venv_pool=pool
+        )
+        with (
+            patch.object(VenvPool, "_create", side_effect=OSError("no venv")),
+            patch(
+                "waldiez.running.subprocess_runner.runner.SyncSubprocessRunner"
+            ) as sync_runner,
+        ):
+            runner.run()
+        kwargs = sync_runner.call_args.kwargs
+        assert "python_executable" not in kwargs
+        assert not kwargs.get("skip_deps")
+
+    def test_build_command_with_python(self) -> None:
+        """Test the subprocess command with a pooled interpreter."""
+        # pylint: disable=import-outside-toplevel
+        from waldiez.running.subprocess_runner import BaseSubprocessRunner
+
+        runner = BaseSubprocessRunner(
+            python_executable="/envs/abc/bin/python", skip_deps=True
+        )
+        cmd = runner.build_command(Path("flow.waldiez"))
+        assert cmd[0] == "/envs/abc/bin/python"
+        assert "--skip-deps" in cmd
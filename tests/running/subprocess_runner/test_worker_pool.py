@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc, missing-return-doc,missing-yield-doc
+# pylint: disable=protected-access,no-self-use
+# pyright: reportPrivateUsage=false
+"""Tests for the warm worker interpreters pool."""
+
+import json
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from waldiez.running.subprocess_runner import (
+    AsyncSubprocessRunner,
+    SyncSubprocessRunner,
+    WarmWorkerPool,
+)
+from waldiez.running.subprocess_runner.worker_pool import (
+    WALDIEZ_WORKER_POOL,
+    get_worker_pool,
+)
+from waldiez.utils import get_waldiez_version
+
+VERSION_CMD = [sys.executable, "-m", "waldiez", "--version"]
+
+
+class TestWarmWorkerPool:
+    """Tests for WarmWorkerPool."""
+
+    def test_accepts(self) -> None:
+        """Test which commands can use a worker."""
+        pool = WarmWorkerPool(size=1)
+        assert pool.accepts(VERSION_CMD)
+        assert not pool.accepts(["/other/python", "-m", "waldiez", "run"])
+        assert not pool.accepts([sys.executable, "-m", "other"])
+        line = json.loads(pool.request_line(VERSION_CMD))
+        assert line["argv"] == ["--version"]
+        assert line["cwd"] == str(Path.cwd())
+        pool.close()
+        assert not pool.accepts(VERSION_CMD)
+
+    def test_run_in_worker(self) -> None:
+        """Test handing a command to a worker."""
+        pool = WarmWorkerPool(size=1)
+        pool.start()
+        assert pool.idle == 1
+        worker = pool.take()
+        assert worker is not None
+        # a replacement is started
+        assert pool.idle == 1
+        pool.run(worker, VERSION_CMD)
+        stdout, _ = worker.communicate(timeout=60)
+        assert worker.returncode == 0
+        assert get_waldiez_version() in stdout
+        pool.close()
+        assert pool.idle == 0
+        assert pool.take() is None
+
+    def test_worker_with_another_env_is_not_used(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a run only gets workers started with its environment."""
+        pool = WarmWorkerPool(size=1)
+        pool.start()
+        started = pool._workers[0]
+        monkeypatch.setenv("WALDIEZ_TEST_WORKER_ENV", "changed")
+        assert pool.take() is None
+        assert started.poll() is not None
+        # the replacement has the current environment
+        worker = pool.take()
+        assert worker is not None
+        pool.run(worker, VERSION_CMD)
+        worker.communicate(timeout=60)
+        assert worker.returncode == 0
+        pool.close()
+
+    async def test_a_run_in_worker(self) -> None:
+        """Test handing a command to an asyncio worker."""
+        pool = WarmWorkerPool(size=1)
+        await pool.a_start()
+        worker = await pool.a_take()
+        assert worker is not None
+        await pool.a_run(worker, VERSION_CMD)
+        stdout, _ = await worker.communicate()
+        assert worker.returncode == 0
+        assert get_waldiez_version() in stdout.decode()
+        await pool.a_close()
+        assert pool.idle == 0
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the process-wide pool."""
+        monkeypatch.delenv(WALDIEZ_WORKER_POOL, raising=False)
+        assert get_worker_pool() is None
+        monkeypatch.setenv(WALDIEZ_WORKER_POOL, "2")
+        pool = get_worker_pool()
+        assert pool is not None
+        assert pool.size == 2
+        assert get_worker_pool() is pool
+
+
+class TestRunnersWithWorkerPool:
+    """Tests for the subprocess runners using a pool."""
+
+    def test_sync_runner_uses_worker(self) -> None:
+        """Test that the sync runner takes a worker."""
+        pool = MagicMock(spec=WarmWorkerPool)
+        pool.accepts.return_value = True
+        worker = MagicMock()
+        pool.take.return_value = worker
+        runner = SyncSubprocessRunner(
+            on_output=MagicMock(),
+            on_input_request=MagicMock(),
+            worker_pool=pool,
+        )
+        assert runner._start_process(VERSION_CMD) is worker
+        pool.run.assert_called_once_with(worker, VERSION_CMD)
+
+    async def test_async_runner_falls_back(self) -> None:
+        """Test that the async runner starts a process without workers."""
+        pool = MagicMock(spec=WarmWorkerPool)
+        pool.accepts.return_value = True
+        pool.a_take = AsyncMock(return_value=None)
+        runner = AsyncSubprocessRunner(
+            on_output=AsyncMock(),
+            on_input_request=AsyncMock(),
+            worker_pool=pool,
+        )
+        process = await runner._start_process(VERSION_CMD)
+        stdout, _ = await process.communicate()
+        assert get_waldiez_version() in stdout.decode()
+        pool.a_run.assert_not_called()
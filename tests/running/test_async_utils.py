@@ -10,6 +10,7 @@
 """Test waldiez.running.utils.*."""
 
 import asyncio
+import contextvars
 import functools
 from typing import Any
 from unittest.mock import patch
@@ -161,6 +162,18 @@ async def test_syncify_with_timeout_in_thread() -> None:
         sync_func()
 
 
+@pytest.mark.asyncio
+async def test_syncify_in_thread_keeps_context() -> None:
+    """Test the coroutine seeing the caller's context in the thread."""
+    var: contextvars.ContextVar[str] = contextvars.ContextVar("var")
+    var.set("caller")
+
+    async def get_var() -> str:
+        return var.get("unset")
+
+    assert async_utils.syncify(get_var)() == "caller"
+
+
 @pytest.mark.asyncio
 async def test_run_in_thread_base_exception() -> None:
     """Test _run_in_thread handling BaseException (like KeyboardInterrupt)."""
@@ -8,7 +8,11 @@
 # pyright: reportArgumentType=false,reportUnknownLambdaType=false, reportUnknownArgumentType=false
 """Test waldiez.running.base_runner.*."""
 
+import asyncio
+import shutil
 import textwrap
+import threading
+import time
 import uuid
 from collections.abc import Generator
 from pathlib import Path
@@ -145,6 +149,64 @@ async def test_async_run_sets_running_flag_and_returns_results(
     assert not runner.is_running()
 
 
+def test_run_async_flow_in_the_callers_thread(
+    tmp_path: Path,
+    waldiez_file: Path,
+) -> None:
+    """Test running an async flow without a portal (no running loop)."""
+    file_path = create_dummy_module(tmp_path, async_main=True)
+    runner = DummyRunner(
+        waldiez=MagicMock(is_async=True, get_flow_env_vars=lambda: {}),
+        output_path=str(file_path),
+        waldiez_file=waldiez_file,
+        uploads_root=None,
+        structured_io=False,
+    )
+    threads: list[int] = []
+
+    async def _a_run(*args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        threads.append(threading.get_ident())
+        return [{"result": "async"}]
+
+    with patch.object(runner, "a_run", side_effect=_a_run):
+        results = runner.run(output_path=str(file_path))
+    assert results == [{"result": "async"}]
+    assert threads == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_a_before_run_does_not_block_the_loop(
+    tmp_path: Path,
+    waldiez_file: Path,
+) -> None:
+    """Test exporting the flow in a worker thread."""
+    runner = DummyRunner(
+        waldiez=MagicMock(is_async=True),
+        output_path=str(tmp_path / "flow.py"),
+        waldiez_file=waldiez_file,
+        uploads_root=None,
+        structured_io=False,
+    )
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(_tick())
+    with patch.object(
+        runner, "_export_flow", side_effect=lambda *_, **__: time.sleep(0.2)
+    ):
+        temp_dir = await runner.a_before_run(
+            output_file=tmp_path / "flow.py", uploads_root=None, message=None
+        )
+    task.cancel()
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    assert ticks >= 5
+
+
 def test_run_raises_if_already_running(
     tmp_path: Path, waldiez_file: Path
 ) -> None:
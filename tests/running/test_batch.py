@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc
+"""Test waldiez.running.batch.*."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from waldiez import WaldiezRunner
+from waldiez.models import Waldiez, WaldiezFlow
+from waldiez.running.batch import (
+    BATCH_MESSAGE,
+    batch_work_dir,
+    load_batch_inputs,
+    new_flow_module,
+)
+
+INPUTS: list[str | dict[str, Any]] = [
+    "hello",
+    {"id": "second", "message": "goodbye"},
+    "again",
+]
+
+
+def _check_records(records: list[dict[str, object]], tmp_path: Path) -> None:
+    """Check the records and the results file of a batch run."""
+    assert [record["id"] for record in records] == ["0", "second", "2"]
+    assert all(record["error"] is None for record in records)
+    first_messages = [
+        record["results"][0]["messages"][0]["content"]  # type: ignore
+        for record in records
+    ]
+    assert first_messages == ["hello", "goodbye", "again"]
+    lines = (tmp_path / "results.jsonl").read_text("utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["0", "second", "2"]
+
+
+def test_load_batch_inputs(tmp_path: Path) -> None:
+    """Test loading the inputs from a JSONL file."""
+    inputs_file = tmp_path / "inputs.jsonl"
+    inputs_file.write_text(
+        '"first"\n\n{"id": "b", "message": "second"}\n', encoding="utf-8"
+    )
+    assert load_batch_inputs(inputs_file) == [
+        {"index": 0, "id": "0", "message": "first"},
+        {"index": 1, "id": "b", "message": "second"},
+    ]
+    with pytest.raises(ValueError):
+        load_batch_inputs([{"id": "no-message"}])
+
+
+def test_new_flow_module() -> None:
+    """Test replacing the initial message in a new module."""
+    code = compile(
+        f"__INITIAL_MSG__ = {BATCH_MESSAGE!r}\ndef main():\n    return []\n",
+        "flow.py",
+        "exec",
+    )
+    module = new_flow_module(code, "/tmp/flow.py", "hi")
+    assert module.__INITIAL_MSG__ == "hi"
+    assert module.__name__ == "flow"
+    other = compile("__INITIAL_MSG__ = [{'chat': 1}]\n", "flow.py", "exec")
+    with pytest.raises(ValueError):
+        new_flow_module(other, "/tmp/flow.py", "hi")
+
+
+def test_batch_work_dir(tmp_path: Path) -> None:
+    """Test each input getting its own working directory."""
+    item = load_batch_inputs(["first", "second"])[1]
+    work_dir = batch_work_dir(tmp_path, item)
+    assert work_dir == tmp_path / "batch-1"
+    assert work_dir.is_dir()
+    code = compile(
+        f"__INITIAL_MSG__ = {BATCH_MESSAGE!r}\n"
+        "SEEN = globals().get('__WORK_DIR__')\n",
+        "flow.py",
+        "exec",
+    )
+    module = new_flow_module(code, "/tmp/flow.py", "hi", str(work_dir))
+    assert module.SEEN == str(work_dir)
+
+
+def test_run_batch(
+    tmp_path: Path, waldiez_flow_no_human_input: WaldiezFlow
+) -> None:
+    """Test running a sync flow over many inputs."""
+    runner = WaldiezRunner(
+        Waldiez(flow=waldiez_flow_no_human_input),
+        output_path=tmp_path / "flow.py",
+    )
+    records = runner.run_batch(
+        INPUTS,
+        concurrency=2,
+        results_file=tmp_path / "results.jsonl",
+        skip_deps=True,
+    )
+    _check_records(records, tmp_path)
+
+
+async def test_batch_rejects_interactive_flows(
+    tmp_path: Path, waldiez_flow_no_human_input: WaldiezFlow
+) -> None:
+    """Test that a flow asking for user input cannot run in a batch."""
+    flow = waldiez_flow_no_human_input
+    flow.data.agents.userProxyAgents[0].data.human_input_mode = "ALWAYS"
+    runner = WaldiezRunner(Waldiez(flow=flow), output_path=tmp_path / "flow.py")
+    with pytest.raises(ValueError, match="not interactive"):
+        runner.run_batch(INPUTS, skip_deps=True)
+    flow.data.is_async = True
+    runner = WaldiezRunner(Waldiez(flow=flow), output_path=tmp_path / "flow.py")
+    with pytest.raises(ValueError, match="not interactive"):
+        await runner.a_run_batch(INPUTS, skip_deps=True)
+    assert not runner.is_running()
+
+
+async def test_a_run_batch(
+    tmp_path: Path, waldiez_flow_no_human_input: WaldiezFlow
+) -> None:
+    """Test running an async flow over many inputs."""
+    flow = waldiez_flow_no_human_input
+    flow.data.is_async = True
+    runner = WaldiezRunner(Waldiez(flow=flow), output_path=tmp_path / "flow.py")
+    records = await runner.a_run_batch(
+        INPUTS,
+        concurrency=2,
+        results_file=tmp_path / "results.jsonl",
+        skip_deps=True,
+    )
+    _check_records(records, tmp_path)
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc,protected-access
+# pyright: reportPrivateUsage=false
+"""Test waldiez.running.flow_cache.*."""
+
+import shutil
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from waldiez.models import Waldiez
+from waldiez.running.base_runner import WaldiezBaseRunner
+from waldiez.running.dir_utils import chdir
+from waldiez.running.flow_cache import (
+    CompiledFlow,
+    FlowCodeCache,
+    snapshot_files,
+    with_filename,
+)
+
+from ..conftest import get_runnable_flow
+
+
+class _Runner(WaldiezBaseRunner):
+    """Runner that only prepares the flow."""
+
+    def _run(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        return []
+
+    async def _a_run(self, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        return []
+
+
+def _runner(
+    tmp_path: Path, cache: FlowCodeCache, structured_io: bool = False
+) -> _Runner:
+    """Get a runner of the runnable flow."""
+    waldiez = Waldiez(flow=get_runnable_flow())
+    return _Runner(
+        waldiez=waldiez,
+        output_path=None,
+        uploads_root=None,
+        structured_io=structured_io,
+        waldiez_file=waldiez.dump(to=tmp_path / "flow.waldiez"),
+        flow_cache=cache,
+    )
+
+
+def _prepare(runner: _Runner, tmp_path: Path) -> tuple[Path, int]:
+    """Run _before_run, get the directory and the number of exports."""
+    export = runner._exporter.export
+    with patch.object(
+        runner._exporter, "export", wraps=export
+    ) as mocked_export:
+        temp_dir = runner._before_run(
+            output_file=tmp_path / "flow.py", uploads_root=None
+        )
+    return temp_dir, mocked_export.call_count
+
+
+def test_repeat_run_skips_export_and_compile(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unchanged flow is exported and compiled once."""
+    cache = FlowCodeCache()
+    first_dir, exports = _prepare(_runner(tmp_path, cache), tmp_path)
+    assert exports == 1
+    assert len(cache) == 1
+    runner = _runner(tmp_path, cache)
+    second_dir, exports = _prepare(runner, tmp_path)
+    try:
+        assert exports == 0
+        assert cache.hits == 1
+        assert (second_dir / "flow.py").read_bytes() == (
+            first_dir / "flow.py"
+        ).read_bytes()
+        monkeypatch.syspath_prepend(str(second_dir))
+        compiled: list[str] = []
+        to_code = SourceFileLoader.source_to_code
+
+        def _source_to_code(loader: Any, data: Any, path: Any) -> Any:
+            compiled.append(str(path))
+            return to_code(loader, data, path)
+
+        with (
+            chdir(to=second_dir),
+            patch.object(SourceFileLoader, "source_to_code", _source_to_code),
+        ):
+            module = runner._load_module(tmp_path / "flow.py", second_dir)
+        # only the flow's own imports (if not in __pycache__) are compiled
+        assert str(second_dir / "flow.py") not in compiled
+        assert hasattr(module, "main")
+        assert module.main.__code__.co_filename == str(second_dir / "flow.py")
+    finally:
+        shutil.rmtree(first_dir, ignore_errors=True)
+        shutil.rmtree(second_dir, ignore_errors=True)
+
+
+def test_changed_options_miss(tmp_path: Path) -> None:
+    """Test that other export options are exported again."""
+    cache = FlowCodeCache()
+    first_dir, _ = _prepare(_runner(tmp_path, cache), tmp_path)
+    second_dir, exports = _prepare(
+        _runner(tmp_path, cache, structured_io=True), tmp_path
+    )
+    shutil.rmtree(first_dir, ignore_errors=True)
+    shutil.rmtree(second_dir, ignore_errors=True)
+    assert exports == 1
+    assert len(cache) == 2
+
+
+def test_disabled_cache(tmp_path: Path) -> None:
+    """Test that a zero-sized cache keeps nothing."""
+    cache = FlowCodeCache(max_entries=0)
+    temp_dir, _ = _prepare(_runner(tmp_path, cache), tmp_path)
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    assert not cache.enabled
+    assert len(cache) == 0
+
+
+def test_snapshot_skips_path_dependent_exports(tmp_path: Path) -> None:
+    """Test that files referring to their directory are not cached."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_text("a")
+    assert snapshot_files(tmp_path) == {"sub/a.txt": b"a"}
+    (tmp_path / "b.py").write_text(f"PATH = {str(tmp_path)!r}")
+    assert snapshot_files(tmp_path) is None
+
+
+def test_lru_eviction() -> None:
+    """Test that the least recently used flow is dropped."""
+    cache = FlowCodeCache(max_entries=2)
+    code = compile("def main():\n    return 1\n", "a.py", "exec")
+    for key in ("a", "b"):
+        cache.put(key, CompiledFlow(files={}, main_file="a.py", code=code))
+    assert cache.get("a") is not None
+    cache.put("c", CompiledFlow(files={}, main_file="a.py", code=code))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert (cache.hits, cache.misses) == (2, 1)
+    renamed = with_filename(code, "b.py")
+    assert renamed.co_filename == "b.py"
+    assert all(
+        const.co_filename == "b.py"
+        for const in renamed.co_consts
+        if hasattr(const, "co_filename")
+    )
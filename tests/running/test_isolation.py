@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc,protected-access
+"""Test isolated (in-process, concurrent) runs."""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from waldiez.models import Waldiez, WaldiezFlow
+from waldiez.running.llm_cache import WALDIEZ_LLM_CACHE, WALDIEZ_LLM_CACHE_DIR
+from waldiez.running.standard_runner import WaldiezStandardRunner
+
+# set (to constants) by the exported flows themselves
+FLOW_SET_VARS = {
+    "AUTOGEN_USE_DOCKER",
+    "TOGETHER_NO_BANNER",
+    "ANONYMIZED_TELEMETRY",
+    "NEP50_DEPRECATION_WARNING",
+    "NEP50_DISABLE_WARNING",
+    "NPY_PROMOTION_STATE",
+}
+
+
+def _environ(environ: dict[str, str]) -> dict[str, str]:
+    """Get the variables that the runs should not change."""
+    return {k: v for k, v in environ.items() if k not in FLOW_SET_VARS}
+
+
+def test_isolated_runs(
+    tmp_path: Path, waldiez_flow_no_human_input: WaldiezFlow
+) -> None:
+    """Test running flows concurrently in the same process."""
+    cwd = os.getcwd()
+    sys_path = list(sys.path)
+    results: dict[int, list[dict[str, Any]]] = {}
+    errors: list[BaseException] = []
+
+    def _run(index: int) -> None:
+        runner = WaldiezStandardRunner(
+            Waldiez(flow=waldiez_flow_no_human_input),
+            output_path=tmp_path / f"run{index}" / "flow.py",
+            isolated=True,
+            skip_deps=True,
+        )
+        try:
+            results[index] = runner.run(message=f"hello {index}")
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            errors.append(exc)
+
+    environ = _environ(dict(os.environ))
+    thread_start = threading.Thread.start
+    # pooled threads, reused after the runs
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_run, range(2)))
+        after = executor.submit(lambda: _environ(dict(os.environ))).result()
+    assert not errors
+    assert after == environ
+    assert _environ(dict(os.environ)) == environ
+    assert threading.Thread.start is thread_start
+    for index in range(2):
+        messages = results[index][0]["messages"]
+        assert messages[0]["content"] == f"hello {index}"
+    assert os.getcwd() == cwd
+    assert sys.path == sys_path
+    assert not (Path(cwd) / "results.json").exists()
+
+
+def test_isolated_run_environment(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    waldiez_flow_no_human_input: WaldiezFlow,
+) -> None:
+    """Test an isolated run's flow using its own environment."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE, "1")
+    monkeypatch.delenv(WALDIEZ_LLM_CACHE_DIR, raising=False)
+    flow = waldiez_flow_no_human_input
+    flow.data.cache_seed = 42
+    runner = WaldiezStandardRunner(
+        Waldiez(flow=flow),
+        output_path=tmp_path / "run" / "flow.py",
+        isolated=True,
+        skip_deps=True,
+    )
+    llm_dir = str(tmp_path / "xdg" / "waldiez" / "llm")
+    # not at the top: other tests might reload autogen's modules
+    # pylint: disable=import-outside-toplevel
+    from autogen import Cache  # type: ignore
+
+    disk = Cache.disk
+    with patch.object(Cache, "disk", side_effect=disk) as cache_disk:
+        runner.run(message="hello")
+    # the persistent cache (not the run's .cache)
+    assert cache_disk.call_args.kwargs["cache_path_root"] == llm_dir
+    assert WALDIEZ_LLM_CACHE_DIR not in os.environ
+    assert runner._flow_env is None
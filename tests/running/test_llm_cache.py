@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc,protected-access
+# pyright: reportPrivateUsage=false,reportUnknownMemberType=false
+"""Test waldiez.running.llm_cache.*."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from autogen import Cache  # type: ignore
+
+from waldiez.exporting.flow.execution_generator import ExecutionGenerator
+from waldiez.running.llm_cache import (
+    LLM_CACHE_STATS_FILE,
+    WALDIEZ_LLM_CACHE,
+    WALDIEZ_LLM_CACHE_DIR,
+    WALDIEZ_LLM_CACHE_REDIS_URL,
+    WALDIEZ_LLM_CACHE_SIZE,
+    WALDIEZ_LLM_CACHE_TTL,
+    LLMResponseCache,
+)
+
+from .test_base_runner import DummyRunner
+
+SEED = 42
+
+
+def _flow_get_cache() -> Any:
+    """Get the generated get_cache() of a flow."""
+    namespace: dict[str, Any] = {
+        "os": os,
+        "Cache": Cache,
+        "__CACHE_SEED__": SEED,
+        "__WORK_DIR__": os.getcwd(),
+        "__ENV__": os.environ,
+    }
+    exec(  # nosec B102 # pylint: disable=exec-used
+        ExecutionGenerator.generate_get_cache(), namespace
+    )
+    return namespace["get_cache"]
+
+
+def _flow_run(cache_root: Path, key: str) -> None:
+    """Look up (and store on a miss) a response like an ag2 client."""
+    with Cache.disk(cache_seed=SEED, cache_path_root=str(cache_root)) as cache:
+        if cache.get(key, None) is None:
+            cache.set(key, {"content": key})
+
+
+@pytest.fixture(name="clean_env")
+def clean_env_fixture(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Unset the cache variables."""
+    for name in (
+        WALDIEZ_LLM_CACHE,
+        WALDIEZ_LLM_CACHE_DIR,
+        WALDIEZ_LLM_CACHE_REDIS_URL,
+        WALDIEZ_LLM_CACHE_SIZE,
+        WALDIEZ_LLM_CACHE_TTL,
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.mark.usefixtures("clean_env")
+def test_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test enabling the cache with environment variables."""
+    assert LLMResponseCache.from_env() is None
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE_DIR, str(tmp_path))
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE_SIZE, "1024")
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE_TTL, "60")
+    cache = LLMResponseCache.from_env()
+    assert cache is not None
+    assert cache.directory == tmp_path.resolve()
+    assert (cache.size_limit, cache.ttl) == (1024, 60)
+    assert cache.env_vars() == [(WALDIEZ_LLM_CACHE_DIR, str(cache.directory))]
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE, "0")
+    assert LLMResponseCache.from_env() is None
+    redis = LLMResponseCache(redis_url="redis://localhost:6379/0")
+    assert redis.env_vars() == [
+        (WALDIEZ_LLM_CACHE_REDIS_URL, "redis://localhost:6379/0")
+    ]
+
+
+@pytest.mark.usefixtures("clean_env")
+def test_flow_uses_the_configured_location(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the exported flow's cache selection."""
+    monkeypatch.chdir(tmp_path)
+    get_cache = _flow_get_cache()
+    default = get_cache()
+    assert default.config["cache_path_root"] == str(tmp_path / ".cache")
+    default.cache.close()
+    monkeypatch.setenv(WALDIEZ_LLM_CACHE_DIR, str(tmp_path / "llm"))
+    cache = get_cache()
+    assert cache.config["cache_path_root"] == str(tmp_path / "llm")
+    cache.cache.close()
+
+
+def test_stats_across_runs(tmp_path: Path) -> None:
+    """Test that repeated runs hit the persistent cache."""
+    cache = LLMResponseCache(directory=tmp_path)
+    cache.prepare(SEED)
+    _flow_run(tmp_path, "request")
+    first = cache.collect(SEED)
+    assert (first["hits"], first["misses"], first["entries"]) == (0, 1, 1)
+    cache.prepare(SEED)
+    _flow_run(tmp_path, "request")
+    second = cache.collect(SEED)
+    assert (second["hits"], second["misses"], second["entries"]) == (1, 0, 1)
+
+
+def test_ttl_expires_old_responses(tmp_path: Path) -> None:
+    """Test that responses older than the TTL are dropped."""
+    cache = LLMResponseCache(directory=tmp_path, ttl=1e-6)
+    cache.prepare(SEED)
+    _flow_run(tmp_path, "request")
+    stats = cache.collect(SEED)
+    assert stats["entries"] == 0
+
+
+def test_runner_reports_stats(tmp_path: Path) -> None:
+    """Test that a run stores the cache stats in its outputs."""
+    waldiez_file = tmp_path / "flow.waldiez"
+    waldiez_file.touch()
+    llm_cache = LLMResponseCache(directory=tmp_path / "llm")
+    runner = DummyRunner(
+        waldiez=MagicMock(is_async=False, cache_seed=SEED),
+        waldiez_file=waldiez_file,
+        output_path=None,
+        uploads_root=None,
+        structured_io=False,
+        llm_cache=llm_cache,
+    )
+    assert runner._prepare_llm_cache() == llm_cache.env_vars()
+    _flow_run(llm_cache.directory, "request")
+    runner._collect_llm_cache_stats(tmp_path)
+    stats = json.loads((tmp_path / LLM_CACHE_STATS_FILE).read_text("utf-8"))
+    assert stats["misses"] == 1
+    assert runner.llm_cache_stats == stats
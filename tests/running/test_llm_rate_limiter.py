@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=missing-param-doc,missing-return-doc,protected-access
+# pylint: disable=too-few-public-methods
+# pyright: reportPrivateUsage=false
+"""Test waldiez.running.llm_rate_limiter.*."""
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from waldiez.models import WaldiezModel
+from waldiez.running.llm_rate_limiter import (
+    LLMRateLimiter,
+    get_llm_rate_limiter,
+    get_llm_rate_limits_stats,
+    limit_llm_calls,
+)
+
+
+def test_requests_per_minute() -> None:
+    """Test waiting for the requests bucket."""
+    limiter = LLMRateLimiter("rpm", requests_per_minute=600)
+    limiter.configure(requests_per_minute=600)
+    limiter._request_allowance = 0
+    waited = limiter.acquire()
+    limiter.release()
+    assert 0.05 < waited < 1
+    stats = limiter.stats()
+    assert stats["requests"] == 1
+    assert stats["throttled"] == 1
+
+
+def test_tokens_per_minute() -> None:
+    """Test the tokens of a request delaying the next ones."""
+    limiter = LLMRateLimiter("tpm", tokens_per_minute=6000)
+    assert limiter.acquire() < 0.001
+    limiter.release(6010)
+    waited = limiter.acquire()
+    limiter.release(0)
+    assert 0.05 < waited < 1
+    assert limiter.stats()["tokens"] == 6010
+
+
+def test_max_in_flight() -> None:
+    """Test a request waiting for a running one."""
+    limiter = LLMRateLimiter("in-flight", max_in_flight=1)
+    limiter.acquire()
+    waits: list[float] = []
+    thread = threading.Thread(target=lambda: waits.append(limiter.acquire()))
+    thread.start()
+    time.sleep(0.1)
+    assert limiter.in_flight == 1
+    limiter.release()
+    thread.join(timeout=5)
+    assert waits and waits[0] >= 0.09
+    assert limiter.in_flight == 1
+
+
+def test_get_llm_rate_limiter() -> None:
+    """Test one (reconfigured) limiter per model key."""
+    limiter = get_llm_rate_limiter("registry", requests_per_minute=10)
+    same = get_llm_rate_limiter("registry", requests_per_minute=20)
+    assert same is limiter
+    assert limiter._requests_per_minute == 20
+    assert get_llm_rate_limiter("other") is not limiter
+    assert "registry" in get_llm_rate_limits_stats()
+
+
+class _Client:
+    """An LLM client."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create(self, **config: Any) -> Any:
+        self.calls += 1
+        return SimpleNamespace(
+            usage=SimpleNamespace(total_tokens=config["tokens"])
+        )
+
+
+def test_limit_llm_calls() -> None:
+    """Test limiting an agent's LLM requests."""
+    agent = SimpleNamespace(client=_Client())
+    rate_limit = {"key": "agent-calls", "max_in_flight": 2}
+    limit_llm_calls(agent, rate_limit)
+    limit_llm_calls(agent, rate_limit)
+    agent.client.create(tokens=5)
+    agent.client.create(tokens=7)
+    assert agent.client.calls == 2
+    stats = get_llm_rate_limits_stats()["agent-calls"]
+    assert stats["requests"] == 2
+    assert stats["tokens"] == 12
+    assert get_llm_rate_limiter("agent-calls").in_flight == 0
+    limit_llm_calls(SimpleNamespace(client=None), rate_limit)
+
+
+def test_model_rate_limit() -> None:
+    """Test a model's rate limit."""
+    model = WaldiezModel(
+        id="wm-1",
+        name="gpt-4.1",
+        description="model description",
+        data={  # type: ignore
+            "apiType": "openai",
+            "baseUrl": "http://localhost:8000/v1",
+            "rateLimit": {"tokensPerMinute": 1000},
+        },
+    )
+    assert model.get_rate_limit() == {
+        "key": "openai:http://localhost:8000/v1:gpt-4.1",
+        "requests_per_minute": None,
+        "tokens_per_minute": 1000,
+        "max_in_flight": None,
+    }
+    model.data.rate_limit = None
+    assert model.get_rate_limit() is None
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-function-docstring,missing-param-doc
+# pylint: disable=no-self-use,protected-access
+# flake8: noqa: D102
+"""Test waldiez.running.requirements_mixin.*."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from waldiez.models import Waldiez
+from waldiez.running import requirements_mixin
+from waldiez.running.requirements_mixin import RequirementsMixin
+from waldiez.utils.requirements import RequirementsCache
+
+
+class _Runner(RequirementsMixin):
+    """A minimal runner using the mixin."""
+
+    def __init__(self, requirements: list[str], cache_file: Path) -> None:
+        super().__init__()
+        self._waldiez = MagicMock(spec=Waldiez)
+        self._waldiez.requirements = requirements
+        self._called_install_requirements = False
+        self._requirements_cache = RequirementsCache(cache_file)
+        self.pip = MagicMock()
+        self.pip.a_pip_install = AsyncMock()
+        self._python_manager = self.pip
+        self.print = MagicMock()
+
+
+class TestRequirementsMixin:
+    """Test installing only the missing requirements."""
+
+    def test_installed_requirements(self, tmp_path: Path) -> None:
+        runner = _Runner(
+            ["packaging", "waldiez==0.1"], tmp_path / "requirements.json"
+        )
+        assert "waldiez==0.1" not in runner.flow_requirements()
+        with (
+            patch.object(requirements_mixin, "refresh_environment") as refresh,
+            patch(
+                "waldiez.utils.requirements.missing_requirements",
+                return_value=set(),
+            ) as resolve,
+        ):
+            runner.install_requirements()
+            runner._called_install_requirements = False
+            runner.install_requirements()
+        runner.pip.pip_install.assert_not_called()
+        # the second time, the recorded fingerprint is used
+        resolve.assert_called_once()
+        assert refresh.call_args_list[-1].kwargs == {"reload": False}
+
+    async def test_missing_requirements(self, tmp_path: Path) -> None:
+        runner = _Runner(
+            ["packaging", "surely-not-installed-package"],
+            tmp_path / "requirements.json",
+        )
+        with patch.object(requirements_mixin, "refresh_environment") as refresh:
+            await runner.a_install_requirements()
+        runner.pip.a_pip_install.assert_awaited_once()
+        installed = runner.pip.a_pip_install.call_args.args[0]
+        assert installed == {"surely-not-installed-package"}
+        refresh.assert_called_once_with(reload=True)
+        assert not runner._requirements_cache.cache_file.exists()
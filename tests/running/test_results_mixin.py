@@ -18,6 +18,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from waldiez.running.results_mixin import ResultsMixin, WaldiezRunResults
+from waldiez.storage import StorageManager
 
 
 class TestResultsMixin:
@@ -461,25 +462,33 @@ class TestAsyncMethods:
 
     async def test_a_post_run(self, tmp_path: Path) -> None:
         """Test async post_run."""
-        with patch(
-            "waldiez.running.results_mixin.anyio.to_thread.run_sync"
-        ) as mock_run_sync:
-            mock_run_sync.return_value = tmp_path / "result"
-
-            waldiez_file = tmp_path / "test.waldiez"
-            waldiez_file.touch()
+        storage_manager = StorageManager(workspace_dir=tmp_path / "workspace")
+        temp_dir = tmp_path / "tmp"
+        temp_dir.mkdir()
+        (temp_dir / "output.txt").write_text("output")
+        waldiez_file = tmp_path / "test.waldiez"
+        waldiez_file.write_text("{}")
 
+        with patch.object(
+            storage_manager, "a_finalize", wraps=storage_manager.a_finalize
+        ) as a_finalize:
             result = await ResultsMixin.a_post_run(
-                results=[],
+                results=[{"result": "data"}],
                 error=None,
-                temp_dir=tmp_path,
-                output_file=None,
+                temp_dir=temp_dir,
+                output_file=tmp_path / "test.py",
                 flow_name="test",
                 waldiez_file=waldiez_file,
+                storage_manager=storage_manager,
             )
-
-            assert result == tmp_path / "result"
-            mock_run_sync.assert_called_once()
+        storage_manager.close()
+
+        assert result is not None
+        assert (result / "output.txt").read_text() == "output"
+        assert (result / "results.json").is_file()
+        assert (result / "test.waldiez").is_file()
+        assert not temp_dir.exists()
+        a_finalize.assert_awaited_once()
 
 
 class TestEdgeCases:
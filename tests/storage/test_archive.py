@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use
+
+"""Tests for packing old checkpoints into a session archive."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from typer.testing import CliRunner
+
+from waldiez.storage import FilesystemStorage, StorageManager
+from waldiez.storage.archive import ARCHIVE_DIR, CheckpointArchive
+from waldiez.storage.cli import app
+from waldiez.storage.history import WaldiezHistoryLog
+
+_BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(number: int) -> dict[str, Any]:
+    return {"state": {"messages": [{"content": f"msg {number}"}]}}
+
+
+def _populate(storage: FilesystemStorage, count: int = 5) -> list[Path]:
+    paths: list[Path] = []
+    for number in range(count):
+        path = storage.save_checkpoint(
+            "session",
+            {"messages": [{"content": f"state {number}"}]},
+            metadata={"number": number},
+            timestamp=_BASE + timedelta(minutes=number),
+        )
+        (path / "logs").mkdir()
+        (path / "logs" / "events.csv").write_text("a,b\n" * 100)
+        log = WaldiezHistoryLog(path)
+        log.append(_entry(number))
+        log.append(_entry(number + 100))
+        paths.append(path)
+    return paths
+
+
+class TestCheckpointArchive:
+    """Tests for CheckpointArchive."""
+
+    def test_pack_read_and_extract(self, tmp_path: Path) -> None:
+        """Test packing directories and reading them back."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage, 3)
+        session_dir = paths[0].parent
+        archive = CheckpointArchive(session_dir)
+        assert not archive.exists()
+        assert archive.names() == []
+
+        packed = archive.pack(paths[:2])
+        assert packed == paths[:2]
+        assert archive.path == session_dir / ARCHIVE_DIR
+        assert (archive.path / f"{paths[0].name}.zip").is_file()
+        assert not paths[0].exists()
+        assert archive.names() == sorted(p.name for p in paths[:2])
+        assert paths[0].name in archive
+        assert paths[2].name not in archive
+        assert archive.read_json(paths[1].name, "metadata.json") == {
+            "number": 1
+        }
+        assert archive.read(paths[1].name, "missing.json") is None
+        assert archive.history(paths[0].name) == [_entry(0), _entry(100)]
+
+        # packing the same checkpoint again is a no-op
+        paths[2].mkdir(exist_ok=True)
+        assert archive.pack([paths[2]]) == [paths[2]]
+        assert len(archive.names()) == 3
+
+        extracted = archive.extract(paths[0].name)
+        assert extracted == paths[0]
+        assert (paths[0] / "logs" / "events.csv").is_file()
+        assert archive.extract("missing") is None
+
+        assert archive.remove([p.name for p in paths]) == 3
+        assert not archive.exists()
+        assert archive.remove([paths[0].name]) == 0
+
+    def test_concurrent_changes_keep_checkpoints(self, tmp_path: Path) -> None:
+        """Test that concurrent packs and removes do not lose checkpoints."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage, 8)
+        session_dir = paths[0].parent
+        archive = CheckpointArchive(session_dir)
+        archive.pack(paths[:2])
+
+        def _change(index: int) -> None:
+            other = CheckpointArchive(session_dir)
+            if index < 2:
+                other.remove([paths[index].name])
+            else:
+                other.pack([paths[index]])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_change, range(8)))
+
+        assert archive.names() == sorted(p.name for p in paths[2:])
+        for path in paths[2:]:
+            assert not path.exists()
+            assert archive.history(path.name)
+            assert archive.read(path.name, "logs/events.csv") == (
+                b"a,b\n" * 100
+            )
+
+
+class TestStoragePacking:
+    """Tests for the storage's packed checkpoints."""
+
+    def test_pack_keeps_latest_loose(self, tmp_path: Path) -> None:
+        """Test that only the older checkpoints get packed."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage)
+
+        assert storage.pack_checkpoints("session", keep_count=2) == 3
+        assert [p.is_dir() for p in paths] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+        ]
+        assert storage.pack_checkpoints("session", keep_count=2) == 0
+
+        listed = storage.list_checkpoints("session")
+        assert [info.path for info in listed] == paths[::-1]
+        assert storage.catalog.count("session") == 5
+
+    def test_packed_checkpoints_are_readable(self, tmp_path: Path) -> None:
+        """Test lazily reading a packed checkpoint's data."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage)
+        storage.pack_checkpoints("session", keep_count=1)
+
+        info = storage.get_checkpoint("session", _BASE)
+        assert info is not None
+        checkpoint = info.checkpoint
+        assert checkpoint.packed
+        assert checkpoint.exists
+        assert checkpoint.state == {"messages": [{"content": "state 0"}]}
+        assert checkpoint.metadata == {"number": 0}
+        assert checkpoint.history() == [_entry(0), _entry(100)]
+        assert not paths[0].exists()
+
+        manager = StorageManager(storage=storage)
+        history = manager.history("session")
+        assert len(history) == 5
+
+    def test_load_with_history_index_unpacks(self, tmp_path: Path) -> None:
+        """Test that restoring a history state extracts the checkpoint."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage)
+        storage.pack_checkpoints("session", keep_count=1)
+
+        info = storage.get_checkpoint("session", _BASE + timedelta(minutes=1))
+        assert info is not None
+        checkpoint = storage.load_checkpoint(info, history_index=1)
+        assert paths[1].is_dir()
+        assert not checkpoint.packed
+        assert checkpoint.state == _entry(101)["state"]
+        assert paths[1].name not in CheckpointArchive(paths[1].parent)
+        assert (paths[1] / "logs" / "events.csv").is_file()
+
+    def test_update_packed_checkpoint(self, tmp_path: Path) -> None:
+        """Test saving over a packed checkpoint keeps its files."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage)
+        storage.pack_checkpoints("session", keep_count=1)
+
+        storage.save_checkpoint("session", {"updated": True}, timestamp=_BASE)
+        assert (paths[0] / "logs" / "events.csv").is_file()
+        assert len(WaldiezHistoryLog(paths[0])) == 2
+        assert len(storage.list_checkpoints("session")) == 5
+
+    def test_delete_packed_checkpoints(self, tmp_path: Path) -> None:
+        """Test deleting packed checkpoints."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        _populate(storage)
+        storage.pack_checkpoints("session", keep_count=1)
+
+        storage.delete_checkpoint("session", _BASE)
+        assert storage.catalog.count("session") == 4
+        deleted = storage.delete_checkpoints_batch(
+            [
+                ("session", _BASE + timedelta(minutes=1)),
+                ("session", _BASE + timedelta(minutes=4)),
+            ]
+        )
+        assert deleted == 2
+        listed = storage.list_checkpoints("session")
+        assert [info.timestamp.minute for info in listed] == [3, 2]
+        assert storage.cleanup_old_checkpoints("session", keep_count=1) == 1
+        assert len(storage.list_checkpoints("session")) == 1
+
+    def test_link_packed_checkpoint(self, tmp_path: Path) -> None:
+        """Test linking to a packed checkpoint extracts it."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        paths = _populate(storage)
+        storage.pack_checkpoints("session", keep_count=1)
+
+        storage.link_checkpoint(tmp_path / "out", "session", _BASE)
+        link = tmp_path / "out" / paths[0].name
+        assert link.is_symlink()
+        assert (link / "state.json").is_file()
+        # linked checkpoints are not packed again
+        assert storage.pack_checkpoints("session", keep_count=1) == 0
+
+    def test_cli_pack(self, tmp_path: Path) -> None:
+        """Test the --pack option of the CLI."""
+        workspace = tmp_path / "workspace"
+        storage = FilesystemStorage(workspace)
+        paths = _populate(storage)
+        result = CliRunner().invoke(
+            app,
+            ["checkpoints", "--workspace", str(workspace), "--pack"],
+        )
+        assert result.exit_code == 0
+        assert all(path.is_dir() for path in paths)
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "checkpoints",
+                "--workspace",
+                str(workspace),
+                "--pack",
+                "--session",
+                "session",
+                "--keep",
+                "3",
+            ],
+        )
+        assert result.exit_code == 0
+        assert [path.is_dir() for path in paths] == [
+            False,
+            False,
+            True,
+            True,
+            True,
+        ]
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use
+
+"""Tests for the content-addressed artifact store."""
+
+import shutil
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from waldiez.storage import (
+    BlobStore,
+    CheckpointArchive,
+    FilesystemStorage,
+    StorageManager,
+)
+from waldiez.storage.blob_store import MANIFEST_FILE, REFS_DIR
+
+
+def _clone(src: Path, dst: Path) -> bool:
+    # a copy stands in for a copy-on-write clone
+    shutil.copy2(src, dst)
+    return True
+
+
+@pytest.fixture(name="cow_filesystem")
+def cow_filesystem_fixture() -> Iterator[None]:
+    """Act as if the filesystem supports copy-on-write clones."""
+    with patch("waldiez.storage.blob_store.reflink", side_effect=_clone):
+        yield
+
+
+def _make_run(tmp_path: Path, name: str) -> Path:
+    run_dir = tmp_path / name
+    (run_dir / "logs").mkdir(parents=True)
+    (run_dir / "flow.waldiez").write_text('{"flow": true}')
+    (run_dir / "tree_of_thoughts.png").write_bytes(b"image")
+    (run_dir / "logs" / "events.csv").write_text("a,b\n1,2\n")
+    (run_dir / "flow.db").write_bytes(b"sqlite")
+    (run_dir / "results.json").write_text(f'{{"run": "{name}"}}')
+    return run_dir
+
+
+class TestBlobStore:
+    """Tests for BlobStore."""
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_put_dedupes_identical_files(self, tmp_path: Path) -> None:
+        """Test that identical files end up sharing one blob."""
+        store = BlobStore(tmp_path / ".blobs")
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("same content")
+        second.write_text("same content")
+
+        digest = store.put(first, tmp_path / "refs1")
+        assert digest
+        assert store.put(second, tmp_path / "refs2") == digest
+        blob = store.blob_path(digest)
+        assert blob.read_text() == "same content"
+        # the files are clones, not links of the blob
+        assert not blob.samefile(first)
+        assert not blob.samefile(second)
+        assert blob.samefile(tmp_path / "refs1" / digest)
+        assert blob.stat().st_nlink == 3
+        # storing it again is a no-op
+        assert store.put(second, tmp_path / "refs2") == digest
+        assert blob.stat().st_nlink == 3
+        assert not list(store.root.glob(".*.tmp"))
+
+    def test_put_without_clones(self, tmp_path: Path) -> None:
+        """Test that nothing is shared if files cannot be cloned."""
+        store = BlobStore(tmp_path / ".blobs")
+        checkpoint = _make_run(tmp_path, "checkpoint")
+        with patch("waldiez.storage.blob_store.reflink", return_value=False):
+            assert store.put(checkpoint / "flow.db", tmp_path / "refs") is None
+            assert not store.intern_tree(checkpoint)
+        assert not (checkpoint / MANIFEST_FILE).exists()
+        assert not (checkpoint / REFS_DIR).exists()
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_intern_tree_and_materialize(self, tmp_path: Path) -> None:
+        """Test the checkpoint manifest and restoring artifacts."""
+        store = BlobStore(tmp_path / ".blobs")
+        checkpoint = _make_run(tmp_path, "checkpoint")
+        (checkpoint / "state.json").write_text("{}")
+
+        manifest = store.intern_tree(checkpoint)
+
+        # found by their content, whatever their kind
+        assert set(manifest) == {
+            "flow.waldiez",
+            "tree_of_thoughts.png",
+            "logs/events.csv",
+            "flow.db",
+            "results.json",
+            "state.json",
+        }
+        assert BlobStore.load_manifest(checkpoint) == manifest
+        assert (checkpoint / MANIFEST_FILE).is_file()
+        assert {path.name for path in (checkpoint / REFS_DIR).iterdir()} == (
+            set(manifest.values())
+        )
+        # interning again does not store the references
+        assert store.intern_tree(checkpoint) == manifest
+
+        (checkpoint / "tree_of_thoughts.png").unlink()
+        assert store.materialize(manifest, checkpoint) == 1
+        restored = checkpoint / "tree_of_thoughts.png"
+        assert restored.read_bytes() == b"image"
+        blob = store.blob_path(manifest["tree_of_thoughts.png"])
+        assert not restored.samefile(blob)
+        assert store.materialize(manifest, checkpoint) == 0
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_release_and_gc(self, tmp_path: Path) -> None:
+        """Test removing blobs that are no longer referenced."""
+        store = BlobStore(tmp_path / ".blobs")
+        first = tmp_path / "first.txt"
+        second = tmp_path / "second.txt"
+        first.write_text("shared")
+        second.write_text("shared")
+        digest = store.put(first, tmp_path / "refs1")
+        assert digest
+        store.put(second, tmp_path / "refs2")
+
+        shutil.rmtree(tmp_path / "refs1")
+        assert store.release([digest]) == 0
+        shutil.rmtree(tmp_path / "refs2")
+        assert store.release([digest]) == 1
+        assert not store.blob_path(digest).exists()
+
+        third = tmp_path / "third.txt"
+        third.write_text("orphan")
+        assert store.put(third, tmp_path / "refs3")
+        shutil.rmtree(tmp_path / "refs3")
+        assert store.gc() == 1
+        assert store.gc() == 0
+
+    def test_load_manifest_invalid(self, tmp_path: Path) -> None:
+        """Test loading a missing or invalid manifest."""
+        assert not BlobStore.load_manifest(tmp_path)
+        (tmp_path / MANIFEST_FILE).write_text("[1, 2]")
+        assert not BlobStore.load_manifest(tmp_path)
+        (tmp_path / MANIFEST_FILE).write_text("invalid")
+        assert not BlobStore.load_manifest(tmp_path)
+
+
+class TestStorageWithBlobStore:
+    """Tests for the blob store integration in the storage."""
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_finalize_dedupes_across_checkpoints(self, tmp_path: Path) -> None:
+        """Test that identical artifacts of two runs share their data."""
+        manager = StorageManager(
+            workspace_dir=tmp_path / "workspace", blob_store=True
+        )
+        output_file = tmp_path / "flow.py"
+        now = datetime.now(timezone.utc)
+        first, _ = manager.finalize(
+            "session",
+            output_file=output_file,
+            tmp_dir=_make_run(tmp_path, "run1"),
+            timestamp=now - timedelta(seconds=1),
+            link_root=tmp_path / "out",
+        )
+        second, _ = manager.finalize(
+            "session",
+            output_file=output_file,
+            tmp_dir=_make_run(tmp_path, "run2"),
+            timestamp=now,
+            link_root=tmp_path / "out",
+        )
+
+        first_manifest = BlobStore.load_manifest(first)
+        second_manifest = BlobStore.load_manifest(second)
+        for name in ("flow.waldiez", "flow.db", "logs/events.csv"):
+            assert first_manifest[name] == second_manifest[name]
+        assert first_manifest["results.json"] != second_manifest["results.json"]
+        store = manager.storage.blob_store  # type: ignore[attr-defined]
+        digest = first_manifest["flow.db"]
+        blob = store.blob_path(digest)
+        assert blob.stat().st_nlink == 3
+        # writing in place does not change the blob or the other checkpoint
+        with open(first / "flow.db", "ab") as f:
+            f.write(b" changed")
+        assert (second / "flow.db").read_bytes() == b"sqlite"
+        assert blob.read_bytes() == b"sqlite"
+        assert manager.sessions() == ["session"]
+
+        manager.delete("session", now - timedelta(seconds=1))
+        assert blob.stat().st_nlink == 2
+        assert (second / "flow.db").read_bytes() == b"sqlite"
+
+        manager.delete_session("session")
+        assert not blob.exists()
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_pack_releases_blobs(self, tmp_path: Path) -> None:
+        """Test that packed checkpoints do not keep their blobs."""
+        storage = FilesystemStorage(tmp_path / "workspace", blob_store=True)
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        paths = [
+            storage.save_checkpoint(
+                "session", {}, timestamp=base + timedelta(minutes=minute)
+            )
+            for minute in range(2)
+        ]
+        for path in paths:
+            (path / "flow.db").write_bytes(b"sqlite")
+            assert storage.intern_checkpoint(path) == 2
+        blob = storage.blob_store.blob_path(
+            BlobStore.load_manifest(paths[0])["flow.db"]
+        )
+
+        assert storage.pack_checkpoints("session", keep_count=1) == 1
+        assert blob.stat().st_nlink == 2
+        archive = CheckpointArchive(paths[0].parent)
+        assert archive.read(paths[0].name, "flow.db") == b"sqlite"
+        assert archive.read(paths[0].name, MANIFEST_FILE) is None
+        assert archive.extract(paths[0].name) == paths[0]
+        assert not (paths[0] / REFS_DIR).exists()
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test that artifacts are not interned unless enabled."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        checkpoint = _make_run(tmp_path, "checkpoint")
+        assert storage.intern_checkpoint(checkpoint) == 0
+        assert not (checkpoint / MANIFEST_FILE).exists()
+
+    @pytest.mark.usefixtures("cow_filesystem")
+    def test_enabled_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test enabling the blob store with WALDIEZ_BLOB_STORE."""
+        monkeypatch.setenv("WALDIEZ_BLOB_STORE", "true")
+        storage = FilesystemStorage(tmp_path / "workspace")
+        checkpoint = _make_run(tmp_path, "checkpoint")
+        assert storage.intern_checkpoint(checkpoint) == 5
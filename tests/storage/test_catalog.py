@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use,protected-access
+
+"""Tests for the checkpoint catalog."""
+
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from waldiez.storage import FilesystemStorage
+from waldiez.storage.catalog import CATALOG_FILE, CheckpointCatalog
+from waldiez.storage.checkpoint import WaldiezCheckpoint
+from waldiez.storage.cli import app
+
+_BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _age(path: Path) -> None:
+    """Move a directory's mtime out of the racy window."""
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def _populate(storage: FilesystemStorage) -> None:
+    for number in range(5):
+        storage.save_checkpoint(
+            "first", {"n": number}, timestamp=_BASE + timedelta(minutes=number)
+        )
+    for number in range(3):
+        storage.save_checkpoint(
+            "second",
+            {"n": number},
+            timestamp=_BASE + timedelta(minutes=number, seconds=30),
+        )
+
+
+class TestCheckpointCatalog:
+    """Tests for the catalog's listing."""
+
+    def test_catalog_file(self, tmp_path: Path) -> None:
+        """Test the catalog is a hidden file in the workspace."""
+        storage = FilesystemStorage(tmp_path)
+        assert storage.catalog.db_path == tmp_path.resolve() / CATALOG_FILE
+        _populate(storage)
+        assert storage.list_sessions() == ["second", "first"]
+
+    def test_sorted_and_paginated(self, tmp_path: Path) -> None:
+        """Test sorting and paginating over all the sessions."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+
+        listed = storage.list_checkpoints()
+        assert len(listed) == 8
+        timestamps = [info.timestamp for info in listed]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+        page = storage.list_checkpoints(limit=3, offset=2)
+        assert [info.timestamp for info in page] == timestamps[2:5]
+
+        oldest = storage.list_checkpoints(order="asc", limit=2)
+        assert [info.timestamp for info in oldest] == [
+            _BASE,
+            _BASE + timedelta(seconds=30),
+        ]
+
+    def test_filtered(self, tmp_path: Path) -> None:
+        """Test filtering by session and time range."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+
+        first = storage.list_checkpoints("first")
+        assert len(first) == 5
+        assert all(info.session_name == "first" for info in first)
+        assert first[0].timestamp == _BASE + timedelta(minutes=4)
+
+        ranged = storage.list_checkpoints(
+            since=_BASE + timedelta(minutes=1),
+            until=_BASE + timedelta(minutes=2),
+        )
+        assert [
+            (info.session_name, info.timestamp.minute, info.timestamp.second)
+            for info in ranged
+        ] == [
+            ("first", 2, 0),
+            ("second", 1, 30),
+            ("first", 1, 0),
+        ]
+        assert (
+            storage.catalog.count("first", since=_BASE + timedelta(minutes=3))
+            == 2
+        )
+
+    def test_tracks_deletes(self, tmp_path: Path) -> None:
+        """Test that deleting checkpoints and sessions updates the catalog."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+
+        storage.delete_checkpoint("first", _BASE)
+        assert storage.catalog.count("first") == 4
+        deleted = storage.delete_checkpoints_batch(
+            [
+                ("first", _BASE + timedelta(minutes=1)),
+                ("second", _BASE + timedelta(seconds=30)),
+            ]
+        )
+        assert deleted == 2
+        assert storage.catalog.count() == 5
+        storage.delete_session("second")
+        assert storage.catalog.count() == 3
+        assert storage.catalog.count("second") == 0
+        assert len(storage.list_checkpoints()) == 3
+
+    def test_unchanged_sessions_are_not_scanned(self, tmp_path: Path) -> None:
+        """Test that listing does not scan sessions that did not change."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+        for name in ("first", "second"):
+            _age(tmp_path / name)
+        assert len(storage.list_checkpoints()) == 8
+
+        with patch.object(
+            storage, "_find_checkpoints", wraps=storage._find_checkpoints
+        ) as find:
+            assert len(storage.list_checkpoints()) == 8
+            assert len(storage.list_checkpoints("first")) == 5
+            find.assert_not_called()
+
+    def test_external_changes_are_indexed(self, tmp_path: Path) -> None:
+        """Test that checkpoints added or removed manually are noticed."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+        _age(tmp_path / "first")
+        assert len(storage.list_checkpoints("first")) == 5
+
+        shutil.rmtree(
+            tmp_path / "first" / WaldiezCheckpoint.format_timestamp(_BASE)
+        )
+        manual = tmp_path / "third" / "1761725646601"
+        manual.mkdir(parents=True)
+        (manual / "state.json").write_text("{}")
+
+        listed = storage.list_checkpoints()
+        assert len(listed) == 8
+        assert {info.session_name for info in listed} == {
+            "first",
+            "second",
+            "third",
+        }
+        shutil.rmtree(tmp_path / "third")
+        assert len(storage.list_checkpoints()) == 7
+
+    def test_reindex(self, tmp_path: Path) -> None:
+        """Test rebuilding the catalog from disk."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+        storage.catalog.clear()
+        assert storage.catalog.count() == 0
+        assert storage.reindex() == 8
+        # a new instance reuses the existing catalog
+        other = CheckpointCatalog(tmp_path / CATALOG_FILE)
+        assert other.count() == 8
+
+    def test_cli_reindex_and_paging(self, tmp_path: Path) -> None:
+        """Test the --reindex and paging options of the CLI."""
+        storage = FilesystemStorage(tmp_path)
+        _populate(storage)
+        runner = CliRunner()
+
+        result = runner.invoke(
+            app, ["checkpoints", "--workspace", str(tmp_path), "--reindex"]
+        )
+        assert result.exit_code == 0
+        assert "Indexed 8 checkpoints." in result.stdout
+
+        result = runner.invoke(
+            app,
+            [
+                "checkpoints",
+                "--workspace",
+                str(tmp_path),
+                "--list",
+                "--session",
+                "first",
+                "--oldest-first",
+                "--limit",
+                "1",
+            ],
+        )
+        assert result.exit_code == 0
+        assert WaldiezCheckpoint.format_timestamp(_BASE) in result.stdout
+        assert result.stdout.count("'session':") == 1
@@ -137,8 +137,10 @@ class TestFilesystemStorage:
         assert link_path.resolve() == checkpoint_path
 
         # Verify link is registered (external link)
-        assert str(checkpoint_path) in storage._links_registry
-        assert str(link_path) in storage._links_registry[str(checkpoint_path)]
+        assert str(checkpoint_path) in storage.links_registry
+        assert str(link_path) in storage.links_registry.links(
+            str(checkpoint_path)
+        )
 
     def test_link_checkpoint_internal(self, storage: FilesystemStorage) -> None:
         """Test creating an internal symlink (not registered)."""
@@ -154,7 +156,7 @@ class TestFilesystemStorage:
         # Verify link was created but not registered
         link_path = link_dir / checkpoint_path.name
         assert link_path.is_symlink()
-        assert str(checkpoint_path) not in storage._links_registry
+        assert str(checkpoint_path) not in storage.links_registry
 
     def test_list_checkpoints_single_session(
         self, storage: FilesystemStorage
@@ -321,7 +323,7 @@ class TestFilesystemStorage:
         # Create a broken link manually
         broken_link = link_dir / "broken"
         broken_link.symlink_to(tmp_path / "non_existent")
-        storage._links_registry[str(checkpoint_path)].append(str(broken_link))
+        storage.links_registry.register(str(checkpoint_path), str(broken_link))
 
         # Now there should be issues
         issues = storage.verify_links()
@@ -357,7 +359,7 @@ class TestFilesystemStorage:
         storage.save_checkpoint("test_session", {"data": "initial"})
 
         # Get initial registry state
-        initial_registry = storage._links_registry.copy()
+        initial_registry = storage.links_registry.as_dict()
 
         # Try transaction that fails
         with pytest.raises(ValueError):
@@ -368,7 +370,7 @@ class TestFilesystemStorage:
                 raise ValueError("Test error")
 
         # Verify registry was rolled back
-        assert storage._links_registry == initial_registry
+        assert storage.links_registry.as_dict() == initial_registry
 
     def test_thread_safety(
         self, storage: FilesystemStorage, tmp_path: Path
@@ -403,15 +405,17 @@ class TestFilesystemStorage:
         self, storage: FilesystemStorage
     ) -> None:
         """Test handling of corrupted registry file."""
-        # Write corrupted registry
-        storage._links_registry_file.write_text("invalid json{")
+        # Write corrupted (legacy) registry
+        registry_file = storage.workspace_dir / ".links_registry.json"
+        registry_file.write_text("invalid json{")
 
-        # Load should handle corruption
-        storage._load_links_registry()
-        assert storage._links_registry == {}
+        # Migrating should handle corruption
+        assert storage.links_registry.migrate(registry_file) == 0
+        assert storage.links_registry.as_dict() == {}
+        assert not registry_file.exists()
 
         # Verify backup was created
-        backup = storage._links_registry_file.with_suffix(".corrupted")
+        backup = registry_file.with_suffix(".corrupted")
         assert backup.exists()
 
     def test_session_directory_structure(
@@ -444,8 +448,8 @@ class TestFilesystemStorage:
         storage2 = FilesystemStorage(workspace)
 
         # Registry should be loaded
-        assert str(checkpoint_path) in storage2._links_registry
-        assert len(storage2._links_registry[str(checkpoint_path)]) == 1
+        assert str(checkpoint_path) in storage2.links_registry
+        assert len(storage2.links_registry.links(str(checkpoint_path))) == 1
 
     def test_delete_session_removes_all_checkpoints_and_links(
         self, storage: FilesystemStorage, tmp_path: Path
@@ -489,7 +493,7 @@ class TestFilesystemStorage:
         assert any(
             session_dir in Path(k).parents
             or Path(k).is_relative_to(session_dir)
-            for k in storage._links_registry.keys()
+            for k in storage.links_registry.as_dict()
         )
 
         # Delete the whole session
@@ -509,7 +513,7 @@ class TestFilesystemStorage:
                 and Path(k).relative_to(storage.workspace_dir).parts[:1]
                 == ("to_delete",)
             )
-            for k in storage._links_registry.keys()
+            for k in storage.links_registry.as_dict()
         )
 
     def test_delete_session_nonexistent_noop(
@@ -550,13 +554,13 @@ class TestFilesystemStorage:
         # 'keep_session' intact
         assert "keep_session" in storage.list_sessions()
         assert keep_link.exists() and keep_link.is_symlink()
-        assert str(cp_keep) in storage._links_registry
+        assert str(cp_keep) in storage.links_registry
 
         # 'del_session' gone and its link removed
         assert "del_session" not in storage.list_sessions()
         assert not del_link.exists()
         assert all(
-            "del_session" not in k for k in storage._links_registry.keys()
+            "del_session" not in k for k in storage.links_registry.as_dict()
         )
 
     def test_delete_session_cleans_registry_garbage(
@@ -571,8 +575,7 @@ class TestFilesystemStorage:
         # Manually inject garbage registry entries pointing under the session
         fake_cp_dir = session_dir / "1900-01-01T00-00-00Z"
         fake_link = storage.workspace_dir.parent / "outside" / "fake_link"
-        storage._links_registry[str(fake_cp_dir)] = [str(fake_link)]
-        storage._save_links_registry()
+        storage.links_registry.register(str(fake_cp_dir), str(fake_link))
 
         # Delete the session
         storage.delete_session("garbage_session")
@@ -580,7 +583,7 @@ class TestFilesystemStorage:
         # Session gone and registry entries purged
         assert not session_dir.exists()
         assert all(
-            "garbage_session" not in k for k in storage._links_registry.keys()
+            "garbage_session" not in k for k in storage.links_registry.as_dict()
         )
 
     def test_delete_session_updates_list_sessions(
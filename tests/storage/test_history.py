@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use
+
+"""Tests for the append-only checkpoint history log."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from waldiez.storage.checkpoint import WaldiezCheckpoint
+from waldiez.storage.history import (
+    WaldiezHistoryLog,
+    entry_digest,
+    get_history_log,
+    strip_trailing_tool_calls,
+)
+
+
+def _entry(number: int) -> dict[str, Any]:
+    return {
+        "state": {"messages": [{"content": f"msg {number}"}]},
+        "metadata": {"type": "group"},
+    }
+
+
+class TestWaldiezHistoryLog:
+    """Tests for WaldiezHistoryLog."""
+
+    def test_append_and_get(self, tmp_path: Path) -> None:
+        """Test appending entries and random access by index."""
+        log = WaldiezHistoryLog(tmp_path)
+        assert not log.exists()
+        assert len(log) == 0
+        assert log.get(0) is None
+
+        for number in range(5):
+            assert log.append(_entry(number)) == number
+
+        assert log.exists()
+        assert len(log) == 5
+        assert log.get(0) == _entry(0)
+        assert log.get(3) == _entry(3)
+        assert log.get(-1) == _entry(4)
+        assert log.get(5) is None
+        assert log.entries() == [_entry(n) for n in range(5)]
+
+    async def test_a_append(self, tmp_path: Path) -> None:
+        """Test appending entries asynchronously."""
+        log = WaldiezHistoryLog(tmp_path)
+        assert await log.a_append(_entry(0)) == 0
+        assert await log.a_append(_entry(1)) == 1
+        assert log.entries() == [_entry(0), _entry(1)]
+
+    def test_append_does_not_rewrite(self, tmp_path: Path) -> None:
+        """Test that appending keeps the existing bytes untouched."""
+        log = WaldiezHistoryLog(tmp_path)
+        log.append(_entry(0))
+        before = log.log_file.read_bytes()
+        log.append(_entry(1))
+        assert log.log_file.read_bytes().startswith(before)
+
+    def test_strips_trailing_tool_calls(self, tmp_path: Path) -> None:
+        """Test that trailing tool calls are dropped on append."""
+        entry = {
+            "state": {
+                "messages": [
+                    {"content": "hi"},
+                    {"tool_calls": [{"id": "1"}]},
+                    {"tool_calls": [{"id": "2"}]},
+                ]
+            }
+        }
+        log = WaldiezHistoryLog(tmp_path)
+        log.append(entry)
+        stored = log.get(0)
+        assert stored == {"state": {"messages": [{"content": "hi"}]}}
+        # the caller's entry is not mutated
+        assert len(entry["state"]["messages"]) == 3
+        assert strip_trailing_tool_calls({"state": None}) == {"state": None}
+
+    def test_duplicates_are_rejected(self, tmp_path: Path) -> None:
+        """Test that an identical entry is rejected on append."""
+        log = WaldiezHistoryLog(tmp_path)
+        assert log.append({**_entry(0), "timestamp": "1"}) == 0
+        assert log.append({**_entry(0), "timestamp": "2"}) is None
+        assert log.append(_entry(1)) == 1
+        # a fresh instance reads the known digests from the index
+        other = WaldiezHistoryLog(tmp_path)
+        assert other.append(_entry(1)) is None
+        assert other.append(_entry(0)) is None
+        assert len(other) == 2
+        # and an instance that already tracked them sees new records
+        assert log.append(_entry(2)) == 2
+        assert other.append(_entry(2)) is None
+
+    async def test_a_append_rejects_duplicates(self, tmp_path: Path) -> None:
+        """Test that an identical entry is rejected on async append."""
+        log = get_history_log(tmp_path)
+        assert get_history_log(tmp_path) is log
+        assert await log.a_append(_entry(0)) == 0
+        assert await log.a_append(_entry(0)) is None
+        assert len(log) == 1
+
+    def test_entry_digest(self) -> None:
+        """Test the digest only depends on the state and metadata."""
+        first = {"timestamp": "1", "state": {"a": 1, "b": 2}}
+        second = {"timestamp": "2", "state": {"b": 2, "a": 1}}
+        assert entry_digest(first) == entry_digest(second)
+        assert entry_digest(first) != entry_digest(_entry(0))
+
+    def test_missing_index_is_rebuilt(self, tmp_path: Path) -> None:
+        """Test rebuilding the offset index from the segment."""
+        log = WaldiezHistoryLog(tmp_path)
+        log.append(_entry(0))
+        log.append(_entry(1))
+        log.index_file.unlink()
+        assert len(log) == 2
+        assert log.get(1) == _entry(1)
+
+    def test_interrupted_append(self, tmp_path: Path) -> None:
+        """Test that torn writes are ignored and dropped on compaction."""
+        log = WaldiezHistoryLog(tmp_path)
+        log.append(_entry(0))
+        with open(log.log_file, "ab") as f:
+            f.write(b'{"state": {"messa')
+        with open(log.index_file, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        assert len(log) == 1
+        assert log.entries() == [_entry(0)]
+        assert log.compact() == 0
+        assert log.log_file.read_bytes().endswith(b"\n")
+        assert log.append(_entry(1)) == 1
+        assert log.entries() == [_entry(0), _entry(1)]
+
+    def test_migrate_legacy_list(self, tmp_path: Path) -> None:
+        """Test migrating a legacy list-based history.json."""
+        legacy = tmp_path / "history.json"
+        legacy.write_text(json.dumps([_entry(0), _entry(1)]))
+        log = WaldiezHistoryLog(tmp_path)
+        assert log.exists()
+        assert len(log) == 2
+        assert not legacy.exists()
+        assert log.get(1) == _entry(1)
+
+    def test_migrate_legacy_dict(self, tmp_path: Path) -> None:
+        """Test migrating a legacy dict-based history.json."""
+        legacy = tmp_path / "history.json"
+        legacy.write_text(
+            json.dumps({"history": [_entry(0)], "metadata": {"a": 1}})
+        )
+        log = WaldiezHistoryLog(tmp_path)
+        log.append(_entry(1))
+        assert not legacy.exists()
+        assert log.entries() == [_entry(0), _entry(1)]
+
+    def test_migrate_invalid_legacy(self, tmp_path: Path) -> None:
+        """Test migrating an unreadable history.json."""
+        legacy = tmp_path / "history.json"
+        legacy.write_text("not json")
+        log = WaldiezHistoryLog(tmp_path)
+        assert log.migrate() is True
+        assert len(log) == 0
+        assert not legacy.exists()
+
+
+class TestCheckpointHistory:
+    """Tests for the checkpoint's history access."""
+
+    def _checkpoint(self, path: Path) -> WaldiezCheckpoint:
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "state.json").write_text("{}")
+        return WaldiezCheckpoint(
+            session_name="session",
+            timestamp=datetime.now(timezone.utc),
+            path=path,
+        )
+
+    def test_history_and_load_state(self, tmp_path: Path) -> None:
+        """Test loading a state from the history by its index."""
+        checkpoint = self._checkpoint(tmp_path / "checkpoint")
+        assert checkpoint.history() == []
+        for number in range(3):
+            checkpoint.history_log.append(_entry(number))
+        assert checkpoint.history() == [_entry(n) for n in range(3)]
+
+        checkpoint.load_state(1)
+        assert checkpoint.state == _entry(1)["state"]
+        # out of range is a no-op
+        checkpoint.load_state(10)
+        assert checkpoint.state == _entry(1)["state"]
+
+    def test_history_from_legacy_file(self, tmp_path: Path) -> None:
+        """Test reading the history of a checkpoint with history.json."""
+        checkpoint = self._checkpoint(tmp_path / "checkpoint")
+        (checkpoint.path / "history.json").write_text(
+            json.dumps({"history": [_entry(0), _entry(0), _entry(1)]})
+        )
+        assert checkpoint.history() == [_entry(0), _entry(1)]
+        assert len(checkpoint.history_log) == 2
+        checkpoint.load_state(1)
+        assert checkpoint.state == _entry(1)["state"]
@@ -261,8 +261,8 @@ class TestStorageIntegration:
         external_dir.mkdir()
 
         # Get initial registry state
-        if hasattr(storage.storage, "_links_registry"):
-            initial_registry_size = len(storage.storage._links_registry)
+        if hasattr(storage.storage, "links_registry"):
+            initial_registry_size = len(storage.storage.links_registry)
         else:
             initial_registry_size = 0
 
@@ -281,8 +281,8 @@ class TestStorageIntegration:
             pass
 
         # Verify registry was rolled back
-        if hasattr(storage.storage, "_links_registry"):
-            final_registry_size = len(storage.storage._links_registry)
+        if hasattr(storage.storage, "links_registry"):
+            final_registry_size = len(storage.storage.links_registry)
             assert final_registry_size == initial_registry_size
 
     def test_edge_cases(self, tmp_path: Path) -> None:
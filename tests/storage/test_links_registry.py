@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use
+
+"""Tests for the sqlite links registry."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from waldiez.storage import FilesystemStorage
+from waldiez.storage.links_registry import (
+    LEGACY_LINKS_REGISTRY_FILE,
+    LINKS_REGISTRY_FILE,
+    LinksRegistry,
+)
+
+
+def _register_many(db_path: str, worker: int) -> None:
+    registry = LinksRegistry(Path(db_path))
+    for number in range(20):
+        registry.register(f"/cp/{worker}", f"/links/{worker}/{number}")
+
+
+class TestLinksRegistry:
+    """Tests for LinksRegistry."""
+
+    def test_register_and_unregister(self, tmp_path: Path) -> None:
+        """Test registering links and popping a checkpoint's links."""
+        registry = LinksRegistry(tmp_path / LINKS_REGISTRY_FILE)
+        registry.register("/ws/s1/1", "/out/a")
+        registry.register("/ws/s1/1", "/out/b")
+        registry.register("/ws/s1/1", "/out/a")
+        registry.register("/ws/s2/1", "/out/c")
+
+        assert len(registry) == 2
+        assert "/ws/s1/1" in registry
+        assert registry.links("/ws/s1/1") == ["/out/a", "/out/b"]
+        assert registry.unregister("/ws/s1/1") == ["/out/a", "/out/b"]
+        assert "/ws/s1/1" not in registry
+        assert registry.unregister("/ws/s1/1") == []
+        assert registry.as_dict() == {"/ws/s2/1": ["/out/c"]}
+
+    def test_prefix_queries(self, tmp_path: Path) -> None:
+        """Test reading and removing a session's entries by prefix."""
+        registry = LinksRegistry(tmp_path / LINKS_REGISTRY_FILE)
+        registry.register("/ws/s1/1", "/out/a")
+        registry.register("/ws/s1/2", "/out/b")
+        registry.register("/ws/s10/1", "/out/c")
+
+        assert set(registry.as_dict("/ws/s1/")) == {"/ws/s1/1", "/ws/s1/2"}
+        assert registry.remove_prefix("/ws/s1/") == 2
+        assert registry.as_dict() == {"/ws/s10/1": ["/out/c"]}
+
+    def test_next_batch_wraps_around(self, tmp_path: Path) -> None:
+        """Test walking the registry incrementally."""
+        registry = LinksRegistry(tmp_path / LINKS_REGISTRY_FILE)
+        for number in range(5):
+            registry.register(f"/ws/s/{number}", f"/out/{number}")
+
+        seen: list[str] = []
+        for _ in range(3):
+            seen.extend(registry.next_batch(2))
+        assert seen == [f"/ws/s/{n}" for n in range(5)]
+        # and starts over
+        assert list(registry.next_batch(2)) == ["/ws/s/0", "/ws/s/1"]
+
+    def test_migrate_legacy_json(self, tmp_path: Path) -> None:
+        """Test importing a legacy .links_registry.json."""
+        legacy = tmp_path / LEGACY_LINKS_REGISTRY_FILE
+        legacy.write_text(
+            json.dumps({"/ws/s/1": ["/out/a", 1], "/ws/s/2": "invalid"})
+        )
+        registry = LinksRegistry(tmp_path / LINKS_REGISTRY_FILE)
+        assert registry.as_dict() == {"/ws/s/1": ["/out/a"]}
+        assert not legacy.exists()
+
+    def test_cross_process_registration(self, tmp_path: Path) -> None:
+        """Test concurrent registrations from several processes."""
+        db_path = tmp_path / LINKS_REGISTRY_FILE
+        LinksRegistry(db_path)
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(_register_many, str(db_path), worker)
+                for worker in range(3)
+            ]
+            for future in futures:
+                future.result()
+        registry = LinksRegistry(db_path)
+        assert len(registry) == 3
+        assert all(
+            len(registry.links(f"/cp/{worker}")) == 20 for worker in range(3)
+        )
+
+
+class TestIncrementalCompaction:
+    """Tests for compacting the registry in batches."""
+
+    def test_compact_registry_with_limit(self, tmp_path: Path) -> None:
+        """Test that limited compaction eventually covers everything."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        for number in range(4):
+            storage.links_registry.register(
+                str(tmp_path / "missing" / str(number)),
+                str(tmp_path / "out" / str(number)),
+            )
+        assert storage.compact_registry(limit=3) == 3
+        assert len(storage.links_registry) == 1
+        assert storage.compact_registry(limit=3) == 1
+        assert len(storage.links_registry) == 0
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-param-doc,missing-return-doc,missing-raises-doc
+# pylint: disable=no-self-use
+
+"""Tests for the workspace retention policy."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from waldiez.storage import (
+    FilesystemStorage,
+    RetentionDaemon,
+    RetentionPolicy,
+    StorageManager,
+    WaldiezCheckpointInfo,
+)
+from waldiez.storage.cli import app
+from waldiez.storage.retention import parse_age, parse_size, select_expired
+
+_BASE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _populate(storage: FilesystemStorage, sessions: int, count: int) -> None:
+    for session in range(sessions):
+        for number in range(count):
+            path = storage.save_checkpoint(
+                f"session{session}",
+                {},
+                timestamp=_BASE + timedelta(hours=number, minutes=session),
+            )
+            (path / "data.bin").write_bytes(b"x" * 1000)
+
+
+class TestRetentionPolicy:
+    """Tests for the policy and the selection of expired checkpoints."""
+
+    def test_parse_size_and_age(self) -> None:
+        """Test parsing human-readable limits."""
+        assert parse_size("1024") == 1024
+        assert parse_size("10K") == 10 * 1024
+        assert parse_size("1.5GB") == int(1.5 * 1024**3)
+        assert parse_age("90") == timedelta(seconds=90)
+        assert parse_age("12h") == timedelta(hours=12)
+        assert parse_age("30d") == timedelta(days=30)
+        with pytest.raises(ValueError):
+            parse_size("ten")
+        with pytest.raises(ValueError):
+            parse_age("1y")
+
+    def test_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test reading the policy from the environment."""
+        monkeypatch.setenv("WALDIEZ_RETENTION_MAX_SIZE", "1M")
+        monkeypatch.setenv("WALDIEZ_RETENTION_MAX_AGE", "7d")
+        monkeypatch.setenv("WALDIEZ_RETENTION_MIN_KEEP", "3")
+        policy = RetentionPolicy.from_env()
+        assert policy == RetentionPolicy(1024**2, timedelta(days=7), 3)
+        monkeypatch.setenv("WALDIEZ_RETENTION_MAX_AGE", "invalid")
+        assert not RetentionPolicy.from_env().enabled
+
+    def test_select_expired(self) -> None:
+        """Test the age, size and min keep limits."""
+        usage = [
+            (
+                WaldiezCheckpointInfo(
+                    session_name=session,
+                    timestamp=_BASE + timedelta(days=day),
+                    path=Path(session) / str(day),
+                ),
+                100,
+            )
+            for day in range(4)
+            for session in ("a", "b")
+        ]
+        now = _BASE + timedelta(days=4)
+        by_age = select_expired(
+            usage, RetentionPolicy(max_age=timedelta(days=2)), now
+        )
+        assert {(i.session_name, i.timestamp.day) for i, _ in by_age} == {
+            ("a", 1),
+            ("b", 1),
+            ("a", 2),
+            ("b", 2),
+        }
+        by_size = select_expired(
+            usage, RetentionPolicy(max_total_bytes=250, min_keep=1), now
+        )
+        # the latest of each session are always kept
+        assert len(by_size) == 6
+        assert {i.timestamp.day for i, _ in by_size} == {1, 2, 3}
+
+
+class TestApplyRetention:
+    """Tests for applying a policy to a workspace."""
+
+    def test_usage_is_recorded(self, tmp_path: Path) -> None:
+        """Test that checkpoints are measured once."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        _populate(storage, sessions=2, count=3)
+        usage = storage.usage()
+        assert len(usage) == 6
+        assert all(size >= 1000 for _, size in usage)
+        assert not storage.catalog.unsized()
+        total = storage.catalog.total_size()
+        assert total == sum(size for _, size in usage)
+
+        # a new checkpoint is the only one to measure
+        storage.save_checkpoint("session0", {}, timestamp=_BASE)
+        assert len(storage.catalog.unsized()) == 1
+
+    def test_shared_files_are_counted_once(self, tmp_path: Path) -> None:
+        """Test that a file linked in many checkpoints is not over-counted."""
+        storage = FilesystemStorage(tmp_path / "workspace")
+        first = storage.save_checkpoint("session", {}, timestamp=_BASE)
+        second = storage.save_checkpoint(
+            "session", {}, timestamp=_BASE + timedelta(hours=1)
+        )
+        (first / "flow.db").write_bytes(b"x" * 10000)
+        (second / "flow.db").hardlink_to(first / "flow.db")
+        sizes = [size for _, size in storage.usage()]
+        assert 10000 <= sum(sizes) < 12000
+
+    def test_apply_retention(self, tmp_path: Path) -> None:
+        """Test deleting in batches down to the size limit."""
+        storage = FilesystemStorage(tmp_path / "workspace", max_workers=3)
+        _populate(storage, sessions=3, count=5)
+        total = sum(size for _, size in storage.usage())
+        report = storage.apply_retention(
+            RetentionPolicy(max_total_bytes=total // 2, min_keep=2),
+            batch_size=2,
+        )
+        assert report.deleted == 8
+        assert report.total_bytes == total - report.freed_bytes
+        assert report.total_bytes <= total // 2
+        for session in range(3):
+            remaining = storage.list_checkpoints(f"session{session}")
+            assert len(remaining) >= 2
+
+    def test_manager_and_cli(self, tmp_path: Path) -> None:
+        """Test the manager's and the CLI's one-shot retention."""
+        workspace = tmp_path / "workspace"
+        manager = StorageManager(workspace_dir=workspace)
+        _populate(manager.storage, sessions=2, count=4)  # type: ignore
+        report = manager.apply_retention(
+            RetentionPolicy(max_age=timedelta(days=1), min_keep=3)
+        )
+        assert report.deleted == 2
+        result = CliRunner().invoke(
+            app,
+            [
+                "checkpoints",
+                "--workspace",
+                str(workspace),
+                "--retention",
+                "--max-size",
+                "1",
+                "--keep",
+                "1",
+            ],
+        )
+        assert result.exit_code == 0
+        assert len(manager.checkpoints()) == 2
+
+    async def test_daemon(self, tmp_path: Path) -> None:
+        """Test the background retention task."""
+        manager = StorageManager(workspace_dir=tmp_path / "workspace")
+        _populate(manager.storage, sessions=1, count=3)  # type: ignore
+        daemon = RetentionDaemon(
+            manager, RetentionPolicy(max_age=timedelta(days=1)), interval=60
+        )
+        await daemon.start()
+        assert daemon.is_running
+        for _ in range(500):
+            if daemon.last_report is not None:
+                break
+            await asyncio.sleep(0.01)
+        await daemon.stop()
+        assert not daemon.is_running
+        assert daemon.last_report is not None
+        assert daemon.last_report.deleted == 2
+        assert len(manager.checkpoints()) == 1
+        report = await daemon.run_once()
+        assert report.deleted == 0
+        assert daemon.last_report is report
+        manager.close()
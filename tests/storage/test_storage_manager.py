@@ -281,6 +281,38 @@ class TestStorageManager:
         # Verify tmp_dir was removed
         assert not tmp_dir.exists()
 
+    def test_finalize_skip_symlinks(
+        self, manager: StorageManager, tmp_path: Path
+    ) -> None:
+        """Test finalize shares data between checkpoint and public copies."""
+        tmp_dir = tmp_path / "tmp_run"
+        (tmp_dir / "logs").mkdir(parents=True)
+        (tmp_dir / "data.txt").write_text("data")
+        (tmp_dir / "logs" / "run.log").write_text("log data")
+        inode = (tmp_dir / "data.txt").stat().st_ino
+
+        output_file = tmp_path / "script.py"
+        output_file.write_text("print('test')")
+
+        checkpoint_path, public_path = manager.finalize(
+            session_name="test_run",
+            output_file=output_file,
+            tmp_dir=tmp_dir,
+            link_root=tmp_path / "out",
+            skip_symlinks=True,
+        )
+
+        assert not tmp_dir.exists()
+        checkpoint_file = checkpoint_path / "data.txt"
+        assert checkpoint_file.stat().st_ino == inode
+        assert not public_path.is_symlink()
+        assert (public_path / "data.txt").samefile(checkpoint_file)
+        latest = public_path.parent / "latest"
+        assert not latest.is_symlink()
+        assert (latest / "logs" / "run.log").samefile(
+            checkpoint_path / "logs" / "run.log"
+        )
+
     def test_finalize_with_copy_into_subdir(
         self, manager: StorageManager, tmp_path: Path
     ) -> None:
@@ -322,6 +354,7 @@ class TestStorageManager:
 
         # Verify tmp_dir was not removed
         assert tmp_dir.exists()
+        assert (tmp_dir / "data.txt").read_text() == "data"
 
     def test_finalize_custom_link_root(
         self, manager: StorageManager, tmp_path: Path
@@ -434,3 +467,85 @@ class TestStorageManager:
         checkpoints = manager.checkpoints("test_run")
         assert len(checkpoints) == 1
         assert checkpoints[0].timestamp == timestamp
+
+
+class TestAsyncStorageManager:
+    """Tests for the async StorageManager methods."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path) -> Generator[StorageManager, None, None]:
+        """Create a StorageManager with a few worker threads."""
+        manager = StorageManager(
+            workspace_dir=tmp_path / "workspace", max_workers=4
+        )
+        yield manager
+        manager.close()
+
+    async def test_save_checkpoints_and_history(
+        self, manager: StorageManager
+    ) -> None:
+        """Test saving, listing and reading history asynchronously."""
+        paths = [
+            await manager.a_save("session", {"number": number})
+            for number in range(3)
+        ]
+        for path in paths:
+            (path / "history.jsonl").write_text(
+                json.dumps({"state": {"number": path.name}}) + "\n"
+            )
+
+        listed = await manager.a_checkpoints("session", order="asc")
+        assert [info.path for info in listed] == paths
+        history = await manager.a_history("session")
+        assert history == manager.history("session")
+        assert len(history) == 3
+        single = await manager.a_history("session", paths[0].name)
+        assert single == {"history": [{"state": {"number": paths[0].name}}]}
+
+    async def test_finalize(
+        self, manager: StorageManager, tmp_path: Path
+    ) -> None:
+        """Test finalizing a run asynchronously."""
+        tmp_dir = tmp_path / "tmp_run"
+        for number in range(6):
+            (tmp_dir / f"dir{number}").mkdir(parents=True)
+            (tmp_dir / f"dir{number}" / "data.txt").write_text(str(number))
+        (tmp_dir / "output.txt").write_text("test output")
+        output_file = tmp_path / "script.py"
+        output_file.write_text("print('test')")
+
+        checkpoint_path, public_link = await manager.a_finalize(
+            session_name="test_run",
+            output_file=output_file,
+            tmp_dir=tmp_dir,
+            link_root=tmp_path / "out",
+        )
+        assert (checkpoint_path / "output.txt").is_file()
+        assert all(
+            (checkpoint_path / f"dir{number}" / "data.txt").read_text()
+            == str(number)
+            for number in range(6)
+        )
+        assert public_link.resolve() == checkpoint_path
+        assert not tmp_dir.exists()
+
+    async def test_delete_and_cleanup(self, manager: StorageManager) -> None:
+        """Test deleting checkpoints asynchronously."""
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        storage = manager.storage
+        for minute in range(8):
+            storage.save_checkpoint(
+                "session",
+                {"minute": minute},
+                timestamp=base.replace(minute=minute),
+            )
+        await manager.a_delete("session", base)
+        deleted = await manager.a_delete_batch(
+            [("session", base.replace(minute=7)), ("missing", base)]
+        )
+        assert deleted == 1
+        assert await manager.a_cleanup("session", keep_count=2) == 4
+        remaining = await manager.a_checkpoints("session")
+        assert [info.timestamp.minute for info in remaining] == [6, 5]
+        latest = manager.workspace_dir / "session" / "latest"
+        assert latest.resolve() == remaining[0].path
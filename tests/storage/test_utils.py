@@ -17,10 +17,14 @@ from unittest.mock import patch
 import pytest
 
 from waldiez.storage.utils import (
+    clone_tree,
     copy_results,
     get_root_dir,
     is_frozen,
     is_installed_package,
+    link_or_copy,
+    move_path,
+    move_results,
     safe_name,
     symlink,
 )
@@ -522,6 +526,110 @@ class TestCopyResults:
         ).read_text() == "existing"
 
 
+class TestMoveResults:
+    """Tests for move_results and the zero-copy helpers."""
+
+    def test_move_results_basic(self, tmp_path: Path) -> None:
+        """Test moving the run artifacts into the destination."""
+        temp_dir = tmp_path / "temp"
+        (temp_dir / "logs").mkdir(parents=True)
+        (temp_dir / "file1.txt").write_text("content1")
+        (temp_dir / "logs" / "events.csv").write_text("a,b")
+        (temp_dir / "tree_of_thoughts.png").write_bytes(b"image")
+        (temp_dir / ".env").write_text("SECRET=value")
+        inode = (temp_dir / "file1.txt").stat().st_ino
+
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        output_file = output_dir / "flow.waldiez"
+        output_file.write_text("{}")
+        (temp_dir / "flow.py").write_text("print('generated')")
+        destination_dir = tmp_path / "dest"
+
+        move_results(temp_dir, output_file, destination_dir)
+
+        assert (destination_dir / "file1.txt").stat().st_ino == inode
+        assert (destination_dir / "logs" / "events.csv").read_text() == "a,b"
+        assert not (temp_dir / "file1.txt").exists()
+        assert not (temp_dir / "logs").exists()
+        # ignored names stay behind
+        assert (temp_dir / ".env").exists()
+        assert not (destination_dir / ".env").exists()
+        # the generated source goes to the output dir only
+        assert (output_dir / "flow.py").read_text() == "print('generated')"
+        assert not (destination_dir / "flow.py").exists()
+        # promoted files share their data with the checkpoint's copy
+        promoted = output_dir / "tree_of_thoughts.png"
+        assert promoted.read_bytes() == b"image"
+        assert promoted.samefile(destination_dir / "tree_of_thoughts.png")
+
+    def test_move_results_merge_safe(self, tmp_path: Path) -> None:
+        """Test that moving merges into existing directories."""
+        temp_dir = tmp_path / "temp"
+        (temp_dir / "subdir").mkdir(parents=True)
+        (temp_dir / "subdir" / "file1.txt").write_text("new content")
+        destination_dir = tmp_path / "dest"
+        (destination_dir / "subdir").mkdir(parents=True)
+        (destination_dir / "subdir" / "file1.txt").write_text("old")
+        (destination_dir / "subdir" / "file2.txt").write_text("existing")
+
+        move_results(temp_dir, tmp_path / "output.py", destination_dir)
+
+        subdir = destination_dir / "subdir"
+        assert (subdir / "file1.txt").read_text() == "new content"
+        assert (subdir / "file2.txt").read_text() == "existing"
+        assert not (temp_dir / "subdir").exists()
+
+    def test_move_path_across_devices(self, tmp_path: Path) -> None:
+        """Test falling back to a copy when renaming fails."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "file.txt").write_text("content")
+        (tmp_path / "single.txt").write_text("single")
+
+        with patch("os.replace", side_effect=OSError(18, "EXDEV")):
+            move_path(src_dir, tmp_path / "dst")
+            move_path(tmp_path / "single.txt", tmp_path / "copied.txt")
+
+        assert (tmp_path / "dst" / "file.txt").read_text() == "content"
+        assert (tmp_path / "copied.txt").read_text() == "single"
+
+    def test_link_or_copy(self, tmp_path: Path) -> None:
+        """Test hardlinking with a copy fallback."""
+        src = tmp_path / "src.txt"
+        src.write_text("content")
+        linked = tmp_path / "linked.txt"
+        linked.write_text("to be replaced")
+
+        link_or_copy(src, linked)
+        assert linked.samefile(src)
+
+        copied = tmp_path / "copied.txt"
+        with (
+            patch("os.link", side_effect=OSError(18, "EXDEV")),
+            patch("waldiez.storage.utils.reflink", return_value=False),
+        ):
+            link_or_copy(src, copied)
+        assert copied.read_text() == "content"
+        assert not copied.samefile(src)
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_clone_tree(self, tmp_path: Path) -> None:
+        """Test replicating a tree without copying the file data."""
+        src = tmp_path / "src"
+        (src / "logs").mkdir(parents=True)
+        (src / "state.json").write_text("{}")
+        (src / "logs" / "events.csv").write_text("a,b")
+        dst = tmp_path / "dst"
+
+        clone_tree(src, dst)
+
+        assert (dst / "state.json").samefile(src / "state.json")
+        assert (dst / "logs" / "events.csv").samefile(
+            src / "logs" / "events.csv"
+        )
+
+
 # pylint: disable=too-few-public-methods
 class TestSafeName:
     """Tests for safe_name function."""
@@ -147,6 +147,49 @@ def test_cli_run(
     assert has_wrk_flow or has_finished
 
 
+def test_cli_run_batch(
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+    waldiez_flow_no_human_input: WaldiezFlow,
+) -> None:
+    """Test running a WaldiezFlow over a batch of inputs using the CLI.
+
+    Parameters
+    ----------
+    capsys : pytest.CaptureFixture[str]
+        Pytest fixture to capture stdout and stderr.
+    tmp_path : Path
+        Pytest fixture to provide a temporary directory.
+    waldiez_flow_no_human_input : WaldiezFlow
+        A WaldiezFlow instance with no human input.
+    """
+    input_file = tmp_path / f"{waldiez_flow_no_human_input.name}.waldiez"
+    with open(input_file, "w", encoding="utf-8", newline="\n") as file:
+        file.write(waldiez_flow_no_human_input.model_dump_json(by_alias=True))
+    batch_file = tmp_path / "inputs.jsonl"
+    batch_file.write_text('"first"\n"second"\n', encoding="utf-8")
+    results_file = tmp_path / "results.jsonl"
+    sys.argv = [
+        "waldiez",
+        "run",
+        "--file",
+        str(input_file),
+        "--batch",
+        str(batch_file),
+        "--concurrency",
+        "2",
+        "--batch-results",
+        str(results_file),
+        "--skip-deps",
+    ]
+    with pytest.raises(SystemExit) as exc_info:
+        waldiez_main()
+    assert exc_info.value.code in (0, None)
+    captured = capsys.readouterr()
+    assert "Ran 2 inputs (0 failed)" in escape_ansi(captured.out)
+    assert len(results_file.read_text("utf-8").splitlines()) == 2
+
+
 def test_cli_check(
     capsys: pytest.CaptureFixture[str],
     tmp_path: Path,
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+"""Import time benchmark for the waldiez package."""
+
+import os
+import subprocess
+import sys
+
+# cumulative `python -X importtime` budget (in microseconds) of the
+# top-level `import waldiez`, override with WALDIEZ_IMPORT_BUDGET_US.
+IMPORT_BUDGET_US = int(os.environ.get("WALDIEZ_IMPORT_BUDGET_US", "750000"))
+
+HEAVY_MODULES = ("autogen", "jupytext", "nbformat", "pandas", "pydantic")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Get the cumulative import time (in us) of each imported module."""
+    env = {**os.environ, "WALDIEZ_TESTING": "1"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+def test_import_waldiez_is_lazy() -> None:
+    """Test that `import waldiez` does not load the heavy dependencies."""
+    times = _import_times("import waldiez")
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert not loaded, f"`import waldiez` imported {loaded}"
+
+
+def test_import_waldiez_budget() -> None:
+    """Test that `import waldiez` stays within the import time budget."""
+    times = _import_times("import waldiez")
+    assert times["waldiez"] < IMPORT_BUDGET_US, (
+        f"`import waldiez` took {times['waldiez']}us "
+        f"(budget: {IMPORT_BUDGET_US}us)"
+    )
+
+
+def test_lazy_attributes() -> None:
+    """Test that the public classes are still importable."""
+    # pylint: disable=import-outside-toplevel
+    import waldiez
+    from waldiez.exporter import WaldiezExporter
+    from waldiez.models import Waldiez
+    from waldiez.runner import WaldiezRunner
+
+    assert waldiez.Waldiez is Waldiez
+    assert waldiez.WaldiezExporter is WaldiezExporter
+    assert waldiez.WaldiezRunner is WaldiezRunner
+    assert {"Waldiez", "WaldiezExporter", "WaldiezRunner"} <= set(dir(waldiez))
+    assert set(waldiez.__all__) <= set(dir(waldiez))
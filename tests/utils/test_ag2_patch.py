@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-function-docstring,missing-param-doc
+# pylint: disable=no-self-use,missing-yield-doc
+# flake8: noqa: D102
+"""Test waldiez.utils.ag2_patch.*."""
+
+import json
+import os
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from waldiez.utils import ag2_patch
+from waldiez.utils.ag2_patch import (
+    PATCH_STAMP_FILE,
+    PatchState,
+    apply_patch,
+    clear_patch_stamp,
+)
+
+PKG = "waldiez_fake_patch_target"
+
+DIFF = f"""\
+--- a/{PKG}/module.py
++++ b/{PKG}/module.py
+@@ -1,2 +1,2 @@
+ def value():
+-    return 1
++    return 2
+"""
+
+
+@pytest.fixture(name="fake_package")
+def fake_package_fixture(tmp_path: Path) -> Generator[Path, None, None]:
+    """Create an importable package and a diff that patches it."""
+    site = tmp_path / "site"
+    pkg_dir = site / PKG
+    pkg_dir.mkdir(parents=True)
+    (pkg_dir / "__init__.py").write_text('__version__ = "1.2.3"\n')
+    (pkg_dir / "module.py").write_text("def value():\n    return 1\n")
+    (tmp_path / "fake.diff").write_text(DIFF)
+    sys.path.insert(0, str(site))
+    try:
+        yield pkg_dir
+    finally:
+        sys.path.remove(str(site))
+
+
+class TestPatchStamp:
+    """Test the cached patch state check."""
+
+    def test_stamp_after_apply(self, fake_package: Path) -> None:
+        diff_path = fake_package.parent.parent / "fake.diff"
+        apply_patch(PKG, diff_path)
+        assert "return 2" in (fake_package / "module.py").read_text()
+
+        stamp = json.loads((fake_package / PATCH_STAMP_FILE).read_text())
+        assert stamp["version"] == "1.2.3"
+        assert stamp["state"] == PatchState.ALREADY_APPLIED.value
+        assert list(stamp["files"]) == [f"{PKG}/module.py"]
+
+        with patch.object(ag2_patch, "_check_patch_state") as check:
+            apply_patch(PKG, diff_path)
+            check.assert_not_called()
+            apply_patch(PKG, diff_path, verify=True)
+            check.assert_called_once()
+
+    def test_changed_files_are_checked_again(self, fake_package: Path) -> None:
+        diff_path = fake_package.parent.parent / "fake.diff"
+        apply_patch(PKG, diff_path)
+        module = fake_package / "module.py"
+        # e.g. a reinstall of the package
+        module.write_text("def value():\n    return 1\n")
+        os.utime(module, ns=(1, 1))
+
+        apply_patch(PKG, diff_path)
+        assert "return 2" in module.read_text()
+
+    def test_changed_diff_is_checked_again(self, fake_package: Path) -> None:
+        diff_path = fake_package.parent.parent / "fake.diff"
+        apply_patch(PKG, diff_path)
+        diff_path.write_text(DIFF.replace("return 2", "return 3"))
+
+        with patch.object(
+            ag2_patch,
+            "_check_patch_state",
+            return_value=PatchState.DIVERGED,
+        ) as check:
+            apply_patch(PKG, diff_path)
+            check.assert_called_once()
+            # the diverged state is also recorded
+            apply_patch(PKG, diff_path)
+            check.assert_called_once()
+
+    def test_clear_stamp(self, fake_package: Path) -> None:
+        diff_path = fake_package.parent.parent / "fake.diff"
+        apply_patch(PKG, diff_path, dry_run=True)
+        assert not (fake_package / PATCH_STAMP_FILE).exists()
+        apply_patch(PKG, diff_path)
+        assert (fake_package / PATCH_STAMP_FILE).exists()
+        clear_patch_stamp(PKG)
+        assert not (fake_package / PATCH_STAMP_FILE).exists()
+        clear_patch_stamp(PKG)
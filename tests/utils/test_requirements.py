@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=missing-function-docstring,missing-param-doc
+# pylint: disable=no-self-use
+# flake8: noqa: D102
+"""Test waldiez.utils.requirements.*."""
+
+import os
+from importlib.metadata import PackageNotFoundError, distribution
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from waldiez.utils import requirements as requirements_module
+from waldiez.utils.requirements import (
+    RequirementsCache,
+    missing_requirements,
+    requirements_fingerprint,
+)
+
+
+class TestMissingRequirements:
+    """Test resolving requirements against the installed packages."""
+
+    def test_installed_and_missing(self) -> None:
+        missing = missing_requirements(
+            [
+                "packaging",
+                "pydantic>=2",
+                "pydantic<1",
+                "waldiez-surely-not-installed",
+                "not a valid requirement !",
+                'packaging; python_version < "3"',
+            ]
+        )
+        assert missing == {
+            "pydantic<1",
+            "waldiez-surely-not-installed",
+            "not a valid requirement !",
+        }
+
+    def test_extras(self) -> None:
+        # ag2's "openai" extra requires openai
+        assert not missing_requirements(["ag2[openai]"])
+
+        def _distribution(name: str) -> Any:
+            if name == "openai":
+                raise PackageNotFoundError(name)
+            return distribution(name)
+
+        with patch.object(
+            requirements_module, "distribution", side_effect=_distribution
+        ):
+            assert missing_requirements(["ag2[openai]", "ag2"]) == {
+                "ag2[openai]"
+            }
+
+    def test_fingerprint_is_normalized(self) -> None:
+        assert requirements_fingerprint(
+            ["Pydantic>=2", "packaging"]
+        ) == requirements_fingerprint(["packaging", "pydantic >= 2"])
+        assert requirements_fingerprint(["a"]) != requirements_fingerprint(
+            ["b"]
+        )
+
+
+class TestRequirementsCache:
+    """Test recording the satisfied requirement sets."""
+
+    def test_record_and_reuse(self, tmp_path: Path) -> None:
+        site_dir = tmp_path / "site"
+        site_dir.mkdir()
+        cache = RequirementsCache(
+            tmp_path / "cache" / "requirements.json", extra_dirs=[site_dir]
+        )
+        assert not cache.is_satisfied(["packaging"])
+        assert not cache.missing(["packaging"])
+        assert cache.cache_file.is_file()
+        assert cache.is_satisfied(["packaging"])
+
+        with patch.object(
+            requirements_module, "missing_requirements"
+        ) as resolve:
+            assert not cache.missing(["packaging"])
+            resolve.assert_not_called()
+
+        # something got installed
+        os.utime(site_dir, ns=(1, 1))
+        assert not cache.is_satisfied(["packaging"])
+
+        # unsatisfied sets are not recorded
+        assert cache.missing(["waldiez-surely-not-installed"])
+        assert not cache.is_satisfied(["waldiez-surely-not-installed"])
+
+        cache.clear()
+        assert not cache.cache_file.exists()
+
+    def test_keeps_recent_sets(self, tmp_path: Path) -> None:
+        cache = RequirementsCache(tmp_path / "requirements.json")
+        with patch.object(requirements_module, "MAX_FINGERPRINTS", 2):
+            for name in ("a", "b", "c"):
+                cache.record([name])
+        assert not cache.is_satisfied(["a"])
+        assert cache.is_satisfied(["b"])
+        assert cache.is_satisfied(["c"])
@@ -23,7 +23,7 @@ from waldiez.storage import (
 )
 from waldiez.ws.checkpoints_handler import (
     CheckpointsHandler,
-    _get_checkpoint_info,
+    _a_get_checkpoint_info,
     _get_payload_dict,
     _update_checkpoint,
 )
@@ -57,7 +57,7 @@ class TestCheckpointsHandler:
         flow_name = "test_flow"
         mock_checkpoints = {"checkpoint1": [{"data": "test"}]}
 
-        self.storage_manager.history.return_value = mock_checkpoints
+        self.storage_manager.a_history.return_value = mock_checkpoints
 
         request = GetCheckpointsRequest(
             request_id="req_123",
@@ -72,7 +72,7 @@ class TestCheckpointsHandler:
         assert response["request_id"] == "req_123"
         assert response["success"] is True
 
-        self.storage_manager.history.assert_called_once_with(flow_name)
+        self.storage_manager.a_history.assert_awaited_once_with(flow_name)
 
     @pytest.mark.asyncio
     async def test_handle_get_checkpoints_with_dict_payload_flow_name(
@@ -82,7 +82,7 @@ class TestCheckpointsHandler:
         flow_name = "test_flow"
         mock_checkpoints = {"checkpoint1": [{"data": "test"}]}
 
-        self.storage_manager.history.return_value = mock_checkpoints
+        self.storage_manager.a_history.return_value = mock_checkpoints
 
         request = GetCheckpointsRequest(
             request_id="req_123",
@@ -93,7 +93,7 @@ class TestCheckpointsHandler:
 
         assert response["type"] == "get_checkpoints"
         assert response["checkpoints"] == mock_checkpoints
-        self.storage_manager.history.assert_called_once_with(flow_name)
+        self.storage_manager.a_history.assert_awaited_once_with(flow_name)
 
     @pytest.mark.asyncio
     async def test_handle_get_checkpoints_with_dict_payload_flow_name_camelcase(
@@ -103,7 +103,7 @@ class TestCheckpointsHandler:
         flow_name = "test_flow"
         mock_checkpoints = {"checkpoint1": [{"data": "test"}]}
 
-        self.storage_manager.history.return_value = mock_checkpoints
+        self.storage_manager.a_history.return_value = mock_checkpoints
 
         request = GetCheckpointsRequest(
             request_id="req_123",
@@ -114,7 +114,7 @@ class TestCheckpointsHandler:
 
         assert response["type"] == "get_checkpoints"
         assert response["checkpoints"] == mock_checkpoints
-        self.storage_manager.history.assert_called_once_with(flow_name)
+        self.storage_manager.a_history.assert_awaited_once_with(flow_name)
 
     @pytest.mark.asyncio
     async def test_handle_get_checkpoints_empty_flow_name(self) -> None:
@@ -169,7 +169,7 @@ class TestCheckpointsHandler:
         }
 
         # Setup storage manager mocks
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload = {
             "flow_name": flow_name,
@@ -253,7 +253,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.timestamp = timestamp
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload = {
             "flow_name": "test_flow",
@@ -282,7 +282,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.timestamp = timestamp
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
         mock_checkpoint_info.to_dict.return_value = {
             "id": checkpoint_id,
             "state": {"messages": ["msg1", "msg2"], "context_variables": {}},
@@ -323,11 +323,11 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.timestamp = timestamp
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        # Mock both get_latest_checkpoint and get to return the mock
-        self.storage_manager.get_latest_checkpoint.return_value = (
+        # Mock both a_get_latest_checkpoint and a_get to return the mock
+        self.storage_manager.a_get_latest_checkpoint.return_value = (
             mock_checkpoint_info
         )
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
         mock_checkpoint_info.to_dict.return_value = {
             "id": checkpoint_id,
             "state": {"messages": ["msg1", "msg2"], "context_variables": {}},
@@ -351,7 +351,7 @@ class TestCheckpointsHandler:
 
         assert response["type"] == "set_checkpoint"
         assert response["success"] is True
-        self.storage_manager.get_latest_checkpoint.assert_called_once_with(
+        self.storage_manager.a_get_latest_checkpoint.assert_awaited_once_with(
             flow_name
         )
 
@@ -362,7 +362,7 @@ class TestCheckpointsHandler:
         checkpoint_id = WaldiezCheckpoint.format_timestamp(timestamp)
 
         # Storage manager returns None
-        self.storage_manager.get.return_value = None
+        self.storage_manager.a_get.return_value = None
 
         payload = {
             "flow_name": "test_flow",
@@ -400,7 +400,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.timestamp = timestamp
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
         mock_checkpoint_info.to_dict.return_value = {
             "id": checkpoint_id,
             "state": {"messages": ["msg1", "msg2"], "context_variables": {}},
@@ -437,7 +437,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.id = checkpoint_id
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload = {
             "flow_name": flow_name,
@@ -456,7 +456,7 @@ class TestCheckpointsHandler:
         assert response["checkpoint"] == checkpoint_id
         assert response["payload"] == checkpoint_id
 
-        self.storage_manager.delete.assert_called_once_with(
+        self.storage_manager.a_delete.assert_awaited_once_with(
             session_name=flow_name,
             timestamp=timestamp,
         )
@@ -499,7 +499,7 @@ class TestCheckpointsHandler:
         timestamp = datetime.now(timezone.utc)
         checkpoint_id = WaldiezCheckpoint.format_timestamp(timestamp)
 
-        self.storage_manager.get.return_value = None
+        self.storage_manager.a_get.return_value = None
 
         payload = {
             "flow_name": "test_flow",
@@ -529,7 +529,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.id = checkpoint_id
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload = {
             "flow_name": flow_name,
@@ -560,7 +560,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.id = checkpoint_id
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload = {
             "flow_name": flow_name,
@@ -602,7 +602,7 @@ class TestCheckpointsHandler:
             "state": {"messages": ["msg1", "msg2"], "context_variables": {}},
         }
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
         mock_checkpoint_info.to_dict.return_value = {
             "id": checkpoint_id,
             "state": {"messages": ["msg1", "msg2"], "context_variables": {}},
@@ -656,7 +656,7 @@ class TestCheckpointsHandler:
         flow_name = "test_flow"
 
         # Mock storage to return None for invalid timestamp
-        self.storage_manager.get.return_value = None
+        self.storage_manager.a_get.return_value = None
 
         payload = {
             "flow_name": flow_name,
@@ -689,7 +689,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.id = checkpoint_id
         mock_checkpoint_info.checkpoint = mock_checkpoint
 
-        self.storage_manager.get.return_value = mock_checkpoint_info
+        self.storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload_dict = {
             "flow_name": flow_name,
@@ -736,8 +736,9 @@ class TestCheckpointsHandler:
 
         assert not result
 
-    def test_get_checkpoint_info_with_latest(self) -> None:
-        """Test _get_checkpoint_info helper with 'latest' keyword."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_with_latest(self) -> None:
+        """Test _a_get_checkpoint_info helper with 'latest' keyword."""
         flow_name = "test_flow"
         timestamp = datetime.now(timezone.utc)
 
@@ -747,7 +748,7 @@ class TestCheckpointsHandler:
         mock_checkpoint_info.timestamp = timestamp
 
         storage_manager = MagicMock(spec=StorageManager)
-        storage_manager.get_latest_checkpoint.return_value = (
+        storage_manager.a_get_latest_checkpoint.return_value = (
             mock_checkpoint_info
         )
 
@@ -756,13 +757,16 @@ class TestCheckpointsHandler:
             "checkpoint": "latest",
         }
 
-        result = _get_checkpoint_info(payload_dict, storage_manager)
+        result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is mock_checkpoint_info
-        storage_manager.get_latest_checkpoint.assert_called_once_with(flow_name)
+        storage_manager.a_get_latest_checkpoint.assert_awaited_once_with(
+            flow_name
+        )
 
-    def test_get_checkpoint_info_with_timestamp_id(self) -> None:
-        """Test _get_checkpoint_info helper with timestamp ID."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_with_timestamp_id(self) -> None:
+        """Test _a_get_checkpoint_info helper with timestamp ID."""
         flow_name = "test_flow"
         timestamp = datetime.now(timezone.utc)
         checkpoint_id = WaldiezCheckpoint.format_timestamp(timestamp)
@@ -770,43 +774,46 @@ class TestCheckpointsHandler:
         mock_checkpoint_info = MagicMock(spec=WaldiezCheckpointInfo)
 
         storage_manager = MagicMock(spec=StorageManager)
-        storage_manager.get.return_value = mock_checkpoint_info
+        storage_manager.a_get.return_value = mock_checkpoint_info
 
         payload_dict = {
             "flow_name": flow_name,
             "checkpoint": checkpoint_id,
         }
 
-        result = _get_checkpoint_info(payload_dict, storage_manager)
+        result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is mock_checkpoint_info
 
-    def test_get_checkpoint_info_missing_flow_name(self) -> None:
-        """Test _get_checkpoint_info helper without flow name."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_missing_flow_name(self) -> None:
+        """Test _a_get_checkpoint_info helper without flow name."""
         storage_manager = MagicMock(spec=StorageManager)
 
         payload_dict = {
             "checkpoint": "some_id",
         }
 
-        result = _get_checkpoint_info(payload_dict, storage_manager)
+        result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is None
 
-    def test_get_checkpoint_info_missing_checkpoint(self) -> None:
-        """Test _get_checkpoint_info helper without checkpoint."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_missing_checkpoint(self) -> None:
+        """Test _a_get_checkpoint_info helper without checkpoint."""
         storage_manager = MagicMock(spec=StorageManager)
 
         payload_dict = {
             "flow_name": "test_flow",
         }
 
-        result = _get_checkpoint_info(payload_dict, storage_manager)
+        result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is None
 
-    def test_get_checkpoint_info_invalid_checkpoint_type(self) -> None:
-        """Test _get_checkpoint_info helper with invalid checkpoint type."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_invalid_checkpoint_type(self) -> None:
+        """Test _a_get_checkpoint_info helper with invalid checkpoint type."""
         storage_manager = MagicMock(spec=StorageManager)
 
         payload_dict = {
@@ -814,12 +821,13 @@ class TestCheckpointsHandler:
             "checkpoint": 123,  # Invalid type
         }
 
-        result = _get_checkpoint_info(payload_dict, storage_manager)
+        result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is None
 
-    def test_get_checkpoint_info_invalid_timestamp_format(self) -> None:
-        """Test _get_checkpoint_info helper with invalid timestamp format."""
+    @pytest.mark.asyncio
+    async def test_get_checkpoint_info_invalid_timestamp_format(self) -> None:
+        """Test _a_get_checkpoint_info helper with invalid timestamp format."""
         storage_manager = MagicMock(spec=StorageManager)
 
         payload_dict = {
@@ -831,7 +839,7 @@ class TestCheckpointsHandler:
         with patch.object(
             WaldiezCheckpoint, "parse_timestamp", return_value=None
         ):
-            result = _get_checkpoint_info(payload_dict, storage_manager)
+            result = await _a_get_checkpoint_info(payload_dict, storage_manager)
 
         assert result is None
 
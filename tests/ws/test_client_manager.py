@@ -201,6 +201,17 @@ class TestClientManager:
 
         assert self.client_manager.is_active is False
 
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_storage(self) -> None:
+        """Test the storage's thread pool being shut down on cleanup."""
+        await self.client_manager.storage_manager._run(lambda: None)
+        assert self.client_manager.storage_manager._executor is not None
+
+        await self.client_manager.cleanup()
+
+        assert self.client_manager.storage_manager._executor is None
+        assert self.client_manager.is_active is False
+
     @pytest.mark.asyncio
     async def test_handle_ping_request(self) -> None:
         """Test handling ping request."""
@@ -636,6 +647,36 @@ class TestClientManager:
         finally:
             await self.session_manager.stop()
 
+    @pytest.mark.asyncio
+    async def test_handle_event_history_request(self) -> None:
+        """Test handling event history request."""
+        await self.session_manager.start()
+
+        try:
+            mock_runner = MockSubprocessRunner()
+            session_id = "test_session"
+            self.client_manager._runners[session_id] = mock_runner  # type: ignore
+
+            message = json.dumps(
+                {
+                    "type": "event_history",
+                    "start": 101,
+                    "limit": 50,
+                    "session_id": session_id,
+                }
+            )
+
+            response = await self.client_manager.handle_message(message)
+
+            assert response is not None
+            assert response["type"] == "event_history_response"
+            assert response["success"] is True
+            assert response["start"] == 101
+            assert "hi 101 50" in mock_runner.input_queue
+
+        finally:
+            await self.session_manager.stop()
+
     @pytest.mark.asyncio
     async def test_handle_user_input_response(self) -> None:
         """Test handling user input response."""
@@ -33,6 +33,7 @@ except ImportError:  # pragma: no cover
         websockets,
     )
 
+from waldiez.storage import RetentionPolicy, StorageManager
 from waldiez.ws.server import HAS_WATCHDOG, WaldiezWsServer, run_server
 from waldiez.ws.utils import get_available_port
 
@@ -162,6 +163,33 @@ class TestWaldiezWsServer:
         assert not server.is_running
         assert len(server.clients) == 0
 
+    @pytest.mark.asyncio
+    async def test_server_retention_daemon(self, tmp_path: Path) -> None:
+        """Test the checkpoints retention task follows the server."""
+        storage_manager = StorageManager(workspace_dir=tmp_path / "workspace")
+        with patch(
+            "waldiez.ws.server.StorageManager", return_value=storage_manager
+        ):
+            server = WaldiezWsServer(
+                host=self.host,
+                port=self.port,
+                retention=RetentionPolicy(max_total_bytes=1024),
+            )
+        daemon = server.retention_daemon
+        assert daemon is not None
+        assert daemon.manager is storage_manager
+
+        start_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.5)
+        try:
+            assert daemon.is_running
+            assert daemon.last_report is not None
+        finally:
+            server.shutdown()
+            await asyncio.wait_for(start_task, timeout=2.0)
+        assert not daemon.is_running
+        storage_manager.close()
+
     @pytest.mark.asyncio
     async def test_server_already_running(self) -> None:
         """Test starting server when already running."""
@@ -1,14 +1,29 @@
 # SPDX-License-Identifier: Apache-2.0.
 # Copyright (c) 2024 - 2026 Waldiez and contributors.
-"""Waldiez package."""
+"""Waldiez package.
 
+The public classes are imported lazily (PEP 562), so that importing the
+package (e.g. for ``waldiez --version``) does not load the models, the
+exporters, autogen or pandas until they are used.
+"""
+
+import importlib
 import os
+from typing import TYPE_CHECKING, Any
 
-from .exporter import WaldiezExporter
-from .models import Waldiez
-from .runner import WaldiezRunner
 from .utils import check_conflicts, patch_ag2
 
+if TYPE_CHECKING:
+    from .exporter import WaldiezExporter
+    from .models import Waldiez
+    from .runner import WaldiezRunner
+
+_LAZY_ATTRS = {
+    "Waldiez": ".models",
+    "WaldiezExporter": ".exporter",
+    "WaldiezRunner": ".runner",
+}
+
 # pylint: disable=invalid-name
 __waldiez_initialized = False
 
@@ -44,3 +59,40 @@ __all__ = [
     "WaldiezRunner",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public classes on first access.
+
+    Parameters
+    ----------
+    name : str
+        The attribute's name.
+
+    Returns
+    -------
+    Any
+        The attribute.
+
+    Raises
+    ------
+    AttributeError
+        If the attribute is not found.
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including the lazy ones.
+
+    Returns
+    -------
+    list[str]
+        The attribute names.
+    """
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
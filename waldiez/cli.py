@@ -186,8 +186,43 @@ def run(
         ),
         is_eager=True,
     ),
+    batch: Path | None = typer.Option(  # noqa: B008
+        None,
+        "--batch",
+        help=(
+            "Path to a JSONL file with one input per line (a message, or an "
+            'object with a "message" and an optional "id"). The flow is '
+            "exported once and run for each input."
+        ),
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        resolve_path=True,
+        rich_help_panel="Batch",
+    ),
+    concurrency: int = typer.Option(  # noqa: B008
+        4,
+        "--concurrency",
+        min=1,
+        help="The number of batch inputs to run at the same time.",
+        rich_help_panel="Batch",
+    ),
+    batch_results: Path | None = typer.Option(  # noqa: B008
+        None,
+        "--batch-results",
+        help=(
+            "Path to the batch results (JSONL) file. "
+            "Defaults to results.jsonl next to the output (or in the "
+            "current directory)."
+        ),
+        dir_okay=False,
+        resolve_path=True,
+        rich_help_panel="Batch",
+    ),
 ) -> None:
     """Run a Waldiez flow."""
+    _check_batch_args(batch, step=step, subprocess=subprocess)
     output_path = _get_output_path(output, force)
     from waldiez.runner import create_runner
     from waldiez.storage import safe_name
@@ -229,6 +264,18 @@ def run(
     except ValueError as error:
         typer.echo(f"Invalid .waldiez file: {error}")
         raise typer.Exit(code=1) from error
+    if batch is not None:
+        _do_batch_run(
+            runner,
+            batch=batch,
+            concurrency=concurrency,
+            results_file=batch_results,
+            output_path=output_path,
+            uploads_root=uploads_root,
+            env_file=env_file,
+            skip_deps=skip_deps,
+        )
+        return
     _do_run(
         runner,
         output_path=output_path,
@@ -388,6 +435,47 @@ def _get_output_path(output: Path | None, force: bool) -> Path | None:
     return output
 
 
+def _check_batch_args(batch: Path | None, step: bool, subprocess: bool) -> None:
+    if batch is not None and (step or subprocess):
+        typer.echo("--batch cannot be used with --step or --subprocess")
+        raise typer.Exit(code=1)
+
+
+def _do_batch_run(
+    runner: "WaldiezBaseRunner",  # noqa: F821
+    batch: Path,
+    concurrency: int,
+    results_file: Path | None,
+    output_path: Path | None,
+    uploads_root: Path | None,
+    env_file: Path | None,
+    skip_deps: bool,
+) -> None:
+    if results_file is None:
+        results_dir = output_path.parent if output_path else Path.cwd()
+        results_file = results_dir / "results.jsonl"
+    try:
+        records = runner.run_batch(
+            batch,
+            concurrency=concurrency,
+            results_file=results_file,
+            output_path=output_path,
+            uploads_root=uploads_root,
+            skip_deps=skip_deps,
+            dot_env=env_file,
+        )
+    except ValueError as error:
+        typer.echo(f"Invalid batch run: {error}")
+        raise typer.Exit(code=1) from error
+    failed = sum(1 for record in records if record["error"])
+    typer.echo(
+        f"Ran {len(records)} inputs ({failed} failed), "
+        f"results: {results_file}"
+    )
+    if failed:
+        raise typer.Exit(code=1)
+
+
 def _do_run(
     runner: "WaldiezBaseRunner",  # noqa: F821
     output_path: Path | None,
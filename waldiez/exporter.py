@@ -20,11 +20,6 @@ import shutil
 from pathlib import Path
 from typing import Any
 
-import jupytext  # type: ignore[import-untyped]
-from jupytext.config import (  # type: ignore[import-untyped]
-    JupytextConfiguration,
-)
-
 from .exporting import FlowExtras, create_flow_exporter
 from .models import Waldiez
 
@@ -183,6 +178,12 @@ class WaldiezExporter:
         """
         # we first create a .py file with the content
         # and then convert it to a notebook using jupytext
+        # pylint: disable=import-outside-toplevel
+        import jupytext  # type: ignore[import-untyped]
+        from jupytext.config import (  # type: ignore[import-untyped]
+            JupytextConfiguration,
+        )
+
         if not isinstance(path, Path):
             path = Path(path)
         exporter = create_flow_exporter(
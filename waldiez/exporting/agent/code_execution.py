@@ -79,9 +79,14 @@ class CodeExecutionProcessor:
         executor_class = self._get_executor_class_name(use_docker)
         lines = [f"{self.agent_name}_executor = {executor_class}("]
 
-        # Add work directory
+        # Add work directory (relative to the flow's one)
         if config.work_dir:
-            lines.append(f"    work_dir={json.dumps(config.work_dir)},")
+            lines.append(
+                "    work_dir=os.path.join(__WORK_DIR__, "
+                f"{json.dumps(config.work_dir)}),"
+            )
+        else:
+            lines.append("    work_dir=__WORK_DIR__,")
 
         # Add timeout
         if config.timeout:
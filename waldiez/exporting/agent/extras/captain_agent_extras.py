@@ -83,7 +83,7 @@ class CaptainAgentProcessor:
         save_path = str(self.output_dir) if self.output_dir else "."
         if save_path != ".":
             os.makedirs(save_path, exist_ok=True)
-        result.add_arg("agent_config_save_path=os.getcwd()", tabs=1)
+        result.add_arg("agent_config_save_path=__WORK_DIR__", tabs=1)
         if self.agent.data.agent_lib:
             lib_dict = [
                 lib.model_dump(by_alias=False)
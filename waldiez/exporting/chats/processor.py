@@ -19,10 +19,12 @@ from ..core import (
     Serializer,
 )
 from .utils import (
+    CHAT_GRAPH_IMPORTS,
     export_group_chats,
     export_nested_chat_registration,
     export_sequential_chat,
     export_single_chat,
+    has_chat_prerequisites,
 )
 
 
@@ -249,3 +251,15 @@ class ChatsProcessor:
                     statement=import_string, position=ImportPosition.THIRD_PARTY
                 )
             )
+        elif (
+            self._is_async
+            and len(self._chats.main) > 1
+            and has_chat_prerequisites(self._chats.main)
+        ):
+            for import_string in CHAT_GRAPH_IMPORTS:
+                self._extras.add_import(
+                    ImportStatement(
+                        statement=import_string,
+                        position=ImportPosition.THIRD_PARTY,
+                    )
+                )
@@ -4,13 +4,19 @@
 
 from .group import export_group_chats
 from .nested import export_nested_chat_registration, get_nested_chat_queue
-from .sequential import export_sequential_chat
+from .sequential import (
+    CHAT_GRAPH_IMPORTS,
+    export_sequential_chat,
+    has_chat_prerequisites,
+)
 from .single import export_single_chat
 
 __all__ = [
+    "CHAT_GRAPH_IMPORTS",
     "export_group_chats",
     "export_nested_chat_registration",
     "get_nested_chat_queue",
     "export_sequential_chat",
+    "has_chat_prerequisites",
     "export_single_chat",
 ]
@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0.
 # Copyright (c) 2024 - 2026 Waldiez and contributors.
+# pylint: disable=line-too-long
+# flake8: noqa: E501
 """Utility functions for exporting sequential chats."""
 
 from typing import Callable
@@ -12,6 +14,155 @@ from waldiez.models import (
 
 from .common import get_chat_message_string, get_event_handler_string
 
+CHAT_GRAPH_IMPORTS = [
+    "from autogen.agentchat.utils import consolidate_chat_info",
+    "from autogen.events.agent_events import ErrorEvent",
+    "from autogen.events.agent_events import PostCarryoverProcessingEvent",
+    "from autogen.events.agent_events import RunCompletionEvent",
+    "from autogen.io.base import IOStream",
+    "from autogen.io.run_response import AsyncRunResponse",
+    "from autogen.io.thread_io_stream import AsyncThreadIOStream",
+]
+"""The imports the chat graph runner needs (besides the common ones)."""
+
+CHAT_GRAPH_RUNNER = '''
+__CHAT_GRAPH_TASKS__: set[asyncio.Task[None]] = set()
+
+
+# pylint: disable=too-many-locals,too-many-statements
+async def a_run_chat_graph(
+    sender: ConversableAgent,
+    chat_queue: list[dict[str, Any]],
+) -> list[AsyncRunResponseProtocol]:
+    """Run the chats, each one as soon as its prerequisites have finished.
+
+    Independent chats run concurrently (at most WALDIEZ_MAX_PARALLEL_CHATS
+    at a time, default 4) and a chat's carryover gets the summaries of its
+    prerequisites. Chats with the same recipient do not overlap.
+
+    Parameters
+    ----------
+    sender : ConversableAgent
+        The sender of the chats that do not specify one.
+    chat_queue : list[dict[str, Any]]
+        The chats (with their "chat_id" and "prerequisites").
+
+    Returns
+    -------
+    list[AsyncRunResponseProtocol]
+        One response per chat, in the chats' topological order.
+
+    Raises
+    ------
+    ValueError
+        If the chat ids are not unique or the prerequisites have a cycle.
+    """
+    for chat_info in chat_queue:
+        if chat_info.get("sender") is None:
+            chat_info["sender"] = sender
+    consolidate_chat_info(chat_queue)
+    chat_book = {chat_info["chat_id"]: chat_info for chat_info in chat_queue}
+    if len(chat_book) != len(chat_queue):
+        raise ValueError("Each chat must have a unique chat_id.")
+    in_degree = {chat_id: 0 for chat_id in chat_book}
+    dependents: dict[int, list[int]] = {chat_id: [] for chat_id in chat_book}
+    for chat_id, chat_info in chat_book.items():
+        for pre_chat_id in set(chat_info.get("prerequisites", [])):
+            if pre_chat_id not in chat_book:
+                raise ValueError(f"Chat {chat_id} has an unknown prerequisite: {pre_chat_id}")
+            in_degree[chat_id] += 1
+            dependents[pre_chat_id].append(chat_id)
+    order = [chat_id for chat_id, degree in in_degree.items() if degree == 0]
+    for chat_id in order:
+        for dependent in dependents[chat_id]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                order.append(dependent)
+    if len(order) != len(chat_book):
+        raise ValueError("The chat prerequisites have a cycle.")
+    try:
+        max_parallel = int(os.environ.get("WALDIEZ_MAX_PARALLEL_CHATS", "4"))
+    except ValueError:
+        max_parallel = 4
+    slots = asyncio.Semaphore(max(1, max_parallel))
+    recipient_locks: dict[int, asyncio.Lock] = {}
+    finished = {chat_id: asyncio.Event() for chat_id in order}
+    chat_results: dict[int, ChatResult] = {}
+    iostreams = {chat_id: AsyncThreadIOStream() for chat_id in order}
+    # the responses keep the topological order, whenever each chat starts
+    responses: list[AsyncRunResponseProtocol] = [
+        AsyncRunResponse(iostreams[chat_id], agents=[]) for chat_id in order
+    ]
+
+    async def _a_run_chat(chat_id: int) -> None:
+        chat_info = chat_book[chat_id]
+        iostream = iostreams[chat_id]
+        with IOStream.set_default(iostream):
+            try:
+                prerequisites = chat_info.get("prerequisites", [])
+                for pre_chat_id in prerequisites:
+                    await finished[pre_chat_id].wait()
+                failed = [pre_chat_id for pre_chat_id in prerequisites if pre_chat_id not in chat_results]
+                if failed:
+                    raise RuntimeError(f"Chat {chat_id} has failed prerequisites: {failed}")
+                # only its own prerequisites (and a free slot) gate a chat
+                async with slots:
+                    carryover = chat_info.get("carryover", [])
+                    if isinstance(carryover, str):
+                        carryover = [carryover]
+                    excluded = chat_info.get("finished_chat_indexes_to_exclude_from_carryover", [])
+                    chat_info["carryover"] = carryover + [
+                        chat_results[pre_chat_id].summary
+                        for pre_chat_id in prerequisites
+                        if pre_chat_id not in excluded
+                    ]
+                    if not chat_info.get("silent", False):
+                        iostream.send(PostCarryoverProcessingEvent(chat_info=chat_info))
+                    recipient = chat_info["recipient"]
+                    lock = recipient_locks.setdefault(id(recipient), asyncio.Lock())
+                    async with lock:
+                        chat_res = await chat_info["sender"].a_initiate_chat(**chat_info)
+                chat_results[chat_id] = chat_res
+                history = chat_res.chat_history
+                iostream.send(
+                    RunCompletionEvent(
+                        history=history,
+                        summary=chat_res.summary,
+                        cost=chat_res.cost,
+                        last_speaker=history[-1]["name"] if history else chat_info["sender"].name,
+                    )
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                iostream.send(ErrorEvent(error=e))
+            finally:
+                finished[chat_id].set()
+
+    async def _a_run_chats() -> None:
+        await asyncio.gather(*(_a_run_chat(chat_id) for chat_id in order))
+
+    task = asyncio.create_task(_a_run_chats())
+    __CHAT_GRAPH_TASKS__.add(task)
+    task.add_done_callback(__CHAT_GRAPH_TASKS__.discard)
+    return responses
+'''
+"""Async runner of chats with prerequisites (a DAG of chats)."""
+
+
+def has_chat_prerequisites(main_chats: list[WaldiezAgentConnection]) -> bool:
+    """Check if any of the chats has prerequisites.
+
+    Parameters
+    ----------
+    main_chats : list[WaldiezAgentConnection]
+        The main chats.
+
+    Returns
+    -------
+    bool
+        True if a chat depends on another one.
+    """
+    return any(connection["chat"].prerequisites for connection in main_chats)
+
 
 # pylint: disable=too-many-locals
 def export_sequential_chat(
@@ -49,17 +200,31 @@ def export_sequential_chat(
     -------
     tuple[str, str]
         The main chats content and additional methods string if any.
+
+    Notes
+    -----
+    In async flows with chat prerequisites, the chats are run with the
+    generated ``a_run_chat_graph`` (independent chats run concurrently),
+    instead of the sender's ``a_sequential_run``.
     """
     tab = "    " * tabs if tabs > 0 else ""
     content = "\n"
     additional_methods_string = ""
     sender = main_chats[0]["source"]
-    content += _get_initiate_chats_line(
-        tab=tab,
-        is_async=is_async,
-        sender=agent_names[sender.id],
-        chat_queue_arg=chat_queue_arg,
-    )
+    use_chat_graph = is_async and has_chat_prerequisites(main_chats)
+    if use_chat_graph:
+        additional_methods_string += CHAT_GRAPH_RUNNER
+        content += (
+            f"{tab}results = await a_run_chat_graph("
+            f"{agent_names[sender.id]}, {chat_queue_arg})\n"
+        )
+    else:
+        content += _get_initiate_chats_line(
+            tab=tab,
+            is_async=is_async,
+            sender=agent_names[sender.id],
+            chat_queue_arg=chat_queue_arg,
+        )
     chat_queue = f"{chat_queue_arg} = ["
     for idx, connection in enumerate(main_chats):
         chat_string, additional_methods = _get_chat_dict_string(
@@ -90,15 +90,49 @@ class ExecutionGenerator:
         content += f'{tab}"""\n'
         content += f"{tab}try:\n"
         if is_async:
-            content += f'{tab}{tab}async with aiofiles.open("results.json", "w", encoding="utf-8", newline="\\n") as file:\n'
+            content += f'{tab}{tab}async with aiofiles.open(os.path.join(__WORK_DIR__, "results.json"), "w", encoding="utf-8", newline="\\n") as file:\n'
             content += f"{tab}{tab}{tab}await file.write(json.dumps({{'results': result_dicts}}, indent=4, ensure_ascii=False))\n"
         else:
-            content += f'{tab}{tab}with open("results.json", "w", encoding="utf-8", newline="\\n") as file:\n'
+            content += f'{tab}{tab}with open(os.path.join(__WORK_DIR__, "results.json"), "w", encoding="utf-8", newline="\\n") as file:\n'
             content += f"{tab}{tab}{tab}file.write(json.dumps({{'results': result_dicts}}, indent=4, ensure_ascii=False))\n"
         content += f"{tab}except BaseException:  # pylint: disable=broad-exception-caught\n"
         content += f"{tab}{tab}pass\n"
         return content
 
+    @staticmethod
+    def generate_get_cache() -> str:
+        """Generate the function that creates the flow's LLM cache.
+
+        The cache is persistent if ``WALDIEZ_LLM_CACHE_REDIS_URL`` or
+        ``WALDIEZ_LLM_CACHE_DIR`` is set (in the flow's ``__ENV__``), a
+        (fresh) ``.cache`` in the flow's directory otherwise.
+
+        Returns
+        -------
+        str
+            The function's content.
+        """
+        tab = "    "
+        content = "def get_cache() -> Cache:\n"
+        content += f'{tab}"""Get the LLM response cache of the flow.\n\n'
+        content += f"{tab}Returns\n"
+        content += f"{tab}-------\n"
+        content += f"{tab}Cache\n"
+        content += f"{tab}{tab}The redis or disk cache to use.\n"
+        content += f'{tab}"""\n'
+        content += (
+            f'{tab}redis_url = __ENV__.get("WALDIEZ_LLM_CACHE_REDIS_URL", "")\n'
+        )
+        content += f"{tab}if redis_url:\n"
+        content += f"{tab}{tab}return Cache.redis(cache_seed=__CACHE_SEED__, redis_url=redis_url)\n"
+        content += (
+            f'{tab}cache_dir = __ENV__.get("WALDIEZ_LLM_CACHE_DIR", "")\n'
+        )
+        content += f"{tab}if cache_dir:\n"
+        content += f"{tab}{tab}return Cache.disk(cache_seed=__CACHE_SEED__, cache_path_root=cache_dir)\n"
+        content += f'{tab}return Cache.disk(cache_seed=__CACHE_SEED__, cache_path_root=os.path.join(__WORK_DIR__, ".cache"))\n'
+        return content
+
     @staticmethod
     def generate_store_error(is_async: bool) -> str:
         """Generate the part that writes an error to error.json.
@@ -126,11 +160,11 @@ class ExecutionGenerator:
     try:'''
         if is_async:
             content += """
-        async with aiofiles.open("error.json", "w", encoding="utf-8", newline="\\n") as file:
+        async with aiofiles.open(os.path.join(__WORK_DIR__, "error.json"), "w", encoding="utf-8", newline="\\n") as file:
             await file.write(json.dumps({"error": reason}))"""
         else:
             content += """
-        with open("error.json", "w", encoding="utf-8", newline="\\n") as file:
+        with open(os.path.join(__WORK_DIR__, "error.json"), "w", encoding="utf-8", newline="\\n") as file:
             file.write(json.dumps({"error": reason}))"""
         content += """
     except BaseException: # pylint: disable=broad-exception-caught
@@ -478,14 +512,11 @@ async def _prepare_resume(state_json: str | Path | None = None) -> None:
         flow_content += "    pause_event.set()\n"
         space = "    "
         flow_content += (
-            '    if Path(".cache").is_dir():\n'
-            '        shutil.rmtree(".cache", ignore_errors=True)\n'
+            '    if Path(__WORK_DIR__, ".cache").is_dir() and not __ENV__.get("WALDIEZ_LLM_CACHE_DIR"):\n'
+            '        shutil.rmtree(os.path.join(__WORK_DIR__, ".cache"), ignore_errors=True)\n'
         )
         if cache_seed is not None:
-            # noinspection SqlDialectInspection
-            flow_content += (
-                "    with Cache.disk(cache_seed=__CACHE_SEED__) as cache:\n"
-            )
+            flow_content += "    with get_cache() as cache:\n"
             space = f"{space}    "
 
         flow_content += f"{content}" + "\n"
@@ -196,6 +196,8 @@ __SKIP_LOGGING__: bool = {skip_logging}
         before_main = execution_gen.generate_store_error(is_async) + "\n\n"
         before_main += execution_gen.generate_store_results(is_async) + "\n\n"
         before_main += execution_gen.generate_prepare_resume(is_async) + "\n\n"
+        if self.cache_seed is not None:
+            before_main += execution_gen.generate_get_cache() + "\n\n"
         main = before_main + execution_gen.generate_main_function(
             content=chat_contents,
             is_async=is_async,
@@ -189,6 +189,10 @@ load_dotenv(override=True)
 os.environ["AUTOGEN_USE_DOCKER"] = "0"
 os.environ["TOGETHER_NO_BANNER"] = "1"
 os.environ["ANONYMIZED_TELEMETRY"] = "False"
+# The directory of the flow's files (the current one, unless set by a runner)
+__WORK_DIR__: str = globals().get("__WORK_DIR__") or os.getcwd()
+# The flow's environment (os.environ, unless set by a runner)
+__ENV__: Any = globals().get("__ENV__", os.environ)
 """
     return content
 
@@ -130,6 +130,42 @@ class ModelsExporter(Exporter[ModelExtras]):
                     agent_id=agent.id,
                     agent_position=AgentPosition.AS_ARGUMENT,
                 )
+            rate_limit_call = self.get_agent_rate_limit_call(agent)
+            if rate_limit_call:
+                # after all agents (and their llm clients) are created
+                self.add_content(
+                    rate_limit_call,
+                    ExportPosition.AGENTS,
+                    order=ContentOrder.LATE_CLEANUP,
+                    agent_id=agent.id,
+                    agent_position=AgentPosition.AFTER_ALL,
+                )
+
+    def get_agent_rate_limit_call(self, agent: WaldiezAgent) -> str:
+        """Get the call that rate limits an agent's LLM requests.
+
+        The limits of the agent's first model with a rate limit apply
+        (ag2 uses the first model, unless it fails).
+
+        Parameters
+        ----------
+        agent : WaldiezAgent
+            The agent.
+
+        Returns
+        -------
+        str
+            The call, or an empty string if none of the agent's models
+            has a rate limit.
+        """
+        models = {model.id: model for model in self.models}
+        for model_id in agent.data.model_ids:
+            model = models.get(model_id)
+            model_name = self.model_names.get(model_id)
+            if model and model_name and model.get_rate_limit():
+                agent_name = self.agent_names[agent.id]
+                return f"limit_llm_calls({agent_name}, {model_name}_rate_limit)"
+        return ""
 
     def get_agent_llm_config_arg(self, agent: WaldiezAgent) -> str:
         """Get LLM config argument for agent.
@@ -210,6 +246,16 @@ def load_api_key_module(flow_name: str) -> ModuleType:
         The api keys loading module.
     """
     module_name = f"{{flow_name}}_api_keys"
+    module_path = os.path.join(__WORK_DIR__, f"{{module_name}}.py")
+    if os.path.isfile(module_path):
+        # a new module (not shared by name with other flows in the process)
+        module = ModuleType(module_name)
+        module.__file__ = module_path
+        module.__dict__["__ENV__"] = __ENV__
+        with open(module_path, "r", encoding="utf-8") as file:
+            code = compile(file.read(), module_path, "exec")
+        exec(code, module.__dict__)  # nosec B102 # pylint: disable=exec-used
+        return module
     if module_name in sys.modules:
         return importlib.reload(sys.modules[module_name])
     return importlib.import_module(module_name)
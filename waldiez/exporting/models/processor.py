@@ -13,6 +13,16 @@ from ..core.errors import ExporterContentError
 from ..core.extras.serializer import DefaultSerializer
 from ..core.protocols import Serializer
 
+RATE_LIMITER_IMPORT = """
+try:
+    from waldiez.running.llm_rate_limiter import limit_llm_calls
+except ImportError:  # pragma: no cover
+
+    def limit_llm_calls(agent: Any, rate_limit: dict[str, Any]) -> None:
+        \"\"\"Rate limit an agent's LLM requests (no waldiez, no limits).\"\"\"
+"""
+"""The (process-wide) LLM rate limiter (if waldiez is available)."""
+
 
 @dataclass
 class ModelProcessingResult:
@@ -49,6 +59,8 @@ class ModelProcessor:
             The string representation of all models' LLM configs.
         """
         content = ""
+        if any(model.get_rate_limit() for model in self.models):
+            content += RATE_LIMITER_IMPORT
         for model in self.models:
             model_name = self.model_names[model.id]
             model_config = model.get_llm_config()
@@ -67,6 +79,13 @@ class ModelProcessor:
                 f"\n{model_name}_llm_config: dict[str, Any] = "
                 f"{model_dict_str}\n"
             )
+            rate_limit = model.get_rate_limit()
+            if rate_limit:
+                rate_limit_str = self.serializer.serialize(rate_limit, tabs=0)
+                content += (
+                    f"\n{model_name}_rate_limit: dict[str, Any] = "
+                    f"{rate_limit_str}\n"
+                )
 
         # Write API keys file if output directory provided
         if self.output_dir:
@@ -86,6 +105,10 @@ class ModelProcessor:
 """API keys for the {self.flow_name} models."""
 
 import os
+from typing import Any
+
+# The flow's environment (os.environ, unless set by the flow)
+__ENV__: Any = globals().get("__ENV__", os.environ)
 
 __{flow_name_upper}_MODEL_API_KEYS__ = {{'''
 
@@ -119,7 +142,7 @@ def get_{flow_name_lower}_model_api_key(model_name: str) -> str:
         return ""
     env_key = entry.get("env_key", "")
     if env_key:
-        from_env = os.environ.get(env_key, "")
+        from_env = __ENV__.get(env_key, "")
         if from_env:
             return from_env
     return entry.get("key", "")
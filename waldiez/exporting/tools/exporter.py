@@ -204,6 +204,16 @@ def load_tool_secrets_module(flow_name: str, tool_name: str) -> ModuleType:
         The loaded module.
     """
     module_name = f"{{flow_name}}_{{tool_name}}_secrets"
+    module_path = os.path.join(__WORK_DIR__, f"{{module_name}}.py")
+    if os.path.isfile(module_path):
+        # a new module (not shared by name with other flows in the process)
+        module = ModuleType(module_name)
+        module.__file__ = module_path
+        module.__dict__["__ENV__"] = __ENV__
+        with open(module_path, "r", encoding="utf-8") as file:
+            code = compile(file.read(), module_path, "exec")
+        exec(code, module.__dict__)  # nosec B102 # pylint: disable=exec-used
+        return module
     if module_name in sys.modules:
         return importlib.reload(sys.modules[module_name])
     return importlib.import_module(module_name)
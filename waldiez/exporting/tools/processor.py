@@ -198,13 +198,18 @@ ag2_{tool_name} = ag2_{tool_name}_interop.convert_tool(
 """Secrets for the tool: {tool_name}."""
 
 ''')
-                f.write("import os\n\n")
+                f.write("import os\n")
+                f.write("from typing import Any\n\n")
+                f.write(
+                    "# The flow's environment "
+                    "(os.environ, unless set by the flow)\n"
+                    '__ENV__: Any = globals().get("__ENV__", os.environ)\n\n'
+                )
                 for key, value in tool.secrets.items():
-                    # f.write(f'os.environ["{key}"] = "{value}"\n')
-                    # check first if the key already exists in os.environ
+                    # check first if the key already exists in the env
                     to_write = (
-                        f'os.environ["{key}"] = '
-                        f'os.environ.get("{key}", "{value}")\n'
+                        f'__ENV__["{key}"] = '
+                        f'__ENV__.get("{key}", "{value}")\n'
                     )
                     f.write(to_write)
         except Exception as exc:  # pragma: no cover
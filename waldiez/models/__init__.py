@@ -104,6 +104,7 @@ from .model import (
     WaldiezModelAWS,
     WaldiezModelData,
     WaldiezModelPrice,
+    WaldiezModelRateLimit,
 )
 from .tool import (
     SHARED_TOOL_NAME,
@@ -178,6 +179,7 @@ __all__ = [
     "WaldiezModelAWS",
     "WaldiezModelData",
     "WaldiezModelPrice",
+    "WaldiezModelRateLimit",
     "WaldiezDocAgentQueryEngine",
     "WaldiezRagUserProxy",
     "WaldiezRagUserProxyChunkMode",
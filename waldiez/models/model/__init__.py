@@ -4,6 +4,7 @@
 
 from ._aws import WaldiezModelAWS
 from ._price import WaldiezModelPrice
+from ._rate_limit import WaldiezModelRateLimit
 from .extra_requirements import get_models_extra_requirements
 from .model import DEFAULT_BASE_URLS, MODEL_NEEDS_BASE_URL, WaldiezModel
 from .model_data import (
@@ -18,6 +19,7 @@ __all__ = [
     "WaldiezModel",
     "WaldiezModelData",
     "WaldiezModelPrice",
+    "WaldiezModelRateLimit",
     "WaldiezModelAPIType",
     "WaldiezModelAWS",
 ]
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+# flake8: noqa: E501
+"""Waldiez Model Rate Limit."""
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from ..common import WaldiezBase
+
+
+class WaldiezModelRateLimit(WaldiezBase):
+    """Model Rate Limit.
+
+    The limits are shared by all the flows (and agents) that use the same
+    model in a process.
+
+    Attributes
+    ----------
+    requests_per_minute : int | None
+        The maximum number of requests per minute.
+    tokens_per_minute : int | None
+        The maximum number of (prompt and completion) tokens per minute.
+    max_in_flight : int | None
+        The maximum number of concurrent requests.
+    """
+
+    requests_per_minute: Annotated[
+        int | None, Field(None, ge=1, alias="requestsPerMinute")
+    ]
+    tokens_per_minute: Annotated[
+        int | None, Field(None, ge=1, alias="tokensPerMinute")
+    ]
+    max_in_flight: Annotated[int | None, Field(None, ge=1, alias="maxInFlight")]
+
+    @property
+    def is_set(self) -> bool:
+        """Whether any limit is set."""
+        return any(
+            value is not None
+            for value in (
+                self.requests_per_minute,
+                self.tokens_per_minute,
+                self.max_in_flight,
+            )
+        )
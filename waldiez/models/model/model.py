@@ -194,6 +194,29 @@ class WaldiezModel(WaldiezBase):
             ]
         return None
 
+    def get_rate_limit(self) -> dict[str, Any] | None:
+        """Get the model's rate limit.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The limits and the key that identifies the model (api type,
+            base url and name) in the process-wide limiters, None if the
+            model has no rate limit.
+        """
+        rate_limit = self.data.rate_limit
+        if rate_limit is None or not rate_limit.is_set:
+            return None
+        base_url = self.data.base_url or DEFAULT_BASE_URLS.get(
+            self.data.api_type, ""
+        )
+        return {
+            "key": f"{self.data.api_type}:{base_url}:{self.name}",
+            "requests_per_minute": rate_limit.requests_per_minute,
+            "tokens_per_minute": rate_limit.tokens_per_minute,
+            "max_in_flight": rate_limit.max_in_flight,
+        }
+
     def get_llm_config(self, skip_price: bool = False) -> dict[str, Any]:
         """Get the model's llm config.
 
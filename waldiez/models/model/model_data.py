@@ -11,6 +11,7 @@ from typing_extensions import Self
 from ..common import WaldiezBase, update_dict
 from ._aws import WaldiezModelAWS
 from ._price import WaldiezModelPrice
+from ._rate_limit import WaldiezModelRateLimit
 
 WaldiezModelAPIType = Literal[
     "openai",
@@ -56,6 +57,8 @@ class WaldiezModelData(WaldiezBase):
         The default headers of the model.
     price : Optional[WaldiezModelPrice]
         The price of the model, by default None.
+    rate_limit : Optional[WaldiezModelRateLimit]
+        The (process-wide) rate limit of the model, by default None.
     """
 
     base_url: Annotated[
@@ -154,6 +157,15 @@ class WaldiezModelData(WaldiezBase):
             default=None, title="Price", description="The price of the model"
         ),
     ]
+    rate_limit: Annotated[
+        WaldiezModelRateLimit | None,
+        Field(
+            default=None,
+            alias="rateLimit",
+            title="Rate Limit",
+            description="The rate limit of the model's requests",
+        ),
+    ]
 
     @model_validator(mode="after")
     def validate_model_data(self) -> Self:
@@ -153,10 +153,10 @@ def {self.name}(
     Returns:
         A list of dictionaries of the search results.
     """
-    google_search_api_key = os.environ.get("GOOGLE_SEARCH_API_KEY", "")
+    google_search_api_key = __ENV__.get("GOOGLE_SEARCH_API_KEY", "")
     if not google_search_api_key:
         raise ValueError("GOOGLE_SEARCH_API_KEY is required for Google search tool.")
-    google_search_engine_id = os.environ.get("GOOGLE_SEARCH_ENGINE_ID", "")
+    google_search_engine_id = __ENV__.get("GOOGLE_SEARCH_ENGINE_ID", "")
     if not google_search_engine_id:
         raise ValueError("Google Search Engine ID is required for Google search tool.")
     {self.name}_tool = GoogleSearchTool(
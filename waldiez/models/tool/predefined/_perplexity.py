@@ -142,7 +142,7 @@ def {self.name}(
     Returns:
         A list of dictionaries of the search results.
     """
-    perplexity_api_key = os.environ.get("PERPLEXITY_API_KEY", "")
+    perplexity_api_key = __ENV__.get("PERPLEXITY_API_KEY", "")
     if not perplexity_api_key:
         raise ValueError("PERPLEXITY_API_KEY is required for Perplexity search tool.")
     perplexity_search_tool = PerplexitySearchTool(
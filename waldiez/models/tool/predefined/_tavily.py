@@ -126,7 +126,7 @@ def {self.name}(
             Raises:
                 ValueError: If the Tavily API key is not available.
     """
-    tavily_api_key = os.environ.get("TAVILY_API_KEY", "")
+    tavily_api_key = __ENV__.get("TAVILY_API_KEY", "")
     if not tavily_api_key:
         raise ValueError("TAVILY_API_KEY is required for Tavily search tool.")
     {self.name}_tool = TavilySearchTool(
@@ -122,7 +122,7 @@ def {self.name}(
     Raises:
         ValueError: If YOUTUBE_API_KEY is not set or if the search fails.
     """
-    youtube_api_key = os.environ.get("YOUTUBE_API_KEY", "")
+    youtube_api_key = __ENV__.get("YOUTUBE_API_KEY", "")
     if not youtube_api_key:
         raise ValueError("YOUTUBE_API_KEY is required for YouTube search tool.")
     youtube_search_tool = YoutubeSearchTool(
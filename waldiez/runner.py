@@ -17,6 +17,7 @@ during the flow execution.
 
 """
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -364,6 +365,98 @@ class WaldiezRunner(WaldiezBaseRunner):
             **kwargs,
         )
 
+    @override
+    def run_batch(
+        self,
+        inputs: str | Path | Iterable[str | dict[str, Any]],
+        concurrency: int = 4,
+        results_file: str | Path | None = None,
+        output_path: str | Path | None = None,
+        uploads_root: str | Path | None = None,
+        skip_deps: bool | None = None,
+        dot_env: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the flow once per input, concurrently.
+
+        Parameters
+        ----------
+        inputs : str | Path | Iterable[str | dict[str, Any]]
+            A JSONL file (or the items), each input a message or an object
+            with a ``message`` and an optional ``id``.
+        concurrency : int
+            The maximum number of inputs to run at the same time.
+        results_file : str | Path | None
+            An additional file to write the JSONL results to.
+        output_path : str | Path | None
+            The output path, by default None.
+        uploads_root : str | Path | None
+            The runtime uploads root, by default None.
+        skip_deps : bool | None
+            Whether to skip installing dependencies.
+        dot_env : str | Path | None
+            The path to the .env file, if any.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One record per input (in the inputs' order).
+        """
+        return self._runner.run_batch(
+            inputs,
+            concurrency=concurrency,
+            results_file=results_file,
+            output_path=output_path,
+            uploads_root=uploads_root,
+            skip_deps=skip_deps,
+            dot_env=dot_env,
+        )
+
+    @override
+    async def a_run_batch(
+        self,
+        inputs: str | Path | Iterable[str | dict[str, Any]],
+        concurrency: int = 4,
+        results_file: str | Path | None = None,
+        output_path: str | Path | None = None,
+        uploads_root: str | Path | None = None,
+        skip_deps: bool | None = None,
+        dot_env: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run an async flow once per input, concurrently.
+
+        Parameters
+        ----------
+        inputs : str | Path | Iterable[str | dict[str, Any]]
+            A JSONL file (or the items), each input a message or an object
+            with a ``message`` and an optional ``id``.
+        concurrency : int
+            The maximum number of inputs to run at the same time.
+        results_file : str | Path | None
+            An additional file to write the JSONL results to.
+        output_path : str | Path | None
+            The output path, by default None.
+        uploads_root : str | Path | None
+            The runtime uploads root, by default None.
+        skip_deps : bool | None
+            Whether to skip installing dependencies.
+        dot_env : str | Path | None
+            The path to the .env file, if any.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One record per input (in the inputs' order).
+        """
+        return await self._runner.a_run_batch(
+            inputs,
+            concurrency=concurrency,
+            results_file=results_file,
+            output_path=output_path,
+            uploads_root=uploads_root,
+            skip_deps=skip_deps,
+            dot_env=dot_env,
+        )
+
     @override
     @classmethod
     def load(
@@ -3,6 +3,7 @@
 """Common utilities for the waldiez runner."""
 
 import asyncio
+import contextvars
 import functools
 import inspect
 import logging
@@ -171,7 +172,11 @@ def _run_in_thread(
         finally:
             finished_event.set()
 
-    thread = threading.Thread(target=_thread_target, daemon=True)
+    # the call's context (e.g. the run's IOStream), not the thread's
+    context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run, args=(_thread_target,), daemon=True
+    )
     thread.start()
 
     # Wait for completion with timeout
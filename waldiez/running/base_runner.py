@@ -9,18 +9,25 @@
 
 import importlib.util
 import json
+import marshal
+import os
 import shutil
 import sys
 import tempfile
 import threading
 import traceback as tb
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from types import ModuleType, TracebackType
+from types import CodeType, ModuleType, TracebackType
 from typing import Any
 
 import aiofiles
+import anyio
+import anyio.to_thread
 from aiofiles.os import wrap
-from anyio.from_thread import start_blocking_portal
 from typing_extensions import Self, override
 
 from waldiez.exporter import WaldiezExporter
@@ -28,10 +35,35 @@ from waldiez.logger import WaldiezLogger, get_logger
 from waldiez.models import Waldiez
 from waldiez.storage import StorageManager, WaldiezCheckpoint, safe_name
 
+from .async_utils import syncify
+from .batch import (
+    BATCH_MESSAGE,
+    BATCH_RESULTS_FILE,
+    BatchInput,
+    a_run_batch_item,
+    batch_mp_context,
+    init_batch_worker,
+    load_batch_inputs,
+    run_batch_item,
+    write_batch_results,
+)
 from .dir_utils import a_chdir, chdir
 from .environment import reset_env_vars, set_env_vars
 from .events_mixin import EventsMixin
 from .exceptions import StopRunningException
+from .flow_cache import (
+    CompiledFlow,
+    FlowCodeCache,
+    get_flow_cache,
+    restore_files,
+    snapshot_files,
+    with_filename,
+)
+from .llm_cache import LLM_CACHE_STATS_FILE, LLMResponseCache
+from .llm_rate_limiter import (
+    LLM_RATE_LIMITS_STATS_FILE,
+    get_llm_rate_limits_stats,
+)
 from .protocol import WaldiezRunnerProtocol
 from .requirements_mixin import RequirementsMixin
 from .results_mixin import ResultsMixin
@@ -90,6 +122,22 @@ class WaldiezBaseRunner(
         self._last_exception: Exception | None = None
         self._running_lock = threading.Lock()
         self._loaded_module: ModuleType | None = None
+        self._compiled_flow: CompiledFlow | None = None
+        flow_cache = kwargs.get("flow_cache")
+        self._flow_cache = (
+            flow_cache
+            if isinstance(flow_cache, FlowCodeCache)
+            else get_flow_cache()
+        )
+        llm_cache = kwargs.get("llm_cache")
+        self._llm_cache = (
+            llm_cache
+            if isinstance(llm_cache, LLMResponseCache)
+            else LLMResponseCache.from_env()
+        )
+        self._llm_cache_stats: dict[str, Any] | None = None
+        self._llm_rate_limits_before: dict[str, dict[str, float]] | None = None
+        self._llm_rate_limits_stats: dict[str, Any] | None = None
         logger = kwargs.get("logger")
         if isinstance(logger, WaldiezLogger):
             self._logger = logger
@@ -121,6 +169,9 @@ class WaldiezBaseRunner(
         self._skip_logging = (
             str(kwargs.get("skip_logging", "False")).lower() == "true"
         )
+        self._isolated = str(kwargs.get("isolated", "False")).lower() == "true"
+        # an isolated run's environment (passed to its flow as __ENV__)
+        self._flow_env: dict[str, str] | None = None
 
     @staticmethod
     def _init_output_dir(output_path: str | Path | None) -> Path:
@@ -136,6 +187,9 @@ class WaldiezBaseRunner(
 
     def _store_run_paths(self, tmp_dir: Path, output_file: Path) -> None:
         """Store the path of the module that is to be run."""
+        if self._isolated:
+            # one (process-wide) file, for non-concurrent runs
+            return
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
             dir_path = StorageManager.default_root()
@@ -154,15 +208,17 @@ class WaldiezBaseRunner(
         except BaseException:
             self._logger.error(tb.format_exc())
 
-    @staticmethod
-    def _remove_run_paths() -> None:
+    def _remove_run_paths(self) -> None:
         """Remove run paths."""
-        ResultsMixin._cleanup()
+        if not self._isolated:
+            ResultsMixin._cleanup()
 
     async def _a_store_run_paths(
         self, tmp_dir: Path, output_file: Path
     ) -> None:
         """Store the path of the module that is to be run."""
+        if self._isolated:
+            return
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
             dir_path = StorageManager.default_root()
@@ -247,16 +303,32 @@ class WaldiezBaseRunner(
             return self._running
 
     def _load_module(self, output_file: Path, temp_dir: Path) -> ModuleType:
-        """Load the module from the waldiez file."""
+        """Load the module from the waldiez file.
+
+        The module gets a unique name (it is not added to ``sys.modules``),
+        the run's directory (``__WORK_DIR__``) and, if the run is isolated,
+        its environment (``__ENV__``).
+        """
         file_name = output_file.name
-        module_name = file_name.replace(".py", "")
+        module_name = f"{file_name.replace('.py', '')}_{uuid.uuid4().hex[:8]}"
         spec = importlib.util.spec_from_file_location(
             module_name, temp_dir / file_name
         )
         if not spec or not spec.loader:
             raise ImportError("Could not import the flow")
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module.__dict__["__WORK_DIR__"] = str(temp_dir)
+        if self._flow_env is not None:
+            module.__dict__["__ENV__"] = self._flow_env
+        compiled = self._compiled_flow
+        if compiled is not None and compiled.main_file == file_name:
+            # already exported and compiled (same flow and options)
+            code = with_filename(compiled.code, str(temp_dir / file_name))
+            exec(
+                code, module.__dict__
+            )  # nosec B102 # pylint: disable=exec-used
+        else:
+            spec.loader.exec_module(module)
         if not hasattr(module, "main"):
             raise ImportError(
                 "The waldiez file does not contain a main(...) function"
@@ -264,6 +336,181 @@ class WaldiezBaseRunner(
         self._loaded_module = module
         return module
 
+    def _prepare_llm_cache(self) -> list[tuple[str, str]]:
+        """Prepare the persistent LLM cache (if any) for a run.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The environment variables that point the flow to it.
+        """
+        self._llm_cache_stats = None
+        cache_seed = self._waldiez.cache_seed
+        if self._llm_cache is None or not isinstance(cache_seed, int):
+            return []
+        try:
+            self._llm_cache.prepare(cache_seed)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.log.warning("Could not prepare the LLM cache: %s", exc)
+            return []
+        return self._llm_cache.env_vars()
+
+    def _prepare_llm_rate_limits(self) -> None:
+        """Keep the rate limiters' stats before a run (if it uses them)."""
+        self._llm_rate_limits_stats = None
+        self._llm_rate_limits_before = None
+        if any(model.get_rate_limit() for model in self._waldiez.models):
+            self._llm_rate_limits_before = get_llm_rate_limits_stats()
+
+    def _collect_llm_rate_limits_stats(self, temp_dir: Path) -> None:
+        """Store the rate limited LLM requests of a run in its outputs.
+
+        Runs sharing a model's limiter at the same time are counted
+        together.
+        """
+        before = self._llm_rate_limits_before
+        if before is None:
+            return
+        stats: dict[str, Any] = {}
+        for key, after in get_llm_rate_limits_stats().items():
+            previous = before.get(key, {})
+            delta = {
+                name: after[name] - previous.get(name, 0)
+                for name in ("requests", "tokens", "throttled", "wait_seconds")
+            }
+            if not delta["requests"]:
+                continue
+            delta["wait_seconds"] = round(delta["wait_seconds"], 6)
+            stats[key] = delta
+        try:
+            with open(
+                temp_dir / LLM_RATE_LIMITS_STATS_FILE, "w", encoding="utf-8"
+            ) as file:
+                json.dump(stats, file, indent=2)
+        except OSError as exc:
+            self.log.warning("Could not store the LLM rate limits: %s", exc)
+        self._llm_rate_limits_stats = stats
+        for key, delta in stats.items():
+            self.log.info(
+                "LLM rate limit (%s): %d requests, %d throttled, %.3fs waiting",
+                key,
+                delta["requests"],
+                delta["throttled"],
+                delta["wait_seconds"],
+            )
+
+    def _collect_llm_cache_stats(self, temp_dir: Path) -> None:
+        """Store the LLM cache stats of a run in its outputs."""
+        cache_seed = self._waldiez.cache_seed
+        if self._llm_cache is None or not isinstance(cache_seed, int):
+            return
+        try:
+            stats = self._llm_cache.collect(cache_seed)
+            with open(
+                temp_dir / LLM_CACHE_STATS_FILE, "w", encoding="utf-8"
+            ) as file:
+                json.dump(stats, file, indent=2)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.log.warning("Could not collect the LLM cache stats: %s", exc)
+            return
+        self._llm_cache_stats = stats
+        if "hits" in stats:
+            self.log.info(
+                "LLM cache: %s hits, %s misses", stats["hits"], stats["misses"]
+            )
+
+    def _export_flow(
+        self,
+        temp_dir: Path,
+        file_name: str,
+        uploads_root: Path | None,
+        message: str | None,
+        skip_logging: bool,
+    ) -> None:
+        """Export (or restore from the flow cache) the flow to a directory.
+
+        Must be called with ``temp_dir`` as the current directory, unless
+        the run is isolated.
+        """
+        self._compiled_flow = None
+        key: str | None = None
+        if self._flow_cache.enabled and isinstance(self._waldiez, Waldiez):
+            key = self._flow_cache.key(
+                self._waldiez,
+                file_name=file_name,
+                structured_io=self._structured_io,
+                skip_logging=skip_logging,
+                message=message,
+                uploads_root=uploads_root,
+            )
+            cached = self._flow_cache.get(key)
+            if cached is not None:
+                restore_files(cached.files, temp_dir)
+                self._compiled_flow = cached
+                return
+        self._exporter.export(
+            path=temp_dir / file_name,
+            uploads_root=uploads_root,
+            message=message,
+            structured_io=self._structured_io,
+            skip_logging=skip_logging,
+            force=True,
+        )
+        if key is None:
+            return
+        files = snapshot_files(temp_dir)
+        if files is None or file_name not in files:
+            return
+        try:
+            code = compile(files[file_name], str(temp_dir / file_name), "exec")
+        except SyntaxError:
+            # let the import report it
+            return
+        self._compiled_flow = CompiledFlow(
+            files=files, main_file=file_name, code=code
+        )
+        self._flow_cache.put(key, self._compiled_flow)
+
+    @contextmanager
+    def _in_run_dir(self, temp_dir: Path) -> Iterator[None]:
+        """Enter the run's directory (unless the run is isolated)."""
+        if self._isolated:
+            yield
+            return
+        with chdir(to=temp_dir):
+            yield
+
+    @contextmanager
+    def _run_context(
+        self, temp_dir: Path, env_vars: list[tuple[str, str]]
+    ) -> Iterator[None]:
+        """Enter the run's directory and environment.
+
+        An isolated run changes none of them: its flow gets the run's
+        directory as ``__WORK_DIR__`` and a copy of the environment with
+        the flow's variables as ``__ENV__``. Others change the process'
+        current directory, ``sys.path`` and environment.
+        """
+        if self._isolated:
+            self._flow_env = dict(os.environ)
+            self._flow_env.update(
+                {key: value for key, value in env_vars if key}
+            )
+            try:
+                yield
+            finally:
+                self._flow_env = None
+            return
+        old_env_vars = set_env_vars(env_vars)
+        try:
+            with chdir(to=temp_dir):
+                sys.path.insert(0, str(temp_dir))
+                yield
+        finally:
+            reset_env_vars(old_env_vars)
+            if str(temp_dir) in sys.path:
+                sys.path.remove(str(temp_dir))
+
     def _before_run(
         self,
         output_file: Path,
@@ -275,14 +522,13 @@ class WaldiezBaseRunner(
         temp_dir = Path(tempfile.mkdtemp(prefix="wlz-"))
         self._output_dir = temp_dir
         file_name = output_file.name
-        with chdir(to=temp_dir):
-            self._exporter.export(
-                path=file_name,
+        with self._in_run_dir(temp_dir):
+            self._export_flow(
+                temp_dir,
+                file_name=file_name,
                 uploads_root=uploads_root,
                 message=message,
-                structured_io=self._structured_io,
-                skip_logging=self._skip_logging,
-                force=True,
+                skip_logging=self._skip_logging or self._isolated,
             )
             if self.dot_env_path and self.dot_env_path.is_file():
                 shutil.copyfile(
@@ -291,30 +537,51 @@ class WaldiezBaseRunner(
                 )
         return temp_dir
 
+    def _export_in_run_dir(
+        self,
+        temp_dir: Path,
+        file_name: str,
+        uploads_root: Path | None,
+        message: str | None,
+        skip_logging: bool,
+    ) -> None:
+        """Export the flow in the run's directory."""
+        with self._in_run_dir(temp_dir):
+            self._export_flow(
+                temp_dir,
+                file_name=file_name,
+                uploads_root=uploads_root,
+                message=message,
+                skip_logging=skip_logging,
+            )
+
     async def _a_before_run(
         self,
         output_file: Path,
         uploads_root: Path | None,
         message: str | None,
     ) -> Path:
-        """Run before the flow execution asynchronously."""
+        """Run before the flow execution asynchronously.
+
+        The export (or its restore from the flow cache) runs in a worker
+        thread, so the event loop is not blocked.
+        """
         temp_dir = Path(tempfile.mkdtemp(prefix="wlz-"))
         self._output_dir = temp_dir
-        file_name = output_file.name
-        async with a_chdir(to=temp_dir):
-            self._exporter.export(
-                path=file_name,
-                uploads_root=uploads_root,
-                message=message,
-                structured_io=self.structured_io,
-                force=True,
+        await anyio.to_thread.run_sync(
+            self._export_in_run_dir,
+            temp_dir,
+            output_file.name,
+            uploads_root,
+            message,
+            self._isolated,
+        )
+        if self.dot_env_path and self.dot_env_path.is_file():
+            wrapped = wrap(shutil.copyfile)
+            await wrapped(
+                str(self.dot_env_path),
+                str(temp_dir / ".env"),
             )
-            if self.dot_env_path and self.dot_env_path.is_file():
-                wrapped = wrap(shutil.copyfile)
-                await wrapped(
-                    str(self.dot_env_path),
-                    str(temp_dir / ".env"),
-                )
         return temp_dir
 
     def _run(
@@ -601,23 +868,26 @@ class WaldiezBaseRunner(
             str(kwargs.get("skip_logging", self._skip_logging)).lower()
             == "true"
         )
+        self._isolated = (
+            str(kwargs.get("isolated", self._isolated)).lower() == "true"
+        )
         if self.is_running():
             raise RuntimeError("Workflow already running")
         if self.is_async:
-            with start_blocking_portal(backend="asyncio") as portal:
-                return portal.call(
-                    self.a_run,
-                    output_path,
-                    uploads_root,
-                    structured_io,
-                    message,
-                    skip_mmd,
-                    skip_timeline,
-                    skip_symlinks,
-                    skip_deps,
-                    dot_env,
-                    **kwargs,
-                )
+            # in this thread, unless called from a running event loop
+            # (await a_run(...) there instead)
+            return syncify(self.a_run)(
+                output_path,
+                uploads_root,
+                structured_io,
+                message,
+                skip_mmd,
+                skip_timeline,
+                skip_symlinks,
+                skip_deps,
+                dot_env,
+                **kwargs,
+            )
         temp_dir, output_file, uploads_root_path = self.prepare(
             output_path=output_path,
             uploads_root=uploads_root,
@@ -626,11 +896,14 @@ class WaldiezBaseRunner(
         self._running = True
         results: list[dict[str, Any]] = []
         error: BaseException | None = None
-        old_env_vars = set_env_vars(self._waldiez.get_flow_env_vars())
+        self._prepare_llm_rate_limits()
+        env_vars = [
+            *self._waldiez.get_flow_env_vars(),
+            *self._prepare_llm_cache(),
+        ]
         output_dir = output_file.parent
         try:
-            with chdir(to=temp_dir):
-                sys.path.insert(0, str(temp_dir))
+            with self._run_context(temp_dir, env_vars):
                 results = self._run(
                     temp_dir=temp_dir,
                     output_file=output_file,
@@ -649,7 +922,8 @@ class WaldiezBaseRunner(
             error = exc
         finally:
             self._running = False
-            reset_env_vars(old_env_vars)
+            self._collect_llm_cache_stats(temp_dir)
+            self._collect_llm_rate_limits_stats(temp_dir)
             output = self.after_run(
                 results=results,
                 error=error,
@@ -663,8 +937,6 @@ class WaldiezBaseRunner(
             if output:
                 output_dir = output
         self.do_print("<Waldiez> - Done running the flow.")
-        if sys.path[0] == str(temp_dir):
-            sys.path.pop(0)
         return self.get_results(results, output_dir)
 
     async def a_prepare(
@@ -766,6 +1038,9 @@ class WaldiezBaseRunner(
             str(kwargs.get("skip_logging", self._skip_logging)).lower()
             == "true"
         )
+        self._isolated = (
+            str(kwargs.get("isolated", self._isolated)).lower() == "true"
+        )
         if self.is_running():
             raise RuntimeError("Workflow already running")
         temp_dir, output_file, uploads_root_path = await self.a_prepare(
@@ -777,10 +1052,13 @@ class WaldiezBaseRunner(
         results: list[dict[str, Any]] = []
         error: BaseException | None = None
         output_dir = output_file.parent
-        old_env_vars = set_env_vars(self._waldiez.get_flow_env_vars())
+        self._prepare_llm_rate_limits()
+        env_vars = [
+            *self._waldiez.get_flow_env_vars(),
+            *await anyio.to_thread.run_sync(self._prepare_llm_cache),
+        ]
         try:
-            async with a_chdir(to=temp_dir):
-                sys.path.insert(0, str(temp_dir))
+            with self._run_context(temp_dir, env_vars):
                 results = await self._a_run(
                     temp_dir=temp_dir,
                     output_file=output_file,
@@ -800,7 +1078,10 @@ class WaldiezBaseRunner(
             error = exc
         finally:
             self._running = False
-            reset_env_vars(old_env_vars)
+            await anyio.to_thread.run_sync(
+                self._collect_llm_cache_stats, temp_dir
+            )
+            self._collect_llm_rate_limits_stats(temp_dir)
             output = await self.a_after_run(
                 results=results,
                 error=error,
@@ -813,10 +1094,292 @@ class WaldiezBaseRunner(
             )
             if output:
                 output_dir = output
-        if sys.path[0] == str(temp_dir):
-            sys.path.pop(0)
         return await self.a_get_results(results, output_dir)
 
+    def _prepare_batch(
+        self,
+        output_path: str | Path | None,
+        uploads_root: str | Path | None,
+        skip_deps: bool | None,
+        dot_env: str | Path | None,
+    ) -> tuple[Path, Path, Path | None, CodeType]:
+        """Export and compile the flow once for a batch run."""
+        if self.is_running():
+            raise RuntimeError("Workflow already running")
+        interactive = [
+            agent.name
+            for agent in self._waldiez.agents
+            if agent.data.human_input_mode != "NEVER"
+        ]
+        if interactive:
+            # nobody to answer (and an async input would wait forever)
+            raise ValueError(
+                "Batch runs are not interactive, these agents ask for user "
+                f"input: {', '.join(interactive)}"
+            )
+        if isinstance(skip_deps, bool):
+            self._skip_deps = skip_deps
+        if dot_env is not None and Path(dot_env).resolve().is_file():
+            self._dot_env_path = Path(dot_env).resolve()
+        output_file, uploads_root_path = self._prepare_paths(
+            output_path=output_path,
+            uploads_root=uploads_root,
+        )
+        temp_dir = Path(tempfile.mkdtemp(prefix="wlz-"))
+        self._output_dir = temp_dir
+        file_path = temp_dir / output_file.name
+        with chdir(to=temp_dir):
+            self._export_flow(
+                temp_dir,
+                file_name=output_file.name,
+                uploads_root=uploads_root_path,
+                message=BATCH_MESSAGE,
+                skip_logging=True,
+            )
+        if self.dot_env_path and self.dot_env_path.is_file():
+            shutil.copyfile(str(self.dot_env_path), str(temp_dir / ".env"))
+        if self._compiled_flow is not None:
+            code = with_filename(self._compiled_flow.code, str(file_path))
+        else:
+            code = compile(file_path.read_bytes(), str(file_path), "exec")
+        return temp_dir, output_file, uploads_root_path, code
+
+    def _batch_outputs(
+        self,
+        records: list[dict[str, Any]],
+        temp_dir: Path,
+        results_file: str | Path | None,
+    ) -> list[dict[str, Any]]:
+        """Write a batch run's results (before the post-run actions)."""
+        records.sort(key=lambda record: record["index"])
+        write_batch_results(
+            records,
+            temp_dir / BATCH_RESULTS_FILE,
+            Path(results_file).resolve() if results_file else None,
+        )
+        # the (last) result of a single run, use all of them instead
+        (temp_dir / "results.json").unlink(missing_ok=True)
+        self._collect_llm_cache_stats(temp_dir)
+        self._collect_llm_rate_limits_stats(temp_dir)
+        return records
+
+    # pylint: disable=too-many-locals
+    def run_batch(
+        self,
+        inputs: str | Path | Iterable[str | dict[str, Any]],
+        concurrency: int = 4,
+        results_file: str | Path | None = None,
+        output_path: str | Path | None = None,
+        uploads_root: str | Path | None = None,
+        skip_deps: bool | None = None,
+        dot_env: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the flow once per input, concurrently.
+
+        The flow is exported and its requirements are checked once. Sync
+        flows run in ``concurrency`` worker processes, async ones are
+        delegated to :meth:`a_run_batch`. All the results go to one
+        ``results.jsonl`` (and ``results_file`` if given) and one
+        checkpoint. Batch runs are not interactive, so none of the flow's
+        agents can ask for user input.
+
+        Parameters
+        ----------
+        inputs : str | Path | Iterable[str | dict[str, Any]]
+            A JSONL file (or the items), each input a message or an object
+            with a ``message`` and an optional ``id``.
+        concurrency : int
+            The maximum number of inputs to run at the same time.
+        results_file : str | Path | None
+            An additional file to write the JSONL results to.
+        output_path : str | Path | None
+            The output path, by default None.
+        uploads_root : str | Path | None
+            The runtime uploads root, by default None.
+        skip_deps : bool | None
+            Whether to skip installing dependencies.
+        dot_env : str | Path | None
+            The path to the .env file, if any.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One record per input (in the inputs' order) with its ``id``,
+            ``message``, ``results``, ``error`` and ``duration``.
+
+        Raises
+        ------
+        ValueError
+            If an input has no message, or an agent asks for user input.
+        """
+        if self.is_async:
+            return syncify(self.a_run_batch)(
+                inputs,
+                concurrency=concurrency,
+                results_file=results_file,
+                output_path=output_path,
+                uploads_root=uploads_root,
+                skip_deps=skip_deps,
+                dot_env=dot_env,
+            )
+        items = load_batch_inputs(inputs)
+        temp_dir, output_file, uploads_root_path, code = self._prepare_batch(
+            output_path, uploads_root, skip_deps, dot_env
+        )
+        if not self._skip_deps:
+            self.install_requirements()
+        self._running = True
+        records: list[dict[str, Any]] = []
+        error: BaseException | None = None
+        self._prepare_llm_rate_limits()
+        old_env_vars = set_env_vars(
+            [*self._waldiez.get_flow_env_vars(), *self._prepare_llm_cache()]
+        )
+        try:
+            if items:
+                with ProcessPoolExecutor(
+                    max_workers=max(1, min(concurrency, len(items))),
+                    mp_context=batch_mp_context(),
+                    initializer=init_batch_worker,
+                    initargs=(
+                        str(temp_dir),
+                        output_file.name,
+                        marshal.dumps(code),
+                        dict(os.environ),
+                    ),
+                ) as pool:
+                    futures = [pool.submit(run_batch_item, it) for it in items]
+                    for future in as_completed(futures):
+                        records.append(future.result())
+                        if self._stop_requested.is_set():
+                            pool.shutdown(cancel_futures=True)
+                            break
+        except BaseException as exc:
+            self.log.error("Error occurred while running the batch: %s", exc)
+            error = exc
+        finally:
+            self._running = False
+            reset_env_vars(old_env_vars)
+            records = self._batch_outputs(records, temp_dir, results_file)
+            self.after_run(
+                results=records,
+                error=error,
+                output_file=output_file,
+                uploads_root=uploads_root_path,
+                temp_dir=temp_dir,
+                skip_mmd=True,
+                skip_timeline=True,
+                skip_symlinks=False,
+            )
+        return records
+
+    async def a_run_batch(
+        self,
+        inputs: str | Path | Iterable[str | dict[str, Any]],
+        concurrency: int = 4,
+        results_file: str | Path | None = None,
+        output_path: str | Path | None = None,
+        uploads_root: str | Path | None = None,
+        skip_deps: bool | None = None,
+        dot_env: str | Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run an async flow once per input, concurrently.
+
+        The inputs run in a task group, ``concurrency`` at a time, each in
+        its own ``batch-<index>`` working directory. See :meth:`run_batch`.
+
+        Parameters
+        ----------
+        inputs : str | Path | Iterable[str | dict[str, Any]]
+            A JSONL file (or the items), each input a message or an object
+            with a ``message`` and an optional ``id``.
+        concurrency : int
+            The maximum number of inputs to run at the same time.
+        results_file : str | Path | None
+            An additional file to write the JSONL results to.
+        output_path : str | Path | None
+            The output path, by default None.
+        uploads_root : str | Path | None
+            The runtime uploads root, by default None.
+        skip_deps : bool | None
+            Whether to skip installing dependencies.
+        dot_env : str | Path | None
+            The path to the .env file, if any.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One record per input (in the inputs' order).
+
+        Raises
+        ------
+        RuntimeError
+            If the flow is not async.
+        ValueError
+            If an input has no message, or an agent asks for user input.
+        """
+        if not self.is_async:
+            raise RuntimeError("The flow is not async, use run_batch")
+        items = load_batch_inputs(inputs)
+        (
+            temp_dir,
+            output_file,
+            uploads_root_path,
+            code,
+        ) = await anyio.to_thread.run_sync(
+            self._prepare_batch, output_path, uploads_root, skip_deps, dot_env
+        )
+        if not self._skip_deps:
+            await self.a_install_requirements()
+        self._running = True
+        records: list[dict[str, Any]] = []
+        error: BaseException | None = None
+        limiter = anyio.CapacityLimiter(max(1, concurrency))
+        file_path = str(temp_dir / output_file.name)
+
+        async def _run_item(item: BatchInput) -> None:
+            async with limiter:
+                if not self._stop_requested.is_set():
+                    records.append(
+                        await a_run_batch_item(code, file_path, item)
+                    )
+
+        self._prepare_llm_rate_limits()
+        old_env_vars = set_env_vars(
+            [
+                *self._waldiez.get_flow_env_vars(),
+                *await anyio.to_thread.run_sync(self._prepare_llm_cache),
+            ]
+        )
+        sys.path.insert(0, str(temp_dir))
+        try:
+            async with a_chdir(to=temp_dir):
+                async with anyio.create_task_group() as task_group:
+                    for item in items:
+                        task_group.start_soon(_run_item, item)
+        except BaseException as exc:
+            self.log.error("Error occurred while running the batch: %s", exc)
+            error = exc
+        finally:
+            self._running = False
+            reset_env_vars(old_env_vars)
+            if str(temp_dir) in sys.path:
+                sys.path.remove(str(temp_dir))
+            records = await anyio.to_thread.run_sync(
+                self._batch_outputs, records, temp_dir, results_file
+            )
+            await self.a_after_run(
+                results=records,
+                error=error,
+                output_file=output_file,
+                uploads_root=uploads_root_path,
+                temp_dir=temp_dir,
+                skip_mmd=True,
+                skip_timeline=True,
+                skip_symlinks=False,
+            )
+        return records
+
     @override
     def after_run(
         self,
@@ -917,6 +1480,16 @@ class WaldiezBaseRunner(
             skip_symlinks=skip_symlinks,
         )
 
+    @property
+    def llm_cache_stats(self) -> dict[str, Any] | None:
+        """The persistent LLM cache stats of the last run (if used)."""
+        return self._llm_cache_stats
+
+    @property
+    def llm_rate_limits_stats(self) -> dict[str, Any] | None:
+        """The rate limited LLM requests of the last run (by model)."""
+        return self._llm_rate_limits_stats
+
     @property
     def waldiez(self) -> Waldiez:
         """Get the Waldiez instance."""
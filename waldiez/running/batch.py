@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,global-statement
+"""Run one flow over many inputs.
+
+The flow is exported (with a placeholder initial message) and compiled
+once. Each input then gets a fresh module (its own agents) executed from
+that code, with the placeholder replaced by the input's message, and its
+``main()`` called:
+
+- async flows run concurrently in the runner's event loop,
+- sync flows run in a pool of worker processes.
+
+Each input gets its own working directory under the run's one
+(``batch-<index>``), passed to the flow as ``__WORK_DIR__``, for the files
+the flow writes (results, cache, code execution). The current directory
+(what relative paths in user code resolve against) is the input's one in
+the worker processes, but the run's one for concurrent async runs.
+
+Batch runs are not interactive: flows with agents that ask for user input
+(a human input mode other than ``NEVER``) are rejected before running.
+"""
+
+import json
+import marshal
+import multiprocessing
+import os
+import sys
+import time
+from collections.abc import Iterable
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Any, TypedDict
+
+BATCH_MESSAGE = "__WALDIEZ_BATCH_MESSAGE__"
+BATCH_RESULTS_FILE = "results.jsonl"
+
+
+class BatchInput(TypedDict):
+    """An input of a batch run."""
+
+    index: int
+    id: str
+    message: str
+
+
+def load_batch_inputs(
+    inputs: str | Path | Iterable[str | dict[str, Any]],
+) -> list[BatchInput]:
+    """Load the inputs of a batch run.
+
+    Parameters
+    ----------
+    inputs : str | Path | Iterable[str | dict[str, Any]]
+        A JSONL file (or the items) with one input per line: either a
+        message (a json string) or an object with a ``message`` and an
+        optional ``id``.
+
+    Returns
+    -------
+    list[BatchInput]
+        The inputs.
+
+    Raises
+    ------
+    ValueError
+        If an input has no message.
+    """
+    items: Iterable[Any]
+    if isinstance(inputs, (str, Path)):
+        with open(inputs, "r", encoding="utf-8") as file:
+            items = [json.loads(line) for line in file if line.strip()]
+    else:
+        items = inputs
+    loaded: list[BatchInput] = []
+    for index, item in enumerate(items):
+        message: Any = item
+        item_id: Any = index
+        if isinstance(item, dict):
+            message = item.get("message")
+            item_id = item.get("id", index)
+        if not isinstance(message, str) or not message:
+            raise ValueError(f"Batch input {index} has no message")
+        loaded.append({"index": index, "id": str(item_id), "message": message})
+    return loaded
+
+
+def batch_work_dir(run_dir: str | Path, item: BatchInput) -> Path:
+    """Get (and create) the working directory of an input.
+
+    Parameters
+    ----------
+    run_dir : str | Path
+        The run's directory (with the exported flow).
+    item : BatchInput
+        The input.
+
+    Returns
+    -------
+    Path
+        The input's directory.
+    """
+    work_dir = Path(run_dir) / f"batch-{item['index']}"
+    work_dir.mkdir(parents=True, exist_ok=True)
+    return work_dir
+
+
+def new_flow_module(
+    code: CodeType,
+    file_path: str,
+    message: str,
+    work_dir: str | None = None,
+) -> ModuleType:
+    """Execute the flow's code in a new module, with an input's message.
+
+    Parameters
+    ----------
+    code : CodeType
+        The compiled flow (exported with ``BATCH_MESSAGE``).
+    file_path : str
+        The flow's file.
+    message : str
+        The input's message.
+    work_dir : str | None
+        The directory of the files the flow writes (``__WORK_DIR__``),
+        the current one if not set.
+
+    Returns
+    -------
+    ModuleType
+        The module (not added to ``sys.modules``).
+
+    Raises
+    ------
+    ValueError
+        If the flow's initial message cannot be replaced (e.g. a flow
+        of sequential chats).
+    """
+    module = ModuleType(Path(file_path).stem)
+    module.__file__ = file_path
+    if work_dir:
+        module.__dict__["__WORK_DIR__"] = work_dir
+    exec(code, module.__dict__)  # nosec B102 # pylint: disable=exec-used
+    initial = getattr(module, "__INITIAL_MSG__", None)
+    if not isinstance(initial, str) or BATCH_MESSAGE not in initial:
+        raise ValueError("The flow's initial message cannot be replaced")
+    module.__dict__["__INITIAL_MSG__"] = initial.replace(BATCH_MESSAGE, message)
+    return module
+
+
+def _record(
+    item: BatchInput,
+    results: list[dict[str, Any]],
+    error: BaseException | None,
+    started: float,
+) -> dict[str, Any]:
+    """Get the result record of an input."""
+    return {
+        "index": item["index"],
+        "id": item["id"],
+        "message": item["message"],
+        "results": results,
+        "error": (str(error) or type(error).__name__) if error else None,
+        "duration": round(time.perf_counter() - started, 6),
+    }
+
+
+def batch_mp_context() -> BaseContext:
+    """Get the multiprocessing context of a sync batch run's workers.
+
+    Forking the runner's process can leave the workers with locks held
+    at the time (e.g. by other threads or previous runs), so, where
+    available, the workers are forked from a fork server that has already
+    imported waldiez and autogen (started once per process). Elsewhere,
+    they are spawned.
+
+    Returns
+    -------
+    BaseContext
+        The context.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__, "autogen"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+_WORKER_CODE: CodeType | None = None
+_WORKER_FILE = ""
+
+
+def init_batch_worker(
+    temp_dir: str, file_name: str, code: bytes, env: dict[str, str]
+) -> None:
+    """Initialize a worker process of a sync batch run.
+
+    Parameters
+    ----------
+    temp_dir : str
+        The run's directory (with the exported flow and the inputs'
+        working directories).
+    file_name : str
+        The flow's file name.
+    code : bytes
+        The marshalled compiled flow.
+    env : dict[str, str]
+        The run's environment (a fork server's workers do not inherit it).
+    """
+    global _WORKER_CODE, _WORKER_FILE
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(temp_dir)
+    if temp_dir not in sys.path:
+        sys.path.insert(0, temp_dir)
+    _WORKER_CODE = marshal.loads(code)  # nosec B302
+    _WORKER_FILE = str(Path(temp_dir) / file_name)
+
+
+def run_batch_item(item: BatchInput) -> dict[str, Any]:
+    """Run a sync flow with an input (in a worker process).
+
+    Parameters
+    ----------
+    item : BatchInput
+        The input.
+
+    Returns
+    -------
+    dict[str, Any]
+        The input's result record.
+    """
+    started = time.perf_counter()
+    if _WORKER_CODE is None:  # pragma: no cover
+        error = RuntimeError("The batch worker is not initialized")
+        return _record(item, [], error, started)
+    try:
+        work_dir = batch_work_dir(Path(_WORKER_FILE).parent, item)
+        # a worker runs one input at a time
+        os.chdir(work_dir)
+        module = new_flow_module(
+            _WORKER_CODE, _WORKER_FILE, item["message"], str(work_dir)
+        )
+        results = module.main()
+    except (Exception, SystemExit) as exc:
+        return _record(item, [], exc, started)
+    return _record(item, results or [], None, started)
+
+
+async def a_run_batch_item(
+    code: CodeType, file_path: str, item: BatchInput
+) -> dict[str, Any]:
+    """Run an async flow with an input (in its own working directory).
+
+    Parameters
+    ----------
+    code : CodeType
+        The compiled flow.
+    file_path : str
+        The flow's file.
+    item : BatchInput
+        The input.
+
+    Returns
+    -------
+    dict[str, Any]
+        The input's result record.
+    """
+    started = time.perf_counter()
+    try:
+        work_dir = batch_work_dir(Path(file_path).parent, item)
+        module = new_flow_module(
+            code, file_path, item["message"], str(work_dir)
+        )
+        results = await module.main()
+    except (Exception, SystemExit) as exc:
+        return _record(item, [], exc, started)
+    return _record(item, results or [], None, started)
+
+
+def write_batch_results(
+    records: list[dict[str, Any]], *paths: Path | None
+) -> None:
+    """Write the result records (ordered by input) as JSONL.
+
+    Parameters
+    ----------
+    records : list[dict[str, Any]]
+        The records.
+    *paths : Path | None
+        The files to write.
+    """
+    lines = "".join(
+        json.dumps(record, default=str, ensure_ascii=False) + "\n"
+        for record in sorted(records, key=lambda record: record["index"])
+    )
+    for path in paths:
+        if path is None:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="\n") as file:
+            file.write(lines)
@@ -14,8 +14,15 @@ import sys
 from collections.abc import Generator
 
 
-def refresh_environment() -> None:
-    """Refresh the environment."""
+def refresh_environment(reload: bool = True) -> None:
+    """Refresh the environment.
+
+    Parameters
+    ----------
+    reload : bool
+        Whether to also reload the already imported autogen (and chromadb)
+        modules, only needed after installing new packages.
+    """
     # a group chat without a user agent
     # creates a new user (this has a default code execution with docker)
     # captain also generates new agents that also have
@@ -25,8 +32,9 @@ def refresh_environment() -> None:
     os.environ["ANONYMIZED_TELEMETRY"] = "False"
     os.environ["TOGETHER_NO_BANNER"] = "1"
     try_handle_the_np_thing()
-    reload_autogen()
-    reload_chroma_if_needed()
+    if reload:
+        reload_autogen()
+        reload_chroma_if_needed()
 
 
 # pylint: disable=too-complex,too-many-try-statements,unused-import
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 import aiofiles
 
 from waldiez.storage import WaldiezCheckpoint
+from waldiez.storage.history import get_history_log
 from waldiez.storage.storage_manager import StorageManager
 
 from .async_utils import is_async_callable, syncify
@@ -249,11 +250,12 @@ class EventsMixin:
 
     @staticmethod
     async def a_save_history(output_dir: Path) -> None:
-        """Append the current state and metadata to history.json (async).
+        """Append the current state and metadata to the history log (async).
 
         Reads the latest `state.json` and `metadata.json` (if present) and
-        appends them to a list in `history.json`. Each entry includes a UTC
-        ISO timestamp. Missing or malformed files are handled gracefully.
+        appends them to the checkpoint's append-only history log. Each entry
+        includes a UTC ISO timestamp. Missing or malformed files are handled
+        gracefully.
 
         Parameters
         ----------
@@ -262,7 +264,6 @@ class EventsMixin:
         """
         state_file = output_dir / "state.json"
         metadata_file = output_dir / "metadata.json"
-        history_file = output_dir / "history.json"
 
         # If either state or metadata is missing, there's nothing to record.
         if not state_file.exists() or not metadata_file.exists():
@@ -290,22 +291,7 @@ class EventsMixin:
             "state": state_data,
             "metadata": metadata_data,
         }
-
-        # Load existing history (if present)
-        history: list[dict[str, Any]] = []
-        if history_file.exists():
-            existing = await _read_json(history_file)
-            if isinstance(existing, list):
-                history = existing
-            elif existing is not None:
-                # If someone wrote a non-list, wrap it to preserve data
-                history = [existing]
-
-        history.append(entry)
-
-        # Write back updated history
-        async with aiofiles.open(history_file, "w", encoding="utf-8") as f_out:
-            await f_out.write(json.dumps(history, default=str, indent=2))
+        await get_history_log(output_dir).a_append(entry)
 
     async def a_process_event(
         self,
@@ -388,11 +374,11 @@ class EventsMixin:
 
     @staticmethod
     def save_history(output_dir: Path) -> None:
-        """Append the current state and metadata to history.json.
+        """Append the current state and metadata to the history log.
 
         Reads the latest `state.json` and `metadata.json` (if present) and
-        appends them to a list in `history.json`. Each entry includes a UTC
-        ISO timestamp.
+        appends them to the checkpoint's append-only history log. Each entry
+        includes a UTC timestamp.
 
         Parameters
         ----------
@@ -401,30 +387,19 @@ class EventsMixin:
         """
         state_file = output_dir / "state.json"
         metadata_file = output_dir / "metadata.json"
-        history_file = output_dir / "history.json"
-        # pylint: disable=broad-exception-caught
         state = StorageManager.load_dict(state_file)
         metadata = StorageManager.load_dict(metadata_file)
         if not state:  # pragma: no cover
             return
-        history = StorageManager.load_list(history_file, "history")
-        # Compose the new history entry
-        entry = {
+        entry: dict[str, Any] = {
             "timestamp": WaldiezCheckpoint.format_timestamp(
                 datetime.now(timezone.utc)
             ),
             "state": state,
         }
-        # Append new entry and write back
-        history.append(entry)
-        with open(history_file, "w", encoding="utf-8") as f:
-            f.write(
-                json.dumps(
-                    {"history": history, "metadata": metadata},
-                    default=str,
-                    indent=2,
-                )
-            )
+        if metadata:
+            entry["metadata"] = metadata
+        get_history_log(output_dir).append(entry)
 
     def process_event(
         self,
@@ -0,0 +1,259 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+"""Process-wide cache of exported and compiled flows.
+
+Exporting a flow and compiling the generated module is repeated for every
+run, even for an unchanged flow (e.g. a flow used as a tool, called many
+times by another flow). The cache keeps, per (flow content, waldiez
+version, export options), the files the export generated and the
+compiled code of the flow's module, so a repeat run only writes the
+files to its new directory and executes the module.
+
+The cache is in memory only: the generated files can include secrets
+(api keys of models or tools), they are not written anywhere else.
+Exports that embed their output directory's path are not cached.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType
+
+from waldiez.models import Waldiez
+from waldiez.utils.version import get_waldiez_version
+
+WALDIEZ_FLOW_CACHE_SIZE = "WALDIEZ_FLOW_CACHE_SIZE"
+DEFAULT_FLOW_CACHE_SIZE = 32
+
+
+@dataclass
+class CompiledFlow:
+    """The exported files and the compiled module of a flow."""
+
+    files: dict[str, bytes]
+    main_file: str
+    code: CodeType
+    hits: int = field(default=0)
+
+
+def with_filename(code: CodeType, filename: str) -> CodeType:
+    """Get a code object (and its nested ones) with another file name.
+
+    Parameters
+    ----------
+    code : CodeType
+        The (module's) code object.
+    filename : str
+        The file name to use in tracebacks.
+
+    Returns
+    -------
+    CodeType
+        The code object with the new file name.
+    """
+    if code.co_filename == filename:
+        return code
+    consts = tuple(
+        with_filename(const, filename) if isinstance(const, CodeType) else const
+        for const in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def snapshot_files(directory: Path) -> dict[str, bytes] | None:
+    """Read the files of an export's directory.
+
+    Parameters
+    ----------
+    directory : Path
+        The export's output directory.
+
+    Returns
+    -------
+    dict[str, bytes] | None
+        The contents by relative (posix) path, None if any of them refers
+        to the directory itself (so it cannot be reused elsewhere).
+    """
+    markers = {str(directory).encode(), str(directory.resolve()).encode()}
+    files: dict[str, bytes] = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = Path(root) / name
+            if path.is_symlink():
+                return None
+            content = path.read_bytes()
+            if any(marker in content for marker in markers):
+                return None
+            files[path.relative_to(directory).as_posix()] = content
+    return files
+
+
+def restore_files(files: dict[str, bytes], directory: Path) -> None:
+    """Write a snapshot's files to another directory.
+
+    Parameters
+    ----------
+    files : dict[str, bytes]
+        The contents by relative (posix) path.
+    directory : Path
+        The target directory.
+    """
+    for relative, content in files.items():
+        path = directory / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+class FlowCodeCache:
+    """LRU cache of exported and compiled flows."""
+
+    def __init__(self, max_entries: int = DEFAULT_FLOW_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            The maximum number of flows to keep (0 disables the cache).
+        """
+        self._max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, CompiledFlow] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache keeps anything."""
+        return self._max_entries > 0
+
+    @staticmethod
+    def key(
+        waldiez: Waldiez,
+        *,
+        file_name: str,
+        structured_io: bool,
+        skip_logging: bool,
+        message: str | None = None,
+        uploads_root: Path | None = None,
+    ) -> str:
+        """Get the cache key of a flow's export.
+
+        Parameters
+        ----------
+        waldiez : Waldiez
+            The flow.
+        file_name : str
+            The generated module's file name.
+        structured_io : bool
+            Whether the export uses structured I/O.
+        skip_logging : bool
+            Whether the export skips logging (flow used as a tool).
+        message : str | None
+            The initial message override (if any).
+        uploads_root : Path | None
+            The uploads root (if any).
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        digest = hashlib.sha256()
+        for part in (
+            waldiez.model_dump_json(),
+            get_waldiez_version(),
+            file_name,
+            str(structured_io),
+            str(skip_logging),
+            message if message is not None else "\0",
+            str(uploads_root) if uploads_root else "\0",
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> CompiledFlow | None:
+        """Get a cached flow.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        Returns
+        -------
+        CompiledFlow | None
+            The cached flow, None if not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            entry.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CompiledFlow) -> None:
+        """Cache a flow.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        entry : CompiledFlow
+            The exported files and compiled code.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the cached flows."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached flows."""
+        return len(self._entries)
+
+
+_FLOW_CACHE: FlowCodeCache | None = None
+_FLOW_CACHE_LOCK = threading.Lock()
+
+
+def get_flow_cache() -> FlowCodeCache:
+    """Get the process-wide flow cache.
+
+    Its size is read from the ``WALDIEZ_FLOW_CACHE_SIZE`` environment
+    variable (0 disables it).
+
+    Returns
+    -------
+    FlowCodeCache
+        The cache.
+    """
+    global _FLOW_CACHE  # pylint: disable=global-statement
+    with _FLOW_CACHE_LOCK:
+        if _FLOW_CACHE is None:
+            try:
+                size = int(
+                    os.environ.get(
+                        WALDIEZ_FLOW_CACHE_SIZE, str(DEFAULT_FLOW_CACHE_SIZE)
+                    )
+                )
+            except ValueError:
+                size = DEFAULT_FLOW_CACHE_SIZE
+            _FLOW_CACHE = FlowCodeCache(size)
+        return _FLOW_CACHE
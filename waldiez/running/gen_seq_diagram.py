@@ -3,14 +3,18 @@
 
 # pyright: reportUnknownArgumentType=false,reportUnknownVariableType=false
 # pyright: reportUnknownMemberType=false
+# pylint: disable=import-outside-toplevel
 """Generate a Mermaid sequence diagram from a file containing event data."""
 
+from __future__ import annotations
+
 import json
 import re
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 MAX_LEN = 100
 SEQ_TXT = """
@@ -172,6 +176,8 @@ def generate_sequence_diagram(
     ValueError
         If the input file is not a JSON or CSV file.
     """
+    import pandas as pd
+
     if isinstance(file_path, str):
         file_path = Path(file_path)
     if not file_path.exists():
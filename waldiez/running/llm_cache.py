@@ -0,0 +1,253 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=import-outside-toplevel
+# pyright: reportMissingTypeStubs=false
+"""Persistent LLM response cache shared by the runs of flows.
+
+A flow with a ``cache_seed`` wraps its chats in an ag2 ``Cache`` (keyed by
+the model and the request). By default, it is a disk cache in the run's
+(fresh) directory, so every run starts cold. With a persistent location,
+the exported flow uses it instead (see the ``WALDIEZ_LLM_CACHE_DIR`` and
+``WALDIEZ_LLM_CACHE_REDIS_URL`` variables it reads) and the runner:
+
+- sets the disk cache's size limit and least-recently-used eviction
+  before the run (the settings are stored in the cache itself),
+- expires the entries older than the TTL (if any) after the run,
+- reports the hits and misses of the run.
+
+Enable it with ``WALDIEZ_LLM_CACHE=1`` (a ``llm`` directory in the user's
+cache directory), ``WALDIEZ_LLM_CACHE_DIR=<dir>`` (e.g. a workspace
+directory) or ``WALDIEZ_LLM_CACHE_REDIS_URL=<url>``.
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+WALDIEZ_LLM_CACHE = "WALDIEZ_LLM_CACHE"
+WALDIEZ_LLM_CACHE_DIR = "WALDIEZ_LLM_CACHE_DIR"
+WALDIEZ_LLM_CACHE_REDIS_URL = "WALDIEZ_LLM_CACHE_REDIS_URL"
+WALDIEZ_LLM_CACHE_SIZE = "WALDIEZ_LLM_CACHE_SIZE"
+WALDIEZ_LLM_CACHE_TTL = "WALDIEZ_LLM_CACHE_TTL"
+DEFAULT_SIZE_LIMIT = 2**30  # 1 GiB
+LLM_CACHE_STATS_FILE = "llm_cache.json"
+DISKCACHE_DB = "cache.db"  # diskcache.core.DBNAME
+
+
+def _default_cache_dir() -> Path:
+    """Get the default location of the disk cache."""
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("waldiez", appauthor=False)) / "llm"
+
+
+def _open_disk_cache(directory: Path) -> Any:
+    """Open (or create) the disk cache of a seed, as ag2's DiskCache does."""
+    import diskcache  # type: ignore
+
+    return diskcache.Cache(str(directory))
+
+
+class LLMResponseCache:
+    """Persistent LLM response cache configuration and maintenance."""
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+        ttl: float | None = None,
+        redis_url: str | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        directory : str | Path | None
+            The root of the disk caches (one per cache seed), defaults to
+            ``llm`` in the user's cache directory.
+        size_limit : int
+            The maximum size (in bytes) of a disk cache.
+        ttl : float | None
+            The time (in seconds) to keep a response, None to keep it
+            until evicted.
+        redis_url : str | None
+            Use a redis cache instead of a disk one (the size limit, TTL
+            and stats are then up to the redis server).
+        """
+        self._directory = (
+            Path(directory).expanduser().resolve()
+            if directory
+            else _default_cache_dir()
+        )
+        self._size_limit = max(0, size_limit)
+        self._ttl = ttl if ttl and ttl > 0 else None
+        self._redis_url = redis_url or None
+        self._stats_before: tuple[int, int] = (0, 0)
+
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache | None":
+        """Get a cache if enabled with the ``WALDIEZ_LLM_CACHE*`` variables.
+
+        Returns
+        -------
+        LLMResponseCache | None
+            The cache, None if not enabled.
+        """
+        enabled = os.environ.get(WALDIEZ_LLM_CACHE, "").lower()
+        directory = os.environ.get(WALDIEZ_LLM_CACHE_DIR, "")
+        redis_url = os.environ.get(WALDIEZ_LLM_CACHE_REDIS_URL, "")
+        if enabled in ("0", "false", "no", "off") or not (
+            enabled or directory or redis_url
+        ):
+            return None
+        try:
+            size_limit = int(
+                os.environ.get(WALDIEZ_LLM_CACHE_SIZE, str(DEFAULT_SIZE_LIMIT))
+            )
+        except ValueError:
+            size_limit = DEFAULT_SIZE_LIMIT
+        try:
+            ttl: float | None = float(
+                os.environ.get(WALDIEZ_LLM_CACHE_TTL, "0") or "0"
+            )
+        except ValueError:
+            ttl = None
+        return cls(
+            directory=directory or None,
+            size_limit=size_limit,
+            ttl=ttl,
+            redis_url=redis_url,
+        )
+
+    @property
+    def directory(self) -> Path:
+        """The root of the disk caches."""
+        return self._directory
+
+    @property
+    def size_limit(self) -> int:
+        """The maximum size (in bytes) of a disk cache."""
+        return self._size_limit
+
+    @property
+    def ttl(self) -> float | None:
+        """The time (in seconds) to keep a response."""
+        return self._ttl
+
+    def env_vars(self) -> list[tuple[str, str]]:
+        """Get the variables that point the exported flow to the cache.
+
+        Returns
+        -------
+        list[tuple[str, str]]
+            The environment variables (names and values).
+        """
+        if self._redis_url:
+            return [(WALDIEZ_LLM_CACHE_REDIS_URL, self._redis_url)]
+        return [(WALDIEZ_LLM_CACHE_DIR, str(self._directory))]
+
+    def seed_dir(self, cache_seed: int | str) -> Path:
+        """Get the disk cache directory of a seed (as ag2 names it).
+
+        Parameters
+        ----------
+        cache_seed : int | str
+            The flow's cache seed.
+
+        Returns
+        -------
+        Path
+            The directory.
+        """
+        return self._directory / str(cache_seed)
+
+    def prepare(self, cache_seed: int | str) -> None:
+        """Apply the eviction settings before a run.
+
+        Parameters
+        ----------
+        cache_seed : int | str
+            The flow's cache seed.
+        """
+        if self._redis_url:
+            return
+        with _open_disk_cache(self.seed_dir(cache_seed)) as cache:
+            cache.reset("eviction_policy", "least-recently-used")
+            cache.reset("size_limit", self._size_limit)
+            self._stats_before = cache.stats(enable=True)
+
+    def collect(self, cache_seed: int | str) -> dict[str, Any]:
+        """Expire old entries and get the run's stats.
+
+        Runs sharing the cache at the same time are counted together.
+
+        Parameters
+        ----------
+        cache_seed : int | str
+            The flow's cache seed.
+
+        Returns
+        -------
+        dict[str, Any]
+            The hits, misses, entries and size of the cache.
+        """
+        stats: dict[str, Any] = {"cache_seed": cache_seed}
+        if self._redis_url:
+            stats["backend"] = "redis"
+            return stats
+        directory = self.seed_dir(cache_seed)
+        if self._ttl is not None:
+            self._apply_ttl(directory, self._ttl)
+        with _open_disk_cache(directory) as cache:
+            cache.expire()
+            cache.cull()
+            hits, misses = cache.stats()
+            before_hits, before_misses = self._stats_before
+            stats.update(
+                {
+                    "backend": "disk",
+                    "directory": str(directory),
+                    "hits": max(0, hits - before_hits),
+                    "misses": max(0, misses - before_misses),
+                    "entries": len(cache),
+                    "size": cache.volume(),
+                }
+            )
+        self._stats_before = (hits, misses)
+        return stats
+
+    @staticmethod
+    def _apply_ttl(directory: Path, ttl: float) -> None:
+        """Let the entries without an expiration time expire after ``ttl``.
+
+        ag2 stores the responses without one, set it from their store
+        time (in the cache's own sqlite table) so ``expire()`` drops them.
+        """
+        db_path = directory / DISKCACHE_DB
+        if not db_path.is_file():
+            return
+        connection = sqlite3.connect(str(db_path), timeout=60)
+        try:
+            with connection:
+                connection.execute(
+                    "UPDATE Cache SET expire_time = store_time + ? "
+                    "WHERE expire_time IS NULL",
+                    (ttl,),
+                )
+        finally:
+            connection.close()
+
+    def clear(self, cache_seed: int | str) -> None:
+        """Remove the cached responses of a seed.
+
+        Parameters
+        ----------
+        cache_seed : int | str
+            The flow's cache seed.
+        """
+        if self._redis_url:
+            return
+        with _open_disk_cache(self.seed_dir(cache_seed)) as cache:
+            cache.clear()
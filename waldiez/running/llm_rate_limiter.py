@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pyright: reportUnknownMemberType=false, reportUnknownArgumentType=false
+"""Process-wide rate limits of the LLM requests.
+
+Flows running in the same process (e.g. concurrent runs in a worker, or
+flows used as tools by other flows) share one limiter per model (api
+type, base url and name), so together they stay within the model's:
+
+- requests per minute,
+- (prompt and completion) tokens per minute,
+- concurrent requests.
+
+The exported flows call :func:`limit_llm_calls` for the agents of the
+models with a rate limit: their LLM client's ``create`` waits for the
+limiter first. ag2 makes these calls synchronously (in a worker thread
+for async agents), so a blocking, thread-safe limiter serves both the
+sync and the async flows.
+
+Requests and tokens are token buckets (full at start, refilled
+continuously). The tokens of a request are only known after it, so they
+are taken then (the bucket can go below zero, delaying the next
+requests) and a request waits for a non-empty tokens bucket.
+"""
+
+import threading
+import time
+from types import MethodType
+from typing import Any
+
+LLM_RATE_LIMITS_STATS_FILE = "llm_rate_limits.json"
+
+
+class LLMRateLimiter:
+    """Token-bucket rate limiter of a model's requests."""
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Parameters
+        ----------
+        key : str
+            The model's key (api type, base url and name).
+        requests_per_minute : int | None
+            The maximum number of requests per minute.
+        tokens_per_minute : int | None
+            The maximum number of tokens per minute.
+        max_in_flight : int | None
+            The maximum number of concurrent requests.
+        """
+        self.key = key
+        self._condition = threading.Condition()
+        self._requests_per_minute: int | None = None
+        self._tokens_per_minute: int | None = None
+        self._max_in_flight: int | None = None
+        self._request_allowance = 0.0
+        self._token_allowance = 0.0
+        self._updated_at = time.monotonic()
+        self._in_flight = 0
+        self._stats: dict[str, float] = {
+            "requests": 0,
+            "tokens": 0,
+            "throttled": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+        self.configure(requests_per_minute, tokens_per_minute, max_in_flight)
+
+    def configure(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Set the limits (the latest configuration of a model applies).
+
+        Parameters
+        ----------
+        requests_per_minute : int | None
+            The maximum number of requests per minute.
+        tokens_per_minute : int | None
+            The maximum number of tokens per minute.
+        max_in_flight : int | None
+            The maximum number of concurrent requests.
+        """
+        with self._condition:
+            self._refill()
+            if requests_per_minute != self._requests_per_minute:
+                self._requests_per_minute = requests_per_minute
+                self._request_allowance = float(requests_per_minute or 0)
+            if tokens_per_minute != self._tokens_per_minute:
+                self._tokens_per_minute = tokens_per_minute
+                self._token_allowance = float(tokens_per_minute or 0)
+            self._max_in_flight = max_in_flight
+            self._condition.notify_all()
+
+    def _refill(self) -> None:
+        """Refill the buckets (with the lock held)."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self._requests_per_minute:
+            self._request_allowance = min(
+                float(self._requests_per_minute),
+                self._request_allowance
+                + elapsed * self._requests_per_minute / 60,
+            )
+        if self._tokens_per_minute:
+            self._token_allowance = min(
+                float(self._tokens_per_minute),
+                self._token_allowance + elapsed * self._tokens_per_minute / 60,
+            )
+
+    def _wait_time(self) -> float:
+        """Get the time until the buckets allow a request, 0 if now.
+
+        With the lock held and the buckets refilled.
+        """
+        delays = [0.0]
+        if self._requests_per_minute and self._request_allowance < 1:
+            missing = 1 - self._request_allowance
+            delays.append(missing * 60 / self._requests_per_minute)
+        if self._tokens_per_minute and self._token_allowance <= 0:
+            missing = 1 - self._token_allowance
+            delays.append(missing * 60 / self._tokens_per_minute)
+        return max(delays)
+
+    def acquire(self) -> float:
+        """Wait until a request can start and take its place.
+
+        Returns
+        -------
+        float
+            The time (in seconds) the request waited.
+        """
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                self._refill()
+                delay = self._wait_time()
+                full = (
+                    self._max_in_flight is not None
+                    and self._in_flight >= self._max_in_flight
+                )
+                if not full and delay <= 0:
+                    break
+                self._condition.wait(None if full and delay <= 0 else delay)
+            if self._requests_per_minute:
+                self._request_allowance -= 1
+            self._in_flight += 1
+            waited = time.monotonic() - started
+            self._stats["requests"] += 1
+            if waited > 0.001:
+                self._stats["throttled"] += 1
+            self._stats["wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(
+                self._stats["max_wait_seconds"], waited
+            )
+        return waited
+
+    def release(self, tokens: int = 0) -> None:
+        """Finish a request.
+
+        Parameters
+        ----------
+        tokens : int
+            The request's (prompt and completion) tokens.
+        """
+        with self._condition:
+            self._refill()
+            self._in_flight = max(0, self._in_flight - 1)
+            if tokens > 0:
+                self._stats["tokens"] += tokens
+                if self._tokens_per_minute:
+                    self._token_allowance -= tokens
+            self._condition.notify_all()
+
+    @property
+    def in_flight(self) -> int:
+        """The number of running requests."""
+        return self._in_flight
+
+    def stats(self) -> dict[str, float]:
+        """Get the limiter's (cumulative) stats.
+
+        Returns
+        -------
+        dict[str, float]
+            The requests, tokens, throttled requests and the total and
+            maximum wait time.
+        """
+        with self._condition:
+            return dict(self._stats)
+
+
+_LIMITERS: dict[str, LLMRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_llm_rate_limiter(
+    key: str,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+    max_in_flight: int | None = None,
+) -> LLMRateLimiter:
+    """Get (and configure) the process-wide limiter of a model.
+
+    Parameters
+    ----------
+    key : str
+        The model's key (api type, base url and name).
+    requests_per_minute : int | None
+        The maximum number of requests per minute.
+    tokens_per_minute : int | None
+        The maximum number of tokens per minute.
+    max_in_flight : int | None
+        The maximum number of concurrent requests.
+
+    Returns
+    -------
+    LLMRateLimiter
+        The limiter.
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = LLMRateLimiter(
+                key, requests_per_minute, tokens_per_minute, max_in_flight
+            )
+            _LIMITERS[key] = limiter
+            return limiter
+    limiter.configure(requests_per_minute, tokens_per_minute, max_in_flight)
+    return limiter
+
+
+def get_llm_rate_limits_stats() -> dict[str, dict[str, float]]:
+    """Get the stats of the process' limiters.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        The (cumulative) stats by model key.
+    """
+    with _LIMITERS_LOCK:
+        limiters = list(_LIMITERS.values())
+    return {limiter.key: limiter.stats() for limiter in limiters}
+
+
+def _get_tokens(response: Any) -> int:
+    """Get the total tokens of an LLM client's response."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0
+    if isinstance(usage, dict):
+        total = usage.get("total_tokens", 0)
+    else:
+        total = getattr(usage, "total_tokens", 0)
+    return total if isinstance(total, int) else 0
+
+
+def limit_llm_calls(agent: Any, rate_limit: dict[str, Any]) -> None:
+    """Make an agent's LLM requests wait for its model's limiter.
+
+    Parameters
+    ----------
+    agent : Any
+        The (ag2) agent.
+    rate_limit : dict[str, Any]
+        The model's key and limits (see ``WaldiezModel.get_rate_limit``).
+    """
+    client = getattr(agent, "client", None)
+    if client is None or getattr(client, "_waldiez_rate_limited", False):
+        return
+    limiter = get_llm_rate_limiter(
+        rate_limit["key"],
+        requests_per_minute=rate_limit.get("requests_per_minute"),
+        tokens_per_minute=rate_limit.get("tokens_per_minute"),
+        max_in_flight=rate_limit.get("max_in_flight"),
+    )
+    create = client.create
+
+    def _limited_create(_self: Any, **config: Any) -> Any:
+        limiter.acquire()
+        tokens = 0
+        try:
+            response = create(**config)
+            tokens = _get_tokens(response)
+            return response
+        finally:
+            limiter.release(tokens)
+
+    client.create = MethodType(_limited_create, client)
+    client._waldiez_rate_limited = True  # pylint: disable=protected-access
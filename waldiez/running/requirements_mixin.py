@@ -4,11 +4,13 @@
 # pyright:  reportUninitializedInstanceVariable=false
 """Actions to perform before running the flow."""
 
-import sys
 from typing import Callable
 
+import anyio.to_thread
+
 from waldiez.models import Waldiez
 from waldiez.utils.python_manager import PythonManager
+from waldiez.utils.requirements import RequirementsCache
 
 from .environment import refresh_environment
 
@@ -23,43 +25,75 @@ class RequirementsMixin:
     def __init__(self) -> None:
         """Initialize the instance."""
         self._python_manager = PythonManager()
+        site_packages = self._python_manager.site_packages_directory
+        self._requirements_cache = RequirementsCache(
+            extra_dirs=[site_packages] if site_packages else []
+        )
+
+    def flow_requirements(self) -> set[str]:
+        """Get the requirements of the flow.
+
+        Returns
+        -------
+        set[str]
+            The flow's requirements that do not include 'waldiez'
+            in their name (plus 'python-dotenv').
+        """
+        requirements = {
+            req for req in self._waldiez.requirements if "waldiez" not in req
+        }
+        requirements.add("python-dotenv")
+        return requirements
 
     def gather_requirements(self) -> set[str]:
         """Gather extra requirements to install before running the flow.
 
+        The requirements are resolved against the installed distributions
+        (unless the same set was already found satisfied in the same
+        environment).
+
         Returns
         -------
         set[str]
             A set of requirements that are not already installed and do not
             include 'waldiez' in their name.
         """
-        extra_requirements = {
-            req
-            for req in self._waldiez.requirements
-            if req not in sys.modules and "waldiez" not in req
-        }
-        if "python-dotenv" not in extra_requirements:  # pragma: no branch
-            extra_requirements.add("python-dotenv")
-        return extra_requirements
+        return self._requirements_cache.missing(self.flow_requirements())
+
+    def _after_install(self, installed: set[str]) -> None:
+        """Record the requirements and refresh the environment if needed."""
+        if installed:
+            # record the new fingerprint (if everything is installed now)
+            self._requirements_cache.missing(self.flow_requirements())
+        # nothing to reload if nothing was installed
+        refresh_environment(reload=bool(installed))
 
     def install_requirements(self) -> None:
         """Install the requirements for the flow."""
         if not self._called_install_requirements:  # pragma: no branch
             self._called_install_requirements = True
             extra_requirements = self.gather_requirements()
-            if extra_requirements:  # pragma: no branch
+            if extra_requirements:
                 self._python_manager.pip_install(
                     extra_requirements, printer=self.print
                 )
-            refresh_environment()
+            self._after_install(extra_requirements)
 
     async def a_install_requirements(self) -> None:
-        """Install the requirements for the flow asynchronously."""
+        """Install the requirements for the flow asynchronously.
+
+        Resolving the requirements and refreshing the environment run in a
+        worker thread (the event loop is not blocked).
+        """
         if not self._called_install_requirements:  # pragma: no branch
             self._called_install_requirements = True
-            extra_requirements = self.gather_requirements()
-            if extra_requirements:  # pragma: no branch
+            extra_requirements = await anyio.to_thread.run_sync(
+                self.gather_requirements
+            )
+            if extra_requirements:
                 await self._python_manager.a_pip_install(
                     extra_requirements, printer=self.print
                 )
-            refresh_environment()
+            await anyio.to_thread.run_sync(
+                self._after_install, extra_requirements
+            )
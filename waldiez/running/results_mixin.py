@@ -221,18 +221,11 @@ class ResultsMixin:
             ResultsMixin.make_timeline_json(temp_dir)
         if storage_manager is None:
             storage_manager = StorageManager()
-        link_root = (
-            (output_file.parent / "waldiez_out")
-            if output_file
-            else (waldiez_file.parent / "waldiez_out")
-        )
-        output_hint = (
-            output_file if output_file else Path.cwd() / waldiez_file.name
+        session_name, output_hint, link_root, to_ignore = (
+            ResultsMixin._get_finalize_args(
+                output_file, flow_name, waldiez_file, ignore_names
+            )
         )
-        session_name = safe_name(flow_name)
-        to_ignore = list(ignore_names)
-        if ResultsMixin.RUN_DETAILS not in to_ignore:
-            to_ignore.append(ResultsMixin.RUN_DETAILS)
         _checkpoint_path, public_link_path = storage_manager.finalize(
             session_name=session_name,
             output_file=output_hint,
@@ -247,6 +240,40 @@ class ResultsMixin:
             ignore_names=to_ignore,
             skip_symlinks=skip_symlinks,
         )
+        ResultsMixin._after_finalize(
+            public_link_path, waldiez_file, temp_dir, keep_tmp
+        )
+        return public_link_path if output_file else None
+
+    @staticmethod
+    def _get_finalize_args(
+        output_file: Path | None,
+        flow_name: str,
+        waldiez_file: Path,
+        ignore_names: Iterable[str],
+    ) -> tuple[str, Path, Path, list[str]]:
+        """Get the session, output hint, link root and names to ignore."""
+        link_root = (
+            (output_file.parent / "waldiez_out")
+            if output_file
+            else (waldiez_file.parent / "waldiez_out")
+        )
+        output_hint = (
+            output_file if output_file else Path.cwd() / waldiez_file.name
+        )
+        to_ignore = list(ignore_names)
+        if ResultsMixin.RUN_DETAILS not in to_ignore:
+            to_ignore.append(ResultsMixin.RUN_DETAILS)
+        return safe_name(flow_name), output_hint, link_root, to_ignore
+
+    @staticmethod
+    def _after_finalize(
+        public_link_path: Path,
+        waldiez_file: Path,
+        temp_dir: Path,
+        keep_tmp: bool,
+    ) -> None:
+        """Add the waldiez file to the public path and clean up."""
         try:
             dst_waldiez = public_link_path / waldiez_file.name
             if not dst_waldiez.exists() and waldiez_file.is_file():
@@ -254,7 +281,6 @@ class ResultsMixin:
         except BaseException:
             pass
         ResultsMixin._cleanup(None, None if keep_tmp else temp_dir)
-        return public_link_path if output_file else None
 
     @staticmethod
     async def a_post_run(
@@ -326,26 +352,63 @@ class ResultsMixin:
         Path | None
             The destination directory if output file, else None
         """
-        return await anyio.to_thread.run_sync(
-            ResultsMixin.post_run,
-            results,
-            error,
-            temp_dir,
-            output_file,
-            flow_name,
-            waldiez_file,
-            uploads_root,
-            skip_mmd,
-            skip_timeline,
-            storage_manager,
-            metadata,
-            copy_artifacts_into,
-            keep_tmp,
-            link_latest,
-            promote_to_output,
-            ignore_names,
-            skip_symlinks,
+        if isinstance(output_file, str):
+            output_file = Path(output_file)
+        mmd_dir = output_file.parent if output_file else Path.cwd()
+        await ResultsMixin.a_ensure_db_outputs(temp_dir)
+        if error is not None:
+            ResultsMixin.ensure_error_json(temp_dir, error)
+        else:
+            await ResultsMixin.a_ensure_results_json(temp_dir, results)
+        # parsing the logs is cpu-bound, keep it off the event loop
+        if not skip_mmd:
+            await anyio.to_thread.run_sync(
+                ResultsMixin.make_mermaid_diagram,
+                temp_dir,
+                output_file,
+                flow_name,
+                mmd_dir,
+            )
+        if not skip_timeline:  # pragma: no branch
+            await anyio.to_thread.run_sync(
+                ResultsMixin.make_timeline_json, temp_dir
+            )
+        owned_manager = storage_manager is None
+        if storage_manager is None:
+            storage_manager = StorageManager()
+        session_name, output_hint, link_root, to_ignore = (
+            ResultsMixin._get_finalize_args(
+                output_file, flow_name, waldiez_file, ignore_names
+            )
         )
+        try:
+            _checkpoint_path, public_link_path = (
+                await storage_manager.a_finalize(
+                    session_name=session_name,
+                    output_file=output_hint,
+                    tmp_dir=temp_dir,
+                    metadata=metadata or {},
+                    timestamp=datetime.now(timezone.utc),
+                    link_root=link_root,
+                    link_latest=link_latest,
+                    keep_tmp=keep_tmp,
+                    copy_into_subdir=copy_artifacts_into,
+                    promote_to_output=promote_to_output,
+                    ignore_names=to_ignore,
+                    skip_symlinks=skip_symlinks,
+                )
+            )
+            await anyio.to_thread.run_sync(
+                ResultsMixin._after_finalize,
+                public_link_path,
+                waldiez_file,
+                temp_dir,
+                keep_tmp,
+            )
+        finally:
+            if owned_manager:
+                storage_manager.close()
+        return public_link_path if output_file else None
 
     @staticmethod
     def make_mermaid_diagram(
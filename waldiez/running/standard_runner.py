@@ -10,6 +10,14 @@ The flow is first converted to an autogen flow with agents, chats, and tools.
 We then chown to temporary directory, call the flow's `main()` and
 return the results. Before running the flow, any additional environment
 variables specified in the waldiez file are set.
+
+With ``isolated=True``, the run does not change the process' directory,
+``sys.path`` or environment, so many flows can run concurrently in one
+process (a runner per flow). The flow gets its directory as ``__WORK_DIR__``
+and a copy of the environment with its variables (models' keys, tools'
+secrets, the LLM cache) as ``__ENV__``, which the exported code reads and
+writes instead of ``os.environ``; user code that uses ``os.environ`` still
+sees (and changes) the process' one.
 """
 
 import asyncio
@@ -112,10 +120,12 @@ class WaldiezStandardRunner(WaldiezBaseRunner):
             self._output_dir = temp_dir
             self.print(MESSAGES["workflow_starting"])
             self.print(self.waldiez.info.model_dump_json())
-            results = loaded_module.main(
-                on_event=self._on_event,
-                state_json=self.state_json,
-            )
+            # the run's stream, for this context only (not process-wide)
+            with IOStream.set_default(stream):
+                results = loaded_module.main(
+                    on_event=self._on_event,
+                    state_json=self.state_json,
+                )
             results_container["results"] = results
             self.print(MESSAGES["workflow_finished"])
         except SystemExit:  # pragma: no cover
@@ -241,10 +251,11 @@ class WaldiezStandardRunner(WaldiezBaseRunner):
                 self._output_dir = temp_dir
                 self.print(MESSAGES["workflow_starting"])
                 self.print(self.waldiez.info.model_dump_json())
-                results = await loaded_module.main(
-                    on_event=self._a_on_event,
-                    state_json=self.state_json,
-                )
+                with IOStream.set_default(stream):
+                    results = await loaded_module.main(
+                        on_event=self._a_on_event,
+                        state_json=self.state_json,
+                    )
                 self.print(MESSAGES["workflow_finished"])
             except SystemExit:  # pragma: no cover
                 self.log.debug("Execution stopped by user (async)")
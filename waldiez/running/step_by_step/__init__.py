@@ -5,11 +5,13 @@
 
 from .breakpoints_mixin import BreakpointsMixin
 from .step_by_step_models import (
+    WaldiezDebugAgentsState,
     WaldiezDebugBreakpointAdded,
     WaldiezDebugBreakpointCleared,
     WaldiezDebugBreakpointRemoved,
     WaldiezDebugBreakpointsList,
     WaldiezDebugError,
+    WaldiezDebugEventHistory,
     WaldiezDebugEventInfo,
     WaldiezDebugHelp,
     WaldiezDebugHelpCommand,
@@ -26,7 +28,9 @@ from .step_by_step_runner import WaldiezStepByStepRunner
 
 __all__ = [
     "BreakpointsMixin",
+    "WaldiezDebugAgentsState",
     "WaldiezDebugError",
+    "WaldiezDebugEventHistory",
     "WaldiezDebugEventInfo",
     "WaldiezDebugHelp",
     "WaldiezDebugHelpCommand",
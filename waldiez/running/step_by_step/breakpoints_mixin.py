@@ -7,15 +7,21 @@
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
 # pyright: reportUnknownArgumentType=false
 
-"""Breakpoints management mixin for step-by-step debugging."""
+"""Breakpoints management mixin for step-by-step debugging.
+
+The breakpoints are compiled (on their first check after a change) into
+lookup tables by event type and agent, so checking an event is a few set
+lookups, regardless of the number of breakpoints.
+"""
 
 import logging
 from collections.abc import Iterable
-from functools import lru_cache
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Callable, Union
 
 from .step_by_step_models import (
     WaldiezBreakpoint,
+    WaldiezBreakpointType,
     WaldiezDebugBreakpointAdded,
     WaldiezDebugBreakpointCleared,
     WaldiezDebugBreakpointRemoved,
@@ -62,6 +68,147 @@ def handle_breakpoint_errors(func: Callable[..., bool]) -> Callable[..., bool]:
     return _wrapper
 
 
+@dataclass(frozen=True)
+class CompiledBreakpoints:
+    """Lookup tables of breakpoints (with the agents' names).
+
+    Attributes
+    ----------
+    match_all : bool
+        Whether every event matches (an ``all`` breakpoint).
+    event_types : frozenset[str]
+        The event types of any agent.
+    agents : frozenset[str]
+        The agents of any event type.
+    agent_events : frozenset[tuple[str, str]]
+        The (agent, event type) pairs.
+    agent_event_types : frozenset[str]
+        The event types of the (agent, event type) pairs.
+    agent_id_to_name : dict[str, str]
+        The agent id to name mapping (for the events' agents).
+    """
+
+    match_all: bool
+    event_types: frozenset[str]
+    agents: frozenset[str]
+    agent_events: frozenset[tuple[str, str]]
+    agent_event_types: frozenset[str]
+    agent_id_to_name: dict[str, str]
+
+    @classmethod
+    def compile(
+        cls,
+        breakpoints: Iterable[WaldiezBreakpoint],
+        agent_id_to_name: dict[str, str],
+    ) -> "CompiledBreakpoints":
+        """Compile breakpoints.
+
+        Parameters
+        ----------
+        breakpoints : Iterable[WaldiezBreakpoint]
+            The breakpoints.
+        agent_id_to_name : dict[str, str]
+            The agent id to name mapping.
+
+        Returns
+        -------
+        CompiledBreakpoints
+            The lookup tables.
+        """
+        match_all = False
+        event_types: set[str] = set()
+        agents: set[str] = set()
+        agent_events: set[tuple[str, str]] = set()
+        for bp in breakpoints:
+            agent = agent_id_to_name.get(bp.agent, bp.agent) if bp.agent else ""
+            if bp.type == WaldiezBreakpointType.ALL:
+                match_all = True
+            elif bp.type == WaldiezBreakpointType.EVENT and bp.event_type:
+                event_types.add(bp.event_type)
+            elif bp.type == WaldiezBreakpointType.AGENT and agent:
+                agents.add(agent)
+            elif (
+                bp.type == WaldiezBreakpointType.AGENT_EVENT
+                and agent
+                and bp.event_type
+            ):
+                agent_events.add((agent, bp.event_type))
+        return cls(
+            match_all=match_all,
+            event_types=frozenset(event_types),
+            agents=frozenset(agents),
+            agent_events=frozenset(agent_events),
+            agent_event_types=frozenset(
+                event_type for _, event_type in agent_events
+            ),
+            agent_id_to_name=dict(agent_id_to_name),
+        )
+
+    def may_match(self, event_type: str) -> bool:
+        """Check if an event of a type could match (by its agents).
+
+        Parameters
+        ----------
+        event_type : str
+            The event type.
+
+        Returns
+        -------
+        bool
+            False if no event of this type matches.
+        """
+        return (
+            self.match_all
+            or bool(self.agents)
+            or event_type in self.event_types
+            or event_type in self.agent_event_types
+        )
+
+    def matches(
+        self,
+        event_type: str,
+        sender: str,
+        recipient: str,
+        sender_only: bool,
+    ) -> bool:
+        """Check if an event matches any breakpoint.
+
+        Parameters
+        ----------
+        event_type : str
+            The event type.
+        sender : str
+            The event's sender (name or id).
+        recipient : str
+            The event's recipient (name or id).
+        sender_only : bool
+            Only check for the event's sender agent.
+
+        Returns
+        -------
+        bool
+            True if any breakpoint matches, False otherwise.
+        """
+        if self.match_all or event_type in self.event_types:
+            return True
+        sender = self.agent_id_to_name.get(sender, sender)
+        if sender in self.agents or (sender, event_type) in self.agent_events:
+            return True
+        if sender_only:
+            return False
+        recipient = self.agent_id_to_name.get(recipient, recipient)
+        return (
+            recipient in self.agents
+            or (recipient, event_type) in self.agent_events
+        )
+
+
+def _get_str(item: Any, key: str) -> str:
+    """Get a string attribute (or key) of an event (or its content)."""
+    value = item.get(key) if isinstance(item, dict) else getattr(item, key, "")
+    return value if isinstance(value, str) else ""
+
+
 class BreakpointsMixin:
     """Mixin class for managing breakpoints in step-by-step debugging."""
 
@@ -77,14 +224,10 @@ class BreakpointsMixin:
         # Statistics for monitoring
         self._breakpoint_stats = {
             "total_matches": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
+            "checks": 0,
+            "compilations": 0,
         }
-
-        # Create the cached function with proper binding
-        self._check_breakpoint_match_cached = lru_cache(maxsize=1000)(
-            self._check_breakpoint_match_impl
-        )
+        self._compiled_breakpoints: CompiledBreakpoints | None = None
         self._config = kwargs.get("config", WaldiezDebugConfig())
 
     @staticmethod
@@ -125,6 +268,7 @@ class BreakpointsMixin:
             The agent id to agent name mapping.
         """
         self._agent_id_to_name = mapping
+        self._invalidate_cache()
 
     # noinspection PyTypeHints
     def emit(self, message: WaldiezDebugMessage) -> None:
@@ -138,72 +282,18 @@ class BreakpointsMixin:
         raise NotImplementedError("emit method must be implemented")
 
     def _invalidate_cache(self) -> None:
-        """Invalidate the event matching cache when breakpoints change."""
-        self._check_breakpoint_match_cached.cache_clear()
-
-    def _get_breakpoints_signature(self) -> frozenset[str]:
-        """Get a hashable signature of current breakpoints."""
-        return frozenset(str(bp) for bp in self._breakpoints)
-
-    def _check_breakpoint_match_impl(
-        self,
-        event_type: str,
-        sender: str,
-        recipient: str,
-        sender_only: bool,
-        breakpoints_sig: frozenset[str],
-    ) -> bool:
-        """Check if the event matches any breakpoints.
-
-        Parameters
-        ----------
-        event_type : str
-            The event type to check.
-        sender : str
-            The event sender.
-        recipient : str
-            The event recipient.
-        sender_only : bool
-            Only check for event's sender agent.
-        breakpoints_sig : frozenset[str]
-            Signature of current breakpoints for cache invalidation.
-
-        Returns
-        -------
-        bool
-            True if any breakpoint matches, False otherwise.
-        """
-        event_dict = {
-            "type": event_type,
-            "sender": self._agent_id_to_name.get(sender, sender),
-            "recipient": self._agent_id_to_name.get(recipient, recipient),
-        }
-
-        # Reconstruct breakpoints from signature for cache safety
-        # noinspection PyBroadException
-        try:
-            breakpoints = {
-                WaldiezBreakpoint.from_string(bp_str)
-                for bp_str in breakpoints_sig
-            }
-            return any(
-                bp.matches(
-                    event_dict,
-                    self._agent_id_to_name,
-                    sender_only=sender_only,
-                )
-                for bp in breakpoints
-            )
-        except Exception:  # pylint: disable=broad-exception-caught
-            # Fallback to current breakpoints if signature is malformed
-            return any(
-                bp.matches(
-                    event_dict,
-                    self._agent_id_to_name,
-                    sender_only=sender_only,
-                )
-                for bp in self._breakpoints
+        """Drop the compiled breakpoints when breakpoints change."""
+        self._compiled_breakpoints = None
+
+    @property
+    def compiled_breakpoints(self) -> CompiledBreakpoints:
+        """The breakpoints' lookup tables (compiled after a change)."""
+        if self._compiled_breakpoints is None:
+            self._compiled_breakpoints = CompiledBreakpoints.compile(
+                self._breakpoints, self._agent_id_to_name
             )
+            self._breakpoint_stats["compilations"] += 1
+        return self._compiled_breakpoints
 
     @handle_breakpoint_errors
     def add_breakpoint(self, spec: str) -> bool:
@@ -412,56 +502,31 @@ class BreakpointsMixin:
             recipient = ""
         return event_type, sender, recipient
 
+    @staticmethod
+    def _get_event_participants(
+        event: Union["BaseEvent", "BaseMessage"],
+    ) -> tuple[str, str]:
+        """Get an event's sender and recipient (without dumping it)."""
+        content = getattr(event, "content", None)
+        sender = (
+            _get_str(event, "sender")
+            or _get_str(content, "sender")
+            or _get_str(content, "speaker")
+        )
+        recipient = _get_str(event, "recipient") or _get_str(
+            content, "recipient"
+        )
+        return sender, recipient
+
     def _got_breakpoint_match(
         self, event_dump: dict[str, Any], sender_only: bool
     ) -> bool:
         event_type, sender, recipient = BreakpointsMixin._get_event_core(
             event_dump
         )
-        event_dict = {
-            "type": event_type,
-            "sender": sender,
-            "recipient": recipient,
-        }
-
-        has_agent_breakpoints = any(
-            bp.agent is not None for bp in self._breakpoints
+        return self.compiled_breakpoints.matches(
+            event_type, sender, recipient, sender_only=sender_only
         )
-        if has_agent_breakpoints:
-            # Don't use cache for agent-based breakpoints
-            # (we might have a mix of agent ids and names)
-            matches_breakpoint = any(
-                bp.matches(
-                    event_dict,
-                    self._agent_id_to_name,
-                    sender_only=sender_only,
-                )
-                for bp in self._breakpoints
-            )
-        else:
-            # Get current breakpoints signature for cache invalidation
-            breakpoints_sig = self._get_breakpoints_signature()
-
-            # Check cached result
-            # noinspection PyBroadException
-            try:
-                matches_breakpoint = self._check_breakpoint_match_cached(
-                    event_type, sender, recipient, sender_only, breakpoints_sig
-                )
-                self._breakpoint_stats["cache_hits"] += 1
-            except Exception:  # pylint: disable=broad-exception-caught
-                # Fallback to non-cached check
-                matches_breakpoint = any(
-                    bp.matches(
-                        event_dict,
-                        self._agent_id_to_name,
-                        sender_only=sender_only,
-                    )
-                    for bp in self._breakpoints
-                )
-                self._breakpoint_stats["cache_misses"] += 1
-
-        return matches_breakpoint
 
     def should_break_on_event(
         self,
@@ -492,17 +557,18 @@ class BreakpointsMixin:
         if not self._breakpoints:
             return not bool(self._config.auto_continue)
 
-        # Check if this event matches any breakpoint using caching
-        if not hasattr(event, "model_dump"):
-            return not bool(self._config.auto_continue)
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
-            event_dump = event.model_dump(
-                mode="python", exclude_none=True, fallback=str
-            )
-            matches_breakpoint = self._got_breakpoint_match(
-                event_dump, sender_only=sender_only
-            )
+            self._breakpoint_stats["checks"] += 1
+            compiled = self.compiled_breakpoints
+            if not isinstance(event_type, str):
+                event_type = "unknown"
+            matches_breakpoint = compiled.may_match(event_type)
+            if matches_breakpoint and not compiled.match_all:
+                sender, recipient = self._get_event_participants(event)
+                matches_breakpoint = compiled.matches(
+                    event_type, sender, recipient, sender_only=sender_only
+                )
             # If any breakpoint matches: break regardless of step_mode
             if matches_breakpoint:
                 self._breakpoint_stats["total_matches"] += 1
@@ -510,7 +576,6 @@ class BreakpointsMixin:
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             logging.warning("Error processing event for breakpoints: %s", e)
-            self._breakpoint_stats["cache_misses"] += 1
 
         return not bool(self._config.auto_continue)
 
@@ -533,39 +598,24 @@ class BreakpointsMixin:
             for bp in self._breakpoints
         ]
 
-        # Calculate cache efficiency
-        total_checks = (
-            self._breakpoint_stats["cache_hits"]
-            + self._breakpoint_stats["cache_misses"]
-        )
-        cache_hit_rate = (
-            self._breakpoint_stats["cache_hits"] / total_checks
-            if total_checks > 0
-            else 0
-        )
-
-        # Get cache info from lru_cache
-        cache_info = self._check_breakpoint_match_cached.cache_info()
-
+        compiled = self.compiled_breakpoints
         return {
             "total_breakpoints": len(self._breakpoints),
             "breakpoints": breakpoints,
             "has_breakpoints": len(self._breakpoints) > 0,
-            "cache_stats": {
-                "cache_hit_rate": f"{cache_hit_rate:.2%}",
-                "cache_size": cache_info.currsize,
-                "cache_maxsize": cache_info.maxsize,
+            "match_stats": {
+                "checks": self._breakpoint_stats["checks"],
                 "total_matches": self._breakpoint_stats["total_matches"],
-                "cache_hits": cache_info.hits,
-                "cache_misses": cache_info.misses,
+                "compilations": self._breakpoint_stats["compilations"],
             },
-            "performance": {
-                "lru_cache_info": {
-                    "hits": cache_info.hits,
-                    "misses": cache_info.misses,
-                    "maxsize": cache_info.maxsize,
-                    "currsize": cache_info.currsize,
-                }
+            "compiled": {
+                "match_all": compiled.match_all,
+                "event_types": sorted(compiled.event_types),
+                "agents": sorted(compiled.agents),
+                "agent_events": [
+                    f"{agent}:{event_type}"
+                    for agent, event_type in sorted(compiled.agent_events)
+                ],
             },
         }
 
@@ -573,13 +623,13 @@ class BreakpointsMixin:
         """Reset breakpoint statistics."""
         self._breakpoint_stats = {
             "total_matches": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
+            "checks": 0,
+            "compilations": 0,
         }
         self._invalidate_cache()
 
     def optimize_cache(self) -> None:
-        """Manually optimize the cache by clearing it."""
+        """Recompile the breakpoints (on their next check)."""
         self._invalidate_cache()
 
     def export_breakpoints(self) -> list[str]:
@@ -36,6 +36,8 @@ class CommandHandler:
             "i": self._handle_info,
             "h": self._handle_help,
             "st": self._handle_stats,
+            "sy": self._handle_sync_agents,
+            "hi": self._handle_history,
             "ab": self._handle_add_breakpoint,
             "rb": self._handle_remove_breakpoint,
             "lb": self._handle_list_breakpoints,
@@ -94,6 +96,25 @@ class CommandHandler:
         self.runner.show_stats()
         return WaldiezDebugStepAction.STATS
 
+    def _handle_sync_agents(self, args: str | None) -> WaldiezDebugStepAction:
+        self.runner.show_agents_state()
+        return WaldiezDebugStepAction.SYNC_AGENTS
+
+    def _handle_history(self, args: str | None) -> WaldiezDebugStepAction:
+        try:
+            values = [int(value) for value in (args or "").split()]
+        except ValueError:
+            values = [-1]
+        if len(values) > 2 or any(value < 0 for value in values):
+            self.runner.emit(
+                WaldiezDebugError(
+                    error="Invalid history range. Usage: 'hi [start] [limit]'"
+                )
+            )
+            return WaldiezDebugStepAction.HISTORY
+        self.runner.show_event_history(*values)
+        return WaldiezDebugStepAction.HISTORY
+
     def _handle_add_breakpoint(
         self, args: str | None
     ) -> WaldiezDebugStepAction:
@@ -0,0 +1,193 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+"""Event history of step-by-step runs.
+
+The newest events are kept in memory. While a run has a file for them, the
+older ones are moved (appended) to it, a JSON line per event, with the
+file offsets of the events kept by their count (number), so any part of a
+long session's history can be read back, a page at a time.
+"""
+
+import json
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+EVENT_HISTORY_FILE = "event_history.jsonl"
+
+
+class EventHistory:
+    """Events in memory (the newest ones) and on disk (the older ones)."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the history.
+
+        Parameters
+        ----------
+        maxlen : int
+            The maximum number of events in memory.
+        """
+        self._maxlen = maxlen
+        self._hot: deque[dict[str, Any]] = deque()
+        self._path: Path | None = None
+        self._file: IO[bytes] | None = None
+        self._counts: array[int] = array("q")
+        self._offsets: array[int] = array("q")
+
+    @property
+    def maxlen(self) -> int:
+        """The maximum number of events in memory."""
+        return self._maxlen
+
+    @property
+    def path(self) -> Path | None:
+        """The file of the older events (if any)."""
+        return self._path
+
+    @property
+    def spilling(self) -> bool:
+        """Whether the older events are moved to a file."""
+        return self._file is not None
+
+    @property
+    def spilled(self) -> int:
+        """The number of events in the file."""
+        return len(self._offsets)
+
+    @property
+    def total(self) -> int:
+        """The number of events (in memory and in the file)."""
+        return len(self._offsets) + len(self._hot)
+
+    def spill_to(self, path: Path) -> None:
+        """Move the older events to a file (from now on).
+
+        Parameters
+        ----------
+        path : Path
+            The file (created or truncated).
+        """
+        self.close()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "w+b")  # pylint: disable=consider-using-with
+        self._path = path
+
+    def close(self) -> None:
+        """Stop moving events to the file (and forget the moved ones).
+
+        The events in memory are also written to the file (and kept in
+        memory), so the file has the whole history.
+        """
+        if self._file is not None:
+            self._file.seek(0, 2)
+            for event_info in self._hot:
+                self._file.write(_to_line(event_info))
+            self._file.close()
+        self._file = None
+        self._path = None
+        self._counts = array("q")
+        self._offsets = array("q")
+
+    def append(self, event_info: dict[str, Any]) -> None:
+        """Add an event (moving the oldest one out of memory if full).
+
+        Parameters
+        ----------
+        event_info : dict[str, Any]
+            The event.
+        """
+        self._hot.append(event_info)
+        while len(self._hot) > self._maxlen:
+            self.popleft()
+
+    def popleft(self) -> dict[str, Any]:
+        """Remove the oldest event from memory (to the file, if any).
+
+        Returns
+        -------
+        dict[str, Any]
+            The event.
+        """
+        event_info = self._hot.popleft()
+        if self._file is not None:
+            self._file.seek(0, 2)
+            self._offsets.append(self._file.tell())
+            self._counts.append(_get_count(event_info))
+            self._file.write(_to_line(event_info))
+        return event_info
+
+    def clear(self) -> None:
+        """Remove all the events."""
+        self._hot.clear()
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        self._counts = array("q")
+        self._offsets = array("q")
+
+    def __len__(self) -> int:
+        """Get the number of events in memory."""
+        return len(self._hot)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the events in memory."""
+        return iter(self._hot)
+
+    def _read_spilled(self, index: int, limit: int) -> list[dict[str, Any]]:
+        """Read events from the file, starting at an index."""
+        if self._file is None or index >= len(self._offsets) or limit <= 0:
+            return []
+        self._file.flush()
+        self._file.seek(self._offsets[index])
+        events: list[dict[str, Any]] = []
+        for _ in range(min(limit, len(self._offsets) - index)):
+            events.append(json.loads(self._file.readline()))
+        return events
+
+    def page(self, start: int = 1, limit: int = 100) -> dict[str, Any]:
+        """Get the events starting from an event count.
+
+        Parameters
+        ----------
+        start : int
+            The count (number) of the first event.
+        limit : int
+            The maximum number of events.
+
+        Returns
+        -------
+        dict[str, Any]
+            The ``events``, the ``start``, the count of the event after
+            them (``next``, None if none) and the ``total`` events.
+        """
+        limit = max(limit, 0)
+        # one more, for the next page's start
+        events = self._read_spilled(bisect_left(self._counts, start), limit + 1)
+        for event_info in self._hot:
+            if len(events) > limit:
+                break
+            if _get_count(event_info) >= start:
+                events.append(event_info)
+        next_start = _get_count(events[limit]) if len(events) > limit else None
+        return {
+            "events": events[:limit],
+            "start": start,
+            "next": next_start,
+            "total": self.total,
+        }
+
+
+def _to_line(event_info: dict[str, Any]) -> bytes:
+    """Get the JSON line of an event."""
+    line = json.dumps(event_info, default=str, ensure_ascii=False)
+    return line.encode("utf-8") + b"\n"
+
+
+def _get_count(event_info: dict[str, Any]) -> int:
+    """Get the count (number) of an event."""
+    count = event_info.get("count", 0)
+    return count if isinstance(count, int) else 0
@@ -6,11 +6,37 @@
 # pyright: reportDeprecated=false, reportUnknownMemberType=false
 # pyright: reportUnknownVariableType=false, reportUnknownArgumentType=false
 
-"""Command handler for step-by-step execution."""
+"""Event processor for step-by-step execution.
+
+With ``delta_agents_state`` (see ``WaldiezDebugConfig``), the agents' info
+of an event is a full snapshot only on the first event and when the client
+asks for one (the ``sy`` command); the other events only carry what changed
+since the previous one:
+
+.. code-block:: python
+
+    {
+        "seq": 5,  # one more than the previous agents' info
+        "snapshot": False,
+        "sender": "assistant",  # the names (full dumps in snapshots)
+        "recipient": "user",
+        "all": [  # only the agents that changed
+            {
+                "name": "assistant",
+                "changed": {"cost": {...}},  # the changed fields
+                "new_messages": {"user": [...]},  # appended, by chat
+                "chat_messages": {"other": [...]},  # replaced, by chat
+            },
+        ],
+    }
+
+A client that misses a ``seq`` asks for a snapshot. A re-emitted event
+repeats its ``seq`` (and its changes, to apply once).
+"""
 
 import inspect
 from collections.abc import Mapping, Sequence
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, field, is_dataclass
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 if TYPE_CHECKING:
@@ -22,6 +48,14 @@ if TYPE_CHECKING:
     from .step_by_step_runner import WaldiezStepByStepRunner
 
 
+@dataclass
+class _AgentState:
+    """The last sent state of an agent (for the deltas)."""
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    message_counts: dict[str, int] = field(default_factory=dict)
+
+
 # pylint: disable=too-few-public-methods
 # noinspection PyBroadException
 class EventProcessor:
@@ -29,11 +63,34 @@ class EventProcessor:
 
     def __init__(self, runner: "WaldiezStepByStepRunner"):
         self.runner = runner
+        self._agents: list["ConversableAgent"] = []
+        self._agents_state: dict[str, _AgentState] = {}
+        self._agents_seq = 0
+        self._snapshot_requested = True
+
+    def request_agents_snapshot(self) -> dict[str, Any] | None:
+        """Get a full snapshot of the agents (and send deltas after it).
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The snapshot (``seq`` and ``all``), or None before the first
+            event (its agents' info will be a snapshot).
+        """
+        if not self._agents:
+            self._snapshot_requested = True
+            return None
+        self._agents_seq += 1
+        return {
+            "seq": self._agents_seq,
+            "all": [self._snapshot_agent(agent) for agent in self._agents],
+        }
 
     def process_event(
         self,
         event: Union["BaseEvent", "BaseMessage"],
         agents: list["ConversableAgent"],
+        should_break: bool | None = None,
     ) -> dict[str, Any]:
         """Shared logic for both sync and async event processing.
 
@@ -43,6 +100,8 @@ class EventProcessor:
             The event to process.
         agents : list[ConversableAgent]
             The workflow's known agents.
+        should_break : bool | None
+            Whether to break on the event, if already checked.
 
         Returns
         -------
@@ -61,9 +120,10 @@ class EventProcessor:
         self._check_for_input_request(event_info)
         self._add_agents_info(event_info, agents)
 
-        should_break = self.runner.should_break_on_event(
-            event, sender_only=True
-        )
+        if should_break is None:
+            should_break = self.runner.should_break_on_event(
+                event, sender_only=True
+            )
 
         return {
             "action": "break" if should_break else "continue",
@@ -211,11 +271,8 @@ class EventProcessor:
             self.runner.last_recipient = sender
 
     @staticmethod
-    def _get_agent_dump(
-        agent: Optional["ConversableAgent"],
-    ) -> dict[str, Any] | None:
-        if not agent:
-            return None
+    def _get_agent_fields(agent: "ConversableAgent") -> dict[str, Any]:
+        """Get an agent's dump without its messages."""
         dump = {
             name: _trimmed(value)
             for name, value in vars(agent).items()
@@ -229,19 +286,97 @@ class EventProcessor:
             attr_val = getattr(agent, attr_key)
             if attr_val:
                 dump[attr_key] = _trimmed(attr_val)
+        dump["cost"] = {
+            "actual": agent.get_actual_usage(),
+            "total": agent.get_total_usage(),
+        }
+        return dump
+
+    @staticmethod
+    def _get_chat_messages(agent: "ConversableAgent") -> dict[str, Any]:
+        """Get an agent's (untrimmed) messages by chat."""
         try:
-            dump["chat_messages"] = {
-                _to_json_key(agent): [_trimmed(message) for message in messages]
+            return {
+                _to_json_key(_agent): messages
                 for _agent, messages in agent.chat_messages.items()
             }
         except BaseException:  # pylint: disable=broad-exception-caught
-            pass
-        dump["cost"] = {
-            "actual": agent.get_actual_usage(),
-            "total": agent.get_total_usage(),
+            return {}
+
+    @staticmethod
+    def _get_agent_dump(
+        agent: Optional["ConversableAgent"],
+    ) -> dict[str, Any] | None:
+        if not agent:
+            return None
+        dump = EventProcessor._get_agent_fields(agent)
+        dump["chat_messages"] = {
+            key: [_trimmed(message) for message in messages]
+            for key, messages in EventProcessor._get_chat_messages(
+                agent
+            ).items()
         }
         return dump
 
+    def _snapshot_agent(self, agent: "ConversableAgent") -> dict[str, Any]:
+        """Get an agent's full dump and keep its state for the deltas."""
+        fields = self._get_agent_fields(agent)
+        chat_messages = self._get_chat_messages(agent)
+        self._agents_state[agent.name] = _AgentState(
+            fields=fields,
+            message_counts={
+                key: len(messages) for key, messages in chat_messages.items()
+            },
+        )
+        return {
+            **fields,
+            "chat_messages": {
+                key: [_trimmed(message) for message in messages]
+                for key, messages in chat_messages.items()
+            },
+        }
+
+    def _get_agent_delta(
+        self, agent: "ConversableAgent"
+    ) -> dict[str, Any] | None:
+        """Get an agent's changes since its last sent state, if any."""
+        state = self._agents_state.setdefault(agent.name, _AgentState())
+        fields = self._get_agent_fields(agent)
+        delta: dict[str, Any] = {"name": agent.name}
+        changed = {
+            key: value
+            for key, value in fields.items()
+            if key not in state.fields or state.fields[key] != value
+        }
+        changed.update({key: None for key in state.fields if key not in fields})
+        if changed:
+            delta["changed"] = changed
+        new_messages: dict[str, list[Any]] = {}
+        replaced: dict[str, list[Any]] = {}
+        chat_messages = self._get_chat_messages(agent)
+        for key, messages in chat_messages.items():
+            count = state.message_counts.get(key, 0)
+            if len(messages) > count:
+                new_messages[key] = [_trimmed(msg) for msg in messages[count:]]
+            elif len(messages) < count:
+                replaced[key] = [_trimmed(msg) for msg in messages]
+        replaced.update(
+            {
+                key: []
+                for key in state.message_counts
+                if key not in chat_messages
+            }
+        )
+        if new_messages:
+            delta["new_messages"] = new_messages
+        if replaced:
+            delta["chat_messages"] = replaced
+        state.fields = fields
+        state.message_counts = {
+            key: len(messages) for key, messages in chat_messages.items()
+        }
+        return delta if len(delta) > 1 else None
+
     def _add_agents_info(
         self, event_info: dict[str, Any], agents: list["ConversableAgent"]
     ) -> None:
@@ -267,10 +402,36 @@ class EventProcessor:
                 ordered_agents.append(a)
                 seen.add(a.name)
 
+        if not self.runner.delta_agents_state:
+            event_info["agents"] = {
+                "sender": self._get_agent_dump(sender_agent),
+                "recipient": self._get_agent_dump(recipient_agent),
+                "all": [self._get_agent_dump(a) for a in ordered_agents if a],
+            }
+            return
+        self._agents = ordered_agents
+        self._agents_seq += 1
+        if self._snapshot_requested:
+            self._snapshot_requested = False
+            dumps = [self._snapshot_agent(a) for a in ordered_agents]
+            by_name = {dump["name"]: dump for dump in dumps}
+            event_info["agents"] = {
+                "seq": self._agents_seq,
+                "snapshot": True,
+                "sender": by_name.get(sender) if sender_agent else None,
+                "recipient": (
+                    by_name.get(recipient) if recipient_agent else None
+                ),
+                "all": dumps,
+            }
+            return
+        deltas = [self._get_agent_delta(a) for a in ordered_agents]
         event_info["agents"] = {
-            "sender": self._get_agent_dump(sender_agent),
-            "recipient": self._get_agent_dump(recipient_agent),
-            "all": [self._get_agent_dump(a) for a in ordered_agents if a],
+            "seq": self._agents_seq,
+            "snapshot": False,
+            "sender": sender_agent.name if sender_agent else None,
+            "recipient": recipient_agent.name if recipient_agent else None,
+            "all": [delta for delta in deltas if delta],
         }
 
 
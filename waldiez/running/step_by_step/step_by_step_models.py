@@ -38,6 +38,8 @@ class WaldiezDebugStepAction(Enum):
     REMOVE_BREAKPOINT = "rb"  # Remove a breakpoint
     LIST_BREAKPOINTS = "lb"  # List all breakpoints
     CLEAR_BREAKPOINTS = "cb"  # Clear all breakpoints
+    SYNC_AGENTS = "sy"  # Send a full snapshot of the agents
+    HISTORY = "hi"  # Show a page of the event history
     UNKNOWN = "unknown"  # Unknown command
 
 
@@ -54,6 +56,8 @@ VALID_CONTROL_COMMANDS = {
     "rb",  # remove_breakpoint
     "lb",  # list_breakpoints
     "cb",  # clear_breakpoints
+    "sy",  # sync_agents
+    "hi",  # history
 }
 
 
@@ -362,6 +366,13 @@ class WaldiezDebugConfig(BaseModel):
     step_mode: bool = Field(default=True)
     enable_stats_collection: bool = Field(default=True)
     command_timeout_seconds: float = Field(default=300.0, gt=0)
+    # send the agents' changes (instead of their full dumps) on each event
+    delta_agents_state: bool = Field(default=False)
+    # on auto-continue, skip the debug processing of the events that
+    # cannot hit a breakpoint (they are sent as in a standard run)
+    fast_auto_continue: bool = Field(default=False)
+    # keep the events that do not fit in the history in the run's directory
+    spill_event_history: bool = Field(default=True)
 
 
 class WaldiezDebugBreakpointsList(BaseModel):
@@ -461,6 +472,24 @@ class WaldiezDebugEventInfo(BaseModel):
     event: dict[str, Any]
 
 
+class WaldiezDebugAgentsState(BaseModel):
+    """Debug agents state (full snapshot) message."""
+
+    type: Literal["debug_agents_state"] = "debug_agents_state"
+    seq: int
+    agents: list[dict[str, Any]]
+
+
+class WaldiezDebugEventHistory(BaseModel):
+    """Debug event history (page) message."""
+
+    type: Literal["debug_event_history"] = "debug_event_history"
+    events: list[dict[str, Any]]
+    start: int
+    next: int | None = None
+    total: int
+
+
 class WaldiezDebugStats(BaseModel):
     """Debug stats message."""
 
@@ -496,6 +525,8 @@ WaldiezDebugMessage = Annotated[
         WaldiezDebugInputRequest,
         WaldiezDebugInputResponse,
         WaldiezDebugEventInfo,
+        WaldiezDebugAgentsState,
+        WaldiezDebugEventHistory,
         WaldiezDebugStats,
         WaldiezDebugHelp,
         WaldiezDebugError,
@@ -541,6 +572,14 @@ HELP_MESSAGE = WaldiezDebugHelp(
                 WaldiezDebugHelpCommand(
                     cmds=["stats", "st"], desc="Show execution statistics"
                 ),
+                WaldiezDebugHelpCommand(
+                    cmds=["sync", "sy"],
+                    desc="Send a full snapshot of the agents' state",
+                ),
+                WaldiezDebugHelpCommand(
+                    cmds=["history", "hi"],
+                    desc="Show events. Usage: 'hi [start] [limit]' (event numbers)",
+                ),
             ],
         ),
         WaldiezDebugHelpCommandGroup(
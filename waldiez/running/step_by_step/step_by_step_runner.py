@@ -17,7 +17,7 @@ import uuid
 from collections import deque
 from collections.abc import Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Union
 
 from pydantic import ValidationError
 from typing_extensions import override
@@ -30,10 +30,13 @@ from ..base_runner import WaldiezBaseRunner
 from ..exceptions import StopRunningException
 from ..results_mixin import WaldiezRunResults
 from .breakpoints_mixin import BreakpointsMixin
+from .event_history import EVENT_HISTORY_FILE, EventHistory
 from .step_by_step_models import (
     VALID_CONTROL_COMMANDS,
+    WaldiezDebugAgentsState,
     WaldiezDebugConfig,
     WaldiezDebugError,
+    WaldiezDebugEventHistory,
     WaldiezDebugEventInfo,
     WaldiezDebugInputRequest,
     WaldiezDebugInputResponse,
@@ -61,6 +64,15 @@ DEBUG_INPUT_PROMPT = (
 )
 
 
+class _SkippedEvent(NamedTuple):
+    """An event that skipped the debug processing (fast auto-continue)."""
+
+    number: int
+    event: Union["BaseEvent", "BaseMessage"]
+    sender: str | None
+    recipient: str | None
+
+
 def gen_id() -> str:
     """Generate a new id.
 
@@ -110,8 +122,12 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         self._processed_events = 0
         self._step_mode = self._config.step_mode
 
-        # Use deque for efficient FIFO operations on event history
-        self._event_history: deque[dict[str, Any]] = deque(
+        # The newest events in memory, the older ones in the run's directory
+        self._event_history = EventHistory(
+            maxlen=self._config.max_event_history
+        )
+        # Skipped events, added to the history when it is needed
+        self._skipped_events: deque[_SkippedEvent] = deque(
             maxlen=self._config.max_event_history
         )
         self._current_event: Union["BaseEvent", "BaseMessage", None] = None
@@ -228,6 +244,11 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         """Get the maximum event history size."""
         return self._config.max_event_history
 
+    @property
+    def delta_agents_state(self) -> bool:
+        """Whether the events carry the agents' changes (not full dumps)."""
+        return self._config.delta_agents_state
+
     def add_to_history(self, event_info: dict[str, Any]) -> None:
         """Add an event to the history.
 
@@ -236,8 +257,67 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         event_info : dict[str, Any]
             The event information to add to the history.
         """
+        self._add_skipped_to_history()
         self._event_history.append(event_info)
 
+    def _add_skipped_to_history(self) -> None:
+        """Add the (dumped) skipped events to the history."""
+        while self._skipped_events:
+            skipped = self._skipped_events.popleft()
+            event_info = skipped.event.model_dump(
+                mode="json", exclude_none=True, fallback=str
+            )
+            event_info["count"] = skipped.number
+            event_info["sender"] = skipped.sender
+            event_info["recipient"] = skipped.recipient
+            self._event_history.append(event_info)
+
+    def _skip_event(
+        self, event: Union["BaseEvent", "BaseMessage"], should_break: bool
+    ) -> bool:
+        """Skip the debug processing of an event, if in fast auto-continue.
+
+        Parameters
+        ----------
+        event : BaseEvent | BaseMessage
+            The event.
+        should_break : bool
+            Whether to break on the event.
+
+        Returns
+        -------
+        bool
+            True if the event is skipped (only kept as a reference).
+        """
+        if (
+            should_break
+            or not self._config.fast_auto_continue
+            or not self._config.auto_continue
+            or self._stop_requested.is_set()
+            or getattr(event, "type", None) == "input_request"
+        ):
+            return False
+        self.event_plus_one()
+        self._current_event = event
+        sender, recipient = self._get_event_participants(event)
+        self._last_sender = sender or self._last_sender
+        self._last_recipient = recipient or self._last_recipient
+        if (
+            self._event_history.spilling
+            and len(self._skipped_events) == self._skipped_events.maxlen
+        ):
+            # to the history (and the file), instead of dropping the oldest
+            self._add_skipped_to_history()
+        self._skipped_events.append(
+            _SkippedEvent(
+                number=self._event_count,
+                event=event,
+                sender=self._last_sender,
+                recipient=self._last_recipient,
+            )
+        )
+        return True
+
     def pop_event(self) -> None:
         """Pop event from the history."""
         if self._event_history:
@@ -338,6 +418,16 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         }
         self.emit(WaldiezDebugEventInfo(event=event_info))
 
+    def show_agents_state(self) -> None:
+        """Show a full snapshot of the agents (for the deltas to follow)."""
+        snapshot = self._event_processor.request_agents_snapshot()
+        if snapshot is None:
+            # the next event's agents info will be the snapshot
+            return
+        self.emit(
+            WaldiezDebugAgentsState(seq=snapshot["seq"], agents=snapshot["all"])
+        )
+
     def show_stats(self) -> None:
         """Show comprehensive execution statistics."""
         base_stats: dict[str, Any] = {
@@ -356,6 +446,8 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
             },
             "history": {
                 "event_history_count": len(self._event_history),
+                "skipped_events_count": len(self._skipped_events),
+                "spilled_events_count": self._event_history.spilled,
                 "max_history_size": self._config.max_event_history,
                 "memory_usage": f"{len(self._event_history) * 200}B (est.)",
             },
@@ -414,13 +506,59 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         list[dict[str, Any]]
             A list of dictionaries containing event history.
         """
+        self._add_skipped_to_history()
         return list(self._event_history)
 
+    def get_event_history_page(
+        self, start: int = 1, limit: int = 100
+    ) -> dict[str, Any]:
+        """Get a page of the event history (in memory and on disk).
+
+        Parameters
+        ----------
+        start : int
+            The number (count) of the first event.
+        limit : int
+            The maximum number of events.
+
+        Returns
+        -------
+        dict[str, Any]
+            The ``events``, the ``start``, the number of the event after
+            them (``next``, None if none) and the ``total`` events.
+        """
+        self._add_skipped_to_history()
+        return self._event_history.page(start=start, limit=limit)
+
+    def show_event_history(self, start: int = 1, limit: int = 100) -> None:
+        """Show a page of the event history.
+
+        Parameters
+        ----------
+        start : int
+            The number (count) of the first event.
+        limit : int
+            The maximum number of events.
+        """
+        page = self.get_event_history_page(start=start, limit=limit)
+        self.emit(WaldiezDebugEventHistory(**page))
+
+    def _spill_event_history(self, temp_dir: Path) -> None:
+        """Keep the events that do not fit in memory in the run's dir."""
+        if self._config.spill_event_history:
+            self._event_history.spill_to(temp_dir / EVENT_HISTORY_FILE)
+
+    def _close_event_history(self) -> None:
+        """Stop spilling, with the skipped events also in the file."""
+        self._add_skipped_to_history()
+        self._event_history.close()
+
     def reset_session(self) -> None:
         """Reset the debugging session state."""
         self._event_count = 0
         self._processed_events = 0
         self._event_history.clear()
+        self._skipped_events.clear()
         self._current_event = None
         self._last_sender = None
         self._last_recipient = None
@@ -626,6 +764,7 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
             self.set_input_function(stream.input)
             self.set_send_function(stream.send)
             self._output_dir = temp_dir
+            self._spill_event_history(temp_dir)
             self.print(MESSAGES["workflow_starting"])
             self.print(self.waldiez.info.model_dump_json())
             results = loaded_module.main(
@@ -643,6 +782,7 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
             self.print(MESSAGES["workflow_failed"].format(error=str(e)))
         finally:
             results_container["completed"] = True
+            self._close_event_history()
             self._remove_run_paths()
 
         return results_container["results"]
@@ -664,8 +804,16 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         """Process an event with step-by-step debugging."""
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
+            should_break = self.should_break_on_event(event, sender_only=True)
+            if self._skip_event(event, should_break):
+                # as in a standard run
+                self.process_event(event, agents, output_dir=self._output_dir)
+                self._processed_events += 1
+                return not self._stop_requested.is_set()
             # Use the event processor for core logic
-            result = self._event_processor.process_event(event, agents)
+            result = self._event_processor.process_event(
+                event, agents, should_break=should_break
+            )
 
             if result["action"] == "stop":
                 self.log.debug(
@@ -746,6 +894,7 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
                 self.set_send_function(stream.send)
 
                 self._output_dir = temp_dir
+                self._spill_event_history(temp_dir)
                 self.print(MESSAGES["workflow_starting"])
                 self.print(self.waldiez.info.model_dump_json())
 
@@ -765,6 +914,7 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
                 traceback.print_exc()
                 return []
             finally:
+                self._close_event_history()
                 self._remove_run_paths()
 
         # Create and monitor cancellable task
@@ -790,8 +940,18 @@ class WaldiezStepByStepRunner(WaldiezBaseRunner, BreakpointsMixin):
         """Process an event with step-by-step debugging asynchronously."""
         # pylint: disable=too-many-try-statements,broad-exception-caught
         try:
+            should_break = self.should_break_on_event(event, sender_only=True)
+            if self._skip_event(event, should_break):
+                # as in a standard run
+                await self.a_process_event(
+                    event, agents, output_dir=self._output_dir
+                )
+                self._processed_events += 1
+                return not self._stop_requested.is_set()
             # Use the event processor for core logic
-            result = self._event_processor.process_event(event, agents)
+            result = self._event_processor.process_event(
+                event, agents, should_break=should_break
+            )
 
             if result["action"] == "stop":
                 self.log.debug(
@@ -14,6 +14,8 @@ from typing import Any, Literal
 
 from waldiez.storage import WaldiezCheckpoint
 
+from .worker_pool import WarmWorkerPool, get_worker_pool
+
 
 class BaseSubprocessRunner:
     """Base class with common logic for subprocess runners."""
@@ -59,6 +61,17 @@ class BaseSubprocessRunner:
         self.checkpoint: WaldiezCheckpoint | None = kwargs.get(
             "checkpoint", None
         )
+        python_executable = kwargs.get("python_executable")
+        if not isinstance(python_executable, str) or not python_executable:
+            python_executable = sys.executable
+        self.python_executable: str = python_executable
+        self.skip_deps = bool(kwargs.get("skip_deps", False))
+        worker_pool = kwargs.get("worker_pool")
+        self.worker_pool: WarmWorkerPool | None = (
+            worker_pool
+            if isinstance(worker_pool, WarmWorkerPool)
+            else get_worker_pool()
+        )
 
     def build_command(
         self,
@@ -97,7 +110,7 @@ class BaseSubprocessRunner:
             else str(flow_path.with_suffix(".py"))
         )
         cmd = [
-            sys.executable,
+            self.python_executable,
             "-m",
             "waldiez",
             "run",
@@ -106,15 +119,7 @@ class BaseSubprocessRunner:
             "--output",
             _output_path,
         ]
-
-        if mode == "debug":
-            cmd.append("--step")
-
-        if structured:
-            cmd.append("--structured")
-
-        if force:
-            cmd.append("--force")
+        cmd.extend(self._get_run_flags(mode, structured, force))
 
         if self.uploads_root:
             cmd.extend(["--uploads-root", str(self.uploads_root)])
@@ -132,6 +137,25 @@ class BaseSubprocessRunner:
         self.logger.debug("Runner command: %s", " ".join(cmd))
         return cmd
 
+    def _get_run_flags(
+        self,
+        mode: Literal["debug", "run"],
+        structured: bool,
+        force: bool,
+    ) -> list[str]:
+        """Get the boolean flags of the run command."""
+        flags: list[str] = []
+        if mode == "debug":
+            flags.append("--step")
+        if structured:
+            flags.append("--structured")
+        if force:
+            flags.append("--force")
+        if self.skip_deps:
+            # the interpreter (e.g. a pooled venv) has the requirements
+            flags.append("--skip-deps")
+        return flags
+
     def parse_output(
         self,
         line: str,
@@ -7,10 +7,14 @@ from .__base__ import BaseSubprocessRunner
 from ._async_runner import AsyncSubprocessRunner
 from ._sync_runner import SyncSubprocessRunner
 from .runner import WaldiezSubprocessRunner
+from .venv_pool import VenvPool
+from .worker_pool import WarmWorkerPool
 
 __all__ = [
     "SyncSubprocessRunner",
     "AsyncSubprocessRunner",
     "BaseSubprocessRunner",
     "WaldiezSubprocessRunner",
+    "VenvPool",
+    "WarmWorkerPool",
 ]
@@ -94,13 +94,8 @@ class AsyncSubprocessRunner(BaseSubprocessRunner):
             cmd = self.build_command(flow_path, mode=mode, message=message)
             self.log_subprocess_start(cmd)
 
-            # Start subprocess
-            self.process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            # Start subprocess (or hand the command to a warm worker)
+            self.process = await self._start_process(cmd)
 
             # Start monitoring tasks
             await self._start_monitoring()
@@ -130,6 +125,21 @@ class AsyncSubprocessRunner(BaseSubprocessRunner):
         finally:
             await self._cleanup()
 
+    async def _start_process(self, cmd: list[str]) -> AsyncProcess:
+        """Start the subprocess, using a warm worker if available."""
+        if self.worker_pool is not None and self.worker_pool.accepts(cmd):
+            worker = await self.worker_pool.a_take()
+            if worker is not None:
+                self.logger.debug("Running in a warm worker")
+                await self.worker_pool.a_run(worker, cmd)
+                return worker
+        return await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
     async def provide_user_input(self, user_input: str) -> None:
         """Provide user input response.
 
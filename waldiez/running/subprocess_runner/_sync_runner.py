@@ -90,17 +90,8 @@ class SyncSubprocessRunner(BaseSubprocessRunner):
             cmd = self.build_command(flow_path, mode=mode, message=message)
             self.log_subprocess_start(cmd)
 
-            # Start subprocess
-            # pylint: disable=consider-using-with
-            self.process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                encoding="utf-8",
-                text=True,
-                bufsize=1,  # Line buffered
-            )
+            # Start subprocess (or hand the command to a warm worker)
+            self.process = self._start_process(cmd)
 
             # Start monitoring threads
             self._start_monitoring()
@@ -130,6 +121,25 @@ class SyncSubprocessRunner(BaseSubprocessRunner):
         finally:
             self._cleanup()
 
+    def _start_process(self, cmd: list[str]) -> subprocess.Popen[Any]:
+        """Start the subprocess, using a warm worker if available."""
+        if self.worker_pool is not None and self.worker_pool.accepts(cmd):
+            worker = self.worker_pool.take()
+            if worker is not None:
+                self.logger.debug("Running in a warm worker")
+                self.worker_pool.run(worker, cmd)
+                return worker
+        # pylint: disable=consider-using-with
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            text=True,
+            bufsize=1,  # Line buffered
+        )
+
     @staticmethod
     def gather() -> tuple[bool, str]:
         """Gather any results after run.
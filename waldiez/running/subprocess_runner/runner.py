@@ -18,6 +18,8 @@ from ..base_runner import WaldiezBaseRunner
 from ..step_by_step.breakpoints_mixin import BreakpointsMixin
 from ._async_runner import AsyncSubprocessRunner
 from ._sync_runner import SyncSubprocessRunner
+from .venv_pool import VenvPool
+from .worker_pool import WarmWorkerPool
 
 
 # pylint: disable=too-many-instance-attributes
@@ -64,7 +66,13 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
         input_timeout : float
             Timeout for user input in seconds
         **kwargs : Any
-            Additional arguments for BaseRunner
+            Additional arguments for BaseRunner. A ``venv_pool``
+            (:class:`VenvPool`) runs the flow with the interpreter of
+            a cached environment with its requirements (also enabled
+            with the ``WALDIEZ_VENV_POOL`` environment variable). A
+            ``worker_pool`` (:class:`WarmWorkerPool`) runs the flow in a
+            pre-started interpreter (also enabled with the
+            ``WALDIEZ_WORKER_POOL`` environment variable).
         """
         super().__init__(
             waldiez=waldiez,
@@ -85,6 +93,14 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
             on_async_input_request or self._default_async_input_request
         )
         self.input_timeout = input_timeout
+        venv_pool = kwargs.get("venv_pool")
+        self.venv_pool: VenvPool | None = (
+            venv_pool if isinstance(venv_pool, VenvPool) else None
+        ) or VenvPool.from_env()
+        worker_pool = kwargs.get("worker_pool")
+        self.worker_pool: WarmWorkerPool | None = (
+            worker_pool if isinstance(worker_pool, WarmWorkerPool) else None
+        )
 
         # Subprocess runner instances
         self.async_runner: AsyncSubprocessRunner | None = None
@@ -145,7 +161,42 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
         """Get the default async input request handler."""
         await asyncio.to_thread(self._default_sync_input_request, prompt)
 
-    def _create_async_subprocess_runner(self) -> AsyncSubprocessRunner:
+    def _acquire_python(self) -> str | None:
+        """Get the interpreter of the flow's environment (if pooled).
+
+        None if not pooled, or if the pool could not prepare it.
+        """
+        if self.venv_pool is None or self._skip_deps:
+            return None
+        return self.venv_pool.acquire(
+            self.flow_requirements(), printer=self.log.info
+        )
+
+    def _release_python(self, python_executable: str | None) -> None:
+        """Release the flow's environment (if pooled)."""
+        if self.venv_pool is not None and python_executable:
+            self.venv_pool.release(python_executable)
+
+    @staticmethod
+    def _python_kwargs(python_executable: str | None) -> dict[str, Any]:
+        """Get the subprocess runner's interpreter arguments."""
+        if not python_executable:
+            return {}
+        # the pool's interpreter already has the requirements
+        return {"python_executable": python_executable, "skip_deps": True}
+
+    def _subprocess_kwargs(
+        self, python_executable: str | None
+    ) -> dict[str, Any]:
+        """Get the extra arguments of the subprocess runners."""
+        kwargs = self._python_kwargs(python_executable)
+        if self.worker_pool is not None:
+            kwargs["worker_pool"] = self.worker_pool
+        return kwargs
+
+    def _create_async_subprocess_runner(
+        self, python_executable: str | None = None
+    ) -> AsyncSubprocessRunner:
         """Create async subprocess runner."""
         self.async_runner = AsyncSubprocessRunner(
             on_output=self.async_on_output,
@@ -156,10 +207,13 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
             logger=self.log,
             breakpoints=self.breakpoints,
             checkpoint=self._checkpoint,
+            **self._subprocess_kwargs(python_executable),
         )
         return self.async_runner
 
-    def _create_sync_subprocess_runner(self) -> SyncSubprocessRunner:
+    def _create_sync_subprocess_runner(
+        self, python_executable: str | None = None
+    ) -> SyncSubprocessRunner:
         """Create sync subprocess runner."""
         self.sync_runner = SyncSubprocessRunner(
             on_output=self.sync_on_output,
@@ -170,6 +224,7 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
             logger=self.log,
             breakpoints=self.breakpoints,
             checkpoint=self._checkpoint,
+            **self._subprocess_kwargs(python_executable),
         )
         return self.sync_runner
 
@@ -293,9 +348,11 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
         ]:  # pragma: no cover
             mode = "run"
         self.mode = mode  # type: ignore
+        python_executable: str | None = None
         try:
+            python_executable = self._acquire_python()
             # Create sync subprocess runner
-            runner = self._create_sync_subprocess_runner()
+            runner = self._create_sync_subprocess_runner(python_executable)
 
             # Run subprocess
             # noinspection PyTypeChecker
@@ -315,6 +372,8 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
                     "mode": self.mode,
                 }
             ]
+        finally:
+            self._release_python(python_executable)
 
     @override
     async def a_run(
@@ -425,9 +484,11 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
         self.mode = mode  # type: ignore
 
         # pylint: disable=too-many-try-statements,broad-exception-caught
+        python_executable: str | None = None
         try:
+            python_executable = await asyncio.to_thread(self._acquire_python)
             # Create async subprocess runner
-            runner = self._create_async_subprocess_runner()
+            runner = self._create_async_subprocess_runner(python_executable)
 
             # Run subprocess
             # noinspection PyTypeChecker
@@ -447,6 +508,8 @@ class WaldiezSubprocessRunner(WaldiezBaseRunner):
                     "mode": self.mode,
                 }
             ]
+        finally:
+            self._release_python(python_executable)
 
     def provide_user_input(self, user_input: str) -> None:
         """Provide user input to the active subprocess runner.
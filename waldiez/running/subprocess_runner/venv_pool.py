@@ -0,0 +1,461 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,too-many-try-statements
+# flake8: noqa: G004
+"""Pool of per-requirements virtual environments for flow subprocesses.
+
+Each flow's extra requirements are installed into a virtual environment
+keyed by the fingerprint of its (normalized) requirement set, instead of
+into the one environment every run shares. The environments only hold
+the extras: a ``.pth`` file adds the current interpreter's site-packages
+directories (with waldiez and ag2) after the environment's own ones.
+
+An environment is built in a temporary directory and atomically renamed
+into place, so concurrent builders of the same set do not clash (the
+loser's copy is discarded). Only ``<env>/bin/python -m ...`` is used, so
+the absolute paths pip writes in console scripts do not matter.
+
+The least recently used environments are removed when there are more
+than ``max_envs`` of them, never the ones in use: each process using an
+environment holds a lease file in it (``.leases/<pid>``). An environment
+is first renamed away and checked again for leases taken meanwhile (a
+new lease fails once it is gone), so processes sharing the pool do not
+remove each other's environments.
+"""
+
+import json
+import logging
+import os
+import shutil
+import site
+import subprocess  # nosec B404
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from contextlib import suppress
+from pathlib import Path
+from typing import Callable
+
+from waldiez.utils.requirements import (
+    RequirementsCache,
+    requirements_fingerprint,
+)
+
+WALDIEZ_VENV_POOL = "WALDIEZ_VENV_POOL"
+WALDIEZ_VENV_POOL_SIZE = "WALDIEZ_VENV_POOL_SIZE"
+WALDIEZ_WHEEL_CACHE = "WALDIEZ_WHEEL_CACHE"
+
+READY_FILE = ".waldiez_venv.json"
+BASE_PTH_FILE = "_waldiez_base.pth"
+LEASES_DIR = ".leases"
+
+LOG = logging.getLogger(__name__)
+
+
+def _venv_python(env_dir: Path) -> Path:
+    """Get the python executable of a virtual environment."""
+    if sys.platform == "win32":  # pragma: no cover
+        return env_dir / "Scripts" / "python.exe"
+    return env_dir / "bin" / "python"
+
+
+def _base_site_dirs() -> list[str]:
+    """Get the site-packages directories of the current interpreter."""
+    dirs: list[str] = []
+    with suppress(Exception):
+        dirs.extend(site.getsitepackages())
+    with suppress(Exception):
+        user_site = site.getusersitepackages()
+        if os.path.isdir(user_site):
+            dirs.append(user_site)
+    # e.g. a bundled (--target) location of the python manager
+    for entry in sys.path:
+        if entry.endswith("site-packages") and entry not in dirs:
+            dirs.append(entry)
+    return [entry for entry in dirs if os.path.isdir(entry)]
+
+
+def _is_alive(pid: int) -> bool:
+    """Check if a process is running."""
+    if pid == os.getpid():
+        return True
+    # pylint: disable=import-outside-toplevel
+    import psutil
+
+    return psutil.pid_exists(pid)
+
+
+def _is_leased(env_dir: Path) -> bool:
+    """Check if a (running) process holds a lease of an environment.
+
+    The leases of processes that are gone are removed.
+    """
+    try:
+        leases = list((env_dir / LEASES_DIR).iterdir())
+    except OSError:
+        return False
+    leased = False
+    for lease in leases:
+        try:
+            pid = int(lease.name)
+        except ValueError:
+            continue
+        if _is_alive(pid):
+            leased = True
+        else:
+            with suppress(OSError):
+                lease.unlink()
+    return leased
+
+
+def _default_root() -> Path:
+    from_env = os.environ.get(WALDIEZ_VENV_POOL, "")
+    if from_env and from_env.lower() not in ("1", "true", "yes", "on"):
+        return Path(from_env)
+    # pylint: disable=import-outside-toplevel
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("waldiez", appauthor=False)) / "venvs"
+
+
+class VenvPool:
+    """Cached virtual environments keyed by the flow's requirements."""
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        max_envs: int = 8,
+        wheel_cache: str | Path | None = None,
+        requirements_cache: RequirementsCache | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Parameters
+        ----------
+        root : str | Path | None
+            The directory of the environments, defaults to the
+            ``WALDIEZ_VENV_POOL`` environment variable (if a path) or
+            ``venvs`` in the user's cache directory.
+        max_envs : int
+            The maximum number of environments to keep.
+        wheel_cache : str | Path | None
+            A local cache directory for pip (downloaded and built wheels),
+            shared by all the environments. Defaults to the
+            ``WALDIEZ_WHEEL_CACHE`` environment variable (if set).
+        requirements_cache : RequirementsCache | None
+            The recorded satisfied requirement sets of the current
+            environment (to skip resolving a known set again).
+        """
+        self._root = Path(root) if root else _default_root()
+        self._max_envs = max(1, max_envs)
+        if wheel_cache is None:
+            wheel_cache = os.environ.get(WALDIEZ_WHEEL_CACHE) or None
+        self._wheel_cache = Path(wheel_cache) if wheel_cache else None
+        self._requirements_cache = requirements_cache or RequirementsCache()
+        self._in_use: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "VenvPool | None":
+        """Get a pool if enabled with the ``WALDIEZ_VENV_POOL`` variable.
+
+        Returns
+        -------
+        VenvPool | None
+            The pool, None if not enabled.
+        """
+        from_env = os.environ.get(WALDIEZ_VENV_POOL, "")
+        if not from_env or from_env.lower() in ("0", "false", "no", "off"):
+            return None
+        try:
+            max_envs = int(os.environ.get(WALDIEZ_VENV_POOL_SIZE, "8"))
+        except ValueError:
+            max_envs = 8
+        return cls(max_envs=max_envs)
+
+    @property
+    def root(self) -> Path:
+        """The directory of the environments."""
+        return self._root
+
+    @property
+    def max_envs(self) -> int:
+        """The maximum number of environments to keep."""
+        return self._max_envs
+
+    @property
+    def wheel_cache(self) -> Path | None:
+        """The shared pip cache directory (if any)."""
+        return self._wheel_cache
+
+    @staticmethod
+    def key(requirements: Iterable[str]) -> str:
+        """Get the key of a requirement set.
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The requirement specifiers.
+
+        Returns
+        -------
+        str
+            The environment's key.
+        """
+        return requirements_fingerprint(requirements)[:16]
+
+    def env_dir(self, requirements: Iterable[str]) -> Path:
+        """Get the directory of a requirement set's environment.
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The requirement specifiers.
+
+        Returns
+        -------
+        Path
+            The environment's directory (might not exist yet).
+        """
+        return self._root / self.key(requirements)
+
+    def environments(self) -> list[Path]:
+        """Get the (ready) environments, least recently used first.
+
+        Returns
+        -------
+        list[Path]
+            The environments' directories.
+        """
+        if not self._root.is_dir():
+            return []
+        ready: list[tuple[float, Path]] = []
+        for entry in self._root.iterdir():
+            if entry.name.startswith("."):
+                # still being created
+                continue
+            marker = entry / READY_FILE
+            with suppress(OSError):
+                ready.append((marker.stat().st_mtime, entry))
+        return [path for _, path in sorted(ready)]
+
+    def acquire(
+        self,
+        requirements: Iterable[str],
+        printer: Callable[..., None] = print,
+    ) -> str | None:
+        """Get the python executable to run a flow with.
+
+        If the current environment already has everything, its own
+        interpreter is used. Otherwise, the set's environment is created
+        (once) and used. Call :meth:`release` when the run is done.
+        The returned interpreter has all the requirements.
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The flow's requirement specifiers.
+        printer : Callable[..., None]
+            The callable to use for printing pip's output.
+
+        Returns
+        -------
+        str | None
+            The python executable, None if the set's environment could not
+            be prepared (so the requirements are still to be installed).
+        """
+        wanted = sorted(set(requirements))
+        if not self._requirements_cache.missing(wanted):
+            return sys.executable
+        key = self.key(wanted)
+        env_dir = self._root / key
+        with self._lock:
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+        try:
+            # (re)create it if another process removed it meanwhile
+            for _ in range(2):
+                if not (env_dir / READY_FILE).is_file():
+                    self._create(env_dir, wanted, printer)
+                if self._take_lease(env_dir):
+                    break
+            else:
+                raise RuntimeError(f"{env_dir} was removed while acquiring it")
+        except Exception as error:
+            self.release(str(_venv_python(env_dir)))
+            LOG.warning(f"Could not prepare the environment: {error}")
+            printer(f"Could not prepare an environment: {error}")
+            return None
+        # mark as recently used
+        with suppress(OSError):
+            os.utime(env_dir / READY_FILE)
+        self.evict()
+        return str(_venv_python(env_dir))
+
+    def release(self, python_executable: str) -> None:
+        """Release an environment got from :meth:`acquire`.
+
+        Parameters
+        ----------
+        python_executable : str
+            The python executable returned by :meth:`acquire`.
+        """
+        if python_executable == sys.executable:
+            return
+        python_path = Path(python_executable)
+        env_dir = python_path.parent.parent
+        with self._lock:
+            count = self._in_use.get(env_dir.name, 0) - 1
+            if count > 0:
+                self._in_use[env_dir.name] = count
+                return
+            self._in_use.pop(env_dir.name, None)
+            with suppress(OSError):
+                (env_dir / LEASES_DIR / str(os.getpid())).unlink()
+
+    def evict(self) -> list[Path]:
+        """Remove the least recently used environments over the limit.
+
+        Returns
+        -------
+        list[Path]
+            The removed environments.
+        """
+        removed: list[Path] = []
+        environments = self.environments()
+        excess = len(environments) - self._max_envs
+        for env_dir in environments:
+            if excess <= 0:
+                break
+            if self._remove(env_dir):
+                removed.append(env_dir)
+                excess -= 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all the environments not in use."""
+        for env_dir in self.environments():
+            self._remove(env_dir)
+
+    def _take_lease(self, env_dir: Path) -> bool:
+        """Hold a lease of a (ready) environment for this process.
+
+        Returns False if the environment is gone (e.g. evicted by
+        another process).
+        """
+        with self._lock:
+            try:
+                # no parents: fails if the environment was removed
+                (env_dir / LEASES_DIR).mkdir(exist_ok=True)
+                (env_dir / LEASES_DIR / str(os.getpid())).touch()
+            except OSError:
+                return False
+        return (env_dir / READY_FILE).is_file()
+
+    def _remove(self, env_dir: Path) -> bool:
+        """Remove an environment if no process holds a lease of it."""
+        with self._lock:
+            if env_dir.name in self._in_use:
+                return False
+        if _is_leased(env_dir):
+            return False
+        trash = self._root / f".{env_dir.name}.{uuid.uuid4().hex[:8]}.old"
+        try:
+            os.rename(env_dir, trash)
+        except OSError:
+            # e.g. gone already, or in use (windows)
+            return False
+        if _is_leased(trash):
+            # leased while moving it away, put it back
+            with suppress(OSError):
+                os.rename(trash, env_dir)
+            return False
+        shutil.rmtree(trash, ignore_errors=True)
+        return True
+
+    def _pip_command(self, python: Path, requirements: list[str]) -> list[str]:
+        cmd = [
+            str(python),
+            "-m",
+            "pip",
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+        ]
+        if self._wheel_cache:
+            self._wheel_cache.mkdir(parents=True, exist_ok=True)
+            cmd += ["--cache-dir", str(self._wheel_cache)]
+            wheels = self._wheel_cache / "wheels"
+            if wheels.is_dir():
+                cmd += ["--find-links", str(wheels)]
+        cmd.extend(requirements)
+        return cmd
+
+    def _create(
+        self,
+        env_dir: Path,
+        requirements: list[str],
+        printer: Callable[..., None],
+    ) -> None:
+        """Create and populate an environment (in a temporary directory)."""
+        self._root.mkdir(parents=True, exist_ok=True)
+        tmp_dir = self._root / f".{env_dir.name}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            subprocess.run(  # nosec B603
+                [sys.executable, "-m", "venv", "--without-pip", str(tmp_dir)],
+                check=True,
+                capture_output=True,
+            )
+            python = _venv_python(tmp_dir)
+            site_dir = subprocess.run(  # nosec B603
+                [
+                    str(python),
+                    "-c",
+                    "import sysconfig; print(sysconfig.get_path('purelib'))",
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+            (Path(site_dir) / BASE_PTH_FILE).write_text(
+                "".join(
+                    f"import site; site.addsitedir({entry!r})\n"
+                    for entry in _base_site_dirs()
+                ),
+                encoding="utf-8",
+            )
+            printer(f"Installing requirements: {', '.join(requirements)}")
+            started = time.monotonic()
+            result = subprocess.run(  # nosec B603
+                self._pip_command(python, requirements),
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+            for line in (result.stdout + result.stderr).splitlines():
+                if line.strip():
+                    printer(line.strip())
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"pip failed with exit code {result.returncode}"
+                )
+            (tmp_dir / READY_FILE).write_text(
+                json.dumps(
+                    {
+                        "requirements": requirements,
+                        "seconds": round(time.monotonic() - started, 3),
+                    }
+                ),
+                encoding="utf-8",
+            )
+            try:
+                os.replace(tmp_dir, env_dir)
+            except OSError:
+                # another process was faster (or a leftover is there)
+                if not (env_dir / READY_FILE).is_file():
+                    shutil.rmtree(env_dir, ignore_errors=True)
+                    os.replace(tmp_dir, env_dir)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=import-outside-toplevel,unused-import,broad-exception-caught
+# flake8: noqa: F401
+"""Pre-started waldiez worker interpreter.
+
+Started with ``python -m waldiez.running.subprocess_runner.worker``, it
+imports waldiez, autogen and the (heavy) modules a flow run needs, then
+blocks reading one json line from stdin::
+
+    {"argv": ["run", "--file", ...], "cwd": "...", "env": {...}}
+
+and runs that ``waldiez`` command line in-process, exactly as
+``python -m waldiez <argv>`` would (the rest of stdin and stdout are
+the flow's, like with a fresh process). The worker exits after the flow,
+a closed stdin (no command) just stops it.
+
+The worker is started with the run's environment (the pool only hands it
+runs with the one it was started with), so it is in place before the
+imports read it. The request's ``env`` only restores it, in case the
+imports changed it.
+"""
+
+import json
+import os
+import sys
+import warnings
+from typing import Any
+
+WORKER_MODULE = "waldiez.running.subprocess_runner.worker"
+
+
+def warm_up() -> None:
+    """Import what a flow run needs (and check the ag2 patch)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        import waldiez.cli
+
+        try:
+            import autogen  # type: ignore
+            from autogen.agentchat import ConversableAgent  # type: ignore
+            from autogen.io import IOStream  # type: ignore
+        except Exception:  # pragma: no cover
+            pass
+        import waldiez.running.standard_runner
+        from waldiez.exporter import WaldiezExporter
+        from waldiez.io import StructuredIOStream
+
+
+def _apply(request: dict[str, Any]) -> list[str]:
+    """Apply the request's environment, get the command line."""
+    env = request.get("env")
+    if isinstance(env, dict):
+        os.environ.clear()
+        os.environ.update({str(k): str(v) for k, v in env.items()})
+    cwd = request.get("cwd")
+    if isinstance(cwd, str) and cwd:
+        os.chdir(cwd)
+        if sys.path and sys.path[0] != cwd:
+            sys.path.insert(0, cwd)
+    argv = request.get("argv", [])
+    return [str(arg) for arg in argv] if isinstance(argv, list) else []
+
+
+def main() -> None:
+    """Warm up, wait for a command and run it."""
+    warm_up()
+    line = sys.stdin.readline()
+    if not line.strip():
+        return
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError:
+        print(f"Invalid worker request: {line.strip()}", file=sys.stderr)
+        sys.exit(2)
+    argv = _apply(request if isinstance(request, dict) else {})
+    sys.argv = ["waldiez", *argv]
+    from waldiez.cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,consider-using-with
+# flake8: noqa: G004
+"""Pool of warm (pre-started) worker interpreters for flow subprocesses.
+
+A fresh ``python -m waldiez run ...`` pays for importing waldiez, autogen,
+pydantic, the openai client and the ag2 patch check before the flow's
+first event. The pool keeps ``size`` worker interpreters (see
+:mod:`.worker`) started ahead, with all that already imported. A run
+takes one, sends it its command line as a single json line over stdin
+and then talks to it exactly like to a fresh process.
+
+Each worker runs one flow and exits (no state is shared between runs), a
+replacement is started as soon as one is taken.
+
+A worker is started with the environment of the time it is started, so
+what the imports read from it (e.g. the ag2 or openai settings) is there
+before the imports. It is only handed runs with the same environment:
+the idle workers started with another one are stopped on take (and the
+run starts a fresh process).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import sys
+import threading
+from collections import deque
+
+from .worker import WORKER_MODULE
+
+WALDIEZ_WORKER_POOL = "WALDIEZ_WORKER_POOL"
+
+LOG = logging.getLogger(__name__)
+
+_DEFAULT_POOL: "WarmWorkerPool | None" = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def _env_key(env: dict[str, str]) -> str:
+    """Get a fingerprint of an environment."""
+    payload = json.dumps(sorted(env.items()))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class WarmWorkerPool:
+    """Pre-started waldiez worker interpreters."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        python_executable: str | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Workers are started on :meth:`start` (:meth:`a_start` for asyncio
+        subprocesses) or on the first take.
+
+        Parameters
+        ----------
+        size : int
+            The number of idle workers to keep.
+        python_executable : str | None
+            The interpreter of the workers (defaults to ``sys.executable``).
+        """
+        self._size = max(1, size)
+        self._python = python_executable or sys.executable
+        self._workers: deque[subprocess.Popen[str]] = deque()
+        self._async_workers: deque[asyncio.subprocess.Process] = deque()
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_tasks: set[asyncio.Task[None]] = set()
+        self._async_pending = 0
+        # the environment (fingerprint) each worker was started with
+        self._worker_envs: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """The number of idle workers to keep."""
+        return self._size
+
+    @property
+    def python_executable(self) -> str:
+        """The interpreter of the workers."""
+        return self._python
+
+    @property
+    def idle(self) -> int:
+        """The number of started (idle) workers."""
+        return len(self._workers) + len(self._async_workers)
+
+    def worker_command(self) -> list[str]:
+        """Get the command that starts a worker.
+
+        Returns
+        -------
+        list[str]
+            The command arguments.
+        """
+        return [self._python, "-m", WORKER_MODULE]
+
+    def accepts(self, cmd: list[str]) -> bool:
+        """Check if a ``python -m waldiez ...`` command can use a worker.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            The subprocess command.
+
+        Returns
+        -------
+        bool
+            True if a worker of this pool can run it.
+        """
+        return not self._closed and cmd[:3] == [self._python, "-m", "waldiez"]
+
+    @staticmethod
+    def request_line(cmd: list[str]) -> str:
+        """Get the line that hands a ``python -m waldiez`` command to a worker.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            The subprocess command.
+
+        Returns
+        -------
+        str
+            The json line (with the current directory and environment).
+        """
+        request = {"argv": cmd[3:], "cwd": os.getcwd(), "env": dict(os.environ)}
+        return json.dumps(request) + "\n"
+
+    def _spawn(self) -> subprocess.Popen[str]:
+        env = dict(os.environ)
+        # same pipes as SyncSubprocessRunner's own Popen
+        worker = subprocess.Popen(  # nosec B603
+            self.worker_command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+        self._worker_envs[worker.pid] = _env_key(env)
+        return worker
+
+    def _has_current_env(self, pid: int) -> bool:
+        """Check if a worker was started with the current environment."""
+        return self._worker_envs.pop(pid, None) == _env_key(dict(os.environ))
+
+    @staticmethod
+    def _stop(worker: subprocess.Popen[str]) -> None:
+        """Stop an idle worker."""
+        try:
+            worker.kill()
+            worker.communicate(timeout=5)
+        except Exception:
+            pass
+
+    def start(self) -> None:
+        """Start workers up to the pool's size."""
+        with self._lock:
+            while not self._closed and len(self._workers) < self._size:
+                try:
+                    self._workers.append(self._spawn())
+                except Exception as error:
+                    LOG.warning(f"Could not start a worker: {error}")
+                    break
+
+    def take(self) -> subprocess.Popen[str] | None:
+        """Take an idle worker (and start a replacement).
+
+        Returns
+        -------
+        subprocess.Popen[str] | None
+            A started worker, None if none is available.
+        """
+        worker: subprocess.Popen[str] | None = None
+        stale: list[subprocess.Popen[str]] = []
+        with self._lock:
+            while self._workers:
+                candidate = self._workers.popleft()
+                if candidate.poll() is not None:
+                    self._worker_envs.pop(candidate.pid, None)
+                elif self._has_current_env(candidate.pid):
+                    worker = candidate
+                    break
+                else:
+                    stale.append(candidate)
+        for candidate in stale:
+            self._stop(candidate)
+        self.start()
+        return worker
+
+    def run(self, worker: subprocess.Popen[str], cmd: list[str]) -> None:
+        """Hand a command to a worker.
+
+        Parameters
+        ----------
+        worker : subprocess.Popen[str]
+            A worker got from :meth:`take`.
+        cmd : list[str]
+            The ``python -m waldiez ...`` command.
+        """
+        if worker.stdin is None:  # pragma: no cover
+            raise RuntimeError("The worker has no stdin")
+        worker.stdin.write(self.request_line(cmd))
+        worker.stdin.flush()
+
+    def _check_loop(self) -> asyncio.AbstractEventLoop:
+        """Drop the asyncio workers of another (closed) loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            for worker in self._async_workers:
+                try:
+                    worker.kill()
+                except Exception:
+                    pass
+            self._async_workers.clear()
+            self._async_loop = loop
+        return loop
+
+    async def _a_spawn(self) -> None:
+        env = dict(os.environ)
+        try:
+            worker = await asyncio.create_subprocess_exec(
+                *self.worker_command(),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+        except Exception as error:
+            LOG.warning(f"Could not start a worker: {error}")
+            return
+        finally:
+            self._async_pending -= 1
+        if self._closed:
+            worker.kill()
+            await worker.wait()
+        else:
+            self._worker_envs[worker.pid] = _env_key(env)
+            self._async_workers.append(worker)
+
+    async def a_start(self) -> None:
+        """Start asyncio workers up to the pool's size."""
+        self._check_loop()
+        missing = self._size - len(self._async_workers) - self._async_pending
+        if missing > 0 and not self._closed:
+            self._async_pending += missing
+            await asyncio.gather(*(self._a_spawn() for _ in range(missing)))
+
+    async def a_take(self) -> asyncio.subprocess.Process | None:
+        """Take an idle asyncio worker (and start a replacement).
+
+        Returns
+        -------
+        asyncio.subprocess.Process | None
+            A started worker, None if none is available.
+        """
+        self._check_loop()
+        worker: asyncio.subprocess.Process | None = None
+        while self._async_workers:
+            candidate = self._async_workers.popleft()
+            if candidate.returncode is not None:
+                self._worker_envs.pop(candidate.pid, None)
+            elif self._has_current_env(candidate.pid):
+                worker = candidate
+                break
+            else:
+                candidate.kill()
+                await candidate.communicate()
+        if not self._closed:
+            task = asyncio.create_task(self.a_start())
+            self._async_tasks.add(task)
+            task.add_done_callback(self._async_tasks.discard)
+        return worker
+
+    async def a_run(
+        self, worker: asyncio.subprocess.Process, cmd: list[str]
+    ) -> None:
+        """Hand a command to an asyncio worker.
+
+        Parameters
+        ----------
+        worker : asyncio.subprocess.Process
+            A worker got from :meth:`a_take`.
+        cmd : list[str]
+            The ``python -m waldiez ...`` command.
+        """
+        if worker.stdin is None:  # pragma: no cover
+            raise RuntimeError("The worker has no stdin")
+        worker.stdin.write(self.request_line(cmd).encode("utf-8"))
+        await worker.stdin.drain()
+
+    def close(self) -> None:
+        """Stop the idle workers (the taken ones keep running)."""
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            try:
+                if worker.stdin:
+                    worker.stdin.close()
+                worker.wait(timeout=5)
+            except Exception:
+                worker.kill()
+            for stream in (worker.stdout, worker.stderr):
+                if stream:
+                    stream.close()
+
+    async def a_close(self) -> None:
+        """Stop the idle workers, including the asyncio ones."""
+        self.close()
+        for task in list(self._async_tasks):
+            task.cancel()
+        workers = list(self._async_workers)
+        self._async_workers.clear()
+        for worker in workers:
+            try:
+                if worker.stdin:
+                    worker.stdin.close()
+                await asyncio.wait_for(worker.wait(), timeout=5)
+            except Exception:
+                worker.kill()
+                await worker.wait()
+
+
+def get_worker_pool() -> WarmWorkerPool | None:
+    """Get the process-wide pool (if enabled).
+
+    The pool is enabled with the ``WALDIEZ_WORKER_POOL`` environment
+    variable (the number of idle workers to keep).
+
+    Returns
+    -------
+    WarmWorkerPool | None
+        The pool, None if not enabled.
+    """
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    try:
+        size = int(os.environ.get(WALDIEZ_WORKER_POOL, "0") or "0")
+    except ValueError:
+        size = 0
+    if size <= 0:
+        return None
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = WarmWorkerPool(size=size)
+        return _DEFAULT_POOL
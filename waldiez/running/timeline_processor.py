@@ -11,20 +11,21 @@ Timeline Analysis Data Processor.
 Processes CSV files and outputs JSON structure for timeline visualization
 """
 
+from __future__ import annotations
+
 import json
 import os
 import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import pandas as pd
-
 from waldiez.logger import WaldiezLogger
 
+# pandas is only imported when processing (it is slow to import)
 if TYPE_CHECKING:
+    import pandas as pd
+
     Series = pd.Series[Any]
-else:
-    Series = pd.Series
 
 # Color palettes
 AGENT_COLORS = [
@@ -95,6 +96,8 @@ class TimelineProcessor:
         bool
             True if the value is missing, NaN, or empty; False otherwise.
         """
+        import pandas as pd
+
         if pd.isna(value):
             return True
         if isinstance(value, str) and (
@@ -184,6 +187,8 @@ class TimelineProcessor:
         functions_file : str | None
             Path to the functions CSV file.
         """
+        import pandas as pd
+
         if agents_file:
             self.agents_data = pd.read_csv(agents_file)
             LOG.info("Loaded agents data: %d rows", len(self.agents_data))
@@ -219,6 +224,8 @@ class TimelineProcessor:
         pd.Timestamp
             The parsed datetime.
         """
+        import pandas as pd
+
         # noinspection PyBroadException
         try:
             return pd.to_datetime(date_str)
@@ -553,6 +560,8 @@ class TimelineProcessor:
         bool
             True if gap likely represents human input waiting, False otherwise.
         """
+        import pandas as pd
+
         if gap_duration < 1.0:  # Reduced threshold for better detection
             return False
 
@@ -665,6 +674,8 @@ class TimelineProcessor:
         dict[str, Any]
             A dictionary categorizing the gap activity.
         """
+        import pandas as pd
+
         # First check for human input waiting period
         if self.is_human_input_waiting_period(
             prev_session, current_session, gap_duration
@@ -762,6 +773,8 @@ class TimelineProcessor:
         ValueError
             If chat data is not provided.
         """
+        import pandas as pd
+
         if self.chat_data is None:
             raise ValueError("Chat data is required")
 
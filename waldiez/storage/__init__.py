@@ -6,10 +6,16 @@
 import typer
 from typer.models import CommandInfo
 
+from .archive import CheckpointArchive
+from .blob_store import BlobStore
+from .catalog import CheckpointCatalog
 from .checkpoint import WaldiezCheckpoint, WaldiezCheckpointInfo
 from .cli import handle_checkpoints
 from .filesystem_storage import FilesystemStorage
+from .history import WaldiezHistoryLog
+from .links_registry import LinksRegistry
 from .protocol import Storage
+from .retention import RetentionDaemon, RetentionPolicy, RetentionReport
 from .storage_manager import StorageManager
 from .utils import get_root_dir, safe_name, symlink
 
@@ -33,11 +39,19 @@ def add_checkpoints_app(app: typer.Typer) -> None:
 
 
 __all__ = [
+    "BlobStore",
+    "CheckpointArchive",
+    "CheckpointCatalog",
     "Storage",
     "StorageManager",
     "FilesystemStorage",
     "WaldiezCheckpoint",
     "WaldiezCheckpointInfo",
+    "WaldiezHistoryLog",
+    "LinksRegistry",
+    "RetentionDaemon",
+    "RetentionPolicy",
+    "RetentionReport",
     "symlink",
     "safe_name",
     "get_root_dir",
@@ -0,0 +1,332 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,too-many-try-statements
+
+"""Packed archive of a session's older checkpoints.
+
+Older checkpoints of a session can be packed into compressed zip files,
+one per checkpoint (``<session>/.archive/<checkpoint>.zip``). A zip's
+central directory is its index, so a packed checkpoint's ``state.json``,
+``metadata.json`` or history can be read without extracting anything
+else, and packing or removing a checkpoint never rewrites the others.
+
+Changes (pack, extract, remove) hold an exclusive lock on the archive's
+lock file, so the retention daemon, the CLI and restores can run at the
+same time (in threads or processes).
+
+Zip (deflate) is used instead of zstd to stay within the standard library.
+"""
+
+import json
+import os
+import shutil
+import sys
+import time
+import zipfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+
+from .blob_store import MANIFEST_FILE, REFS_DIR
+from .history import HISTORY_LOG_FILE, LEGACY_HISTORY_FILE, entry_digest
+
+ARCHIVE_DIR = ".archive"
+LOCK_FILE = ".lock"
+
+# not worth keeping in the archive (restored files are not blob clones).
+_SKIP_NAMES = frozenset({MANIFEST_FILE, REFS_DIR})
+_SUFFIX = ".zip"
+
+
+class CheckpointArchive:
+    """Compressed archive of a session's packed checkpoints."""
+
+    def __init__(self, session_dir: Path) -> None:
+        """Initialize the archive.
+
+        Parameters
+        ----------
+        session_dir : Path
+            The session directory holding the archive.
+        """
+        self._session_dir = session_dir
+        self._path = session_dir / ARCHIVE_DIR
+
+    @property
+    def path(self) -> Path:
+        """The path of the archive directory."""
+        return self._path
+
+    def exists(self) -> bool:
+        """Check if the archive has any packed checkpoints.
+
+        Returns
+        -------
+        bool
+            True if at least one checkpoint is packed.
+        """
+        return bool(self.names())
+
+    def names(self) -> list[str]:
+        """Get the names of the packed checkpoints.
+
+        Returns
+        -------
+        list[str]
+            The packed checkpoints' directory names.
+        """
+        if not self._path.is_dir():
+            return []
+        return sorted(
+            path.name[: -len(_SUFFIX)]
+            for path in self._path.iterdir()
+            if path.name.endswith(_SUFFIX) and path.is_file()
+        )
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a checkpoint is packed in the archive."""
+        return isinstance(name, str) and self._zip_path(name).is_file()
+
+    def read(self, name: str, member: str) -> bytes | None:
+        """Read a file of a packed checkpoint.
+
+        Parameters
+        ----------
+        name : str
+            The checkpoint's directory name.
+        member : str
+            The file's path relative to the checkpoint.
+
+        Returns
+        -------
+        bytes | None
+            The file's content, None if not found.
+        """
+        try:
+            with zipfile.ZipFile(self._zip_path(name)) as zf:
+                return zf.read(member)
+        except Exception:
+            return None
+
+    def read_json(self, name: str, member: str) -> Any:
+        """Read a json file of a packed checkpoint.
+
+        Parameters
+        ----------
+        name : str
+            The checkpoint's directory name.
+        member : str
+            The file's path relative to the checkpoint.
+
+        Returns
+        -------
+        Any
+            The loaded json, None if not found or invalid.
+        """
+        data = self.read(name, member)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except Exception:
+            return None
+
+    def size(self, name: str) -> int:
+        """Get the compressed size of a packed checkpoint.
+
+        Parameters
+        ----------
+        name : str
+            The checkpoint's directory name.
+
+        Returns
+        -------
+        int
+            The checkpoint's compressed size in bytes (0 if not packed).
+        """
+        try:
+            return self._zip_path(name).stat().st_size
+        except OSError:
+            return 0
+
+    def history(self, name: str) -> list[dict[str, Any]]:
+        """Read the history of a packed checkpoint.
+
+        Parameters
+        ----------
+        name : str
+            The checkpoint's directory name.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The distinct history entries in insertion order.
+        """
+        data = self.read(name, HISTORY_LOG_FILE)
+        if data is not None:
+            entries: list[Any] = []
+            for line in data.splitlines():
+                with suppress(Exception):
+                    entries.append(json.loads(line))
+        else:
+            legacy = self.read_json(name, LEGACY_HISTORY_FILE)
+            if isinstance(legacy, dict):
+                legacy = legacy.get("history", [])
+            entries = legacy if isinstance(legacy, list) else []
+        unique: dict[bytes, dict[str, Any]] = {}
+        for entry in entries:
+            if isinstance(entry, dict):
+                unique.setdefault(entry_digest(entry), entry)
+        return list(unique.values())
+
+    def pack(self, checkpoint_dirs: Iterable[Path]) -> list[Path]:
+        """Pack checkpoint directories into the archive.
+
+        Each checkpoint is written to a temporary zip that atomically
+        replaces its packed copy, its directory is only removed after
+        that. Checkpoints that are already packed are skipped.
+
+        Parameters
+        ----------
+        checkpoint_dirs : Iterable[Path]
+            The (loose) checkpoint directories of the session.
+
+        Returns
+        -------
+        list[Path]
+            The packed (and removed) directories.
+        """
+        packed: list[Path] = []
+        self._path.mkdir(parents=True, exist_ok=True)
+        with self._locked():
+            for directory in checkpoint_dirs:
+                zip_path = self._zip_path(directory.name)
+                if zip_path.exists() or not directory.is_dir():
+                    continue
+                tmp = zip_path.with_name(f"{zip_path.name}.{os.getpid()}.tmp")
+                try:
+                    with zipfile.ZipFile(
+                        tmp, "w", compression=zipfile.ZIP_DEFLATED
+                    ) as zf:
+                        self._add_tree(zf, directory)
+                    os.replace(tmp, zip_path)
+                finally:
+                    with suppress(OSError):
+                        tmp.unlink(missing_ok=True)
+                shutil.rmtree(directory, ignore_errors=True)
+                packed.append(directory)
+        return packed
+
+    def extract(self, name: str, target_dir: Path | None = None) -> Path | None:
+        """Extract a packed checkpoint.
+
+        Parameters
+        ----------
+        name : str
+            The checkpoint's directory name.
+        target_dir : Path | None
+            Where to extract the checkpoint's directory into
+            (defaults to the session directory).
+
+        Returns
+        -------
+        Path | None
+            The extracted checkpoint directory, None if not packed.
+        """
+        if target_dir is None:
+            target_dir = self._session_dir
+        if name not in self:
+            return None
+        with self._locked():
+            try:
+                with zipfile.ZipFile(self._zip_path(name)) as zf:
+                    zf.extractall(target_dir / name)
+            except Exception:
+                return None
+        return target_dir / name
+
+    def remove(self, names: Iterable[str]) -> int:
+        """Remove packed checkpoints from the archive.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            The checkpoints' directory names.
+
+        Returns
+        -------
+        int
+            The number of removed checkpoints.
+        """
+        to_remove = [name for name in set(names) if name in self]
+        if not to_remove:
+            return 0
+        removed = 0
+        with self._locked():
+            for name in to_remove:
+                try:
+                    self._zip_path(name).unlink()
+                except FileNotFoundError:
+                    continue
+                removed += 1
+        return removed
+
+    def _zip_path(self, name: str) -> Path:
+        """Get the path of a packed checkpoint's zip file."""
+        return self._path / f"{name}{_SUFFIX}"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the archive's (inter-process) exclusive lock."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        with open(self._path / LOCK_FILE, "a+b") as lock_file:
+            _lock(lock_file.fileno())
+            try:
+                yield
+            finally:
+                _unlock(lock_file.fileno())
+
+    @staticmethod
+    def _add_tree(zf: zipfile.ZipFile, directory: Path) -> None:
+        """Add a checkpoint directory's files to a zip file."""
+        for root, dirs, files in os.walk(directory):
+            root_path = Path(root)
+            dirs[:] = [name for name in dirs if name not in _SKIP_NAMES]
+            for file_name in sorted(files):
+                path = root_path / file_name
+                if file_name in _SKIP_NAMES or path.is_symlink():
+                    continue
+                zf.write(path, path.relative_to(directory).as_posix())
+
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        """Lock a file exclusively, waiting for other holders."""
+        while True:
+            try:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK only retries for ~10 seconds
+                time.sleep(0.1)
+
+    def _unlock(fd: int) -> None:
+        """Release a file's lock."""
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        """Lock a file exclusively, waiting for other holders."""
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        """Release a file's lock."""
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,too-many-try-statements
+
+"""Content-addressed blob store for checkpoint artifacts.
+
+Artifacts that are byte-identical across checkpoints (the generated
+``.py``, the ``.waldiez`` file, ``flow.db``, logs, uploads, ...) are
+found by their content's digest and stored once under
+``<workspace>/.blobs/<aa>/<digest>``. Each checkpoint keeps a manifest
+(``.blobs.json``) mapping its relative paths to digests.
+
+A checkpoint's files are copy-on-write clones (reflinks) of their blobs:
+they share the blob's data blocks, but an in-place write (a sqlite
+database, an appended log) only changes the written file. On filesystems
+without reflinks (e.g. ext4) nothing can be shared safely, so the files
+stay the checkpoint's own.
+
+Each checkpoint also holds a hardlink to every blob it uses (in
+``.blob_refs/``), so the hardlink count of a blob is its reference count:
+a blob whose only remaining link is the one in the store is not
+referenced by any checkpoint and can be removed.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Iterable
+from contextlib import suppress
+from pathlib import Path
+
+from .utils import reflink
+
+BLOBS_DIR = ".blobs"
+MANIFEST_FILE = ".blobs.json"
+REFS_DIR = ".blob_refs"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStore:
+    """Content-addressed store of checkpoint artifacts."""
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the blob store.
+
+        Parameters
+        ----------
+        root : Path
+            The directory of the store (e.g. ``<workspace>/.blobs``).
+        """
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        """The directory of the store."""
+        return self._root
+
+    @staticmethod
+    def file_digest(path: Path) -> str:
+        """Get the content digest of a file.
+
+        Parameters
+        ----------
+        path : Path
+            The file to hash.
+
+        Returns
+        -------
+        str
+            The hex sha256 digest of the file's content.
+        """
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    @staticmethod
+    def load_manifest(directory: Path) -> dict[str, str]:
+        """Load the manifest of a checkpoint.
+
+        Parameters
+        ----------
+        directory : Path
+            The checkpoint directory.
+
+        Returns
+        -------
+        dict[str, str]
+            The relative paths of the stored artifacts and their digests.
+        """
+        manifest_file = directory / MANIFEST_FILE
+        if not manifest_file.is_file():
+            return {}
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            str(key): str(value)
+            for key, value in data.items()
+            if isinstance(value, str)
+        }
+
+    def blob_path(self, digest: str) -> Path:
+        """Get the path of a blob.
+
+        Parameters
+        ----------
+        digest : str
+            The blob's digest.
+
+        Returns
+        -------
+        Path
+            The path of the blob in the store.
+        """
+        return self._root / digest[:2] / digest[2:]
+
+    def put(self, path: Path, refs_dir: Path) -> str | None:
+        """Store a file, sharing its data with an identical blob.
+
+        The blob is a clone of the file (a new one if no blob has the
+        same content, else the file is replaced with a clone of the
+        existing blob) and ``refs_dir`` gets a hardlink to it.
+
+        Parameters
+        ----------
+        path : Path
+            The file to store.
+        refs_dir : Path
+            Where to keep the reference (hardlink) to the blob.
+
+        Returns
+        -------
+        str | None
+            The file's digest, or None if it could not be cloned
+            (no reflink support, or the store is on another device).
+        """
+        self._root.mkdir(parents=True, exist_ok=True)
+        tmp = self._root / f".{uuid.uuid4().hex}.tmp"
+        try:
+            if not reflink(path, tmp):
+                return None
+            digest = self.file_digest(tmp)
+            blob = self.blob_path(digest)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(tmp, blob)
+            except FileExistsError:
+                # drop the file's own copy of the data
+                if reflink(blob, tmp):
+                    os.replace(tmp, path)
+            refs_dir.mkdir(parents=True, exist_ok=True)
+            with suppress(FileExistsError):
+                os.link(blob, refs_dir / digest)
+            return digest
+        except Exception:
+            return None
+        finally:
+            with suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+    def intern_tree(self, directory: Path) -> dict[str, str]:
+        """Store all the artifacts of a checkpoint.
+
+        Writes the checkpoint's manifest (if anything was stored).
+
+        Parameters
+        ----------
+        directory : Path
+            The checkpoint directory.
+
+        Returns
+        -------
+        dict[str, str]
+            The manifest (relative paths and digests) of the checkpoint.
+        """
+        manifest: dict[str, str] = {}
+        refs_dir = directory / REFS_DIR
+        for root, dirs, files in os.walk(directory):
+            root_path = Path(root)
+            if root_path == directory:
+                dirs[:] = [name for name in dirs if name != REFS_DIR]
+            for name in files:
+                path = root_path / name
+                if name == MANIFEST_FILE or path.is_symlink():
+                    continue
+                digest = self.put(path, refs_dir)
+                if digest:
+                    manifest[path.relative_to(directory).as_posix()] = digest
+        if manifest:
+            manifest_file = directory / MANIFEST_FILE
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+        return manifest
+
+    def materialize(self, manifest: dict[str, str], directory: Path) -> int:
+        """Restore missing checkpoint artifacts from their blobs.
+
+        The artifacts are restored as clones of their blobs (or copies),
+        so they can be written without changing the blobs.
+
+        Parameters
+        ----------
+        manifest : dict[str, str]
+            The relative paths and digests of the artifacts.
+        directory : Path
+            The checkpoint directory.
+
+        Returns
+        -------
+        int
+            The number of restored artifacts.
+        """
+        restored = 0
+        refs_dir = directory / REFS_DIR
+        for relative, digest in manifest.items():
+            target = directory / relative
+            blob = self.blob_path(digest)
+            if target.exists() or not blob.is_file():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if not reflink(blob, target):
+                shutil.copy2(blob, target)
+            refs_dir.mkdir(parents=True, exist_ok=True)
+            with suppress(OSError):
+                os.link(blob, refs_dir / digest)
+            restored += 1
+        return restored
+
+    def release(self, digests: Iterable[str]) -> int:
+        """Remove the given blobs if nothing references them anymore.
+
+        Parameters
+        ----------
+        digests : Iterable[str]
+            The digests of a deleted checkpoint's artifacts.
+
+        Returns
+        -------
+        int
+            The number of removed blobs.
+        """
+        removed = 0
+        for digest in set(digests):
+            if self._remove_if_unreferenced(self.blob_path(digest)):
+                removed += 1
+        return removed
+
+    def gc(self) -> int:
+        """Remove all the blobs that no checkpoint references.
+
+        Returns
+        -------
+        int
+            The number of removed blobs.
+        """
+        if not self._root.is_dir():
+            return 0
+        removed = 0
+        for bucket in self._root.iterdir():
+            if not bucket.is_dir():
+                continue
+            for blob in bucket.iterdir():
+                if self._remove_if_unreferenced(blob):
+                    removed += 1
+        return removed
+
+    @staticmethod
+    def _remove_if_unreferenced(blob: Path) -> bool:
+        """Remove a blob if its only link is the one in the store."""
+        try:
+            if blob.stat().st_nlink > 1:
+                return False
+            blob.unlink()
+        except OSError:
+            return False
+        with suppress(OSError):
+            blob.parent.rmdir()
+        return True
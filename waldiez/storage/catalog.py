@@ -0,0 +1,438 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=too-many-arguments
+
+"""SQLite catalog of the checkpoints in a workspace.
+
+The catalog keeps one row per checkpoint and one row per session with the
+session directory's modification time at the moment it was indexed.
+Listing only needs a ``stat`` per session directory to detect sessions
+that were changed outside the storage API (those are re-indexed from
+disk); everything else is answered from the index, sorted, filtered and
+paginated in SQL.
+
+Each checkpoint row also records the checkpoint's size on disk once it
+has been measured (NULL until then, and again whenever the checkpoint is
+rewritten), so the workspace's usage is a sum over the index instead of
+a walk over the whole tree.
+"""
+
+import sqlite3
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+from .checkpoint import WaldiezCheckpoint, WaldiezCheckpointInfo
+
+CATALOG_FILE = ".catalog.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    session TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER,
+    PRIMARY KEY (session, ts)
+);
+CREATE INDEX IF NOT EXISTS checkpoints_ts ON checkpoints (ts);
+"""
+
+
+def _ts(timestamp: datetime) -> int:
+    """Get the integer (microseconds) form of a checkpoint timestamp."""
+    return int(WaldiezCheckpoint.format_timestamp(timestamp))
+
+
+def _info(name: str, ts: int, path: str) -> WaldiezCheckpointInfo | None:
+    """Build a checkpoint info from a catalog row."""
+    timestamp = WaldiezCheckpoint.parse_timestamp(str(ts))
+    if timestamp is None:  # pragma: no cover
+        return None
+    return WaldiezCheckpointInfo(
+        session_name=name, timestamp=timestamp, path=Path(path)
+    )
+
+
+class CheckpointCatalog:
+    """Index of the checkpoints in a workspace."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the catalog.
+
+        Parameters
+        ----------
+        db_path : Path
+            The path of the sqlite database.
+        """
+        self._db_path = db_path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @property
+    def db_path(self) -> Path:
+        """The path of the sqlite database."""
+        return self._db_path
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection, committing on success."""
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def session_mtimes(self) -> dict[str, int]:
+        """Get the indexed sessions and their directories' mtime.
+
+        Returns
+        -------
+        dict[str, int]
+            The mtime (in ns) of each indexed session's directory.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT name, mtime_ns FROM sessions")
+            return dict(rows)
+
+    def add(
+        self,
+        session: str,
+        timestamp: datetime,
+        path: Path,
+        previous_mtime: int | None,
+        mtime: int,
+    ) -> None:
+        """Add (or replace) a checkpoint.
+
+        Parameters
+        ----------
+        session : str
+            The session (directory) name.
+        timestamp : datetime
+            The checkpoint's timestamp.
+        path : Path
+            The checkpoint's path.
+        previous_mtime : int | None
+            The session directory's mtime before the checkpoint was
+            written (None if the directory did not exist).
+        mtime : int
+            The session directory's mtime after the checkpoint was written.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (session, ts, path) "
+                "VALUES (?, ?, ?)",
+                (session, _ts(timestamp), str(path)),
+            )
+            self._touch_session(conn, session, previous_mtime, mtime)
+
+    def remove(
+        self,
+        entries: Iterable[tuple[str, datetime]],
+        mtimes: dict[str, tuple[int | None, int | None]] | None = None,
+    ) -> None:
+        """Remove checkpoints.
+
+        Parameters
+        ----------
+        entries : Iterable[tuple[str, datetime]]
+            The (session name, timestamp) of the checkpoints.
+        mtimes : dict[str, tuple[int | None, int | None]] | None
+            Optional (previous, current) mtime of the affected
+            session directories.
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM checkpoints WHERE session = ? AND ts = ?",
+                [(session, _ts(timestamp)) for session, timestamp in entries],
+            )
+            for session, (previous, current) in (mtimes or {}).items():
+                if current is None:
+                    conn.execute(
+                        "DELETE FROM sessions WHERE name = ?", (session,)
+                    )
+                else:
+                    self._touch_session(conn, session, previous, current)
+
+    def touch(
+        self, session: str, previous_mtime: int | None, mtime: int | None
+    ) -> None:
+        """Record a session directory's mtime after changing it.
+
+        Parameters
+        ----------
+        session : str
+            The session (directory) name.
+        previous_mtime : int | None
+            The directory's mtime before the change.
+        mtime : int | None
+            The directory's mtime after the change.
+        """
+        if previous_mtime is None or mtime is None:
+            return
+        with self._connect() as conn:
+            self._touch_session(conn, session, previous_mtime, mtime)
+
+    def remove_session(self, session: str) -> None:
+        """Remove a session and its checkpoints.
+
+        Parameters
+        ----------
+        session : str
+            The session (directory) name.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM checkpoints WHERE session = ?", (session,)
+            )
+            conn.execute("DELETE FROM sessions WHERE name = ?", (session,))
+
+    def sync_session(
+        self,
+        session: str,
+        checkpoints: Iterable[WaldiezCheckpoint],
+        mtime: int,
+    ) -> None:
+        """Replace the indexed checkpoints of a session.
+
+        Parameters
+        ----------
+        session : str
+            The session (directory) name.
+        checkpoints : Iterable[WaldiezCheckpoint]
+            The checkpoints found on disk.
+        mtime : int
+            The session directory's mtime before it was scanned.
+        """
+        rows = {
+            _ts(checkpoint.timestamp): str(checkpoint.path)
+            for checkpoint in checkpoints
+        }
+        with self._connect() as conn:
+            indexed = {
+                ts
+                for (ts,) in conn.execute(
+                    "SELECT ts FROM checkpoints WHERE session = ?", (session,)
+                )
+            }
+            conn.executemany(
+                "DELETE FROM checkpoints WHERE session = ? AND ts = ?",
+                [(session, ts) for ts in indexed - rows.keys()],
+            )
+            # keep the recorded sizes of the checkpoints we already know
+            conn.executemany(
+                "INSERT INTO checkpoints (session, ts, path) VALUES (?, ?, ?) "
+                "ON CONFLICT (session, ts) DO UPDATE SET path = excluded.path",
+                [(session, ts, path) for ts, path in rows.items()],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (name, mtime_ns) "
+                "VALUES (?, ?)",
+                (session, mtime),
+            )
+
+    def clear(self) -> None:
+        """Remove everything from the catalog."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints")
+            conn.execute("DELETE FROM sessions")
+
+    def query(
+        self,
+        session: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[WaldiezCheckpointInfo]:
+        """List checkpoints from the catalog.
+
+        Parameters
+        ----------
+        session : str | None
+            Optional filter by session (directory) name.
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+        order : Literal["asc", "desc"]
+            Sort by timestamp, newest first by default.
+        limit : int | None
+            Maximum number of checkpoints to return.
+        offset : int
+            Number of checkpoints to skip.
+
+        Returns
+        -------
+        list[WaldiezCheckpointInfo]
+            The matching checkpoints.
+        """
+        where, params = self._where(session, since, until)
+        direction = "ASC" if order == "asc" else "DESC"
+        sql = (
+            f"SELECT session, ts, path FROM checkpoints{where} "  # nosec
+            f"ORDER BY ts {direction}, session {direction} "
+            "LIMIT ? OFFSET ?"
+        )
+        params.extend([-1 if limit is None else max(limit, 0), max(offset, 0)])
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            info
+            for name, ts, path in rows
+            if (info := _info(name, ts, path)) is not None
+        ]
+
+    def set_sizes(
+        self, entries: Iterable[tuple[str, datetime, int | None]]
+    ) -> None:
+        """Record the size of checkpoints.
+
+        Parameters
+        ----------
+        entries : Iterable[tuple[str, datetime, int | None]]
+            The (session name, timestamp, size in bytes) of the
+            checkpoints, a None size marks it as not measured.
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE checkpoints SET size = ? WHERE session = ? AND ts = ?",
+                [
+                    (size, session, _ts(timestamp))
+                    for session, timestamp, size in entries
+                ],
+            )
+
+    def unsized(self) -> list[WaldiezCheckpointInfo]:
+        """List the checkpoints whose size is not recorded.
+
+        Returns
+        -------
+        list[WaldiezCheckpointInfo]
+            The checkpoints to measure.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT session, ts, path FROM checkpoints WHERE size IS NULL"
+            ).fetchall()
+        return [
+            info
+            for name, ts, path in rows
+            if (info := _info(name, ts, path)) is not None
+        ]
+
+    def usage(self) -> list[tuple[WaldiezCheckpointInfo, int]]:
+        """List all the checkpoints with their recorded size, oldest first.
+
+        Returns
+        -------
+        list[tuple[WaldiezCheckpointInfo, int]]
+            The checkpoints and their size in bytes (0 if not measured).
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT session, ts, path, size FROM checkpoints "
+                "ORDER BY ts ASC, session ASC"
+            ).fetchall()
+        return [
+            (info, size or 0)
+            for name, ts, path, size in rows
+            if (info := _info(name, ts, path)) is not None
+        ]
+
+    def total_size(self) -> int:
+        """Get the recorded size of all the checkpoints.
+
+        Returns
+        -------
+        int
+            The sum of the recorded sizes in bytes.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT SUM(size) FROM checkpoints").fetchone()
+        return int(row[0] or 0)
+
+    def count(
+        self,
+        session: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        """Count checkpoints in the catalog.
+
+        Parameters
+        ----------
+        session : str | None
+            Optional filter by session (directory) name.
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+
+        Returns
+        -------
+        int
+            The number of matching checkpoints.
+        """
+        where, params = self._where(session, since, until)
+        sql = f"SELECT COUNT(*) FROM checkpoints{where}"  # nosec
+        with self._connect() as conn:
+            return int(conn.execute(sql, params).fetchone()[0])
+
+    @staticmethod
+    def _where(
+        session: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[str, list[object]]:
+        """Build the WHERE clause for the listing filters."""
+        clauses: list[str] = []
+        params: list[object] = []
+        if session is not None:
+            clauses.append("session = ?")
+            params.append(session)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_ts(since))
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(_ts(until))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    @staticmethod
+    def _touch_session(
+        conn: sqlite3.Connection,
+        session: str,
+        previous: int | None,
+        current: int,
+    ) -> None:
+        """Record a session directory's mtime after our own change.
+
+        If the recorded mtime does not match the one before our change,
+        someone else changed the directory too, so we leave it stale
+        for the next listing to re-index it.
+        """
+        if previous is None:
+            conn.execute(
+                "INSERT OR IGNORE INTO sessions (name, mtime_ns) "
+                "VALUES (?, ?)",
+                (session, current),
+            )
+            return
+        conn.execute(
+            "UPDATE sessions SET mtime_ns = ? WHERE name = ? AND mtime_ns = ?",
+            (current, session, previous),
+        )
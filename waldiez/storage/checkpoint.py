@@ -13,6 +13,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .archive import CheckpointArchive
+from .history import WaldiezHistoryLog
+
 
 # noinspection PyBroadException
 @dataclass
@@ -40,16 +43,26 @@ class WaldiezCheckpoint:
     def state(self) -> dict[str, Any]:
         """Get the checkpoint's state."""
         if self._state is None:
-            self._state = self._load_json(self.state_file) or {}
+            self._state = self._read_json(self.state_file) or {}
         return self._state
 
     @property
     def metadata(self) -> dict[str, Any]:
         """Get the checkpoint's metadata."""
         if self._metadata is None:
-            self._metadata = self._load_json(self.metadata_file) or {}
+            self._metadata = self._read_json(self.metadata_file) or {}
         return self._metadata
 
+    @property
+    def archive(self) -> CheckpointArchive:
+        """The archive of the checkpoint's session."""
+        return CheckpointArchive(self.path.parent)
+
+    @property
+    def packed(self) -> bool:
+        """Check if the checkpoint is packed in its session's archive."""
+        return not self.path.is_dir() and self.path.name in self.archive
+
     @property
     def state_file(self) -> Path:
         """Path to the state.json file."""
@@ -60,28 +73,53 @@ class WaldiezCheckpoint:
         """Path to the metadata.json file."""
         return self.path / "metadata.json"
 
+    @property
+    def history_log(self) -> WaldiezHistoryLog:
+        """The append-only history log of the checkpoint."""
+        return WaldiezHistoryLog(self.path)
+
     @property
     def history_file(self) -> Path:
-        """Path to the history.json file."""
-        return self.path / "history.json"
+        """Path to the history log file."""
+        return self.history_log.log_file
 
     @property
     def exists(self) -> bool:
         """Check if the checkpoint exists on disk."""
-        return self.path.is_dir() and self.state_file.is_file()
+        if self.path.is_dir():
+            return self.state_file.is_file()
+        return self.packed
+
+    def unpack(self) -> bool:
+        """Extract the checkpoint from its session's archive.
+
+        Returns
+        -------
+        bool
+            True if the checkpoint was packed and got extracted.
+        """
+        if self.path.is_dir():
+            return False
+        archive = self.archive
+        if archive.extract(self.path.name, self.path.parent) is None:
+            return False
+        archive.remove([self.path.name])
+        return True
 
     def load_state(self, index: int) -> None:
         """Load a state from history from its index.
 
+        A packed checkpoint is extracted first.
+
         Parameters
         ----------
         index : int
             The history index to use
         """
-        entries = self.history()
-        if len(entries) < index:
+        self.unpack()
+        entry = self.history_log.get(index)
+        if entry is None:
             return
-        entry = entries[index]
         state = entry.get("state", {})
         if not isinstance(state, dict):
             return
@@ -180,102 +218,38 @@ class WaldiezCheckpoint:
         list[dict[str, Any]]
             The stored history entries
         """
-        if not self.history_file.is_file():
-            return []
-        history_dict = self._load_json(self.history_file)
-        if not history_dict:
+        if not self.path.is_dir():
+            # lazily read from the archive if packed
+            return self.archive.history(self.path.name)
+        history_log = self.history_log
+        if not history_log.exists():
             return []
-        history_entries = history_dict.get("history", [])
-        if history_entries and isinstance(history_entries, list):
-            history_entries = self._remove_trailing_tool_calls(history_entries)
-            return self._dedupe_history(history_entries)
-        if not isinstance(history_entries, list):
-            self._store_history([])
-        return []
-
-    def _remove_trailing_tool_calls(
-        self,
-        history_entries: list[dict[str, Any]],
-    ) -> list[dict[str, Any]]:
-        """Remove trailing tool_call messages from all history entries."""
-        modified = False
-
-        for entry in history_entries:
-            state = entry.get("state")
-            if not isinstance(state, dict):
-                continue
-
-            messages = state.get("messages")
-            if not isinstance(messages, list) or not messages:
-                continue
-
-            # Remove all trailing tool_call messages
-            # (there may be more than one)
-            while (
-                messages
-                and isinstance(messages[-1], dict)
-                and "tool_calls" in messages[-1]
-            ):
-                messages.pop()
-                modified = True
-
-        if modified:
-            self._store_history(history_entries)
-
+        history_entries = history_log.entries()
+        if len(history_entries) != len(history_log):
+            # duplicate or unreadable records (e.g. concurrent writers),
+            # keep the on-disk indices in sync with what we return
+            history_log.compact(history_entries)
         return history_entries
 
-    def _dedupe_history(
-        self, entries: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Remove duplicate history entries based on state & metadata."""
-        seen = set()
-        deduped = []
-
-        for entry in entries:
-            key = json.dumps(
-                {
-                    "state": entry.get("state"),
-                    "metadata": entry.get("metadata"),
-                },
-                sort_keys=True,
-                default=str,
-            )
-            if key not in seen:
-                deduped.append(entry)
-                seen.add(key)
-
-        # Only if something changed
-        if len(deduped) != len(entries):
-            self._store_history(deduped)
-
-        return deduped
-
-    def _store_history(self, entries: list[dict[str, Any]]) -> None:
-        try:
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"history": entries},
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    default=str,
-                )
-        except Exception:  # pylint: disable=broad-exception-caught
-            pass
+    def _read_json(self, path: Path) -> dict[str, Any] | None:
+        """Read a json file of the checkpoint, loose or packed."""
+        if self.path.is_dir():
+            return self._as_dict(self._load_json(path))
+        return self._as_dict(self.archive.read_json(self.path.name, path.name))
 
     @staticmethod
-    def _load_json(path: Path) -> dict[str, Any] | None:
+    def _load_json(path: Path) -> Any:
         with suppress(Exception):
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-                if (
-                    isinstance(data, list)
-                    and data
-                    and isinstance(data[0], dict)
-                ):
-                    return data[0]
+                return json.load(f)
+        return None
+
+    @staticmethod
+    def _as_dict(data: Any) -> dict[str, Any] | None:
+        if isinstance(data, dict):
+            return data
+        if isinstance(data, list) and data and isinstance(data[0], dict):
+            return data[0]
         return None
 
 
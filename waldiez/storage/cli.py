@@ -3,18 +3,21 @@
 
 # pylint: disable=missing-function-docstring, missing-param-doc
 # pylint: disable=missing-raises-doc,too-complex,too-many-branches
+# pylint: disable=too-many-locals
 
 """CLI interface for Waldiez checkpoints."""
 
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich import print as pretty_print
 from typing_extensions import Annotated
 
 from .checkpoint import WaldiezCheckpoint
+from .retention import RetentionPolicy, parse_age, parse_size
 from .storage_manager import StorageManager
 from .utils import get_root_dir, safe_name
 
@@ -35,7 +38,7 @@ DEFAULT_WORKSPACE = get_root_dir()
 
 
 @app.command(name="checkpoints", no_args_is_help=True)
-def handle_checkpoints(
+def handle_checkpoints(  # noqa: C901
     workspace: Annotated[
         Path,
         typer.Option(
@@ -108,6 +111,65 @@ def handle_checkpoints(
             ),
         ),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", help="List at most 'n' checkpoints."),
+    ] = None,
+    offset: Annotated[
+        int,
+        typer.Option("--offset", help="Skip the first 'n' checkpoints."),
+    ] = 0,
+    oldest_first: Annotated[
+        bool,
+        typer.Option(
+            "--oldest-first", help="List the oldest checkpoints first."
+        ),
+    ] = False,
+    pack: Annotated[
+        bool,
+        typer.Option(
+            "--pack",
+            help=(
+                "Pack a session's older checkpoints into a compressed "
+                "archive, keeping the latest '--keep' (default: 5) loose. "
+                "NOTE: if no session is specified, "
+                "all sessions will be used."
+            ),
+        ),
+    ] = False,
+    reindex: Annotated[
+        bool,
+        typer.Option(
+            "--reindex",
+            help="Rebuild the workspace's checkpoint catalog from disk.",
+        ),
+    ] = False,
+    retention: Annotated[
+        bool,
+        typer.Option(
+            "--retention",
+            help=(
+                "Apply a workspace-wide retention policy once, "
+                "keeping the latest '--keep' (default: 1) checkpoints "
+                "of every session. The limits default to the "
+                "WALDIEZ_RETENTION_* environment variables."
+            ),
+        ),
+    ] = False,
+    max_size: Annotated[
+        str | None,
+        typer.Option(
+            "--max-size",
+            help="Retention: the workspace's max size (e.g. '500M', '10G').",
+        ),
+    ] = None,
+    max_age: Annotated[
+        str | None,
+        typer.Option(
+            "--max-age",
+            help="Retention: the checkpoints' max age (e.g. '12h', '30d').",
+        ),
+    ] = None,
 ) -> None:
     """Handle waldiez checkpoints."""
     manager = StorageManager(workspace_dir=workspace)
@@ -116,8 +178,22 @@ def handle_checkpoints(
     if history:
         _history(manager, session_name=session, checkpoint=checkpoint)
         raise typer.Exit(0)
+    if reindex:
+        indexed = manager.reindex()
+        pretty_print(f"Indexed {indexed} checkpoints.")
+        raise typer.Exit(0)
+    if retention:
+        _retention(manager, max_size=max_size, max_age=max_age, keep=keep)
+        raise typer.Exit(0)
     if list_checkpoints:
-        checkpoints = manager.checkpoints(session_name=session)
+        paging: dict[str, Any] = {}
+        if oldest_first:
+            paging["order"] = "asc"
+        if limit is not None:
+            paging["limit"] = limit
+        if offset:
+            paging["offset"] = offset
+        checkpoints = manager.checkpoints(session_name=session, **paging)
         pretty_print([checkpoint.to_dict() for checkpoint in checkpoints])
         raise typer.Exit(0)
     if list_sessions:
@@ -134,6 +210,9 @@ def handle_checkpoints(
     if cleanup:
         _cleanup(manager, session_name=session, keep=keep)
         raise typer.Exit(0)
+    if pack:
+        _pack(manager, session_name=session, keep=keep)
+        raise typer.Exit(0)
 
 
 def _history(
@@ -190,5 +269,45 @@ def _cleanup(
         manager.cleanup(session_name=_session, keep_count=keep_count)
 
 
+def _pack(
+    manager: StorageManager, session_name: str | None, keep: int | None
+) -> None:
+    keep_count = 5 if keep is None else max(keep, 1)
+    if not session_name:
+        sessions = manager.sessions()
+    else:
+        sessions = [session_name]
+    for _session in sessions:
+        manager.pack(session_name=_session, keep_count=keep_count)
+
+
+def _retention(
+    manager: StorageManager,
+    max_size: str | None,
+    max_age: str | None,
+    keep: int | None,
+) -> None:
+    policy = RetentionPolicy.from_env()
+    try:
+        policy = RetentionPolicy(
+            max_total_bytes=(
+                parse_size(max_size) if max_size else policy.max_total_bytes
+            ),
+            max_age=parse_age(max_age) if max_age else policy.max_age,
+            min_keep=policy.min_keep if keep is None else max(keep, 0),
+        )
+    except ValueError as error:
+        typer.echo(str(error), err=True)
+        raise typer.Exit(1) from error
+    if not policy.enabled:
+        typer.echo("Please provide the max size and/or max age.", err=True)
+        raise typer.Exit(1)
+    report = manager.apply_retention(policy)
+    pretty_print(
+        f"Deleted {report.deleted} checkpoints "
+        f"({report.freed_bytes} bytes), {report.total_bytes} bytes left."
+    )
+
+
 if __name__ == "__main__":
     app()
@@ -13,41 +13,82 @@ import json
 import os
 import re
 import shutil
-import threading
+import stat
+import time
 from collections.abc import Generator, Iterable, Mapping
 from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from typing_extensions import Self
 
+from .archive import CheckpointArchive
+from .blob_store import BLOBS_DIR, BlobStore
+from .catalog import CATALOG_FILE, CheckpointCatalog
 from .checkpoint import WaldiezCheckpoint, WaldiezCheckpointInfo
-from .utils import safe_name, symlink
+from .links_registry import LINKS_REGISTRY_FILE, LinksRegistry
+from .retention import RetentionPolicy, RetentionReport, select_expired
+from .utils import default_max_workers, run_parallel, safe_name, symlink
 
 _PATTERNS = r"^(?!.*\.\.)(?!\.)(?!.*\.$)[\w\-.]{1,128}$"
 
 _SAFE = re.compile(_PATTERNS, re.UNICODE)
 
+# a directory modified this recently might still change within the same
+# mtime tick, so we do not trust its mtime for the catalog yet.
+_RACY_NS = 2_000_000_000
+
+
+def _blob_store_from_env() -> bool:
+    """Check if the blob store is enabled with WALDIEZ_BLOB_STORE."""
+    value = os.environ.get("WALDIEZ_BLOB_STORE", "").strip().lower()
+    return value in ("1", "true", "yes", "on")
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Get the mtime of a path (None if it does not exist)."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 # noinspection PyBroadException,PyUnusedLocal,TryExceptPass,PyMethodMayBeStatic
 class FilesystemStorage:
     """Filesystem-based storage implementation."""
 
-    def __init__(self, workspace_dir: Path | str = "workspace"):
+    def __init__(
+        self,
+        workspace_dir: Path | str = "workspace",
+        blob_store: bool | None = None,
+        max_workers: int | None = None,
+    ):
         """Initialize filesystem storage.
 
         Parameters
         ----------
         workspace_dir : str | Path
             Base directory for all workspace data
+        blob_store : bool | None
+            Whether to deduplicate checkpoint artifacts in a
+            content-addressed blob store under the workspace.
+            Defaults to the WALDIEZ_BLOB_STORE environment variable.
+        max_workers : int | None
+            The number of threads for batch file operations
+            (defaults to the number of CPUs, capped to 8).
         """
         self._workspace_dir = Path(workspace_dir).resolve()
         self._workspace_dir.mkdir(parents=True, exist_ok=True)
-        self._links_registry_file = self._workspace_dir / ".links_registry.json"
-        self._links_registry: dict[str, list[str]] = {}
-        self._registry_lock = threading.RLock()
-        self._load_links_registry()
+        if blob_store is None:
+            blob_store = _blob_store_from_env()
+        self._use_blob_store = blob_store
+        self._blob_store = BlobStore(self._workspace_dir / BLOBS_DIR)
+        self._catalog = CheckpointCatalog(self._workspace_dir / CATALOG_FILE)
+        self._links_registry = LinksRegistry(
+            self._workspace_dir / LINKS_REGISTRY_FILE
+        )
+        self._max_workers = max_workers or default_max_workers()
 
     @staticmethod
     def load_dict(json_file: Path) -> dict[str, Any]:
@@ -117,6 +158,38 @@ class FilesystemStorage:
         """Base workspace directory."""
         return self._workspace_dir
 
+    @property
+    def blob_store(self) -> BlobStore:
+        """The workspace's content-addressed artifact store."""
+        return self._blob_store
+
+    @property
+    def catalog(self) -> CheckpointCatalog:
+        """The workspace's checkpoint catalog."""
+        return self._catalog
+
+    def intern_checkpoint(self, checkpoint_path: Path) -> int:
+        """Deduplicate a checkpoint's artifacts through the blob store.
+
+        The artifacts are found by their content and cloned from (or into)
+        a single blob, sharing the data of identical artifacts of other
+        checkpoints where the filesystem supports copy-on-write clones.
+        No-op if the blob store is disabled.
+
+        Parameters
+        ----------
+        checkpoint_path : Path
+            The checkpoint directory.
+
+        Returns
+        -------
+        int
+            The number of artifacts stored in the blob store.
+        """
+        if not self._use_blob_store or not checkpoint_path.is_dir():
+            return 0
+        return len(self._blob_store.intern_tree(checkpoint_path))
+
     def save_checkpoint(
         self,
         session_name: str,
@@ -146,6 +219,15 @@ class FilesystemStorage:
             timestamp = datetime.now(timezone.utc)
 
         checkpoint_path = self._get_checkpoint_path(session_name, timestamp)
+        session_dir = checkpoint_path.parent
+        previous_mtime = _mtime_ns(session_dir)
+        if previous_mtime is not None and not checkpoint_path.is_dir():
+            # updating a packed checkpoint, keep its files and history
+            WaldiezCheckpoint(
+                session_name=session_name,
+                timestamp=timestamp,
+                path=checkpoint_path,
+            ).unpack()
         checkpoint_path.mkdir(parents=True, exist_ok=True)
         state_file = checkpoint_path / "state.json"
         with open(state_file, "w", encoding="utf-8") as f:
@@ -154,9 +236,15 @@ class FilesystemStorage:
             metadata_file = checkpoint_path / "metadata.json"
             with open(metadata_file, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2, default=str)
-        latest_link = self._get_session_dir(session_name) / "latest"
+        latest_link = session_dir / "latest"
         symlink(latest_link, checkpoint_path, overwrite=True)
-
+        self._catalog.add(
+            session_dir.name,
+            timestamp,
+            checkpoint_path,
+            previous_mtime=previous_mtime,
+            mtime=_mtime_ns(session_dir) or 0,
+        )
         return checkpoint_path
 
     def get_checkpoint(
@@ -190,7 +278,7 @@ class FilesystemStorage:
             checkpoint = checkpoints[0]
         else:
             checkpoint_path = self._get_checkpoint_path(session_name, timestamp)
-            if not checkpoint_path.exists():
+            if not self._checkpoint_exists(checkpoint_path):
                 msg = (
                     f"WaldiezCheckpoint not found for session '{session_name}' "
                     f"at {WaldiezCheckpoint.format_timestamp(timestamp)}"
@@ -265,7 +353,7 @@ class FilesystemStorage:
             link_path = to / checkpoint.path.name
         else:
             checkpoint_path = self._get_checkpoint_path(session_name, timestamp)
-            if not checkpoint_path.exists():
+            if not self._checkpoint_exists(checkpoint_path):
                 msg = (
                     f"WaldiezCheckpoint not found for session '{session_name}' "
                     f"at {WaldiezCheckpoint.format_timestamp(timestamp)}"
@@ -278,6 +366,8 @@ class FilesystemStorage:
             )
             link_path = to / checkpoint_path.name
 
+        # a link needs a directory to point to
+        checkpoint.unpack()
         symlink(link_path, checkpoint.path, overwrite=overwrite)
         if not link_path.is_relative_to(self._workspace_dir):
             self._register_link(checkpoint.path, link_path)
@@ -293,7 +383,7 @@ class FilesystemStorage:
         if not self._workspace_dir.exists():
             return []
         return sorted(
-            [p.name for p in self._workspace_dir.iterdir() if p.is_dir()],
+            [p.name for p in self._session_dirs()],
             reverse=True,
         )
 
@@ -311,9 +401,16 @@ class FilesystemStorage:
 
         checkpoints = self._find_checkpoints(session_name)
 
-        external_links: list[Path] = []
+        # all the registered links under this session (even stray ones).
+        session_prefix = f"{session_dir}{os.sep}"
+        external_links = [
+            Path(link)
+            for links in self._links_registry.as_dict(session_prefix).values()
+            for link in links
+        ]
+        blob_digests: list[str] = []
         for cp in checkpoints:
-            external_links.extend(self._unregister_checkpoint_links(cp.path))
+            blob_digests.extend(BlobStore.load_manifest(cp.path).values())
 
         for link_path in external_links:
             if link_path.is_symlink():
@@ -330,51 +427,77 @@ class FilesystemStorage:
                 shutil.rmtree(session_dir)
             except Exception:
                 pass
+        self._blob_store.release(blob_digests)
+        self._catalog.remove_session(session_dir.name)
 
-        # remove any entries still pointing under this session.
-        with self._registry_transaction():
-            to_delete: list[str] = []
-            for checkpoint_str in self._links_registry.keys():
-                try:
-                    rel = Path(checkpoint_str).relative_to(self._workspace_dir)
-                except ValueError:
-                    continue
-                if rel.parts and rel.parts[0] == session_name:
-                    to_delete.append(checkpoint_str)
-            for key in to_delete:
-                self._links_registry.pop(key, None)
+        self._links_registry.remove_prefix(session_prefix)
 
     def list_checkpoints(
-        self, session_name: str | None = None
+        self,
+        session_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[WaldiezCheckpointInfo]:
         """List available checkpoints.
 
+        The checkpoints are listed from the workspace's catalog. Sessions
+        whose directory changed outside the storage (e.g. checkpoints
+        copied or removed manually) are re-indexed first.
+
         Parameters
         ----------
         session_name : str | None
             Optional filter by session name
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+        order : Literal["asc", "desc"]
+            Sort by timestamp, newest first by default.
+        limit : int | None
+            Maximum number of checkpoints to return.
+        offset : int
+            Number of checkpoints to skip.
 
         Returns
         -------
         list[WaldiezCheckpointInfo]
             The list of the checkpoints found.
         """
-        checkpoints: list[WaldiezCheckpoint] = []
-
         if session_name:
-            session_checkpoints = self._find_checkpoints(session_name)
-            checkpoints.extend(session_checkpoints)
-        else:
-            if self._workspace_dir.exists():
-                for session_dir in self._workspace_dir.iterdir():
-                    if session_dir.is_dir():
-                        session_checkpoints = self._find_checkpoints(
-                            session_dir.name
-                        )
-                        if session_checkpoints:
-                            checkpoints.extend(session_checkpoints)
+            session_dir = self._get_session_dir(session_name)
+            self._sync_catalog([session_dir], prune=False)
+            infos = self._catalog.query(
+                session_dir.name,
+                since=since,
+                until=until,
+                order=order,
+                limit=limit,
+                offset=offset,
+            )
+            for info in infos:
+                info.session_name = session_name
+            return infos
+        self._sync_catalog(self._session_dirs(), prune=True)
+        return self._catalog.query(
+            since=since, until=until, order=order, limit=limit, offset=offset
+        )
 
-        return [WaldiezCheckpointInfo.from_checkpoint(c) for c in checkpoints]
+    def reindex(self) -> int:
+        """Rebuild the checkpoint catalog from the workspace.
+
+        Returns
+        -------
+        int
+            The number of indexed checkpoints.
+        """
+        self._catalog.clear()
+        self._sync_catalog(self._session_dirs(), prune=True)
+        return self._catalog.count()
 
     def delete_checkpoint(self, session_name: str, timestamp: datetime) -> None:
         """Delete a specific checkpoint and clean up all its symlinks.
@@ -392,7 +515,7 @@ class FilesystemStorage:
             If checkpoint not found
         """
         checkpoint_path = self._get_checkpoint_path(session_name, timestamp)
-        if not checkpoint_path.exists():
+        if not self._checkpoint_exists(checkpoint_path):
             msg = (
                 f"WaldiezCheckpoint not found for session '{session_name}' "
                 f"at {WaldiezCheckpoint.format_timestamp(timestamp)}"
@@ -406,14 +529,20 @@ class FilesystemStorage:
                     link_path.unlink(missing_ok=True)
                 except Exception:
                     pass
-        shutil.rmtree(checkpoint_path)
-        latest_link = self._get_session_dir(session_name) / "latest"
+        session_dir = checkpoint_path.parent
+        previous_mtime = _mtime_ns(session_dir)
+        self._remove_checkpoint(checkpoint_path)
+        latest_link = session_dir / "latest"
         if latest_link.exists() and latest_link.resolve() == checkpoint_path:
             latest_link.unlink(missing_ok=True)
             # Point to next latest if available
             checkpoints = self._find_checkpoints(session_name)
             if checkpoints:
                 symlink(latest_link, checkpoints[0].path, overwrite=True)
+        self._catalog.remove(
+            [(session_dir.name, timestamp)],
+            mtimes={session_dir.name: (previous_mtime, _mtime_ns(session_dir))},
+        )
 
     def cleanup_old_checkpoints(
         self, session_name: str, keep_count: int = 5
@@ -436,56 +565,166 @@ class FilesystemStorage:
 
         if len(checkpoints) <= keep_count:
             return 0
-        checkpoints_to_delete = checkpoints[keep_count:]
-        deleted_count = 0
+        return self.delete_checkpoints_batch(
+            (session_name, checkpoint.timestamp)
+            for checkpoint in checkpoints[keep_count:]
+        )
 
-        for checkpoint in checkpoints_to_delete:
-            try:
-                self.delete_checkpoint(session_name, checkpoint.timestamp)
-                deleted_count += 1
-            except Exception:
-                pass
+    def pack_checkpoints(self, session_name: str, keep_count: int = 5) -> int:
+        """Pack old checkpoints, keeping only the most recent ones loose.
 
-        return deleted_count
+        The older checkpoints are moved into the session's compressed
+        archive; they are still listed and can be loaded (their state,
+        metadata and history are read from the archive on demand).
+        Checkpoints with registered external links are kept loose.
 
-    # pylint: disable=too-many-branches
-    def _remove_external_links(self) -> tuple[int, Iterable[str]]:
-        links_to_remove: list[str] = []
+        Parameters
+        ----------
+        session_name : str
+            Name of the session
+        keep_count : int
+            Number of recent checkpoints to keep loose (at least one).
+
+        Returns
+        -------
+        int
+            The number of packed checkpoints.
+        """
+        session_dir = self._get_session_dir(session_name)
+        loose = [
+            checkpoint
+            for checkpoint in self._find_checkpoints(session_name)
+            if checkpoint.path.is_dir()
+        ]
+        to_pack = [
+            checkpoint.path
+            for checkpoint in loose[max(keep_count, 1) :]
+            if str(checkpoint.path) not in self._links_registry
+        ]
+        if not to_pack:
+            return 0
+        previous_mtime = _mtime_ns(session_dir)
+        manifests = {path: BlobStore.load_manifest(path) for path in to_pack}
+        archive = CheckpointArchive(session_dir)
+        packed = archive.pack(to_pack)
+        self._blob_store.release(
+            digest for path in packed for digest in manifests[path].values()
+        )
+        self._catalog.touch(
+            session_dir.name, previous_mtime, _mtime_ns(session_dir)
+        )
+        self._catalog.set_sizes(
+            (session_dir.name, timestamp, archive.size(path.name))
+            for path in packed
+            if (timestamp := WaldiezCheckpoint.parse_timestamp(path.name))
+        )
+        return len(packed)
+
+    def measure_checkpoint(self, checkpoint_path: Path) -> int:
+        """Record a checkpoint's current size in the catalog.
+
+        Parameters
+        ----------
+        checkpoint_path : Path
+            The checkpoint's path.
+
+        Returns
+        -------
+        int
+            The checkpoint's size in bytes.
+        """
+        size = _checkpoint_size(checkpoint_path)
+        timestamp = WaldiezCheckpoint.parse_timestamp(checkpoint_path.name)
+        if timestamp is not None:
+            self._catalog.set_sizes(
+                [(checkpoint_path.parent.name, timestamp, size)]
+            )
+        return size
+
+    def usage(self) -> list[tuple[WaldiezCheckpointInfo, int]]:
+        """Get the size of every checkpoint in the workspace.
+
+        Sizes are recorded in the catalog, only the checkpoints not
+        measured yet (new or rewritten ones) are walked, in parallel.
+
+        Returns
+        -------
+        list[tuple[WaldiezCheckpointInfo, int]]
+            The checkpoints (oldest first) and their size in bytes.
+        """
+        self._sync_catalog(self._session_dirs(), prune=True)
+        unsized = self._catalog.unsized()
+        if unsized:
+            sizes = run_parallel(
+                _checkpoint_size,
+                [info.path for info in unsized],
+                self._max_workers,
+            )
+            self._catalog.set_sizes(
+                (info.path.parent.name, info.timestamp, size)
+                for info, size in zip(unsized, sizes, strict=True)
+            )
+        return self._catalog.usage()
+
+    def apply_retention(
+        self,
+        policy: RetentionPolicy,
+        *,
+        now: datetime | None = None,
+        batch_size: int = 64,
+    ) -> RetentionReport:
+        """Delete the checkpoints that a retention policy expires.
+
+        Parameters
+        ----------
+        policy : RetentionPolicy
+            The policy to apply.
+        now : datetime | None
+            The current time (defaults to now).
+        batch_size : int
+            The number of checkpoints per deletion batch.
+
+        Returns
+        -------
+        RetentionReport
+            The number of deleted checkpoints and the freed/remaining size.
+        """
+        report = RetentionReport()
+        if policy.enabled:
+            expired = select_expired(self.usage(), policy, now)
+            batch_size = max(batch_size, 1)
+            for start in range(0, len(expired), batch_size):
+                batch = expired[start : start + batch_size]
+                self.delete_checkpoints_batch(
+                    (info.session_name, info.timestamp) for info, _ in batch
+                )
+                for info, size in batch:
+                    if not self._checkpoint_exists(info.path):
+                        report.deleted += 1
+                        report.freed_bytes += size
+        report.total_bytes = self._catalog.total_size()
+        return report
+
+    def _remove_external_links(self) -> int:
+        """Remove the broken registered links and their entries."""
         removed_count = 0
-        for checkpoint_path_str, link_paths in self._links_registry.items():
-            checkpoint_path = Path(checkpoint_path_str)
-            if not checkpoint_path.exists():
-                for link_path_str in link_paths:
-                    link_path = Path(link_path_str)
-                    if link_path.is_symlink():
-                        try:
-                            link_path.unlink(missing_ok=True)
-                            removed_count += 1
-                        except Exception:
-                            pass
-                links_to_remove.append(checkpoint_path_str)
-            else:
-                valid_links: list[str] = []
-                for link_path_str in link_paths:
-                    link_path = Path(link_path_str)
-                    if link_path.is_symlink() and not link_path.exists():
-                        # Broken symlink
-                        try:
-                            link_path.unlink(missing_ok=True)
-                            removed_count += 1
-                        except Exception:
-                            pass
-                    elif link_path.exists():
-                        valid_links.append(link_path_str)
-
-                if valid_links:
-                    self._links_registry[checkpoint_path_str] = valid_links
-                else:
-                    links_to_remove.append(checkpoint_path_str)
-
-        for checkpoint_path_str in links_to_remove:
-            self._links_registry.pop(checkpoint_path_str, None)
-        return removed_count, links_to_remove
+        stale: list[tuple[str, str]] = []
+        for checkpoint_str, links in self._links_registry.as_dict().items():
+            checkpoint_exists = Path(checkpoint_str).exists()
+            for link_str in links:
+                link_path = Path(link_str)
+                if link_path.is_symlink() and (
+                    not checkpoint_exists or not link_path.exists()
+                ):
+                    try:
+                        link_path.unlink(missing_ok=True)
+                        removed_count += 1
+                    except Exception:
+                        pass
+                if not checkpoint_exists or not link_path.exists():
+                    stale.append((checkpoint_str, link_str))
+        self._links_registry.remove_links(stale)
+        return removed_count
 
     def clean_broken_symlinks(self, session_name: str | None = None) -> int:
         """Clean up broken symlinks.
@@ -509,41 +748,46 @@ class FilesystemStorage:
             session_dir = self._get_session_dir(session_name)
             removed_count += self._clean_broken_symlinks(session_dir)
         else:
-            if self._workspace_dir.exists():
-                for session_dir in self._workspace_dir.iterdir():
-                    if session_dir.is_dir():
-                        removed_count += self._clean_broken_symlinks(
-                            session_dir
-                        )
+            for session_dir in self._session_dirs():
+                removed_count += self._clean_broken_symlinks(session_dir)
 
-        with self._registry_transaction():
-            external_count, _ = self._remove_external_links()
-            removed_count += external_count
+        removed_count += self._remove_external_links()
 
         return removed_count
 
-    def compact_registry(self) -> int:
+    def compact_registry(self, limit: int | None = None) -> int:
         """Remove entries for non-existent checkpoints and links.
 
+        Parameters
+        ----------
+        limit : int | None
+            Optional number of checkpoints to check in this call. Each
+            call resumes where the previous one stopped, so a large
+            registry can be compacted incrementally.
+
         Returns
         -------
         int
-            Number of entries removed from registry
+            Number of checkpoint entries removed from registry
         """
-        with self._registry_transaction():
-            initial_size = len(self._links_registry)
-            valid_registry = {}
-
-            for checkpoint_str, links in self._links_registry.items():
-                if Path(checkpoint_str).exists():
-                    valid_links = [
-                        lnk for lnk in links if Path(lnk).is_symlink()
-                    ]
-                    if valid_links:
-                        valid_registry[checkpoint_str] = valid_links
-
-            self._links_registry = valid_registry
-            return initial_size - len(self._links_registry)
+        if limit is None:
+            entries = self._links_registry.as_dict()
+        else:
+            entries = self._links_registry.next_batch(limit)
+        stale: list[tuple[str, str]] = []
+        removed = 0
+        for checkpoint_str, links in entries.items():
+            checkpoint_exists = Path(checkpoint_str).exists()
+            invalid = [
+                lnk
+                for lnk in links
+                if not checkpoint_exists or not Path(lnk).is_symlink()
+            ]
+            if len(invalid) == len(links):
+                removed += 1
+            stale.extend((checkpoint_str, lnk) for lnk in invalid)
+        self._links_registry.remove_links(stale)
+        return removed
 
     def verify_links(
         self, session_name: str | None = None
@@ -563,21 +807,15 @@ class FilesystemStorage:
         """
         issues: dict[str, list[str]] = {}
 
-        with self._registry_lock:
-            registry_copy = self._links_registry.copy()
+        prefix: str | None = None
+        if session_name:
+            # only read this session's entries from the registry
+            prefix = f"{self._get_session_dir(session_name)}{os.sep}"
+        registry = self._links_registry.as_dict(prefix)
 
-        for checkpoint_str, links in registry_copy.items():
+        for checkpoint_str, links in registry.items():
             checkpoint_path = Path(checkpoint_str)
 
-            if session_name:
-                try:
-                    relative = checkpoint_path.relative_to(self._workspace_dir)
-                    session_part = relative.parts[0] if relative.parts else ""
-                    if session_part != session_name:
-                        continue
-                except ValueError:
-                    continue
-
             for link_str in links:
                 link_path = Path(link_str)
 
@@ -604,11 +842,15 @@ class FilesystemStorage:
 
         return issues
 
+    # pylint: disable=too-many-locals
     def delete_checkpoints_batch(
         self, checkpoints: Iterable[tuple[str, datetime]]
     ) -> int:
         """Delete multiple checkpoints efficiently.
 
+        The loose checkpoint directories are removed in parallel, the
+        packed ones with a single archive lock per session.
+
         Parameters
         ----------
         checkpoints : list[tuple[str, datetime]]
@@ -619,20 +861,28 @@ class FilesystemStorage:
         int
             Number of checkpoints successfully deleted
         """
-        deleted = 0
         all_external_links: list[Path] = []
-        checkpoints_to_delete: list[tuple[str, datetime, Path]] = []
+        loose: list[tuple[datetime, Path]] = []
+        packed: dict[Path, list[tuple[datetime, Path]]] = {}
+        mtimes: dict[str, tuple[int | None, int | None]] = {}
 
         for session_name, timestamp in checkpoints:
             checkpoint_path = self._get_checkpoint_path(session_name, timestamp)
+            if not self._checkpoint_exists(checkpoint_path):
+                continue
+            session_dir = checkpoint_path.parent
+            if session_dir.name not in mtimes:
+                previous_mtime = _mtime_ns(session_dir)
+                mtimes[session_dir.name] = (previous_mtime, previous_mtime)
             if checkpoint_path.exists():
-                checkpoints_to_delete.append(
-                    (session_name, timestamp, checkpoint_path)
-                )
-                external_links = self._unregister_checkpoint_links(
-                    checkpoint_path
+                loose.append((timestamp, checkpoint_path))
+            else:
+                packed.setdefault(session_dir, []).append(
+                    (timestamp, checkpoint_path)
                 )
-                all_external_links.extend(external_links)
+            all_external_links.extend(
+                self._unregister_checkpoint_links(checkpoint_path)
+            )
 
         for link_path in all_external_links:
             if link_path.is_symlink():
@@ -640,31 +890,46 @@ class FilesystemStorage:
                     link_path.unlink(missing_ok=True)
                 except Exception:
                     pass
-        for session_name, _, checkpoint_path in checkpoints_to_delete:
-            try:
-                shutil.rmtree(checkpoint_path)
-
-                # Update latest link if needed
-                latest_link = self._get_session_dir(session_name) / "latest"
-                if (
-                    latest_link.exists()
-                    and latest_link.resolve() == checkpoint_path
-                ):
-                    latest_link.unlink(missing_ok=True)
-                    # Point to next latest if available
-                    remaining_checkpoints = self._find_checkpoints(session_name)
-                    if remaining_checkpoints:
-                        symlink(
-                            latest_link,
-                            remaining_checkpoints[0].path,
-                            overwrite=True,
-                        )
-
-                deleted += 1
-            except Exception:
-                pass
 
-        return deleted
+        blob_digests: list[str] = []
+        for _, checkpoint_path in loose:
+            blob_digests.extend(
+                BlobStore.load_manifest(checkpoint_path).values()
+            )
+        loose_results = run_parallel(
+            _remove_tree, [path for _, path in loose], self._max_workers
+        )
+        packed_results = run_parallel(
+            _remove_packed, list(packed.values()), self._max_workers
+        )
+        if blob_digests:
+            self._blob_store.release(blob_digests)
+
+        removed: list[tuple[str, datetime]] = [
+            (path.parent.name, timestamp)
+            for (timestamp, path), ok in zip(loose, loose_results, strict=True)
+            if ok
+        ]
+        for entries, ok in zip(packed.values(), packed_results, strict=True):
+            if ok:
+                removed.extend(
+                    (path.parent.name, timestamp) for timestamp, path in entries
+                )
+        removed_paths = {
+            path
+            for (_, path), ok in zip(loose, loose_results, strict=True)
+            if ok
+        }
+        for name in mtimes:
+            self._relink_latest(self._workspace_dir / name, removed_paths)
+        for name, (previous_mtime, _) in mtimes.items():
+            mtimes[name] = (
+                previous_mtime,
+                _mtime_ns(self._workspace_dir / name),
+            )
+        if removed:
+            self._catalog.remove(removed, mtimes=mtimes)
+        return len(removed)
 
     @contextmanager
     def transaction(self) -> Generator[Self, None, None]:
@@ -688,77 +953,105 @@ class FilesystemStorage:
             storage.delete_checkpoint("session3", timestamp)
         """
         # Backup current state
-        with self._registry_lock:
-            original_registry = self._links_registry.copy()
+        original_registry = self._links_registry.as_dict()
 
         try:
             yield self
         except Exception:
             # Rollback
-            with self._registry_lock:
-                self._links_registry = original_registry
-                self._save_links_registry()
+            self._links_registry.replace(original_registry)
             raise
 
-    @contextmanager
-    def _registry_transaction(self) -> Generator[None, None, None]:
-        """Context manager for safe registry operations."""
-        with self._registry_lock:
-            self._load_links_registry()
-            yield
-            self._save_links_registry()
-
-    def _load_links_registry(self) -> None:
-        """Load and validate the registry of external links."""
-        if self._links_registry_file.exists():
-            try:
-                with open(
-                    self._links_registry_file, "r", encoding="utf-8"
-                ) as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        for key, value in data.items():
-                            if isinstance(value, list):
-                                valid_links = [
-                                    v for v in value if isinstance(v, str)
-                                ]
-                                if valid_links:
-                                    self._links_registry[key] = valid_links
-            except (json.JSONDecodeError, ValueError):
-                # Backup corrupted file
-                backup = self._links_registry_file.with_suffix(".corrupted")
-                shutil.copy2(self._links_registry_file, backup)
-                self._links_registry = {}
-            except Exception:
-                self._links_registry = {}
-
-    def _save_links_registry(self) -> None:
-        """Save the registry with file locking."""
-        temp_file = self._links_registry_file.with_suffix(".tmp")
-        try:
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self._links_registry, f, indent=2)
-            os.replace(temp_file, self._links_registry_file)
-        finally:
-            with suppress(FileNotFoundError):
-                temp_file.unlink(missing_ok=True)
+    @property
+    def links_registry(self) -> LinksRegistry:
+        """The workspace's registry of external links."""
+        return self._links_registry
 
     def _register_link(self, checkpoint_path: Path, link_path: Path) -> None:
         """Register an external link in the registry."""
-        key = str(checkpoint_path)
-        val = str(link_path)
-        with self._registry_transaction():
-            self._links_registry.setdefault(key, [])
-            if val not in self._links_registry[key]:
-                self._links_registry[key].append(val)
+        self._links_registry.register(str(checkpoint_path), str(link_path))
 
     def _unregister_checkpoint_links(self, checkpoint_path: Path) -> list[Path]:
         """Get and remove all registered links for a checkpoint."""
-        with self._registry_transaction():
-            checkpoint_key = str(checkpoint_path)
-            links = self._links_registry.pop(checkpoint_key, [])
+        links = self._links_registry.unregister(str(checkpoint_path))
         return [Path(link) for link in links]
 
+    @staticmethod
+    def _checkpoint_exists(checkpoint_path: Path) -> bool:
+        """Check if a checkpoint exists, loose or packed."""
+        if checkpoint_path.exists():
+            return True
+        return checkpoint_path.name in CheckpointArchive(checkpoint_path.parent)
+
+    def _remove_checkpoint(self, checkpoint_path: Path) -> None:
+        """Remove a checkpoint's directory or its packed copy."""
+        if not checkpoint_path.exists():
+            CheckpointArchive(checkpoint_path.parent).remove(
+                [checkpoint_path.name]
+            )
+            return
+        blob_digests = BlobStore.load_manifest(checkpoint_path).values()
+        shutil.rmtree(checkpoint_path)
+        self._blob_store.release(blob_digests)
+
+    def _relink_latest(self, session_dir: Path, removed: set[Path]) -> None:
+        """Point a session's latest link away from removed checkpoints."""
+        latest_link = session_dir / "latest"
+        if not latest_link.is_symlink():
+            return
+        try:
+            target = latest_link.resolve()
+        except OSError:
+            return
+        if target not in removed:
+            return
+        latest_link.unlink(missing_ok=True)
+        # Point to next latest if available
+        remaining_checkpoints = self._find_checkpoints(session_dir.name)
+        if remaining_checkpoints:
+            symlink(latest_link, remaining_checkpoints[0].path, overwrite=True)
+
+    def _sync_catalog(self, session_dirs: list[Path], prune: bool) -> None:
+        """Re-index the sessions that changed outside the storage.
+
+        Parameters
+        ----------
+        session_dirs : list[Path]
+            The session directories to check.
+        prune : bool
+            Whether to drop indexed sessions not in ``session_dirs``.
+        """
+        known = self._catalog.session_mtimes()
+        for session_dir in session_dirs:
+            name = session_dir.name
+            mtime = _mtime_ns(session_dir)
+            if mtime is None:
+                if name in known:
+                    self._catalog.remove_session(name)
+                continue
+            if known.get(name) == mtime:
+                continue
+            if time.time_ns() - mtime < _RACY_NS:
+                # check it again on the next listing
+                mtime = 0
+            self._catalog.sync_session(
+                name, self._find_checkpoints(name), mtime
+            )
+        if prune:
+            present = {session_dir.name for session_dir in session_dirs}
+            for name in set(known) - present:
+                self._catalog.remove_session(name)
+
+    def _session_dirs(self) -> list[Path]:
+        """Get the session directories (skipping internal ones)."""
+        if not self._workspace_dir.exists():
+            return []
+        return [
+            path
+            for path in self._workspace_dir.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+
     def _get_session_dir(self, session_name: str) -> Path:
         """Get the directory for a session."""
         name = safe_name(session_name)
@@ -797,6 +1090,17 @@ class FilesystemStorage:
                     checkpoints.append(checkpoint)
             except ValueError:
                 continue
+        loose = {checkpoint.path.name for checkpoint in checkpoints}
+        for name in CheckpointArchive(session_dir).names():
+            timestamp = WaldiezCheckpoint.parse_timestamp(name)
+            if timestamp and name not in loose:
+                checkpoints.append(
+                    WaldiezCheckpoint(
+                        session_name=session_name,
+                        timestamp=timestamp,
+                        path=session_dir / name,
+                    )
+                )
 
         return sorted(checkpoints, key=lambda c: c.timestamp, reverse=True)
 
@@ -831,3 +1135,51 @@ class FilesystemStorage:
                     item.unlink(missing_ok=True)
                     removed += 1
         return removed
+
+
+def _remove_tree(path: Path) -> bool:
+    """Remove a checkpoint directory (in a worker thread)."""
+    try:
+        shutil.rmtree(path)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    return True
+
+
+def _remove_packed(entries: list[tuple[datetime, Path]]) -> bool:
+    """Remove a session's packed checkpoints under one archive lock."""
+    session_dir = entries[0][1].parent
+    try:
+        CheckpointArchive(session_dir).remove(path.name for _, path in entries)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return False
+    return True
+
+
+def _checkpoint_size(checkpoint_path: Path) -> int:
+    """Get the size of a checkpoint's files (or of its packed copy).
+
+    A file with more (hard) links, e.g. a blob store reference, only
+    counts its share of the size, so shared files are not counted in full
+    for every checkpoint. The artifacts cloned from the blob store are
+    counted by their references.
+    """
+    if not checkpoint_path.is_dir():
+        return CheckpointArchive(checkpoint_path.parent).size(
+            checkpoint_path.name
+        )
+    cloned = {
+        os.path.join(checkpoint_path, *relative.split("/"))
+        for relative in BlobStore.load_manifest(checkpoint_path)
+    }
+    total = 0
+    for root, _, files in os.walk(checkpoint_path):
+        for file_name in files:
+            path = os.path.join(root, file_name)
+            if path in cloned:
+                continue
+            with suppress(OSError):
+                stat_result = os.lstat(path)
+                if not stat.S_ISLNK(stat_result.st_mode):
+                    total += stat_result.st_size // max(stat_result.st_nlink, 1)
+    return total
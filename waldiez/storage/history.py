@@ -0,0 +1,483 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught,too-many-try-statements
+# pyright: reportUnknownVariableType=false,reportUnknownMemberType=false
+# pyright: reportUnknownArgumentType=false
+
+"""Append-only checkpoint history log.
+
+The history of a checkpoint is stored as a JSONL segment
+(``history.jsonl``, one entry per line) plus a fixed-width binary
+offset index (``history.idx``). Appending an entry writes one line and
+one index record, and any entry can be read by its index with two seeks,
+without loading the rest of the history.
+
+Each index record also holds a content digest of the entry's state and
+metadata, computed once when the entry is written. Duplicates are
+detected by comparing digests, so an entry identical to one already in
+the log is rejected on append.
+
+Legacy ``history.json`` files (a JSON list, or a dict with a ``history``
+list) are migrated to the new format on first access.
+"""
+
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Iterator
+from contextlib import suppress
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+
+HISTORY_LOG_FILE = "history.jsonl"
+HISTORY_INDEX_FILE = "history.idx"
+LEGACY_HISTORY_FILE = "history.json"
+
+# (byte offset, byte length, content digest) of each line in the segment.
+_RECORD = struct.Struct("<QQ32s")
+
+
+def entry_digest(entry: dict[str, Any]) -> bytes:
+    """Get the content digest of a history entry.
+
+    Only the state and the metadata are used, so entries recorded at
+    different times with the same content share a digest.
+
+    Parameters
+    ----------
+    entry : dict[str, Any]
+        The history entry.
+
+    Returns
+    -------
+    bytes
+        The sha256 digest of the entry's canonical JSON form.
+    """
+    canonical = json.dumps(
+        {"state": entry.get("state"), "metadata": entry.get("metadata")},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+def strip_trailing_tool_calls(entry: dict[str, Any]) -> dict[str, Any]:
+    """Remove trailing tool_call messages from a history entry's state.
+
+    A state whose last message(s) are pending tool calls cannot be
+    resumed, so they are dropped before the entry is stored.
+
+    Parameters
+    ----------
+    entry : dict[str, Any]
+        The history entry.
+
+    Returns
+    -------
+    dict[str, Any]
+        The (possibly) updated entry.
+    """
+    state = entry.get("state")
+    if not isinstance(state, dict):
+        return entry
+    messages = state.get("messages")
+    if not isinstance(messages, list) or not messages:
+        return entry
+    end = len(messages)
+    while (
+        end > 0
+        and isinstance(messages[end - 1], dict)
+        and "tool_calls" in messages[end - 1]
+    ):
+        end -= 1
+    if end == len(messages):
+        return entry
+    return {**entry, "state": {**state, "messages": messages[:end]}}
+
+
+class WaldiezHistoryLog:
+    """Append-only history log of a checkpoint directory."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the history log.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory holding the history files
+            (a checkpoint or a run's output directory).
+        """
+        self._directory = directory
+        # digests of the records read so far and the index bytes they span
+        self._digests: set[bytes] = set()
+        self._digests_end = 0
+
+    @property
+    def directory(self) -> Path:
+        """The directory of the history log."""
+        return self._directory
+
+    @property
+    def log_file(self) -> Path:
+        """Path to the JSONL segment."""
+        return self._directory / HISTORY_LOG_FILE
+
+    @property
+    def index_file(self) -> Path:
+        """Path to the offset index."""
+        return self._directory / HISTORY_INDEX_FILE
+
+    @property
+    def legacy_file(self) -> Path:
+        """Path to a legacy history.json file."""
+        return self._directory / LEGACY_HISTORY_FILE
+
+    def exists(self) -> bool:
+        """Check if there is any history (new or legacy format).
+
+        Returns
+        -------
+        bool
+            True if a history log or a legacy history file exists.
+        """
+        return self.log_file.is_file() or self.legacy_file.is_file()
+
+    def __len__(self) -> int:
+        """Get the number of entries in the log."""
+        self.migrate()
+        if not self.log_file.is_file():
+            return 0
+        self._ensure_index()
+        try:
+            return self.index_file.stat().st_size // _RECORD.size
+        except OSError:
+            return 0
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the entries in the log."""
+        return iter(self.entries())
+
+    def append(self, entry: dict[str, Any]) -> int | None:
+        """Append an entry to the log.
+
+        Parameters
+        ----------
+        entry : dict[str, Any]
+            The entry to append.
+
+        Returns
+        -------
+        int | None
+            The index of the appended entry,
+            or None if an identical entry is already in the log.
+        """
+        self.migrate()
+        self._ensure_index()
+        entry = strip_trailing_tool_calls(entry)
+        digest = entry_digest(entry)
+        if digest in self._known_digests():
+            return None
+        line = self._encode(entry)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, "ab") as f_log:
+            offset = f_log.tell()
+            f_log.write(line)
+        with open(self.index_file, "ab") as f_idx:
+            index = f_idx.tell() // _RECORD.size
+            f_idx.write(_RECORD.pack(offset, len(line), digest))
+        self._track(digest, index)
+        return index
+
+    async def a_append(self, entry: dict[str, Any]) -> int | None:
+        """Append an entry to the log asynchronously.
+
+        Parameters
+        ----------
+        entry : dict[str, Any]
+            The entry to append.
+
+        Returns
+        -------
+        int | None
+            The index of the appended entry,
+            or None if an identical entry is already in the log.
+        """
+        self.migrate()
+        self._ensure_index()
+        entry = strip_trailing_tool_calls(entry)
+        digest = entry_digest(entry)
+        if digest in self._known_digests():
+            return None
+        line = self._encode(entry)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(self.log_file, "ab") as f_log:
+            offset = await f_log.tell()
+            await f_log.write(line)
+        async with aiofiles.open(self.index_file, "ab") as f_idx:
+            index = (await f_idx.tell()) // _RECORD.size
+            await f_idx.write(_RECORD.pack(offset, len(line), digest))
+        self._track(digest, index)
+        return index
+
+    def get(self, index: int) -> dict[str, Any] | None:
+        """Get an entry by its index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the entry (negative values count from the end).
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The entry if found and valid, else None.
+        """
+        count = len(self)
+        if index < 0:
+            index += count
+        if index < 0 or index >= count:
+            return None
+        try:
+            with open(self.index_file, "rb") as f_idx:
+                f_idx.seek(index * _RECORD.size)
+                offset, length, _ = _RECORD.unpack(f_idx.read(_RECORD.size))
+            with open(self.log_file, "rb") as f_log:
+                f_log.seek(offset)
+                return self._decode(f_log.read(length))
+        except Exception:
+            return None
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Get all the valid, distinct entries of the log.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The entries in insertion order.
+        """
+        count = len(self)
+        if not count:
+            return []
+        entries: list[dict[str, Any]] = []
+        try:
+            with open(self.log_file, "rb") as f_log:
+                data = f_log.read()
+            with open(self.index_file, "rb") as f_idx:
+                index_data = f_idx.read(count * _RECORD.size)
+        except OSError:
+            return []
+        seen: set[bytes] = set()
+        for offset, length, digest in _RECORD.iter_unpack(index_data):
+            if digest in seen:
+                continue
+            entry = self._decode(data[offset : offset + length])
+            if entry is not None:
+                entries.append(entry)
+                seen.add(digest)
+        return entries
+
+    def compact(self, entries: list[dict[str, Any]] | None = None) -> int:
+        """Rewrite the log keeping only valid entries.
+
+        Drops unreadable or duplicate records and any bytes that were
+        written without being indexed (e.g. an interrupted append).
+
+        Parameters
+        ----------
+        entries : list[dict[str, Any]] | None
+            Optional entries to keep (defaults to all the valid entries).
+
+        Returns
+        -------
+        int
+            The number of entries removed.
+        """
+        count = len(self)
+        if not self.log_file.is_file():
+            return 0
+        if entries is None:
+            entries = self.entries()
+        self._write_all(entries)
+        return count - len(entries)
+
+    def migrate(self) -> bool:
+        """Migrate a legacy history.json file to the log format.
+
+        Returns
+        -------
+        bool
+            True if a legacy file was migrated.
+        """
+        legacy = self.legacy_file
+        if not legacy.is_file():
+            return False
+        try:
+            with open(legacy, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = None
+        if isinstance(data, dict):
+            data = data.get("history", [])
+        legacy_entries = [
+            strip_trailing_tool_calls(entry)
+            for entry in (data if isinstance(data, list) else [])
+            if isinstance(entry, dict)
+        ]
+        if self.log_file.is_file():
+            # entries appended after the legacy file was written
+            legacy_entries.extend(self._read_lines())
+        unique: dict[bytes, dict[str, Any]] = {}
+        for entry in legacy_entries:
+            unique.setdefault(entry_digest(entry), entry)
+        self._write_all(list(unique.values()))
+        with suppress(OSError):
+            legacy.unlink()
+        return True
+
+    def _write_all(self, entries: list[dict[str, Any]]) -> None:
+        """Atomically replace the log and its index with the entries."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp_log = self.log_file.with_suffix(".jsonl.tmp")
+        tmp_idx = self.index_file.with_suffix(".idx.tmp")
+        try:
+            offset = 0
+            with open(tmp_log, "wb") as f_log, open(tmp_idx, "wb") as f_idx:
+                for entry in entries:
+                    line = self._encode(entry)
+                    f_log.write(line)
+                    f_idx.write(
+                        _RECORD.pack(offset, len(line), entry_digest(entry))
+                    )
+                    offset += len(line)
+            os.replace(tmp_log, self.log_file)
+            os.replace(tmp_idx, self.index_file)
+            self._digests.clear()
+            self._digests_end = 0
+        finally:
+            for tmp in (tmp_log, tmp_idx):
+                with suppress(OSError):
+                    tmp.unlink(missing_ok=True)
+
+    def _ensure_index(self) -> None:
+        """Make sure the index matches the segment.
+
+        Rebuilds the index from the segment if it is missing, and drops
+        a torn trailing record if the last index write was interrupted.
+        """
+        if not self.log_file.is_file():
+            return
+        if not self.index_file.is_file():
+            self._rebuild_index()
+            return
+        try:
+            size = self.index_file.stat().st_size
+        except OSError:
+            return
+        if size % _RECORD.size:
+            with open(self.index_file, "r+b") as f_idx:
+                f_idx.truncate(size - size % _RECORD.size)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the offset index by scanning the segment."""
+        offset = 0
+        with (
+            open(self.log_file, "rb") as f_log,
+            open(self.index_file, "wb") as f_idx,
+        ):
+            for line in f_log:
+                entry = self._decode(line) if line.endswith(b"\n") else None
+                if entry is not None:
+                    f_idx.write(
+                        _RECORD.pack(offset, len(line), entry_digest(entry))
+                    )
+                offset += len(line)
+        self._digests.clear()
+        self._digests_end = 0
+
+    def _known_digests(self) -> set[bytes]:
+        """Get the digests of the entries in the log.
+
+        Only the index records written since the last call are read,
+        so repeated appends through the same instance stay O(1).
+        """
+        try:
+            size = self.index_file.stat().st_size
+        except OSError:
+            size = 0
+        if size < self._digests_end:
+            # the log was rewritten by someone else
+            self._digests.clear()
+            self._digests_end = 0
+        if size > self._digests_end:
+            with open(self.index_file, "rb") as f_idx:
+                f_idx.seek(self._digests_end)
+                tail = f_idx.read(size - self._digests_end)
+            tail = tail[: len(tail) - len(tail) % _RECORD.size]
+            self._digests.update(
+                digest for _, _, digest in _RECORD.iter_unpack(tail)
+            )
+            self._digests_end += len(tail)
+        return self._digests
+
+    def _track(self, digest: bytes, index: int) -> None:
+        """Track the digest of an entry we just appended."""
+        if self._digests_end == index * _RECORD.size:
+            self._digests.add(digest)
+            self._digests_end += _RECORD.size
+
+    def _read_lines(self) -> list[dict[str, Any]]:
+        """Read the entries of the segment, ignoring the index."""
+        entries: list[dict[str, Any]] = []
+        try:
+            with open(self.log_file, "rb") as f_log:
+                for line in f_log:
+                    entry = self._decode(line)
+                    if entry is not None:
+                        entries.append(entry)
+        except OSError:
+            return []
+        return entries
+
+    @staticmethod
+    def _encode(entry: dict[str, Any]) -> bytes:
+        """Serialize an entry to a single JSONL line."""
+        return (
+            json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8")
+            + b"\n"
+        )
+
+    @staticmethod
+    def _decode(line: bytes) -> dict[str, Any] | None:
+        """Deserialize a JSONL line to an entry."""
+        try:
+            entry = json.loads(line)
+        except Exception:
+            return None
+        return entry if isinstance(entry, dict) else None
+
+
+@lru_cache(maxsize=64)
+def get_history_log(directory: Path) -> WaldiezHistoryLog:
+    """Get a (shared) history log for a directory.
+
+    Reusing the same instance across appends keeps the known digests
+    in memory, so duplicate checks do not re-read the index.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory holding the history files.
+
+    Returns
+    -------
+    WaldiezHistoryLog
+        The history log of the directory.
+    """
+    return WaldiezHistoryLog(directory)
@@ -0,0 +1,319 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught
+
+"""SQLite registry of the external links to checkpoints.
+
+One row per (checkpoint, link) pair in ``<workspace>/.links_registry.db``
+(WAL mode), so registering or unregistering a link is a single indexed
+statement, safe across processes. A legacy ``.links_registry.json`` file
+is imported (and removed) on first use.
+"""
+
+import json
+import shutil
+import sqlite3
+from collections.abc import Generator, Iterable, Mapping
+from contextlib import contextmanager, suppress
+from pathlib import Path
+
+LINKS_REGISTRY_FILE = ".links_registry.db"
+LEGACY_LINKS_REGISTRY_FILE = ".links_registry.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    checkpoint TEXT NOT NULL,
+    link TEXT NOT NULL,
+    PRIMARY KEY (checkpoint, link)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _prefix_range(prefix: str) -> tuple[str, str]:
+    """Get the [low, high) key range of the strings starting with a prefix."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class LinksRegistry:
+    """Registry of the external links to checkpoints."""
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the registry.
+
+        Parameters
+        ----------
+        db_path : Path
+            The path of the sqlite database.
+        """
+        self._db_path = db_path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        self.migrate(db_path.with_name(LEGACY_LINKS_REGISTRY_FILE))
+
+    @property
+    def db_path(self) -> Path:
+        """The path of the sqlite database."""
+        return self._db_path
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection, committing on success."""
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def migrate(self, legacy_file: Path) -> int:
+        """Import the links of a legacy json registry and remove it.
+
+        A corrupted file is backed up (``.corrupted``) and skipped.
+
+        Parameters
+        ----------
+        legacy_file : Path
+            The legacy json registry.
+
+        Returns
+        -------
+        int
+            The number of imported links.
+        """
+        if not legacy_file.is_file():
+            return 0
+        data: object = {}
+        try:
+            with open(legacy_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, ValueError):
+            shutil.copy2(legacy_file, legacy_file.with_suffix(".corrupted"))
+        except Exception:
+            return 0
+        pairs: list[tuple[str, str]] = []
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, list):
+                    pairs.extend(
+                        (str(key), link)
+                        for link in value
+                        if isinstance(link, str)
+                    )
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO links (checkpoint, link) VALUES (?, ?)",
+                pairs,
+            )
+        with suppress(OSError):
+            legacy_file.unlink()
+        return len(pairs)
+
+    def __len__(self) -> int:
+        """Get the number of checkpoints with registered links."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COUNT(DISTINCT checkpoint) FROM links"
+            ).fetchone()
+        return int(row[0])
+
+    def __contains__(self, checkpoint: object) -> bool:
+        """Check if a checkpoint has registered links."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM links WHERE checkpoint = ? LIMIT 1",
+                (str(checkpoint),),
+            ).fetchone()
+        return row is not None
+
+    def register(self, checkpoint: str, link: str) -> None:
+        """Register a link to a checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : str
+            The checkpoint's path.
+        link : str
+            The link's path.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO links (checkpoint, link) VALUES (?, ?)",
+                (checkpoint, link),
+            )
+
+    def links(self, checkpoint: str) -> list[str]:
+        """Get the registered links of a checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : str
+            The checkpoint's path.
+
+        Returns
+        -------
+        list[str]
+            The registered links in registration order.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT link FROM links WHERE checkpoint = ? ORDER BY rowid",
+                (checkpoint,),
+            )
+            return [row[0] for row in rows]
+
+    def unregister(self, checkpoint: str) -> list[str]:
+        """Remove and return the registered links of a checkpoint.
+
+        Parameters
+        ----------
+        checkpoint : str
+            The checkpoint's path.
+
+        Returns
+        -------
+        list[str]
+            The links that were registered.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT link FROM links WHERE checkpoint = ? ORDER BY rowid",
+                (checkpoint,),
+            ).fetchall()
+            conn.execute(
+                "DELETE FROM links WHERE checkpoint = ?", (checkpoint,)
+            )
+        return [row[0] for row in rows]
+
+    def remove_links(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Remove specific (checkpoint, link) entries.
+
+        Parameters
+        ----------
+        pairs : Iterable[tuple[str, str]]
+            The (checkpoint, link) pairs to remove.
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM links WHERE checkpoint = ? AND link = ?",
+                list(pairs),
+            )
+
+    def remove_prefix(self, prefix: str) -> int:
+        """Remove the entries of all the checkpoints under a directory.
+
+        Parameters
+        ----------
+        prefix : str
+            The directory's path (with a trailing separator).
+
+        Returns
+        -------
+        int
+            The number of removed entries.
+        """
+        low, high = _prefix_range(prefix)
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM links WHERE checkpoint >= ? AND checkpoint < ?",
+                (low, high),
+            )
+            return cursor.rowcount
+
+    def as_dict(self, prefix: str | None = None) -> dict[str, list[str]]:
+        """Get the registry (or a part of it) as a dict.
+
+        Parameters
+        ----------
+        prefix : str | None
+            Only include the checkpoints under this directory.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            The links of each checkpoint.
+        """
+        sql = "SELECT checkpoint, link FROM links"
+        params: tuple[str, ...] = ()
+        if prefix:
+            sql += " WHERE checkpoint >= ? AND checkpoint < ?"
+            params = _prefix_range(prefix)
+        registry: dict[str, list[str]] = {}
+        with self._connect() as conn:
+            for checkpoint, link in conn.execute(
+                f"{sql} ORDER BY rowid", params
+            ):
+                registry.setdefault(checkpoint, []).append(link)
+        return registry
+
+    def replace(self, registry: Mapping[str, Iterable[str]]) -> None:
+        """Replace the whole registry.
+
+        Parameters
+        ----------
+        registry : Mapping[str, Iterable[str]]
+            The links of each checkpoint.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM links")
+            conn.executemany(
+                "INSERT OR IGNORE INTO links (checkpoint, link) VALUES (?, ?)",
+                [
+                    (checkpoint, link)
+                    for checkpoint, links in registry.items()
+                    for link in links
+                ],
+            )
+
+    def next_batch(self, limit: int) -> dict[str, list[str]]:
+        """Get the next checkpoints to check in an incremental pass.
+
+        Passes resume where the previous batch ended (the position is
+        stored in the registry) and wrap around at the end.
+
+        Parameters
+        ----------
+        limit : int
+            The maximum number of checkpoints in the batch.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            The links of the checkpoints in the batch.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'cursor'"
+            ).fetchone()
+            start = str(row[0]) if row else ""
+            keys = [
+                key
+                for (key,) in conn.execute(
+                    "SELECT DISTINCT checkpoint FROM links "
+                    "WHERE checkpoint > ? ORDER BY checkpoint LIMIT ?",
+                    (start, max(limit, 1)),
+                )
+            ]
+            cursor = keys[-1] if len(keys) == max(limit, 1) else ""
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) "
+                "VALUES ('cursor', ?)",
+                (cursor,),
+            )
+            batch: dict[str, list[str]] = {}
+            for key in keys:
+                batch[key] = [
+                    link
+                    for (link,) in conn.execute(
+                        "SELECT link FROM links WHERE checkpoint = ? "
+                        "ORDER BY rowid",
+                        (key,),
+                    )
+                ]
+        return batch
@@ -9,7 +9,7 @@ from collections.abc import Generator, Iterable, Mapping
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from typing_extensions import Self
 
@@ -149,7 +149,14 @@ class Storage(Protocol):  # pragma: no cover
         ...
 
     def list_checkpoints(
-        self, session_name: str | None = None
+        self,
+        session_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[WaldiezCheckpointInfo]:
         """List available checkpoints.
 
@@ -157,6 +164,16 @@ class Storage(Protocol):  # pragma: no cover
         ----------
         session_name : str | None
             Optional filter by session name
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+        order : Literal["asc", "desc"]
+            Sort by timestamp, newest first by default.
+        limit : int | None
+            Maximum number of checkpoints to return.
+        offset : int
+            Number of checkpoints to skip.
         """
         ...
 
@@ -219,8 +236,14 @@ class Storage(Protocol):  # pragma: no cover
         """
         ...
 
-    def compact_registry(self) -> int:
-        """Remove entries for non-existent checkpoints and links."""
+    def compact_registry(self, limit: int | None = None) -> int:
+        """Remove entries for non-existent checkpoints and links.
+
+        Parameters
+        ----------
+        limit : int | None
+            Optional number of checkpoints to check (incremental pass).
+        """
         ...
 
     def verify_links(
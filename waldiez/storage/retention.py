@@ -0,0 +1,293 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+"""Workspace-wide retention of checkpoints.
+
+A retention policy bounds the workspace by the checkpoints' age and their
+total size on disk, while always keeping the latest checkpoints of every
+session. The sizes come from the checkpoint catalog (each checkpoint is
+measured once), so applying a policy does not walk the whole workspace.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from .checkpoint import WaldiezCheckpointInfo
+
+if TYPE_CHECKING:
+    from .storage_manager import StorageManager
+
+logger = logging.getLogger(__name__)
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+_AGE_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*$", re.I)
+_AGE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$", re.I)
+
+
+def parse_size(value: str) -> int:
+    """Parse a size like ``500M`` or ``10GB`` (binary units) to bytes.
+
+    Parameters
+    ----------
+    value : str
+        The size, a number with an optional K/M/G/T suffix.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a valid size.
+    """
+    match = _SIZE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid size: {value}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
+def parse_age(value: str) -> timedelta:
+    """Parse an age like ``90m``, ``12h`` or ``30d`` (seconds by default).
+
+    Parameters
+    ----------
+    value : str
+        The age, a number with an optional s/m/h/d/w suffix.
+
+    Returns
+    -------
+    timedelta
+        The parsed age.
+
+    Raises
+    ------
+    ValueError
+        If the value is not a valid age.
+    """
+    match = _AGE_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid age: {value}")
+    number, unit = match.groups()
+    return timedelta(seconds=float(number) * _AGE_UNITS[unit.lower()])
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Limits for the checkpoints kept in a workspace.
+
+    Attributes
+    ----------
+    max_total_bytes : int | None
+        Remove the oldest checkpoints while the workspace is larger.
+    max_age : timedelta | None
+        Remove the checkpoints older than this.
+    min_keep : int
+        Always keep this many of the latest checkpoints of each session.
+    """
+
+    max_total_bytes: int | None = None
+    max_age: timedelta | None = None
+    min_keep: int = 1
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the policy limits anything."""
+        return self.max_total_bytes is not None or self.max_age is not None
+
+    @classmethod
+    def from_env(cls) -> RetentionPolicy:
+        """Get the policy from the environment.
+
+        Uses ``WALDIEZ_RETENTION_MAX_SIZE`` (e.g. ``10G``),
+        ``WALDIEZ_RETENTION_MAX_AGE`` (e.g. ``30d``) and
+        ``WALDIEZ_RETENTION_MIN_KEEP``; invalid values are ignored.
+
+        Returns
+        -------
+        RetentionPolicy
+            The configured policy.
+        """
+        max_size = os.environ.get("WALDIEZ_RETENTION_MAX_SIZE", "")
+        max_age = os.environ.get("WALDIEZ_RETENTION_MAX_AGE", "")
+        min_keep = os.environ.get("WALDIEZ_RETENTION_MIN_KEEP", "")
+        try:
+            max_total_bytes = parse_size(max_size) if max_size.strip() else None
+            max_age_value = parse_age(max_age) if max_age.strip() else None
+        except ValueError as error:
+            logger.warning("Ignoring the retention settings: %s", error)
+            return cls()
+        return cls(
+            max_total_bytes=max_total_bytes,
+            max_age=max_age_value,
+            min_keep=int(min_keep) if min_keep.strip().isdigit() else 1,
+        )
+
+
+@dataclass
+class RetentionReport:
+    """The outcome of applying a retention policy.
+
+    Attributes
+    ----------
+    deleted : int
+        The number of deleted checkpoints.
+    freed_bytes : int
+        The recorded size of the deleted checkpoints.
+    total_bytes : int
+        The recorded size of the remaining checkpoints.
+    """
+
+    deleted: int = 0
+    freed_bytes: int = 0
+    total_bytes: int = 0
+
+
+def select_expired(
+    usage: Iterable[tuple[WaldiezCheckpointInfo, int]],
+    policy: RetentionPolicy,
+    now: datetime | None = None,
+) -> list[tuple[WaldiezCheckpointInfo, int]]:
+    """Select the checkpoints a policy removes.
+
+    Checkpoints older than the policy's max age are removed first, then
+    the oldest remaining ones until the total size fits, skipping the
+    latest ``min_keep`` checkpoints of each session.
+
+    Parameters
+    ----------
+    usage : Iterable[tuple[WaldiezCheckpointInfo, int]]
+        The checkpoints and their sizes.
+    policy : RetentionPolicy
+        The policy to apply.
+    now : datetime | None
+        The current time (defaults to now).
+
+    Returns
+    -------
+    list[tuple[WaldiezCheckpointInfo, int]]
+        The checkpoints to delete, oldest first.
+    """
+    entries = sorted(usage, key=lambda entry: entry[0].timestamp)
+    protected: set[int] = set()
+    seen: dict[str, int] = {}
+    for index in range(len(entries) - 1, -1, -1):
+        session = entries[index][0].session_name
+        seen[session] = seen.get(session, 0) + 1
+        if seen[session] <= policy.min_keep:
+            protected.add(index)
+    cutoff: datetime | None = None
+    if policy.max_age is not None:
+        cutoff = (now or datetime.now(timezone.utc)) - policy.max_age
+    total = sum(size for _, size in entries)
+    expired: list[tuple[WaldiezCheckpointInfo, int]] = []
+    for index, (info, size) in enumerate(entries):
+        if index in protected:
+            continue
+        too_old = cutoff is not None and info.timestamp < cutoff
+        too_big = (
+            policy.max_total_bytes is not None
+            and total > policy.max_total_bytes
+        )
+        if too_old or too_big:
+            expired.append((info, size))
+            total -= size
+    return expired
+
+
+class RetentionDaemon:
+    """Apply a retention policy to a workspace periodically."""
+
+    def __init__(
+        self,
+        manager: StorageManager,
+        policy: RetentionPolicy,
+        interval: float = 3600.0,
+    ) -> None:
+        """Initialize the daemon.
+
+        Parameters
+        ----------
+        manager : StorageManager
+            The storage manager of the workspace.
+        policy : RetentionPolicy
+            The policy to apply.
+        interval : float
+            The seconds between two passes.
+        """
+        self.manager = manager
+        self.policy = policy
+        self.interval = interval
+        self.last_report: RetentionReport | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stop_event = asyncio.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background task (a pass runs right away)."""
+        self._stop_event.clear()
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        self._stop_event.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> RetentionReport:
+        """Apply the policy once.
+
+        Returns
+        -------
+        RetentionReport
+            The outcome of the pass.
+        """
+        report = await self.manager.a_apply_retention(self.policy)
+        self.last_report = report
+        if report.deleted:
+            logger.info(
+                "Retention removed %d checkpoints (%d bytes), %d bytes left",
+                report.deleted,
+                report.freed_bytes,
+                report.total_bytes,
+            )
+        return report
+
+    async def _loop(self) -> None:
+        """Retention loop."""
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                break
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                logger.warning("Retention pass failed: %s", error)
+            try:
+                await asyncio.wait_for(
+                    self._stop_event.wait(), timeout=self.interval
+                )
+            except asyncio.TimeoutError:
+                continue
+            except asyncio.CancelledError:
+                break
@@ -7,21 +7,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import shutil
 import sys
-from collections.abc import Generator, Iterable
+import threading
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal, TypeVar
 
 from typing_extensions import Self
 
 from .checkpoint import WaldiezCheckpoint, WaldiezCheckpointInfo
 from .filesystem_storage import FilesystemStorage
+from .history import WaldiezHistoryLog
 from .protocol import Storage
-from .utils import copy_results, get_root_dir, symlink
+from .retention import RetentionPolicy, RetentionReport
+from .utils import (
+    clone_tree,
+    copy_results,
+    default_max_workers,
+    get_root_dir,
+    move_results,
+    symlink,
+)
+
+_T = TypeVar("_T")
 
 
 class StorageManager:
@@ -33,6 +48,8 @@ class StorageManager:
         self,
         storage: Storage | None = None,
         workspace_dir: Path | str | None = None,
+        blob_store: bool | None = None,
+        max_workers: int | None = None,
     ) -> None:
         """
         Initialize the storage manager.
@@ -43,11 +60,25 @@ class StorageManager:
             The Storage backend to use (defaults to FilesystemStorage)
         workspace_dir : Path | str | None
             Workspace directory (only used if storage is None)
+        blob_store : bool | None
+            Whether to deduplicate checkpoint artifacts in a blob store
+            (only used if storage is None, defaults to WALDIEZ_BLOB_STORE).
+        max_workers : int | None
+            The number of threads for file operations: the size of the
+            pool the async methods run on and of the parallel copies or
+            deletions (defaults to the number of CPUs, capped to 8).
         """
+        self._max_workers = max_workers or default_max_workers()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
         if storage is None:
             if workspace_dir is None:
                 workspace_dir = get_root_dir()
-            self._storage = FilesystemStorage(workspace_dir)
+            self._storage = FilesystemStorage(
+                workspace_dir,
+                blob_store=blob_store,
+                max_workers=self._max_workers,
+            )
         else:
             self._storage = storage
 
@@ -132,6 +163,34 @@ class StorageManager:
         """Get the workspace directory."""
         return self._storage.workspace_dir
 
+    @property
+    def max_workers(self) -> int:
+        """Get the number of threads for file operations."""
+        return self._max_workers
+
+    def close(self) -> None:
+        """Shut down the thread pool of the async methods."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    async def _run(
+        self, func: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run a blocking call on the storage's thread pool."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="waldiez-storage",
+                )
+            executor = self._executor
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+
     # pylint: disable=too-many-locals,too-many-arguments,too-complex
     # pylint: disable=too-many-branches
     def finalize(  # noqa: C901
@@ -152,8 +211,13 @@ class StorageManager:
         ),
         ignore_names: Iterable[str] = (".cache", ".env"),
         skip_symlinks: bool = False,
+        max_workers: int | None = None,
     ) -> tuple[Path, Path]:
-        """Copy a run's temporary artifacts into a new checkpoint.
+        """Move a run's temporary artifacts into a new checkpoint.
+
+        The artifacts are renamed into the checkpoint when the tmp_dir is
+        not kept (copied only across devices), and copy-based public paths
+        share the checkpoint's file data through reflinks where possible.
 
         Parameters
         ----------
@@ -174,7 +238,8 @@ class StorageManager:
             Whether to update a `latest` link under link_root/session_name.
             Defaults to True.
         keep_tmp : bool
-            If False, delete the tmp_dir after copying. Defaults to False.
+            If False, move the artifacts and delete the tmp_dir afterwards,
+            if True, copy them. Defaults to False.
         copy_into_subdir : str | None
             If set, copy artifacts into
             checkpoint/<copy_into_subdir> instead of the root.
@@ -184,6 +249,9 @@ class StorageManager:
             Directory/file names to skip entirely.
         skip_symlinks : bool
             Whether to skip creating symlinks for checkpoints.
+        max_workers : int | None
+            The number of threads transferring the artifacts
+            (defaults to the manager's max_workers).
 
         Returns
         -------
@@ -217,13 +285,26 @@ class StorageManager:
             else checkpoint_path
         )
         target_dir.mkdir(parents=True, exist_ok=True)
-        copy_results(
+        # tmp_dir is discarded afterwards, so we can move instead of copy
+        transfer_results = copy_results if keep_tmp else move_results
+        transfer_results(
             temp_dir=tmp_dir,
             output_file=output_file,
             destination_dir=target_dir,
             promote_to_output=promote_to_output,
             ignore_names=ignore_names,
+            max_workers=max_workers or self._max_workers,
         )
+        # appends during the run are O(1), compact once per checkpoint
+        history_log = WaldiezHistoryLog(target_dir)
+        if history_log.exists():
+            history_log.compact()
+        # Only FilesystemStorage has this method currently
+        if hasattr(self._storage, "intern_checkpoint"):
+            self._storage.intern_checkpoint(checkpoint_path)
+        # record the new checkpoint's size for the retention policy
+        if hasattr(self._storage, "measure_checkpoint"):
+            self._storage.measure_checkpoint(checkpoint_path)
         if link_root is None:
             link_root = Path.cwd() / "waldiez_out"
 
@@ -256,13 +337,14 @@ class StorageManager:
                     if tmp_latest.exists():
                         tmp_latest.unlink(missing_ok=True)
         else:
-            # Copy-based public path (no symlinks)
+            # Copy-based public path (no symlinks),
+            # hardlinked/reflinked where the filesystem allows it
             if public_link_path.exists():
                 if public_link_path.is_symlink() or public_link_path.is_file():
                     public_link_path.unlink()
                 else:
                     shutil.rmtree(public_link_path)
-            shutil.copytree(checkpoint_path, public_link_path)
+            clone_tree(checkpoint_path, public_link_path)
 
             if link_latest:
                 latest_link = session_out_dir / "latest"
@@ -271,13 +353,89 @@ class StorageManager:
                         latest_link.unlink()
                     else:
                         shutil.rmtree(latest_link)
-                shutil.copytree(checkpoint_path, latest_link)
+                clone_tree(checkpoint_path, latest_link)
 
         if keep_tmp is False:
             shutil.rmtree(tmp_dir, ignore_errors=True)
 
         return checkpoint_path, public_link_path
 
+    # pylint: disable=too-many-arguments
+    async def a_finalize(
+        self,
+        session_name: str,
+        output_file: Path,
+        tmp_dir: Path,
+        *,
+        metadata: dict[str, Any] | None = None,
+        timestamp: datetime | None = None,
+        link_root: Path | None = None,
+        link_latest: bool = True,
+        keep_tmp: bool = False,
+        copy_into_subdir: str | None = None,
+        promote_to_output: Iterable[str] = (
+            "tree_of_thoughts.png",
+            "reasoning_tree.json",
+        ),
+        ignore_names: Iterable[str] = (".cache", ".env"),
+        skip_symlinks: bool = False,
+    ) -> tuple[Path, Path]:
+        """Move a run's temporary artifacts into a new checkpoint.
+
+        Async version of `finalize`, the artifacts are transferred
+        in parallel off the event loop.
+
+        Parameters
+        ----------
+        session_name : str
+            Session name for the checkpoint.
+        output_file : Path
+            The path to the output.
+        tmp_dir : Path
+            Directory containing artifacts produced by the run.
+        metadata : dict[str, Any] | None
+            Optional metadata to store in the checkpoint.
+        timestamp : datetime | None
+            Optional checkpoint timestamp (defaults to now).
+        link_root : Path | None
+            Base directory for outward-facing links.
+            Defaults to CWD/"waldiez_out".
+        link_latest : bool
+            Whether to update a `latest` link under link_root/session_name.
+        keep_tmp : bool
+            If False, move the artifacts and delete the tmp_dir afterwards,
+            if True, copy them.
+        copy_into_subdir : str | None
+            If set, copy artifacts into
+            checkpoint/<copy_into_subdir> instead of the root.
+        promote_to_output : Iterable[str]
+            File names (exact matches) to also copy into output_dir.
+        ignore_names : Iterable[str]
+            Directory/file names to skip entirely.
+        skip_symlinks : bool
+            Whether to skip creating symlinks for checkpoints.
+
+        Returns
+        -------
+        tuple[Path, Path]
+            (checkpoint_path, public_link_path)
+        """
+        return await self._run(
+            self.finalize,
+            session_name,
+            output_file,
+            tmp_dir,
+            metadata=metadata,
+            timestamp=timestamp,
+            link_root=link_root,
+            link_latest=link_latest,
+            keep_tmp=keep_tmp,
+            copy_into_subdir=copy_into_subdir,
+            promote_to_output=promote_to_output,
+            ignore_names=ignore_names,
+            skip_symlinks=skip_symlinks,
+        )
+
     def save(
         self,
         session_name: str,
@@ -305,6 +463,31 @@ class StorageManager:
             session_name=session_name, state=state, metadata=metadata
         )
 
+    async def a_save(
+        self,
+        session_name: str,
+        state: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+    ) -> Path:
+        """
+        Save a checkpoint with automatic timestamp creation.
+
+        Parameters
+        ----------
+        session_name : str
+            The name of the session.
+        state : dict[str, Any]
+            The session state to store.
+        metadata : dict[str, Any] | None
+            Optional checkpoint metadata.
+
+        Returns
+        -------
+        Path
+            Path to the saved checkpoint
+        """
+        return await self._run(self.save, session_name, state, metadata)
+
     def get(
         self, session_name: str, timestamp: datetime | None = None
     ) -> WaldiezCheckpointInfo | None:
@@ -327,6 +510,25 @@ class StorageManager:
             session_name=session_name, timestamp=timestamp
         )
 
+    async def a_get(
+        self, session_name: str, timestamp: datetime | None = None
+    ) -> WaldiezCheckpointInfo | None:
+        """Get a checkpoint (latest by default).
+
+        Parameters
+        ----------
+        session_name : str
+            The name of the session
+        timestamp : datetime | None
+            Optional specific timestamp
+
+        Returns
+        -------
+        WaldiezCheckpointInfo | None
+            The loaded state data
+        """
+        return await self._run(self.get, session_name, timestamp)
+
     def update(
         self,
         session_name: str,
@@ -362,6 +564,28 @@ class StorageManager:
             timestamp=checkpoint_dt,
         )
 
+    async def a_update(
+        self,
+        session_name: str,
+        checkpoint: str | datetime,
+        state: dict[str, Any],
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Update a checkpoint with new state and optionally new metadata.
+
+        Parameters
+        ----------
+        session_name : str
+            The name of the session
+        checkpoint : str | datetime
+            Specific timestamp for checkpoint.
+        state : dict[str, Any]
+            The new state to set.
+        metadata : dict[str, Any]
+            Optional new metadata to set.
+        """
+        await self._run(self.update, session_name, checkpoint, state, metadata)
+
     def load(
         self,
         info: WaldiezCheckpointInfo,
@@ -408,7 +632,56 @@ class StorageManager:
         )
 
     def checkpoints(
-        self, session_name: str | None = None
+        self,
+        session_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[WaldiezCheckpointInfo]:
+        """
+        List available checkpoints.
+
+        Parameters
+        ----------
+        session_name : str
+            Optional filter by session
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+        order : Literal["asc", "desc"]
+            Sort by timestamp, newest first by default.
+        limit : int | None
+            Maximum number of checkpoints to return.
+        offset : int
+            Number of checkpoints to skip.
+
+        Returns
+        -------
+        list[WaldiezCheckpointInfo]
+            List of checkpoint information
+        """
+        return self._storage.list_checkpoints(
+            session_name=session_name,
+            since=since,
+            until=until,
+            order=order,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def a_checkpoints(
+        self,
+        session_name: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        order: Literal["asc", "desc"] = "desc",
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[WaldiezCheckpointInfo]:
         """
         List available checkpoints.
@@ -417,13 +690,44 @@ class StorageManager:
         ----------
         session_name : str
             Optional filter by session
+        since : datetime | None
+            Only include checkpoints at or after this time.
+        until : datetime | None
+            Only include checkpoints at or before this time.
+        order : Literal["asc", "desc"]
+            Sort by timestamp, newest first by default.
+        limit : int | None
+            Maximum number of checkpoints to return.
+        offset : int
+            Number of checkpoints to skip.
 
         Returns
         -------
         list[WaldiezCheckpointInfo]
             List of checkpoint information
         """
-        return self._storage.list_checkpoints(session_name=session_name)
+        return await self._run(
+            self.checkpoints,
+            session_name,
+            since=since,
+            until=until,
+            order=order,
+            limit=limit,
+            offset=offset,
+        )
+
+    def reindex(self) -> int:
+        """Rebuild the checkpoint catalog from the workspace.
+
+        Returns
+        -------
+        int
+            The number of indexed checkpoints.
+        """
+        # Only FilesystemStorage has this method currently
+        if hasattr(self._storage, "reindex"):
+            return self._storage.reindex()
+        return len(self._storage.list_checkpoints())
 
     def history(
         self, session_name: str, checkpoint_name: str | None = None
@@ -463,6 +767,39 @@ class StorageManager:
                 ] = checkpoint_history
         return entries
 
+    async def a_history(
+        self, session_name: str, checkpoint_name: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get a session's checkpoints' history.
+
+        The checkpoints' history files are read concurrently.
+
+        Parameters
+        ----------
+        session_name : str
+            The session to use.
+        checkpoint_name : str | None
+            Optional checkpoint/folder name to use
+
+        Returns
+        -------
+        list[list[dict[str, Any]]]
+            Each checkpoint's history.
+        """
+        if checkpoint_name:
+            return await self._run(self.history, session_name, checkpoint_name)
+        infos = await self._run(
+            self._storage.list_checkpoints, session_name=session_name
+        )
+        histories = await asyncio.gather(
+            *(self._run(info.checkpoint.history) for info in infos)
+        )
+        return {
+            WaldiezCheckpoint.format_timestamp(info.timestamp): history
+            for info, history in zip(infos, histories, strict=True)
+            if history
+        }
+
     def sessions(self) -> list[str]:
         """List available sessions.
 
@@ -495,6 +832,50 @@ class StorageManager:
             session_name=session_name, timestamp=timestamp
         )
 
+    async def a_delete(self, session_name: str, timestamp: datetime) -> None:
+        """Delete a specific checkpoint.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of the session
+        timestamp : datetime
+            Timestamp of the checkpoint
+        """
+        await self._run(self.delete, session_name, timestamp)
+
+    def delete_batch(self, checkpoints: Iterable[tuple[str, datetime]]) -> int:
+        """Delete multiple checkpoints.
+
+        Parameters
+        ----------
+        checkpoints : Iterable[tuple[str, datetime]]
+            The (session_name, timestamp) pairs to delete.
+
+        Returns
+        -------
+        int
+            Number of checkpoints deleted
+        """
+        return self._storage.delete_checkpoints_batch(list(checkpoints))
+
+    async def a_delete_batch(
+        self, checkpoints: Iterable[tuple[str, datetime]]
+    ) -> int:
+        """Delete multiple checkpoints.
+
+        Parameters
+        ----------
+        checkpoints : Iterable[tuple[str, datetime]]
+            The (session_name, timestamp) pairs to delete.
+
+        Returns
+        -------
+        int
+            Number of checkpoints deleted
+        """
+        return await self._run(self.delete_batch, list(checkpoints))
+
     def cleanup(self, session_name: str, keep_count: int = 5) -> int:
         """
         Clean up old checkpoints.
@@ -515,6 +896,96 @@ class StorageManager:
             session_name=session_name, keep_count=keep_count
         )
 
+    async def a_cleanup(self, session_name: str, keep_count: int = 5) -> int:
+        """
+        Clean up old checkpoints.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of the session
+        keep_count : int
+            Number of recent checkpoints to keep
+
+        Returns
+        -------
+        int
+            Number of checkpoints deleted
+        """
+        return await self._run(self.cleanup, session_name, keep_count)
+
+    def usage(self) -> list[tuple[WaldiezCheckpointInfo, int]]:
+        """Get the size of every checkpoint in the workspace.
+
+        Returns
+        -------
+        list[tuple[WaldiezCheckpointInfo, int]]
+            The checkpoints (oldest first) and their size in bytes.
+        """
+        # Only FilesystemStorage has this method currently
+        if hasattr(self._storage, "usage"):
+            return self._storage.usage()
+        return []
+
+    def apply_retention(self, policy: RetentionPolicy) -> RetentionReport:
+        """Delete the checkpoints that a retention policy expires.
+
+        Parameters
+        ----------
+        policy : RetentionPolicy
+            The workspace-wide policy (max total size, max age and
+            the number of checkpoints to always keep per session).
+
+        Returns
+        -------
+        RetentionReport
+            The number of deleted checkpoints and the freed/remaining size.
+        """
+        # Only FilesystemStorage has this method currently
+        if hasattr(self._storage, "apply_retention"):
+            return self._storage.apply_retention(policy)
+        return RetentionReport()
+
+    async def a_apply_retention(
+        self, policy: RetentionPolicy
+    ) -> RetentionReport:
+        """Delete the checkpoints that a retention policy expires.
+
+        Parameters
+        ----------
+        policy : RetentionPolicy
+            The workspace-wide policy.
+
+        Returns
+        -------
+        RetentionReport
+            The number of deleted checkpoints and the freed/remaining size.
+        """
+        return await self._run(self.apply_retention, policy)
+
+    def pack(self, session_name: str, keep_count: int = 5) -> int:
+        """
+        Pack old checkpoints into the session's compressed archive.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of the session
+        keep_count : int
+            Number of recent checkpoints to keep loose
+
+        Returns
+        -------
+        int
+            Number of checkpoints packed
+        """
+        # Only FilesystemStorage has this method currently
+        if hasattr(self._storage, "pack_checkpoints"):
+            return self._storage.pack_checkpoints(
+                session_name=session_name, keep_count=keep_count
+            )
+        return 0
+
     def clean_broken_symlinks(self, session_name: str | None = None) -> int:
         """
         Clean up broken symlinks.
@@ -579,6 +1050,23 @@ class StorageManager:
             return checkpoints[0]  # Already sorted by timestamp desc
         return None
 
+    async def a_get_latest_checkpoint(
+        self, session_name: str
+    ) -> WaldiezCheckpointInfo | None:
+        """Get information about the latest checkpoint for a session.
+
+        Parameters
+        ----------
+        session_name : str
+            Name of the session
+
+        Returns
+        -------
+        WaldiezCheckpointInfo | None
+            WaldiezCheckpoint info if found, None otherwise
+        """
+        return await self._run(self.get_latest_checkpoint, session_name)
+
     def session_exists(self, session_name: str) -> bool:
         """
         Check if a session has any checkpoints.
@@ -12,9 +12,66 @@ import shutil
 import stat
 import subprocess
 import sys
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
+
+# linux ioctl for a copy-on-write clone of a file (btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def default_max_workers() -> int:
+    """Get the default number of workers for parallel file operations.
+
+    Returns
+    -------
+    int
+        The number of CPUs, capped to 8.
+    """
+    return min(8, os.cpu_count() or 1)
+
+
+def run_parallel(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_workers: int | None = None,
+) -> list[_R]:
+    """Call a function on each item using a bounded pool of threads.
+
+    File operations release the GIL, so copying or deleting independent
+    trees in threads overlaps their disk waits. With a single worker
+    (or a single item) the items are processed in the calling thread.
+
+    Parameters
+    ----------
+    func : Callable[[_T], _R]
+        The function to call.
+    items : Iterable[_T]
+        The items to process.
+    max_workers : int | None
+        The maximum number of threads (defaults to `default_max_workers`).
+
+    Returns
+    -------
+    list[_R]
+        The results, in the items' order.
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = default_max_workers()
+    max_workers = min(max_workers, len(items))
+    if max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="waldiez-io"
+    ) as executor:
+        return list(executor.map(func, items))
 
 
 def symlink(
@@ -301,6 +358,117 @@ def _pre_link(
     return True
 
 
+def link_or_copy(src: Path | str, dst: Path | str) -> None:
+    """Place a file at a destination, sharing its data when possible.
+
+    Tries a hardlink, then a copy-on-write clone (reflink) and falls back
+    to a regular copy (e.g. across devices). An existing file at the
+    destination is replaced.
+
+    Parameters
+    ----------
+    src : Path | str
+        The file to place.
+    dst : Path | str
+        Where to place it.
+    """
+    src, dst = Path(src), Path(dst)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    with suppress(OSError):
+        tmp.unlink()
+    try:
+        try:
+            os.link(src, tmp)
+        except OSError:
+            if not reflink(src, tmp):
+                shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
+
+
+def reflink(src: Path, dst: Path) -> bool:
+    """Try to clone a file's data without copying it (linux only).
+
+    The clone is a copy-on-write copy: it shares the source's data
+    blocks, but writing to either file does not change the other.
+
+    Parameters
+    ----------
+    src : Path
+        The file to clone.
+    dst : Path
+        The clone's path (created or truncated).
+
+    Returns
+    -------
+    bool
+        True if cloned, False if the filesystem does not support it.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return False
+    try:
+        with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+            fcntl.ioctl(f_dst.fileno(), _FICLONE, f_src.fileno())
+    except OSError:
+        with suppress(OSError):
+            dst.unlink(missing_ok=True)
+        return False
+    with suppress(OSError):
+        shutil.copystat(src, dst)
+    return True
+
+
+def clone_tree(src: Path, dst: Path) -> None:
+    """Replicate a directory tree, sharing file data when possible.
+
+    Like ``shutil.copytree(src, dst, dirs_exist_ok=True)``, but files are
+    hardlinked (or reflinked) instead of copied when on the same device.
+
+    Parameters
+    ----------
+    src : Path
+        The directory to replicate.
+    dst : Path
+        The destination directory.
+    """
+    shutil.copytree(src, dst, copy_function=link_or_copy, dirs_exist_ok=True)
+
+
+def move_path(src: Path, dst: Path) -> None:
+    """Move a file or directory, merging into an existing directory.
+
+    Renames in place when possible and falls back to copying when the
+    source and the destination are on different devices (the source is
+    left in place in that case).
+
+    Parameters
+    ----------
+    src : Path
+        The file or directory to move.
+    dst : Path
+        The destination path.
+    """
+    if src.is_dir() and not src.is_symlink() and dst.is_dir():
+        for child in src.iterdir():
+            move_path(child, dst / child.name)
+        with suppress(OSError):
+            src.rmdir()
+        return
+    try:
+        os.replace(src, dst)
+    except OSError:
+        if src.is_dir():
+            shutil.copytree(src, dst, dirs_exist_ok=True)
+        else:
+            shutil.copy2(src, dst)
+
+
 # pylint: disable=too-complex
 # noinspection TryExceptPass,PyBroadException
 def copy_results(
@@ -313,6 +481,7 @@ def copy_results(
         "reasoning_tree.json",
     ),
     ignore_names: Iterable[str] = (".cache", ".env"),
+    max_workers: int = 1,
 ) -> None:
     """Copy the results to the output directory, merge-safe.
 
@@ -329,44 +498,169 @@ def copy_results(
         File names (exact matches) to also copy into output_dir.
     ignore_names : Iterable[str]
         Directory/file names to skip entirely.
+    max_workers : int
+        The number of threads copying the top-level entries in parallel.
     """
-    # pylint: disable=broad-exception-caught
+    _transfer_results(
+        temp_dir,
+        output_file,
+        destination_dir,
+        promote_to_output=promote_to_output,
+        ignore_names=ignore_names,
+        move=False,
+        max_workers=max_workers,
+    )
+
+
+def move_results(
+    temp_dir: Path,
+    output_file: Path,
+    destination_dir: Path,
+    *,
+    promote_to_output: Iterable[str] = (
+        "tree_of_thoughts.png",
+        "reasoning_tree.json",
+    ),
+    ignore_names: Iterable[str] = (".cache", ".env"),
+    max_workers: int = 1,
+) -> None:
+    """Move the results to the output directory, merge-safe.
+
+    Like `copy_results`, but the artifacts are renamed into place
+    (copied only across devices) and promoted files are hardlinked,
+    so the cost does not depend on the artifacts' size. The temp_dir
+    is expected to be discarded afterwards.
+
+    Parameters
+    ----------
+    temp_dir : Path
+        Directory containing run artifacts.
+    output_file : Path
+        The original output target
+        used to determine output_dir and special handling for .waldiez/.py.
+    destination_dir : Path
+        Where the run artifacts should be moved (e.g., public link target).
+    promote_to_output : Iterable[str]
+        File names (exact matches) to also place into output_dir.
+    ignore_names : Iterable[str]
+        Directory/file names to skip entirely.
+    max_workers : int
+        The number of threads moving the top-level entries in parallel.
+    """
+    _transfer_results(
+        temp_dir,
+        output_file,
+        destination_dir,
+        promote_to_output=promote_to_output,
+        ignore_names=ignore_names,
+        move=True,
+        max_workers=max_workers,
+    )
+
+
+# pylint: disable=too-many-arguments
+def _transfer_results(
+    temp_dir: Path,
+    output_file: Path,
+    destination_dir: Path,
+    *,
+    promote_to_output: Iterable[str],
+    ignore_names: Iterable[str],
+    move: bool,
+    max_workers: int = 1,
+) -> None:
+    """Copy or move the run artifacts to the destination directory."""
     temp_dir.mkdir(parents=True, exist_ok=True)
     destination_dir.mkdir(parents=True, exist_ok=True)
 
     output_dir = output_file.parent
-    for item in temp_dir.iterdir():
-        # skip cache files / dirs
-        if (
-            item.name == "__pycache__"
-            or item.suffix in (".pyc", ".pyo", ".pyd")
-            or item.name in ignore_names
-        ):
-            continue
-
-        if item.is_file():
-            if item.name in promote_to_output:
-                try:
-                    shutil.copy2(item, output_dir / item.name)
-                except Exception:
-                    pass
+    # when moving, the generated source goes straight to output_dir
+    output_source = _output_source_name(output_file) if move else None
+    promote_to_output = frozenset(promote_to_output)
+    ignore_names = frozenset(ignore_names)
+    # skip cache files / dirs
+    items = [
+        item
+        for item in temp_dir.iterdir()
+        if item.name != "__pycache__"
+        and item.suffix not in (".pyc", ".pyo", ".pyd")
+        and item.name not in ignore_names
+    ]
+
+    def _transfer(item: Path) -> None:
+        _transfer_item(
+            item,
+            destination_dir,
+            output_dir,
+            promote=item.name in promote_to_output,
+            is_output_source=item.name == output_source,
+            move=move,
+        )
+
+    run_parallel(_transfer, items, max_workers)
+    if not move:
+        _copy_output_file(
+            src_root=temp_dir,
+            output_file_path=output_file,
+            destination_dir=destination_dir,
+            output_dir=output_dir,
+        )
+
+
+# pylint: disable=too-many-branches
+# noinspection TryExceptPass,PyBroadException
+def _transfer_item(  # noqa: C901
+    item: Path,
+    destination_dir: Path,
+    output_dir: Path,
+    *,
+    promote: bool,
+    is_output_source: bool,
+    move: bool,
+) -> None:
+    """Copy or move one of the top-level run artifacts."""
+    # pylint: disable=broad-exception-caught
+    if item.is_file():
+        if promote:
             try:
-                shutil.copy2(item, destination_dir / item.name)
+                if move:
+                    link_or_copy(item, output_dir / item.name)
+                else:
+                    shutil.copy2(item, output_dir / item.name)
             except Exception:
                 pass
-        else:
+        if is_output_source:
             try:
+                move_path(item, output_dir / item.name)
+                return
+            except Exception:
+                pass
+        try:
+            if move:
+                move_path(item, destination_dir / item.name)
+            else:
+                shutil.copy2(item, destination_dir / item.name)
+        except Exception:
+            pass
+    else:
+        try:
+            if move:
+                move_path(item, destination_dir / item.name)
+            else:
                 shutil.copytree(
                     item, destination_dir / item.name, dirs_exist_ok=True
                 )
-            except Exception:
-                pass
-    _copy_output_file(
-        src_root=temp_dir,
-        output_file_path=output_file,
-        destination_dir=destination_dir,
-        output_dir=output_dir,
-    )
+        except Exception:
+            pass
+
+
+def _output_source_name(output_file_path: Path) -> str | None:
+    """Get the name of the generated source (.py) for an output file."""
+    if not output_file_path.is_file():
+        return None
+    if output_file_path.suffix == ".waldiez":
+        return output_file_path.with_suffix(".py").name
+    return output_file_path.name
 
 
 def _copy_output_file(
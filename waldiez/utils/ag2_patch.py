@@ -9,7 +9,10 @@
 """Patch ag2 if needed."""
 
 import argparse
+import hashlib
 import importlib.util
+import json
+import os
 import re
 import sys
 from collections.abc import Iterable
@@ -50,6 +53,12 @@ class PatchError(RuntimeError):
     """Patch error."""
 
 
+# Written in the patched package's directory after a check, so that later
+# checks only compare file stats instead of re-reading the sources.
+PATCH_STAMP_FILE = ".waldiez_patch_stamp.json"
+
+_VERSION_RE = re.compile(r"^__version__\s*=\s*[\"']([^\"']+)[\"']", re.M)
+
 _A_HDR = re.compile(r"^---\s+(?P<path>.+)")
 _B_HDR = re.compile(r"^\+\+\+\s+(?P<path>.+)")
 _HUNK = re.compile(r"^@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@")
@@ -540,6 +549,112 @@ def _check_patch_state(
     return PatchState.DIVERGED
 
 
+def _package_version(pkg_dir: Path) -> str:
+    """Read a package's version from its version module (no metadata)."""
+    for name in ("version.py", "__init__.py"):
+        try:
+            text = (pkg_dir / name).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        match = _VERSION_RE.search(text)
+        if match:
+            return match.group(1)
+    return ""
+
+
+def _file_stats(pkg_root: Path, files: Iterable[str]) -> dict[str, list[int]]:
+    """Get the (mtime_ns, size) of the target files (-1 if missing)."""
+    stats: dict[str, list[int]] = {}
+    for rel in files:
+        try:
+            st = (pkg_root / rel).stat()
+            stats[rel] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stats[rel] = [-1, -1]
+    return stats
+
+
+def _stamp_key(package_name: str, diff_path: Path) -> tuple[Path, str, str]:
+    """Get the package directory, its version and the diff's hash."""
+    pkg_root = _find_package_root(package_name)
+    pkg_dir = pkg_root / package_name
+    digest = hashlib.sha256(diff_path.read_bytes()).hexdigest()
+    return pkg_dir, _package_version(pkg_dir), digest
+
+
+def _stamp_matches(package_name: str, diff_path: Path) -> bool:
+    """Check if a recorded stamp still matches the package and the diff.
+
+    Only the diff is read, the patched files are only stat-ed.
+    """
+    try:
+        pkg_dir, pkg_version, digest = _stamp_key(package_name, diff_path)
+        with open(pkg_dir / PATCH_STAMP_FILE, "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+        if not isinstance(stamp, dict):
+            return False
+        files = stamp.get("files")
+        return (
+            stamp.get("version") == pkg_version
+            and stamp.get("diff") == digest
+            and isinstance(files, dict)
+            and bool(files)
+            and _file_stats(pkg_dir.parent, files) == files
+        )
+    except Exception:
+        return False
+
+
+def _write_stamp(
+    package_name: str,
+    diff_path: Path,
+    state: PatchState,
+    *,
+    strip: int | None,
+    encoding: str,
+) -> None:
+    """Record the checked state of the package's target files."""
+    try:
+        pkg_dir, pkg_version, digest = _stamp_key(package_name, diff_path)
+        parsed = _parse_unified_diff(
+            diff_path.read_text(encoding=encoding, errors="replace")
+        )
+        paths = [fp.new_path or fp.old_path or "" for fp in parsed]
+        if strip is None:
+            strip = _guess_strip_for_package(paths, package_name)
+        files = sorted(
+            {_strip_components(path, strip) for path in paths if path}
+        )
+        stamp = {
+            "version": pkg_version,
+            "diff": digest,
+            "state": state.value,
+            "files": _file_stats(pkg_dir.parent, files),
+        }
+        stamp_path = pkg_dir / PATCH_STAMP_FILE
+        tmp = stamp_path.with_name(f"{PATCH_STAMP_FILE}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(stamp), encoding="utf-8")
+        os.replace(tmp, stamp_path)
+    except Exception:
+        # not writable (or not resolvable): we just check again next time
+        pass
+
+
+def clear_patch_stamp(package_name: str) -> None:
+    """Remove a package's patch stamp (forcing a full check next time).
+
+    Parameters
+    ----------
+    package_name : str
+        The name of the patched package.
+    """
+    try:
+        pkg_dir = _find_package_root(package_name) / package_name
+        (pkg_dir / PATCH_STAMP_FILE).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
 def apply_patch(
     package_name: str,
     diff_path: Path | str,
@@ -548,6 +663,7 @@ def apply_patch(
     allow_rejects: bool = True,
     encoding: str = "utf-8",
     dry_run: bool = False,
+    verify: bool = False,
 ) -> None:
     """Apply patch.
 
@@ -565,13 +681,28 @@ def apply_patch(
         The text encoding for reading/writing files.
     dry_run : bool
         if True, validate first; if it passes, function returns (no mutation).
+    verify : bool
+        if True, check the sources even if the stamp of an earlier
+        check still matches the package's files.
 
+    0) Skip if the stamp (package version, diff hash and the target
+       files' mtime/size) of an earlier check still matches.
     1) Dry-run to validate.
     2) Real apply with .rej generation on any failure (and raise).
+    3) Record the stamp once there is nothing (more) to apply.
     """
+    diff_path = Path(diff_path).resolve()
+    if not verify and not dry_run and _stamp_matches(package_name, diff_path):
+        return
     state = _check_patch_state(
         package_name, diff_path, strip=strip, encoding=encoding
     )
+    if state != PatchState.CLEAN and not dry_run:
+        # nothing to do (already applied, or diverged and left as is)
+        # until the package's files change.
+        _write_stamp(
+            package_name, diff_path, state, strip=strip, encoding=encoding
+        )
     if state == PatchState.CLEAN:
         _apply_unified_diff_to_package(
             package_name,
@@ -590,14 +721,33 @@ def apply_patch(
                 allow_rejects=allow_rejects,
                 encoding=encoding,
             )
+            _write_stamp(
+                package_name,
+                diff_path,
+                PatchState.ALREADY_APPLIED,
+                strip=strip,
+                encoding=encoding,
+            )
+
 
+def patch_ag2(verify: bool | None = None) -> None:
+    """Patch ag2 if a diff file is found.
 
-def patch_ag2() -> None:
-    """Patch ag2 if a diff file is found."""
+    Parameters
+    ----------
+    verify : bool | None
+        Whether to fully re-check the ag2 sources instead of trusting the
+        stamp of an earlier check. Defaults to the WALDIEZ_AG2_PATCH_VERIFY
+        environment variable.
+    """
+    if verify is None:
+        verify = os.environ.get(
+            "WALDIEZ_AG2_PATCH_VERIFY", ""
+        ).strip().lower() in ("1", "true", "yes", "on")
     diff_path = Path(__file__).parent / "ag2.diff"
     if diff_path.is_file():
         try:
-            apply_patch("autogen", diff_path)
+            apply_patch("autogen", diff_path, verify=verify)
         except BaseException as e:  # pylint: disable=broad-exception-caught
             print(e)
 
@@ -645,6 +795,11 @@ def _cli() -> argparse.ArgumentParser:
         default="utf-8",
         help="Encoding used to read/write source files. Default: utf-8",
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Re-check the sources even if an earlier check's stamp matches.",
+    )
     parser.add_argument(
         "--state",
         action="store_true",
@@ -676,6 +831,7 @@ def main() -> None:
             dry_run=args.dry_run,
             allow_rejects=not args.no_rejects,
             encoding=args.encoding,
+            verify=args.verify,
         )
     except PatchError as e:
         print("\nERROR applying diff:\n", file=sys.stderr)
@@ -6,6 +6,7 @@
 
 import sys
 from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 
 # Global variable to track if conflicts have been checked
 __waldiez_checked_conflicts = False
@@ -13,6 +14,9 @@ __waldiez_checked_conflicts = False
 
 # fmt: off
 def _check_autogen_agentchat() -> None:  # pragma: no cover
+    # a (cheap) finder lookup first, the metadata scan only if it is there
+    if find_spec("autogen_agentchat") is None:
+        return
     try:
         version("autogen-agentchat")
         msg = (
@@ -0,0 +1,267 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2026 Waldiez and contributors.
+
+# pylint: disable=broad-exception-caught
+
+"""Resolve a flow's requirements against the installed distributions.
+
+A requirement (e.g. ``ag2[openai]==0.11.4``) is satisfied if its
+distribution's installed version matches the specifier, and the
+requirements of each requested extra are satisfied too.
+
+Once a requirement set has been found satisfied, a fingerprint of it is
+recorded along with a stamp of the environment (the interpreter's prefix
+and the ``mtime`` of the site-packages directories, which change when
+distributions are installed or removed). While the stamp matches, later
+checks of the same set do not need to look at the metadata again.
+"""
+
+import hashlib
+import json
+import os
+import site
+import sys
+from collections.abc import Iterable
+from contextlib import suppress
+from importlib.metadata import PackageNotFoundError, distribution
+from pathlib import Path
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+WALDIEZ_REQUIREMENTS_CACHE = "WALDIEZ_REQUIREMENTS_CACHE"
+MAX_FINGERPRINTS = 64
+
+
+def _is_satisfied(
+    requirement: Requirement,
+    seen: set[tuple[str, str]],
+) -> bool:
+    """Check if a (parsed) requirement is satisfied."""
+    name = canonicalize_name(requirement.name)
+    try:
+        dist = distribution(name)
+    except PackageNotFoundError:
+        return False
+    if not requirement.specifier.contains(dist.version, prereleases=True):
+        return False
+    for extra in sorted(requirement.extras):
+        key = (name, canonicalize_name(extra))
+        if key in seen:
+            continue
+        seen.add(key)
+        for dependency in dist.requires or []:
+            try:
+                dep = Requirement(dependency)
+            except InvalidRequirement:
+                continue
+            if dep.marker is None or not dep.marker.evaluate({"extra": extra}):
+                continue
+            if not _is_satisfied(dep, seen):
+                return False
+    return True
+
+
+def missing_requirements(requirements: Iterable[str]) -> set[str]:
+    """Get the requirements that are not installed (or do not match).
+
+    Requirements whose markers do not apply to this environment are
+    skipped, the ones that cannot be parsed are returned as missing
+    (let pip report them).
+
+    Parameters
+    ----------
+    requirements : Iterable[str]
+        The requirement specifiers.
+
+    Returns
+    -------
+    set[str]
+        The requirements that need to be installed.
+    """
+    missing: set[str] = set()
+    for entry in requirements:
+        try:
+            requirement = Requirement(entry)
+        except InvalidRequirement:
+            missing.add(entry)
+            continue
+        if requirement.marker is not None and not (
+            requirement.marker.evaluate({"extra": ""})
+        ):
+            continue
+        if not _is_satisfied(requirement, set()):
+            missing.add(entry)
+    return missing
+
+
+def requirements_fingerprint(requirements: Iterable[str]) -> str:
+    """Get a fingerprint of a requirement set (and of the interpreter).
+
+    Parameters
+    ----------
+    requirements : Iterable[str]
+        The requirement specifiers.
+
+    Returns
+    -------
+    str
+        The fingerprint (sha256 hex digest).
+    """
+    normalized: set[str] = set()
+    for entry in requirements:
+        try:
+            normalized.add(str(Requirement(entry)).lower())
+        except InvalidRequirement:
+            normalized.add(entry.strip().lower())
+    payload = json.dumps([sys.prefix, sys.version, sorted(normalized)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def environment_stamp(
+    extra_dirs: Iterable[str | Path] = (),
+) -> dict[str, int]:
+    """Get the mtime of the directories distributions get installed into.
+
+    Parameters
+    ----------
+    extra_dirs : Iterable[str | Path]
+        Other directories to include (e.g. a ``--target`` location).
+
+    Returns
+    -------
+    dict[str, int]
+        The ``mtime_ns`` of each directory (-1 if it does not exist).
+    """
+    dirs: list[str] = [str(path) for path in extra_dirs]
+    with suppress(Exception):
+        dirs.extend(site.getsitepackages())
+    with suppress(Exception):
+        dirs.append(site.getusersitepackages())
+    stamp: dict[str, int] = {}
+    for directory in dirs:
+        try:
+            stamp[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            stamp[directory] = -1
+    return stamp
+
+
+def _default_cache_file() -> Path:
+    from_env = os.environ.get(WALDIEZ_REQUIREMENTS_CACHE, "")
+    if from_env:
+        return Path(from_env)
+    # pylint: disable=import-outside-toplevel
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("waldiez", appauthor=False)) / (
+        "requirements.json"
+    )
+
+
+class RequirementsCache:
+    """Recorded fingerprints of the satisfied requirement sets."""
+
+    def __init__(
+        self,
+        cache_file: Path | None = None,
+        extra_dirs: Iterable[str | Path] = (),
+    ) -> None:
+        """Initialize the cache.
+
+        Parameters
+        ----------
+        cache_file : Path | None
+            The json file to keep the fingerprints in, defaults to the
+            ``WALDIEZ_REQUIREMENTS_CACHE`` environment variable or
+            ``requirements.json`` in the user's cache directory.
+        extra_dirs : Iterable[str | Path]
+            Other directories distributions get installed into.
+        """
+        self._cache_file = cache_file or _default_cache_file()
+        self._extra_dirs = list(extra_dirs)
+
+    @property
+    def cache_file(self) -> Path:
+        """The json file with the recorded fingerprints."""
+        return self._cache_file
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def is_satisfied(self, requirements: Iterable[str]) -> bool:
+        """Check if the set was recorded and the environment is the same.
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The requirement specifiers.
+
+        Returns
+        -------
+        bool
+            True if the set is known to be satisfied.
+        """
+        recorded = self._load().get(requirements_fingerprint(requirements))
+        return recorded is not None and recorded == environment_stamp(
+            self._extra_dirs
+        )
+
+    def record(self, requirements: Iterable[str]) -> None:
+        """Record a satisfied requirement set.
+
+        Only the most recent ``MAX_FINGERPRINTS`` sets are kept.
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The requirement specifiers.
+        """
+        data = self._load()
+        key = requirements_fingerprint(requirements)
+        data.pop(key, None)
+        data[key] = environment_stamp(self._extra_dirs)
+        while len(data) > MAX_FINGERPRINTS:
+            data.pop(next(iter(data)))
+        tmp = self._cache_file.with_name(
+            f"{self._cache_file.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self._cache_file)
+        except OSError:
+            # not writable: we just resolve again next time
+            with suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget all the recorded fingerprints."""
+        with suppress(OSError):
+            self._cache_file.unlink(missing_ok=True)
+
+    def missing(self, requirements: Iterable[str]) -> set[str]:
+        """Get the requirements to install (recording a satisfied set).
+
+        Parameters
+        ----------
+        requirements : Iterable[str]
+            The requirement specifiers.
+
+        Returns
+        -------
+        set[str]
+            The missing or mismatched requirements.
+        """
+        requirements = sorted(set(requirements))
+        if self.is_satisfied(requirements):
+            return set()
+        missing = missing_requirements(requirements)
+        if not missing:
+            self.record(requirements)
+        return missing
@@ -9,8 +9,6 @@
 import json
 from typing import Any, Callable
 
-import anyio.to_thread
-
 from waldiez.storage import (
     StorageManager,
     WaldiezCheckpoint,
@@ -59,46 +57,6 @@ class CheckpointsHandler:
         dict[str, Any]
             The flow's checkpoints.
         """
-        return await anyio.to_thread.run_sync(self._handle_get_checkpoints, msg)
-
-    async def handle_save_checkpoint(
-        self, msg: SetCheckpointRequest
-    ) -> dict[str, Any]:
-        """Handle saving a checkpoint.
-
-        Parameters
-        ----------
-        msg : SetCheckpointRequest
-            The save request.
-
-        Returns
-        -------
-        dict[str, Any]
-            The updated checkpoint.
-        """
-        return await anyio.to_thread.run_sync(self._handle_save_checkpoint, msg)
-
-    async def handle_delete_checkpoint(
-        self, msg: DeleteCheckpointRequest
-    ) -> dict[str, Any]:
-        """Handle deleting a checkpoint.
-
-        Parameters
-        ----------
-        msg : DeleteCheckpointRequest
-
-        Returns
-        -------
-        dict[str, Any]
-            The result of the action.
-        """
-        return await anyio.to_thread.run_sync(
-            self._handle_delete_checkpoint, msg
-        )
-
-    def _handle_get_checkpoints(
-        self, msg: GetCheckpointsRequest
-    ) -> dict[str, Any]:
         flow_name = ""
         if isinstance(msg.payload, str):
             flow_name = msg.payload
@@ -111,23 +69,35 @@ class CheckpointsHandler:
                 ValueError("Invalid flow name"),
                 msg.request_id,
             )
-        checkpoints = self.storage_manager.history(flow_name)
+        checkpoints = await self.storage_manager.a_history(flow_name)
         response = GetCheckpointsResponse(
             checkpoints=checkpoints, request_id=msg.request_id
         ).model_dump(mode="json")
         response["payload"] = response["checkpoints"]
         return response
 
-    def _handle_save_checkpoint(
+    async def handle_save_checkpoint(
         self, msg: SetCheckpointRequest
     ) -> dict[str, Any]:
+        """Handle saving a checkpoint.
+
+        Parameters
+        ----------
+        msg : SetCheckpointRequest
+            The save request.
+
+        Returns
+        -------
+        dict[str, Any]
+            The updated checkpoint.
+        """
         payload_dict = _get_payload_dict(msg.payload)
         if not payload_dict:
             return self._error_to_response(
                 ValueError("Invalid request"),
                 msg.request_id,
             )
-        checkpoint_info = _get_checkpoint_info(
+        checkpoint_info = await _a_get_checkpoint_info(
             payload_dict, self.storage_manager
         )
         if not checkpoint_info:
@@ -143,10 +113,10 @@ class CheckpointsHandler:
                 ValueError("Invalid request"),
                 msg.request_id,
             )
-        self.storage_manager.update(
+        await self.storage_manager.a_update(
             checkpoint_info.session_name, checkpoint_info.timestamp, new_state
         )
-        updated_cp = self.storage_manager.get(
+        updated_cp = await self.storage_manager.a_get(
             checkpoint_info.session_name, checkpoint_info.timestamp
         )
         if not updated_cp:  # pragma: no cover
@@ -160,16 +130,27 @@ class CheckpointsHandler:
         response["payload"] = response["checkpoint"]
         return response
 
-    def _handle_delete_checkpoint(
+    async def handle_delete_checkpoint(
         self, msg: DeleteCheckpointRequest
     ) -> dict[str, Any]:
+        """Handle deleting a checkpoint.
+
+        Parameters
+        ----------
+        msg : DeleteCheckpointRequest
+
+        Returns
+        -------
+        dict[str, Any]
+            The result of the action.
+        """
         payload_dict = _get_payload_dict(msg.payload)
         if not payload_dict:
             return self._error_to_response(
                 ValueError("Invalid request"),
                 msg.request_id,
             )
-        checkpoint_info = _get_checkpoint_info(
+        checkpoint_info = await _a_get_checkpoint_info(
             payload_dict, self.storage_manager
         )
         if not checkpoint_info:
@@ -177,7 +158,7 @@ class CheckpointsHandler:
                 ValueError("Invalid request"),
                 msg.request_id,
             )
-        self.storage_manager.delete(
+        await self.storage_manager.a_delete(
             session_name=checkpoint_info.session_name,
             timestamp=checkpoint_info.timestamp,
         )
@@ -205,7 +186,7 @@ def _get_payload_dict(payload: Any) -> dict[str, Any]:
 
 
 # noinspection PyBroadException,PyUnusedLocal
-def _get_checkpoint_info(
+async def _a_get_checkpoint_info(
     payload_dict: dict[str, Any],
     storage_manager: StorageManager,
 ) -> WaldiezCheckpointInfo | None:
@@ -225,12 +206,12 @@ def _get_checkpoint_info(
     else:
         cp_ts_str = checkpoint
     if cp_ts_str == "latest":
-        cp_info = storage_manager.get_latest_checkpoint(flow_name)
+        cp_info = await storage_manager.a_get_latest_checkpoint(flow_name)
     else:
         cp_ts = WaldiezCheckpoint.parse_timestamp(cp_ts_str)
         if not cp_ts:
             return None
-        cp_info = storage_manager.get(flow_name, cp_ts)
+        cp_info = await storage_manager.a_get(flow_name, cp_ts)
     if not cp_info:
         return None
     return cp_info
@@ -19,6 +19,9 @@ from typing import Annotated, Any
 
 import typer
 
+from waldiez.storage import RetentionPolicy
+from waldiez.storage.retention import parse_age, parse_size
+
 HAS_WATCHDOG = False
 try:
     from .reloader import FileWatcher  # noqa: F401
@@ -96,6 +99,24 @@ def _get_ws_port() -> int:
         return DEFAULT_WS_PORT
 
 
+def _get_retention_policy(
+    max_size: str | None, max_age: str | None, keep: int | None
+) -> RetentionPolicy:
+    """Get the checkpoints retention policy (env overridden by options)."""
+    policy = RetentionPolicy.from_env()
+    try:
+        return RetentionPolicy(
+            max_total_bytes=(
+                parse_size(max_size) if max_size else policy.max_total_bytes
+            ),
+            max_age=parse_age(max_age) if max_age else policy.max_age,
+            min_keep=policy.min_keep if keep is None else max(keep, 0),
+        )
+    except ValueError as e:
+        typer.echo(f"Invalid retention setting: {e}")
+        sys.exit(1)
+
+
 # noinspection PyBroadException
 @app.command()
 def serve(
@@ -165,6 +186,37 @@ def serve(
     max_size: Annotated[
         int, typer.Option("--max-size", help="Maximum message size in bytes")
     ] = 8388608,
+    retention_max_size: Annotated[
+        str | None,
+        typer.Option(
+            "--retention-max-size",
+            help=(
+                "Delete the oldest checkpoints while the checkpoints "
+                "workspace is larger than this (e.g. '10G')"
+            ),
+        ),
+    ] = None,
+    retention_max_age: Annotated[
+        str | None,
+        typer.Option(
+            "--retention-max-age",
+            help="Delete the checkpoints older than this (e.g. '30d')",
+        ),
+    ] = None,
+    retention_keep: Annotated[
+        int | None,
+        typer.Option(
+            "--retention-keep",
+            help="Always keep the latest 'n' checkpoints of every session",
+        ),
+    ] = None,
+    retention_interval: Annotated[
+        float,
+        typer.Option(
+            "--retention-interval",
+            help="Seconds between two checkpoints retention passes",
+        ),
+    ] = 3600.0,
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Enable verbose logging")
     ] = False,
@@ -189,6 +241,10 @@ def serve(
             typer.echo(f"Invalid regex pattern in allowed origins: {e}")
             sys.exit(1)
 
+    retention = _get_retention_policy(
+        retention_max_size, retention_max_age, retention_keep
+    )
+
     # Server configuration
     server_config: dict[str, Any] = {
         "max_clients": max_clients,
@@ -196,6 +252,8 @@ def serve(
         "ping_interval": ping_interval,
         "ping_timeout": ping_timeout,
         "max_size": max_size,
+        "retention": retention,
+        "retention_interval": retention_interval,
     }
     if not HAS_WATCHDOG and auto_reload:
         msg = (
@@ -212,6 +270,7 @@ def serve(
     logger.info("  Allowed origins: %s", allowed_origins or ["*"])
     logger.info("  Auto-reload: %s", auto_reload)
     logger.info("  Workspace directory: %s", workspace_dir)
+    logger.info("  Checkpoints retention: %s", retention)
 
     if watch_dirs:
         logger.info("  Watch directories: %s", watch_dirs)
@@ -44,6 +44,8 @@ from .models import (
     BreakpointResponse,
     ConvertWorkflowRequest,
     DeleteCheckpointRequest,
+    EventHistoryRequest,
+    EventHistoryResponse,
     ExecutionMode,
     GetCheckpointsRequest,
     GetStatusRequest,
@@ -191,6 +193,8 @@ class ClientManager:
         self._runners.clear()
         self._pending_input.clear()
         self._last_prompt.clear()
+        # the storage's thread pool (waiting for pending operations)
+        await asyncio.to_thread(self.storage_manager.close)
         self.close_connection()
 
     # ---------------------------------------------------------------------
@@ -344,6 +348,10 @@ class ClientManager:
         if isinstance(msg, BreakpointRequest):
             return await self._handle_breakpoint_control(msg)
 
+        # Event history (pages)
+        if isinstance(msg, EventHistoryRequest):
+            return await self._handle_event_history(msg)
+
         # User input for pending input_request
         if isinstance(msg, UserInputResponse):
             return await self._handle_user_input(msg)
@@ -503,7 +511,7 @@ class ClientManager:
                 session_id=msg.session_id,
             ).model_dump(mode="json")
         code: str | None
-        if msg.action in {"", "c", "s", "r", "q", "i", "h", "st"}:
+        if msg.action in {"", "c", "s", "r", "q", "i", "h", "st", "sy"}:
             code = msg.action if msg.action else "c"
         else:
             code = {
@@ -515,6 +523,7 @@ class ClientManager:
                 "info": "i",
                 "help": "h",
                 "stats": "st",
+                "sync": "sy",
             }.get(msg.action)
 
         if not code:
@@ -554,6 +563,23 @@ class ClientManager:
             action=msg.action, session_id=msg.session_id
         ).model_dump(mode="json")
 
+    async def _handle_event_history(
+        self, msg: EventHistoryRequest
+    ) -> dict[str, Any]:
+        runner = self._runners.get(msg.session_id)
+        if not runner:
+            return EventHistoryResponse.fail(
+                error="Session not found",
+                start=msg.start,
+                limit=msg.limit,
+                session_id=msg.session_id,
+            ).model_dump(mode="json")
+        # the page is sent as a "debug_event_history" message
+        runner.provide_user_input(f"hi {msg.start} {msg.limit}")
+        return EventHistoryResponse.ok(
+            start=msg.start, limit=msg.limit, session_id=msg.session_id
+        ).model_dump(mode="json")
+
     async def _handle_user_input(
         self, msg: UserInputResponse
     ) -> dict[str, Any]:
@@ -726,7 +752,9 @@ class ClientManager:
         # noinspection PyTypeChecker
         kind = msg_type.replace("debug_", "", 1) or "info"
         debug_type = (
-            kind if kind in {"stats", "help", "error", "info"} else "info"
+            kind
+            if kind in {"stats", "help", "error", "info", "event_history"}
+            else "info"
         )  # noqa: E501
         await self.send_message(
             StepDebugNotification(
@@ -156,6 +156,7 @@ class StepControlRequest(BaseRequest):
         "info",
         "help",
         "stats",
+        "sync",
         "",
         "c",
         "s",
@@ -165,6 +166,7 @@ class StepControlRequest(BaseRequest):
         "h",
         "?",
         "st",
+        "sy",
     ]
     session_id: str
 
@@ -189,6 +191,15 @@ class BreakpointRequest(BaseRequest):
         return "added"
 
 
+class EventHistoryRequest(BaseRequest):
+    """Request a page of a step-by-step run's event history."""
+
+    type: Literal["event_history"] = "event_history"
+    session_id: str
+    start: int = Field(default=1, ge=0)  # the first event's number
+    limit: int = Field(default=100, ge=0, le=1000)
+
+
 class UserInputResponse(BaseRequest):
     """User input response for workflow execution."""
 
@@ -322,6 +333,15 @@ class BreakpointResponse(BaseResponse):
     error: str | None = None
 
 
+class EventHistoryResponse(BaseResponse):
+    """Response to event history request (the page is a debug message)."""
+
+    type: Literal["event_history_response"] = "event_history_response"
+    session_id: str
+    start: int
+    limit: int
+
+
 class ConvertWorkflowResponse(BaseResponse):
     """Response to convert workflow request."""
 
@@ -531,7 +551,7 @@ class StepDebugNotification(BaseNotification):
 
     type: Literal["step_debug"] = "step_debug"
     session_id: str
-    debug_type: Literal["stats", "help", "error", "info"]
+    debug_type: Literal["stats", "help", "error", "info", "event_history"]
     data: dict[str, Any]
 
 
@@ -596,6 +616,7 @@ ClientMessage = Annotated[
         StepRunWorkflowRequest,
         StepControlRequest,
         BreakpointRequest,
+        EventHistoryRequest,
         UserInputResponse,
         StopWorkflowRequest,
         ConvertWorkflowRequest,
@@ -619,6 +640,7 @@ ServerMessage = Annotated[
         StopWorkflowResponse,
         StepControlResponse,
         BreakpointResponse,
+        EventHistoryResponse,
         BreakpointNotification,
         ConvertWorkflowResponse,
         UploadFileResponse,
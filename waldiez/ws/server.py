@@ -23,6 +23,8 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import Any, final
 
+from waldiez.storage import RetentionDaemon, RetentionPolicy, StorageManager
+
 from .client_manager import ClientManager
 from .errors import ErrorHandler, MessageParsingError, ServerOverloadError
 from .models import ConnectionNotification
@@ -117,6 +119,10 @@ class WaldiezWsServer:
             Maximum queue size
         write_limit : int
             Write buffer limit
+        retention : RetentionPolicy | None
+            Checkpoints retention policy to apply in the background
+        retention_interval : float
+            Seconds between two retention passes (default: 3600)
         """
         self.host = host
         self.port = port
@@ -144,6 +150,16 @@ class WaldiezWsServer:
         # Shutdown event
         self.shutdown_event = asyncio.Event()
 
+        # Checkpoints retention
+        self.retention_daemon: RetentionDaemon | None = None
+        retention = kwargs.get("retention")
+        if isinstance(retention, RetentionPolicy) and retention.enabled:
+            self.retention_daemon = RetentionDaemon(
+                StorageManager(),
+                retention,
+                interval=kwargs.get("retention_interval", 3600.0),
+            )
+
         # Statistics
         self.stats = {
             "connections_total": 0,
@@ -284,6 +300,8 @@ class WaldiezWsServer:
             return
 
         await self.session_manager.start()
+        if self.retention_daemon:
+            await self.retention_daemon.start()
         # Check port availability
         if not self.auto_reload and not is_port_available(self.port):
             logger.warning("Port %d is not available", self.port)
@@ -336,6 +354,8 @@ class WaldiezWsServer:
     async def stop(self) -> None:
         """Stop the WebSocket server."""
         await self.session_manager.stop()
+        if self.retention_daemon:
+            await self.retention_daemon.stop()
         if not self.is_running:
             logger.warning("Server is not running")
             return